@@ -0,0 +1,401 @@
+import asyncio
+import time
+from http.cookiejar import CookieJar
+from ..client import Client
+from ..encoders.multipart_encoder import MultipartEncoder
+from ..exception import AppwriteException
+from ..hooks import RequestEvent
+from ..timeouts import deadline_exceeded, request_timeout
+from ..transport import _no_cookies
+
+try:
+    import httpx
+except ImportError as error:
+    raise ImportError("AsyncClient requires httpx, install it with: pip install 'appwrite[async]'") from error
+
+class AsyncClient(Client):
+    """Client whose call and chunked_upload are coroutines sharing one httpx connection pool"""
+
+    def __init__(self):
+        super().__init__()
+        self._async_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def set_connection_pool(self, pool_connections=10, pool_maxsize=10, pool_block=False, idle_timeout=None):
+        """Configure the keep-alive connection pool: pool_maxsize connections are kept alive and, with pool_block, at most pool_connections * pool_maxsize are opened at once"""
+
+        if self._async_session is not None:
+            raise AppwriteException('The connection pool must be configured before the first request')
+
+        return super().set_connection_pool(pool_connections, pool_maxsize, pool_block, idle_timeout)
+
+    def set_transport(self, transport):
+        """Not supported, AsyncClient always sends requests over its own httpx.AsyncClient"""
+
+        raise AppwriteException('AsyncClient sends requests over its own httpx.AsyncClient and does not use transports')
+
+    async def aclose(self):
+        """Close the pooled HTTP session and its open connections"""
+
+        session = self._async_session
+        self._async_session = None
+        if session is not None:
+            await session.aclose()
+        return self
+
+    def _get_async_session(self):
+        if self._async_session is None:
+            self._async_session = httpx.AsyncClient(
+                verify=(not self._self_signed),
+                cookies=CookieJar(_no_cookies()),
+                timeout=None,
+                limits=httpx.Limits(
+                    max_connections=self._pool_connections * self._pool_maxsize if self._pool_block else None,
+                    max_keepalive_connections=self._pool_maxsize,
+                    keepalive_expiry=self._pool_idle_timeout,
+                ),
+            )
+        return self._async_session
+
+    async def call(self, method, path='', headers=None, params=None, response_type='json'):
+        return await self._call(method, path, headers, params, response_type)
+
+    async def _call(self, method, path, headers=None, params=None, response_type='json', endpoint=None, kind='call'):
+        event = RequestEvent(method, path, endpoint, kind, self._hooks) if self._hooks else None
+        request = self._prepare_request(method, path, headers, params)
+        return await self._dispatch(method, path, request, response_type, event, endpoint.path if endpoint is not None else path)
+
+    async def call_endpoint(self, endpoint, params=None, path_values=()):
+        event = RequestEvent(endpoint.method, endpoint.path, endpoint, hooks=self._hooks) if self._hooks else None
+        path, request = self._prepare_endpoint_request(endpoint, params, path_values)
+        return await self._dispatch(endpoint.method, path, request, endpoint.response_type, event, endpoint.path)
+
+    async def _dispatch(self, method, path, request, response_type, event=None, route=None):
+        cache_key = self._cache_key(method, path, request, response_type)
+        coalesce_key = self._coalesce_key(method, path, request, response_type)
+        if event is None:
+            return await self._execute(method, path, request, response_type, cache_key=cache_key, coalesce_key=coalesce_key, route=route)
+
+        self._before_request(event, path, request)
+        try:
+            result = await self._execute(method, path, request, response_type, event, cache_key, coalesce_key, route)
+        except AppwriteException as error:
+            self._on_error(event, error)
+            raise
+
+        self._after_response(event, result)
+        return result
+
+    async def _execute(self, method, path, request, response_type, event=None, cache_key=None, coalesce_key=None, route=None):
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if event is not None:
+                    event.cached = True
+                return self._decode_cached(*cached)
+
+        response = None
+        shared = False
+        try:
+            if coalesce_key is None:
+                response = await self._send_async(request, response_type, event, route)
+            else:
+                response, shared = await self._request_coalescer.do_async(coalesce_key, lambda: self._send_async(request, response_type, event, route))
+                if shared and event is not None:
+                    self._share_response(event, response)
+
+            decode_started_at = time.perf_counter()
+            result = self._handle_response(response, response_type)
+            if event is not None:
+                event.timings['decode'] = time.perf_counter() - decode_started_at
+
+            if not shared:
+                self._store_cached(cache_key, path, response)
+            return result
+        except AppwriteException:
+            raise
+        except Exception as e:
+            self._raise_for_response(response, e)
+        finally:
+            self._invalidate_cached(method, path)
+
+    async def _send_async(self, request, response_type, event=None, route=None):
+        attempt = 1
+        started_at = time.monotonic()
+        sent_at = time.perf_counter()
+        path = request['url'][len(self._endpoint):]
+        session = self._get_async_session()
+        pool = self._endpoint_pool
+        tried = []
+        deadline = self._call_deadline(started_at)
+
+        hedge = self._hedge_policy
+        if hedge is not None and not hedge.applies(request['method'], route or path):
+            hedge = None
+
+        while True:
+            if event is not None:
+                event.attempts = attempt
+
+            if self._throttler is not None:
+                wait_for = self._throttler.reserve(request['method'], route or path)
+                if deadline is not None and time.monotonic() + wait_for >= deadline:
+                    raise deadline_exceeded()
+                await asyncio.sleep(wait_for)
+
+            options = {
+                'follow_redirects': response_type != 'location',
+                # Streaming separates waiting for the headers from the body
+                # download in the event timings.
+                'stream': event is not None,
+                'timeout': request_timeout(self._connect_timeout, self._read_timeout, deadline),
+            }
+            try:
+                if hedge is None:
+                    response = await self._attempt_async(session, pool, request, path, tried, options)
+                else:
+                    response = await self._hedged_attempt_async(hedge, route or path, session, pool, request, path, tried, options)
+            except httpx.TransportError as e:
+                if pool is not None and pool.can_fail_over(request['method'], request['headers'], tried):
+                    continue
+
+                delay = self._retry_delay(request, attempt, started_at, error=e)
+                if delay is None or self._past_deadline(deadline, delay):
+                    raise
+            else:
+                if self._throttler is not None:
+                    self._throttler.update(request['method'], route or path, response.headers)
+
+                delay = self._retry_delay(request, attempt, started_at, response=response)
+                if delay is None or self._past_deadline(deadline, delay):
+                    if event is not None:
+                        await self._read_response_async(event, response, sent_at)
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+            tried.clear()
+
+    async def _attempt_async(self, session, pool, request, path, tried, options, endpoint=None):
+        if pool is None:
+            return await self._request_async(session, request, options)
+
+        if endpoint is None:
+            endpoint = pool.acquire(tried)
+
+        attempt_at = time.monotonic()
+        failed = True
+        try:
+            response = await self._request_async(session, {**request, 'url': endpoint + path}, options)
+            failed = response.status_code >= 500
+            return response
+        except httpx.TransportError:
+            tried.append(endpoint)
+            raise
+        finally:
+            pool.release(endpoint, time.monotonic() - attempt_at, failed)
+
+    async def _request_async(self, session, request, options):
+        timeout = options['timeout']
+        request = session.build_request(
+            **self._httpx_request(request),
+            timeout=httpx.Timeout(None, connect=timeout[0], read=timeout[1]) if timeout is not None else httpx.Timeout(None)
+        )
+        return await session.send(request, stream=options['stream'], follow_redirects=options['follow_redirects'])
+
+    async def _hedged_attempt_async(self, hedge, route, session, pool, request, path, tried, options):
+        delay = hedge.delay(route)
+        attempt_at = time.monotonic()
+        if delay is None:
+            response = await self._attempt_async(session, pool, request, path, tried, options)
+            hedge.record(route, time.monotonic() - attempt_at)
+            return response
+
+        endpoint = pool.acquire(tried) if pool is not None else None
+        first = asyncio.ensure_future(self._attempt_async(session, pool, request, path, tried, options, endpoint))
+        first.add_done_callback(lambda task: task.cancelled() or task.exception() is not None or hedge.record(route, time.monotonic() - attempt_at))
+        done, _ = await asyncio.wait([first], timeout=delay)
+        if done:
+            return first.result()
+
+        copy_endpoint = pool.acquire(tried + [endpoint]) if pool is not None else None
+        second = asyncio.ensure_future(self._attempt_async(session, pool, request, path, tried, options, copy_endpoint))
+        pending = {first, second}
+        winner = None
+        while winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None or not pending:
+                    winner = task
+                    break
+
+        hedge.record_hedge(route, winner is second)
+        for task in pending:
+            # Unlike a thread, the slower copy can be cancelled.
+            task.cancel()
+        return winner.result()
+
+    async def _read_response_async(self, event, response, sent_at):
+        headers_at = time.perf_counter()
+        event.timings['ttfb'] = headers_at - sent_at
+        event.response_bytes = len(await response.aread())
+        event.timings['download'] = time.perf_counter() - headers_at
+        event.status = response.status_code
+
+    def _httpx_request(self, request):
+        request = dict(request)
+        data = request.pop('data')
+        if isinstance(data, MultipartEncoder):
+            request['content'] = data.__aiter__()
+        elif isinstance(data, (str, bytes)):
+            request['content'] = data
+        elif data:
+            request['data'] = data
+        return request
+
+    async def chunked_upload(
+        self,
+        path,
+        headers = None,
+        params = None,
+        param_name = '',
+        on_progress = None,
+        upload_id = '',
+        chunk_size = None,
+        max_workers = None,
+        max_bytes_per_second = None,
+        adaptive = None,
+        endpoint = None
+    ):
+        args = (path, headers, params, param_name, on_progress, upload_id, chunk_size, max_workers, max_bytes_per_second, adaptive, endpoint)
+        if not self._hooks:
+            with self._upload_deadline():
+                return await self._upload(*args)
+
+        event = self._before_upload(path, params[param_name], chunk_size, endpoint)
+        try:
+            with self._upload_deadline():
+                result = await self._upload(*args)
+        except AppwriteException as error:
+            self._on_error(event, error)
+            raise
+
+        self._after_response(event, result)
+        return result
+
+    async def _upload(self, path, headers, params, param_name, on_progress, upload_id, chunk_size, max_workers, max_bytes_per_second, adaptive, endpoint):
+        input_file = params[param_name]
+        size = self._upload_size(input_file)
+        chunk_size, concurrency, limiter = self._upload_options(chunk_size, max_workers, max_bytes_per_second, adaptive)
+
+        if size < chunk_size:
+            if input_file.source_type == 'path':
+                with open(input_file.path, 'rb') as input:
+                    input_file.data = input.read()
+
+            params[param_name] = input_file
+            return await self._call(
+                'post',
+                path,
+                headers,
+                params,
+                endpoint=endpoint
+            )
+
+        manifest = self._upload_manifest(path, upload_id, input_file, size, chunk_size)
+        counter = 0
+        result = None
+
+        if manifest is None:
+            try:
+                result = await self._call('get', path + '/' + upload_id, headers, endpoint=self._probe_endpoint(endpoint), kind='probe')
+                counter = result['chunksUploaded']
+            except:
+                pass
+
+        total_chunks = (size + chunk_size - 1) // chunk_size
+        chunks = self._plan_chunks(size, counter, chunk_size)
+
+        if manifest is not None:
+            upload_id = manifest.upload_id or upload_id
+            chunks = [chunk for chunk in chunks if chunk['index'] not in manifest.completed]
+            if not chunks:
+                result = await self._call('get', path + '/' + upload_id, headers, endpoint=self._probe_endpoint(endpoint))
+
+        if not chunks:
+            with self._upload_buffer(input_file) as buffer:
+                return self._finish_upload(manifest, buffer, size, result, total_chunks)
+
+        with self._upload_buffer(input_file) as buffer:
+            upload_id_header = upload_id
+            last_result = None
+            final_result = None
+
+            async def upload_chunk(chunk, current_upload_id):
+                chunk_headers, chunk_params = self._chunk_request(
+                    headers, params, param_name, input_file, buffer, chunk, size, current_upload_id
+                )
+                if limiter is not None:
+                    await asyncio.sleep(limiter.reserve(chunk['end'] - chunk['start']))
+                return await self._call(
+                    'post',
+                    path,
+                    chunk_headers,
+                    chunk_params,
+                    endpoint=endpoint
+                )
+
+            result = await upload_chunk(chunks[0], upload_id_header)
+            last_result = result
+            if "$id" in result:
+                upload_id_header = result["$id"]
+            if manifest is not None:
+                manifest.complete(chunks[0]['index'], upload_id_header)
+
+            completed_count = total_chunks - len(chunks) + 1
+            uploaded_size = size - sum(chunk['end'] - chunk['start'] for chunk in chunks[1:])
+
+            if on_progress is not None:
+                on_progress(self._upload_progress(result.get("$id"), uploaded_size, size, total_chunks, completed_count))
+
+            async def upload_remaining_chunk(chunk):
+                nonlocal completed_count, uploaded_size, last_result, final_result
+                chunk_result = await upload_chunk(chunk, upload_id_header)
+                concurrency.record(chunk['end'] - chunk['start'])
+                if manifest is not None:
+                    manifest.complete(chunk['index'])
+                completed_count = completed_count + 1
+                uploaded_size = uploaded_size + (chunk['end'] - chunk['start'])
+                last_result = chunk_result
+                if self._is_upload_complete(chunk_result, total_chunks):
+                    final_result = chunk_result
+                if on_progress is not None:
+                    on_progress(self._upload_progress(upload_id_header, uploaded_size, size, total_chunks, completed_count))
+
+            remaining = iter(chunks[1:])
+            in_flight = set()
+            try:
+                while True:
+                    while len(in_flight) < concurrency.limit:
+                        chunk = next(remaining, None)
+                        if chunk is None:
+                            break
+                        in_flight.add(asyncio.ensure_future(upload_remaining_chunk(chunk)))
+
+                    if not in_flight:
+                        break
+
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+            return self._finish_upload(manifest, buffer, size, final_result or last_result, total_chunks)
@@ -0,0 +1,47 @@
+import functools
+import inspect
+
+from ..service import Service, _RequestCaptured, _RequestRecorder
+
+class AsyncService:
+    """Async counterpart of a sync Service
+
+    Each public method of the wrapped service runs the sync method's own
+    parameter validation and path building against a recorder, awaits the
+    recorded request on the AsyncClient and then replays the sync method with
+    the response so both share the same response parsing.
+    """
+
+    _service = Service
+
+    def __init__(self, client):
+        self.client = client
+
+    def __init_subclass__(cls, service=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if service is None:
+            return
+
+        cls._service = service
+        for name, method in vars(service).items():
+            if name.startswith('_') or not inspect.isfunction(method):
+                continue
+            setattr(cls, name, _async_method(method))
+
+def _async_method(method):
+    replay = inspect.unwrap(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        recorder = _RequestRecorder(self.client)
+        try:
+            return method(self._service(recorder), *args, **kwargs)
+        except _RequestCaptured:
+            pass
+
+        name, call_args, call_kwargs = recorder.request
+        response = await getattr(self.client, name)(*call_args, **call_kwargs)
+
+        return replay(self._service(_RequestRecorder(self.client, response)), *args, **kwargs)
+
+    return wrapper
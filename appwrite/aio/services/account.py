@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.account import Account as _Account
+
+class Account(AsyncService, service=_Account):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.activities import Activities as _Activities
+
+class Activities(AsyncService, service=_Activities):
+    pass
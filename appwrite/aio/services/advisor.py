@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.advisor import Advisor as _Advisor
+
+class Advisor(AsyncService, service=_Advisor):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.apps import Apps as _Apps
+
+class Apps(AsyncService, service=_Apps):
+    pass
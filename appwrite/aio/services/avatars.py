@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.avatars import Avatars as _Avatars
+
+class Avatars(AsyncService, service=_Avatars):
+    pass
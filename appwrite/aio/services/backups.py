@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.backups import Backups as _Backups
+
+class Backups(AsyncService, service=_Backups):
+    pass
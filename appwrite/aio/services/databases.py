@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.databases import Databases as _Databases
+
+class Databases(AsyncService, service=_Databases):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.functions import Functions as _Functions
+
+class Functions(AsyncService, service=_Functions):
+    pass
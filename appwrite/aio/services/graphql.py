@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.graphql import Graphql as _Graphql
+
+class Graphql(AsyncService, service=_Graphql):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.locale import Locale as _Locale
+
+class Locale(AsyncService, service=_Locale):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.messaging import Messaging as _Messaging
+
+class Messaging(AsyncService, service=_Messaging):
+    pass
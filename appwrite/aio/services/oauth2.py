@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.oauth2 import Oauth2 as _Oauth2
+
+class Oauth2(AsyncService, service=_Oauth2):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.organization import Organization as _Organization
+
+class Organization(AsyncService, service=_Organization):
+    pass
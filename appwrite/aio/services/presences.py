@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.presences import Presences as _Presences
+
+class Presences(AsyncService, service=_Presences):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.project import Project as _Project
+
+class Project(AsyncService, service=_Project):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.proxy import Proxy as _Proxy
+
+class Proxy(AsyncService, service=_Proxy):
+    pass
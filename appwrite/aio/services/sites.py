@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.sites import Sites as _Sites
+
+class Sites(AsyncService, service=_Sites):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.storage import Storage as _Storage
+
+class Storage(AsyncService, service=_Storage):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.tables_db import TablesDB as _TablesDB
+
+class TablesDB(AsyncService, service=_TablesDB):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.teams import Teams as _Teams
+
+class Teams(AsyncService, service=_Teams):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.tokens import Tokens as _Tokens
+
+class Tokens(AsyncService, service=_Tokens):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.users import Users as _Users
+
+class Users(AsyncService, service=_Users):
+    pass
@@ -0,0 +1,5 @@
+from ..service import AsyncService
+from ...services.webhooks import Webhooks as _Webhooks
+
+class Webhooks(AsyncService, service=_Webhooks):
+    pass
@@ -0,0 +1,235 @@
+import random
+import time
+from threading import Event, Lock, Thread
+from .exception import AppwriteException
+from .retry import DEFAULT_METHODS, is_idempotent
+from .transport import RequestsTransport
+
+STRATEGIES = ('round_robin', 'least_outstanding', 'latency')
+
+# Weight of the newest sample in the moving average of an endpoint's latency.
+LATENCY_SMOOTHING = 0.2
+
+class _EndpointState:
+    __slots__ = ('url', 'outstanding', 'requests', 'errors', 'failures', 'latency', 'ejected_until')
+
+    def __init__(self, url):
+        self.url = url
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.failures = 0
+        self.latency = None
+        self.ejected_until = 0.0
+
+class EndpointPool:
+    """Spreads the requests of a Client over several Appwrite endpoints
+
+    strategy picks the endpoint of every request: 'round_robin' takes turns,
+    'least_outstanding' picks the endpoint with the fewest requests in flight
+    and 'latency' picks at random, weighted by the inverse of each endpoint's
+    average latency. An endpoint failing failure_threshold times in a row,
+    with connection errors or 5xx responses, is ejected for eject_seconds.
+    With health_check_interval, a background thread requests
+    health_check_path on every endpoint and ejects or readmits it by the
+    result. When every endpoint is ejected, requests go to all of them.
+    Health checks are sent by the transport of the client the pool is set
+    on, with its TLS verification, and stop when that client is closed;
+    verify only applies to a pool not set on a client.
+
+    Idempotent requests that fail to connect are sent to the next endpoint
+    right away, see RetryPolicy for the meaning of methods and
+    idempotency_header.
+    """
+
+    def __init__(
+        self,
+        endpoints,
+        strategy='round_robin',
+        failure_threshold=3,
+        eject_seconds=30.0,
+        health_check_interval=None,
+        health_check_path='/health/version',
+        health_check_timeout=5.0,
+        verify=True,
+        methods=DEFAULT_METHODS,
+        idempotency_header='idempotency-key'
+    ):
+        endpoints = list(endpoints)
+        if not endpoints:
+            raise AppwriteException('Endpoint pool needs at least one endpoint')
+
+        for endpoint in endpoints:
+            if not endpoint.startswith('http://') and not endpoint.startswith('https://'):
+                raise AppwriteException('Invalid endpoint URL: ' + endpoint)
+
+        if strategy not in STRATEGIES:
+            raise AppwriteException('Endpoint pool strategy must be one of: ' + ', '.join(STRATEGIES))
+
+        if failure_threshold < 1:
+            raise AppwriteException('Endpoint failure threshold must be at least 1')
+
+        if health_check_interval is not None and health_check_interval <= 0:
+            raise AppwriteException('Health check interval must be greater than 0')
+
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.eject_seconds = eject_seconds
+        self.health_check_interval = health_check_interval
+        self.health_check_path = health_check_path
+        self.health_check_timeout = health_check_timeout
+        self.verify = verify
+        self.methods = frozenset(method.lower() for method in methods)
+        self.idempotency_header = idempotency_header.lower() if idempotency_header else None
+        self._states = {endpoint: _EndpointState(endpoint) for endpoint in endpoints}
+        self._turn = 0
+        self._lock = Lock()
+        self._stop = Event()
+        self._health_thread = None
+        self._client = None
+        self._transport = None
+
+    @property
+    def endpoints(self):
+        return list(self._states)
+
+    def __len__(self):
+        return len(self._states)
+
+    def acquire(self, exclude=()):
+        """Pick the endpoint for a request, skipping those in exclude when others are left"""
+
+        if self.health_check_interval is not None and self._health_thread is None:
+            self._start_health_checks()
+
+        with self._lock:
+            candidates = self._available(exclude)
+            self._turn += 1
+            if self.strategy == 'round_robin':
+                state = candidates[self._turn % len(candidates)]
+            elif self.strategy == 'least_outstanding':
+                # Rotating first spreads ties between idle endpoints.
+                offset = self._turn % len(candidates)
+                state = min(candidates[offset:] + candidates[:offset], key=lambda state: state.outstanding)
+            else:
+                state = random.choices(candidates, weights=self._latency_weights(candidates))[0]
+
+            state.outstanding += 1
+            return state.url
+
+    def release(self, endpoint, latency, failed=False):
+        """Record the outcome of a request sent to an endpoint returned by acquire"""
+
+        with self._lock:
+            state = self._states[endpoint]
+            state.outstanding -= 1
+            state.requests += 1
+            if failed:
+                state.errors += 1
+                state.failures += 1
+                if state.failures >= self.failure_threshold:
+                    self._eject(state)
+                return
+
+            state.failures = 0
+            if state.latency is None:
+                state.latency = latency
+            else:
+                state.latency += LATENCY_SMOOTHING * (latency - state.latency)
+
+    def can_fail_over(self, method, headers, tried):
+        """Whether a request that failed to connect may be sent to an endpoint it was not sent to yet"""
+
+        if not is_idempotent(method, headers, self.methods, self.idempotency_header):
+            return False
+
+        with self._lock:
+            return any(state.url not in tried for state in self._available(()))
+
+    def stats(self):
+        """Requests, errors, error rate, average latency in seconds, requests in flight and ejection of every endpoint"""
+
+        now = time.monotonic()
+        with self._lock:
+            return {
+                state.url: {
+                    'requests': state.requests,
+                    'errors': state.errors,
+                    'error_rate': state.errors / state.requests if state.requests else 0.0,
+                    'latency': state.latency,
+                    'outstanding': state.outstanding,
+                    'ejected': state.ejected_until > now,
+                }
+                for state in self._states.values()
+            }
+
+    def check_health(self):
+        """Request the health check path on every endpoint once, ejecting those that fail and readmitting the others"""
+
+        client = self._client
+        if client is not None:
+            transport = client._get_transport()
+            verify = not client._self_signed
+        else:
+            if self._transport is None:
+                self._transport = RequestsTransport()
+            transport = self._transport
+            verify = self.verify
+
+        timeout = (self.health_check_timeout, self.health_check_timeout)
+        for endpoint in self.endpoints:
+            try:
+                response = transport.request('get', endpoint + self.health_check_path, {}, None, None, verify=verify, timeout=timeout)
+                healthy = response.status_code < 400
+                transport.close_response(response)
+            except Exception:
+                healthy = False
+
+            with self._lock:
+                state = self._states[endpoint]
+                if healthy:
+                    state.failures = 0
+                    state.ejected_until = 0.0
+                else:
+                    self._eject(state)
+
+    def close(self):
+        """Stop the background health checks"""
+
+        self._stop.set()
+        thread = self._health_thread
+        if thread is not None:
+            thread.join()
+
+        if self._transport is not None:
+            self._transport.close()
+
+    def _available(self, exclude):
+        now = time.monotonic()
+        states = list(self._states.values())
+        available = [state for state in states if state.ejected_until <= now] or states
+        return [state for state in available if state.url not in exclude] or available
+
+    def _latency_weights(self, candidates):
+        # Endpoints without samples yet are weighted like the fastest one,
+        # so they get measured.
+        known = [state.latency for state in candidates if state.latency is not None]
+        fastest = max(min(known), 0.001) if known else 1.0
+        return [1 / max(state.latency if state.latency is not None else fastest, 0.001) for state in candidates]
+
+    def _eject(self, state):
+        state.failures = 0
+        state.ejected_until = time.monotonic() + self.eject_seconds
+
+    def _start_health_checks(self):
+        with self._lock:
+            if self._health_thread is not None:
+                return
+
+            self._health_thread = Thread(target=self._run_health_checks, name='appwrite-health', daemon=True)
+            self._health_thread.start()
+
+    def _run_health_checks(self):
+        while not self._stop.is_set():
+            self.check_health()
+            self._stop.wait(self.health_check_interval)
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from threading import Lock
+
+class ResponseCache:
+    """In-memory LRU cache for GET responses, bounded by total body size in bytes
+
+    ttl is the lifetime in seconds of entries whose path matches none of the
+    fnmatch patterns in ttls (e.g. {'/locale/*': 3600}); a ttl of 0 only
+    caches the paths listed in ttls. Entries are keyed by method, path, query
+    parameters and every request header, so callers authenticating with
+    different keys, JWTs or sessions never share an entry.
+    """
+
+    def __init__(self, max_bytes=64*1024*1024, ttl=60, ttls=None):
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._entries = OrderedDict()
+        self._paths = {}
+        self._size = 0
+        self._lock = Lock()
+
+    @property
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, method, path, params, headers):
+        payload = json.dumps([
+            method.lower(),
+            path,
+            sorted((str(name), str(value)) for name, value in params.items()),
+            sorted((name.lower(), str(value)) for name, value in headers.items()),
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def ttl_for(self, path):
+        for pattern, ttl in self._ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self._ttl
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            path, expires_at, content_type, body = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return content_type, body
+
+    def set(self, key, path, content_type, body):
+        ttl = self.ttl_for(path)
+        if ttl <= 0 or len(body) > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (path, time.monotonic() + ttl, content_type, body)
+            self._paths.setdefault(path, set()).add(key)
+            self._size += len(body)
+
+            while self._size > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, path, descendants=True):
+        """Drop entries for path, every parent path and, unless descendants is False, every path below it"""
+
+        segments = path.rstrip('/').split('/')
+        affected = {'/'.join(segments[:i]) for i in range(2, len(segments) + 1)}
+
+        with self._lock:
+            if descendants:
+                prefix = path.rstrip('/') + '/'
+                affected.update(cached for cached in self._paths if cached.startswith(prefix))
+
+            for cached in affected:
+                for key in list(self._paths.get(cached, ())):
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        path, _, _, body = self._entries.pop(key)
+        self._size -= len(body)
+        keys = self._paths[path]
+        keys.discard(key)
+        if not keys:
+            del self._paths[path]
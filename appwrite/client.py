@@ -1,18 +1,35 @@
+import hashlib
 import io
 import json
+import mmap
 import os
 import platform
 import sys
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import copy_context
 from threading import Lock
 from .input_file import InputFile
 from .exception import AppwriteException
-from .encoders.value_class_encoder import ValueClassEncoder
+from .encoders.json_codec import default_json_codec
+from .encoders.multipart_encoder import MultipartEncoder
+from .encoders.params_encoder import flatten
+from .endpoint import Endpoint, body_kind
+from .hedge import HedgePolicy
+from .hooks import RequestEvent, current_event
+from .parsing import check_parse_mode, current_parse_mode
+from .timeouts import check_deadline, check_timeout, current_deadline, current_timeout, deadline_exceeded, request_timeout
+from .transport import RequestsTransport, Transport
+from .upload import RateLimiter, UploadConcurrency, UploadManifest
 
 class Client:
     def __init__(self):
         self._chunk_size = 5*1024*1024
+        self._upload_workers = 8
+        self._upload_bytes_per_second = None
+        self._upload_adaptive = False
+        self._upload_manifest_dir = None
         self._self_signed = False
         self._endpoint = 'https://cloud.appwrite.io/v1'
         self._global_headers = {
@@ -25,6 +42,27 @@ class Client:
             'X-Appwrite-Response-Format' : '1.9.5',
         }
         self._config = {}
+        self._transport = None
+        self._default_transport = True
+        self._pool_connections = 10
+        self._pool_maxsize = 10
+        self._pool_block = False
+        self._pool_idle_timeout = None
+        self._response_cache = None
+        self._request_coalescer = None
+        self._endpoint_pool = None
+        self._connect_timeout = None
+        self._read_timeout = None
+        self._deadline = None
+        self._hedge_policy = None
+        self._hedge_executor = None
+        self._hedge_lock = Lock()
+        self._parse_mode = 'strict'
+        self._retry_policy = None
+        self._throttler = None
+        self._json_codec = default_json_codec()
+        self._endpoint_headers = {}
+        self._hooks = []
 
     def set_self_signed(self, status=True):
         self._self_signed = status
@@ -37,8 +75,203 @@ class Client:
         self._endpoint = endpoint
         return self
 
+    def set_timeout(self, connect=None, read=None, deadline=None):
+        """Seconds to wait for a connection and between bytes of a response, and the time allowed for a whole call or upload including its retries; None waits forever"""
+
+        check_timeout(connect, 'Connect timeout')
+        check_timeout(read, 'Read timeout')
+        check_timeout(deadline, 'Deadline')
+        self._connect_timeout = connect
+        self._read_timeout = read
+        self._deadline = deadline
+        return self
+
+    @contextmanager
+    def timeout(self, connect=None, read=None):
+        """Override the connect and read timeouts of the calls made inside the with block"""
+
+        check_timeout(connect, 'Connect timeout')
+        check_timeout(read, 'Read timeout')
+        token = current_timeout.set((connect, read))
+        try:
+            yield self
+        finally:
+            current_timeout.reset(token)
+
+    @contextmanager
+    def deadline(self, seconds):
+        """Fail the calls and uploads made inside the with block once seconds have passed, retries and upload chunks included"""
+
+        check_timeout(seconds, 'Deadline')
+        deadline = time.monotonic() + seconds
+        outer = current_deadline.get()
+        token = current_deadline.set(deadline if outer is None else min(outer, deadline))
+        try:
+            yield self
+        finally:
+            current_deadline.reset(token)
+
+    def set_parse_mode(self, mode):
+        """How responses become models: 'strict' validates them, 'trusted' builds the models without validation and 'raw' returns the decoded JSON"""
+
+        check_parse_mode(mode)
+        self._parse_mode = mode
+        return self
+
+    def get_parse_mode(self):
+        mode = current_parse_mode.get()
+        return mode if mode is not None else self._parse_mode
+
+    @contextmanager
+    def parse_mode(self, mode):
+        """Override the parse mode of the calls made inside the with block"""
+
+        check_parse_mode(mode)
+        token = current_parse_mode.set(mode)
+        try:
+            yield self
+        finally:
+            current_parse_mode.reset(token)
+
+    def set_hedge_policy(self, policy):
+        """Send a second copy of slow GET calls according to a HedgePolicy and use the first response, or None to disable hedging"""
+
+        if policy is not None and not isinstance(policy, HedgePolicy):
+            raise AppwriteException('Hedge policy must be an instance of appwrite.hedge.HedgePolicy')
+
+        self._hedge_policy = policy
+        return self
+
+    def set_endpoint_pool(self, pool):
+        """Spread requests over the endpoints of an EndpointPool with health checks and failover, or None to use the single endpoint"""
+
+        if pool is not None:
+            self._endpoint = pool.endpoints[0]
+            pool._client = self
+        self._endpoint_pool = pool
+        return self
+
+    def get_endpoint_stats(self):
+        """Latency and error statistics of every endpoint in the endpoint pool"""
+
+        if self._endpoint_pool is None:
+            return {}
+
+        return self._endpoint_pool.stats()
+
+    def set_connection_pool(self, pool_connections=10, pool_maxsize=10, pool_block=False, idle_timeout=None):
+        """Configure the keep-alive connection pool: hosts pooled, connections kept per host, whether to block when exhausted and idle seconds before pooled connections are dropped"""
+
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise AppwriteException('Connection pool sizes must be at least 1')
+
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise AppwriteException('Connection pool idle timeout must be greater than 0')
+
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._pool_idle_timeout = idle_timeout
+        if self._default_transport and self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        return self
+
+    def set_transport(self, transport):
+        """The transport that sends HTTP requests, such as HttpxTransport for HTTP/2; defaults to a pooled requests session"""
+
+        if not isinstance(transport, Transport):
+            raise AppwriteException('Transport must be an instance of appwrite.transport.Transport')
+
+        self._transport = transport
+        self._default_transport = False
+        return self
+
+    def close(self):
+        """Close the transport and its open connections, and stop the health checks of the endpoint pool"""
+
+        if self._endpoint_pool is not None:
+            self._endpoint_pool.close()
+
+        if self._transport is not None:
+            self._transport.close()
+
+        with self._hedge_lock:
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=False)
+                self._hedge_executor = None
+        return self
+
+    def _get_transport(self):
+        if self._transport is None:
+            self._transport = RequestsTransport(
+                pool_connections=self._pool_connections,
+                pool_maxsize=self._pool_maxsize,
+                pool_block=self._pool_block,
+                idle_timeout=self._pool_idle_timeout,
+            )
+        return self._transport
+
+    def set_upload_options(self, chunk_size=5*1024*1024, max_workers=8, max_bytes_per_second=None, adaptive=False, manifest_dir=None):
+        """Default chunk size, parallel chunk uploads, bandwidth limit and adaptive concurrency for chunked uploads; Appwrite Cloud accepts chunks of at most 5MB
+
+        With manifest_dir set, finished chunks are recorded in a manifest file
+        in that directory, so repeating an interrupted upload of the same file
+        only sends the missing chunks and verifies the result with a checksum.
+        """
+
+        if chunk_size < 1 or max_workers < 1:
+            raise AppwriteException('Upload chunk size and workers must be at least 1')
+
+        if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+            raise AppwriteException('Upload rate limit must be greater than 0')
+
+        self._chunk_size = chunk_size
+        self._upload_workers = max_workers
+        self._upload_bytes_per_second = max_bytes_per_second
+        self._upload_adaptive = adaptive
+        self._upload_manifest_dir = manifest_dir
+        return self
+
+    def set_response_cache(self, cache):
+        """Serve repeated GET requests from a ResponseCache shared by this client, or None to disable caching"""
+
+        self._response_cache = cache
+        return self
+
+    def set_request_coalescer(self, coalescer):
+        """Share one round trip between identical GET calls in flight at the same time through a RequestCoalescer, or None to disable coalescing"""
+
+        self._request_coalescer = coalescer
+        return self
+
+    def set_retry_policy(self, policy):
+        """Retry transient failures of API calls according to a RetryPolicy, or None to disable retries"""
+
+        self._retry_policy = policy
+        return self
+
+    def set_throttler(self, throttler):
+        """Pace requests with a Throttler that learns rate limits from response headers, or None to disable it"""
+
+        self._throttler = throttler
+        return self
+
+    def set_json_codec(self, codec=None):
+        """Encode request bodies and decode responses with the given codec, or None for the fastest one installed"""
+
+        self._json_codec = codec if codec is not None else default_json_codec()
+        return self
+
+    def add_hook(self, hook):
+        """Report every call and upload made by this client to a Hook"""
+
+        self._hooks.append(hook)
+        return self
+
     def add_header(self, key, value):
         self._global_headers[key.lower()] = value
+        self._endpoint_headers.clear()
         return self
 
     def get_headers(self):
@@ -51,150 +284,538 @@ class Client:
         """Your project ID"""
 
         self._config['project'] = value
+        self._endpoint_headers.clear()
         return self
 
     def set_key(self, value):
         """Your secret API key"""
 
-        self._global_headers['x-appwrite-key'] = value
+        self.add_header('x-appwrite-key', value)
         self._config['key'] = value
         return self
 
     def set_jwt(self, value):
         """Your secret JSON Web Token"""
 
-        self._global_headers['x-appwrite-jwt'] = value
+        self.add_header('x-appwrite-jwt', value)
         self._config['jwt'] = value
         return self
 
     def set_bearer(self, value):
         """The OAuth access token to authenticate with"""
 
-        self._global_headers['authorization'] = 'Bearer ' + value
+        self.add_header('authorization', 'Bearer ' + value)
         self._config['bearer'] = value
         return self
 
     def set_locale(self, value):
-        self._global_headers['x-appwrite-locale'] = value
+        self.add_header('x-appwrite-locale', value)
         self._config['locale'] = value
         return self
 
     def set_session(self, value):
         """The user session to authenticate with"""
 
-        self._global_headers['x-appwrite-session'] = value
+        self.add_header('x-appwrite-session', value)
         self._config['session'] = value
         return self
 
     def set_forwarded_user_agent(self, value):
         """The user agent string of the client that made the request"""
 
-        self._global_headers['x-forwarded-user-agent'] = value
+        self.add_header('x-forwarded-user-agent', value)
         self._config['forwardeduseragent'] = value
         return self
 
     def set_dev_key(self, value):
         """Your secret dev API key"""
 
-        self._global_headers['x-appwrite-dev-key'] = value
+        self.add_header('x-appwrite-dev-key', value)
         self._config['devkey'] = value
         return self
 
     def set_cookie(self, value):
         """The user cookie to authenticate with. Used by SDKs that forward an incoming Cookie header in server-side runtimes."""
 
-        self._global_headers['cookie'] = value
+        self.add_header('cookie', value)
         self._config['cookie'] = value
         return self
 
     def set_impersonate_user_id(self, value):
         """Impersonate a user by ID"""
 
-        self._global_headers['x-appwrite-impersonate-user-id'] = value
+        self.add_header('x-appwrite-impersonate-user-id', value)
         self._config['impersonateuserid'] = value
         return self
 
     def set_impersonate_user_email(self, value):
         """Impersonate a user by email"""
 
-        self._global_headers['x-appwrite-impersonate-user-email'] = value
+        self.add_header('x-appwrite-impersonate-user-email', value)
         self._config['impersonateuseremail'] = value
         return self
 
     def set_impersonate_user_phone(self, value):
         """Impersonate a user by phone"""
 
-        self._global_headers['x-appwrite-impersonate-user-phone'] = value
+        self.add_header('x-appwrite-impersonate-user-phone', value)
         self._config['impersonateuserphone'] = value
         return self
 
     def call(self, method, path='', headers=None, params=None, response_type='json'):
+        return self._call(method, path, headers, params, response_type)
+
+    def _call(self, method, path, headers=None, params=None, response_type='json', endpoint=None, kind='call'):
+        event = RequestEvent(method, path, endpoint, kind, self._hooks) if self._hooks else None
+        request = self._prepare_request(method, path, headers, params)
+        return self._dispatch(method, path, request, response_type, event, endpoint.path if endpoint is not None else path)
+
+    def call_endpoint(self, endpoint, params=None, path_values=()):
+        """Call a precompiled Endpoint, filling its path parameters from path_values in order"""
+
+        event = RequestEvent(endpoint.method, endpoint.path, endpoint, hooks=self._hooks) if self._hooks else None
+        path, request = self._prepare_endpoint_request(endpoint, params, path_values)
+        return self._dispatch(endpoint.method, path, request, endpoint.response_type, event, endpoint.path)
+
+    def _dispatch(self, method, path, request, response_type, event=None, route=None):
+        # The keys are taken before hooks run, as they may add headers such as
+        # a trace context that differ between otherwise identical calls.
+        cache_key = self._cache_key(method, path, request, response_type)
+        coalesce_key = self._coalesce_key(method, path, request, response_type)
+        if event is None:
+            return self._execute(method, path, request, response_type, cache_key=cache_key, coalesce_key=coalesce_key, route=route)
+
+        self._before_request(event, path, request)
+        try:
+            result = self._execute(method, path, request, response_type, event, cache_key, coalesce_key, route)
+        except AppwriteException as error:
+            self._on_error(event, error)
+            raise
+
+        self._after_response(event, result)
+        return result
+
+    def _execute(self, method, path, request, response_type, event=None, cache_key=None, coalesce_key=None, route=None):
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if event is not None:
+                    event.cached = True
+                return self._decode_cached(*cached)
+
+        response = None
+        shared = False
+        try:
+            if coalesce_key is None:
+                response = self._send(request, response_type, event, route=route)
+            else:
+                response, shared = self._request_coalescer.do(coalesce_key, lambda: self._send(request, response_type, event, route=route))
+                if shared and event is not None:
+                    self._share_response(event, response)
+
+            decode_started_at = time.perf_counter()
+            result = self._handle_response(response, response_type)
+            if event is not None:
+                event.timings['decode'] = time.perf_counter() - decode_started_at
+
+            if not shared:
+                self._store_cached(cache_key, path, response)
+            return result
+        except AppwriteException:
+            raise
+        except Exception as e:
+            self._raise_for_response(response, e)
+        finally:
+            self._invalidate_cached(method, path)
+
+    def _before_request(self, event, path, request):
+        event.timings['serialize'] = time.perf_counter() - event.started_at
+        event.path = path
+        # Merged endpoint headers are shared between calls, hooks get a copy
+        # they may add to.
+        event.headers = request['headers'] = dict(request['headers'])
+        event.request_bytes = self._body_size(request['data'])
+        for hook in event.hooks:
+            hook.before_request(event)
+
+    def _after_response(self, event, result):
+        event.finished_at = time.perf_counter()
+        event.result = result
+        current_event.set(event)
+        for hook in event.hooks:
+            hook.after_response(event)
+
+    def _on_error(self, event, error):
+        event.finished_at = time.perf_counter()
+        event.error = error
+        event.status = error.code or event.status
+        for hook in event.hooks:
+            hook.on_error(event)
+
+    def _read_response(self, event, transport, response, sent_at, read=True):
+        # The response is streamed while hooks are installed, so the headers
+        # have arrived here and reading the content times the body download.
+        # Bodies the caller streams are timed while they are read.
+        headers_at = time.perf_counter()
+        event.timings['ttfb'] = headers_at - sent_at
+        event.status = response.status_code
+        if read:
+            event.response_bytes = len(transport.read(response))
+            event.timings['download'] = time.perf_counter() - headers_at
+
+    def _share_response(self, event, response):
+        event.coalesced = True
+        event.status = response.status_code
+        event.response_bytes = len(response.content)
+
+    def _body_size(self, data):
+        if isinstance(data, str):
+            return len(data.encode())
+
+        if isinstance(data, (bytes, MultipartEncoder)):
+            return len(data)
+
+        return 0
+
+    def _send(self, request, response_type, event=None, stream=False, route=None):
+        attempt = 1
+        started_at = time.monotonic()
+        sent_at = time.perf_counter()
+        path = request['url'][len(self._endpoint):]
+        transport = self._get_transport()
+        pool = self._endpoint_pool
+        tried = []
+        deadline = self._call_deadline(started_at)
+
+        hedge = self._hedge_policy
+        if hedge is not None and not hedge.applies(request['method'], route or path):
+            hedge = None
+
+        while True:
+            if event is not None:
+                event.attempts = attempt
+
+            if self._throttler is not None:
+                wait_for = self._throttler.reserve(request['method'], route or path)
+                if deadline is not None and time.monotonic() + wait_for >= deadline:
+                    raise deadline_exceeded()
+                time.sleep(wait_for)
+
+            options = {
+                'verify': not self._self_signed,
+                'allow_redirects': response_type != 'location',
+                'stream': stream or event is not None,
+                'timeout': request_timeout(self._connect_timeout, self._read_timeout, deadline),
+            }
+            try:
+                if hedge is None:
+                    response = self._attempt(transport, pool, request, path, tried, options)
+                else:
+                    response = self._hedged_attempt(hedge, route or path, transport, pool, request, path, tried, options)
+            except transport.connection_errors as e:
+                if pool is not None and pool.can_fail_over(request['method'], request['headers'], tried):
+                    continue
+
+                delay = self._retry_delay(request, attempt, started_at, error=e)
+                if delay is None or self._past_deadline(deadline, delay):
+                    raise
+            else:
+                if self._throttler is not None:
+                    self._throttler.update(request['method'], route or path, response.headers)
+
+                delay = self._retry_delay(request, attempt, started_at, response=response)
+                if delay is None or self._past_deadline(deadline, delay):
+                    if event is not None:
+                        self._read_response(event, transport, response, sent_at, read=not stream)
+                    return response
+                transport.close_response(response)
+
+            time.sleep(delay)
+            attempt += 1
+            tried.clear()
+
+    def _call_deadline(self, started_at):
+        deadline = current_deadline.get()
+        if deadline is None and self._deadline is not None:
+            deadline = started_at + self._deadline
+        return deadline
+
+    def _attempt(self, transport, pool, request, path, tried, options, endpoint=None):
+        if pool is None:
+            return transport.request(**request, **options)
+
+        if endpoint is None:
+            endpoint = pool.acquire(tried)
+
+        attempt_at = time.monotonic()
+        failed = True
+        try:
+            response = transport.request(**{**request, 'url': endpoint + path}, **options)
+            failed = response.status_code >= 500
+            return response
+        except transport.connection_errors:
+            tried.append(endpoint)
+            raise
+        finally:
+            pool.release(endpoint, time.monotonic() - attempt_at, failed)
+
+    def _hedged_attempt(self, hedge, route, transport, pool, request, path, tried, options):
+        delay = hedge.delay(route)
+        attempt_at = time.monotonic()
+        if delay is None:
+            response = self._attempt(transport, pool, request, path, tried, options)
+            hedge.record(route, time.monotonic() - attempt_at)
+            return response
+
+        endpoint = pool.acquire(tried) if pool is not None else None
+        executor = self._get_hedge_executor()
+        first = executor.submit(copy_context().run, self._attempt, transport, pool, request, path, tried, options, endpoint)
+        # The latency of the first copy is recorded even when the second one
+        # wins, so that the delay keeps tracking the route's real latency.
+        first.add_done_callback(lambda future: future.exception() is None and hedge.record(route, time.monotonic() - attempt_at))
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+
+        # The copy goes to another endpoint of the pool when there is one.
+        copy_endpoint = pool.acquire(tried + [endpoint]) if pool is not None else None
+        second = executor.submit(copy_context().run, self._attempt, transport, pool, request, path, tried, options, copy_endpoint)
+        pending = {first, second}
+        winner = None
+        while winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None or not pending:
+                    winner = future
+                    break
+
+        hedge.record_hedge(route, winner is second)
+        for future in pending:
+            # The slower copy cannot be cancelled once sent, its response is
+            # dropped when it arrives.
+            future.add_done_callback(lambda future: future.exception() is None and transport.close_response(future.result()))
+        return winner.result()
+
+    def _get_hedge_executor(self):
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                # Each hedged call holds a worker for its first copy, so the
+                # pool is sized well above the number of calling threads.
+                self._hedge_executor = ThreadPoolExecutor(max_workers=128, thread_name_prefix='appwrite-hedge')
+            return self._hedge_executor
+
+    def _past_deadline(self, deadline, delay):
+        return deadline is not None and time.monotonic() + delay >= deadline
+
+    def _retry_delay(self, request, attempt, started_at, response=None, error=None):
+        policy = self._retry_policy
+        if policy is None:
+            return None
+
+        status = None
+        retry_after = None
+        if response is not None:
+            status = response.status_code
+            retry_after = policy.parse_retry_after(response.headers.get('retry-after'))
+
+        delay = policy.retry_delay(request['method'], request['headers'], attempt, status, retry_after, error is not None)
+        if delay is not None and policy.on_retry is not None:
+            policy.on_retry({
+                'method': request['method'],
+                'path': request['url'][len(self._endpoint):],
+                'attempt': attempt,
+                'delay': delay,
+                'status': status,
+                'error': error,
+                'elapsed': time.monotonic() - started_at,
+            })
+
+        return delay
+
+    def stream(self, method, path='', headers=None, params=None, chunk_size=1024*1024, offset=0, endpoint=None):
+        """Yield the response body in chunks of at most chunk_size bytes, starting at byte offset via an HTTP Range request; endpoint is the Endpoint the path was built from"""
+
+        headers = dict(headers or {})
+        if offset:
+            headers['range'] = f'bytes={offset}-'
+
+        event = RequestEvent(method, path, endpoint, hooks=self._hooks) if self._hooks else None
+        request = self._prepare_request(method, path, headers, params)
+        route = endpoint.path if endpoint is not None else path
+        if event is None:
+            yield from self._stream(request, chunk_size, offset, route)
+            return
+
+        # Hooks hear of the call once the body was read, or once the caller
+        # stopped reading it.
+        self._before_request(event, path, request)
+        error = None
+        try:
+            yield from self._stream(request, chunk_size, offset, route, event)
+        except AppwriteException as e:
+            error = e
+            raise
+        finally:
+            if error is None:
+                self._after_response(event, None)
+            else:
+                self._on_error(event, error)
+
+    def _stream(self, request, chunk_size, offset, route, event=None):
+        transport = self._get_transport()
+        # The deadline covers the whole body, a server sending it slowly
+        # would otherwise only be bounded by the read timeout of each chunk.
+        deadline = self._call_deadline(time.monotonic())
+        response = None
+        try:
+            response = self._send(request, 'json', event, stream=True, route=route)
+        except AppwriteException:
+            raise
+        except Exception as e:
+            self._raise_for_response(None, e)
+
+        headers_at = time.perf_counter()
+        try:
+            if offset and response.status_code == 416:
+                return
+
+            if response.status_code >= 400:
+                self._raise_for_response(response)
+
+            # A server that ignores the Range header answers 200 with the
+            # whole body, so the bytes before offset are dropped here.
+            skip = offset if offset and response.status_code != 206 else 0
+            try:
+                for chunk in transport.iter_content(response, chunk_size):
+                    check_deadline(deadline)
+                    if event is not None:
+                        event.response_bytes += len(chunk)
+                    if skip:
+                        if len(chunk) <= skip:
+                            skip -= len(chunk)
+                            continue
+                        chunk = chunk[skip:]
+                        skip = 0
+                    yield chunk
+            except AppwriteException:
+                raise
+            except Exception as e:
+                raise AppwriteException(e) from e
+        finally:
+            if event is not None:
+                event.timings['download'] = time.perf_counter() - headers_at
+            transport.close_response(response)
+
+    def _prepare_request(self, method, path, headers=None, params=None):
         if headers is None:
             headers = {}
 
+        headers = {**self._global_headers, **headers}
+        return self._build_request(method, path, headers, params, body_kind(headers['content-type']))
+
+    def _prepare_endpoint_request(self, endpoint, params, path_values):
+        # The merged headers only change with the client's configuration, so
+        # they are built once per endpoint and shared by every call.
+        headers = self._endpoint_headers.get(endpoint)
+        if headers is None:
+            headers = {**self._global_headers, **endpoint.request_headers(self.get_config('project'))}
+            self._endpoint_headers[endpoint] = headers
+
+        path = endpoint.format_path(path_values)
+        return path, self._build_request(endpoint.method, path, headers, params, endpoint.body)
+
+    def _build_request(self, method, path, headers, params, body):
         if params is None:
             params = {}
 
         data = {}
-        files = {}
         stringify = False
 
-        headers = {**self._global_headers, **headers}
-
         if method != 'get':
             data = params
             params = {}
 
-        if headers['content-type'].startswith('application/json'):
-            data = json.dumps(data, cls=ValueClassEncoder)
+        if body == 'json':
+            data = self._json_codec.encode(data)
 
-        if headers['content-type'].startswith('multipart/form-data'):
-            del headers['content-type']
+        if body == 'multipart':
             stringify = True
-            for key in data.copy():
-                if isinstance(data[key], InputFile):
-                    files[key] = (data[key].filename, data[key].data)
-                    del data[key]
-            data = self.flatten(data, stringify=stringify)
+            headers = dict(headers)
+            if method == 'get':
+                del headers['content-type']
+            else:
+                data = MultipartEncoder(
+                    flatten({key: value for key, value in data.items() if not isinstance(value, InputFile)}, stringify=stringify),
+                    [(key, value.filename, value.data) for key, value in data.items() if isinstance(value, InputFile)]
+                )
+                headers['content-type'] = data.content_type
+                headers['content-length'] = str(len(data))
+
+        return {
+            'method': method,
+            'url': self._endpoint + path,
+            'params': flatten(params, stringify=stringify) if params else {},
+            'data': data,
+            'headers': headers,
+        }
 
-        response = None
-        try:
-            response = requests.request(  # call method dynamically https://stackoverflow.com/a/4246075/2299554
-                method=method,
-                url=self._endpoint + path,
-                params=self.flatten(params, stringify=stringify),
-                data=data,
-                files=files,
-                headers=headers,
-                verify=(not self._self_signed),
-                allow_redirects=False if response_type == 'location' else True
-            )
+    def _handle_response(self, response, response_type='json'):
+        if response.status_code >= 400:
+            self._raise_for_response(response)
 
-            response.raise_for_status()
+        warnings = response.headers.get('x-appwrite-warning')
+        if warnings:
+            for warning in warnings.split(';'):
+                print(f'Warning: {warning}', file=sys.stderr)
 
-            warnings = response.headers.get('x-appwrite-warning')
-            if warnings:
-                for warning in warnings.split(';'):
-                    print(f'Warning: {warning}', file=sys.stderr)
+        content_type = response.headers['Content-Type']
 
-            content_type = response.headers['Content-Type']
+        if response_type == 'location':
+            return response.headers.get('Location')
 
-            if response_type == 'location':
-                return response.headers.get('Location')
+        if content_type.startswith('application/json'):
+            return self._json_codec.decode(response.content)
 
-            if content_type.startswith('application/json'):
-                return response.json()
+        return response.content
 
-            return response._content
-        except Exception as e:
-            if response != None:
-                content_type = response.headers['Content-Type']
-                if content_type.startswith('application/json'):
-                    raise AppwriteException(response.json()['message'], response.status_code, response.json().get('type'), response.text)
-                else:
-                    raise AppwriteException(response.text, response.status_code, None, response.text)
-            else:
-                raise AppwriteException(e)
+    def _cache_key(self, method, path, request, response_type):
+        if self._response_cache is None or method != 'get' or response_type != 'json':
+            return None
+
+        return self._response_cache.key(method, path, request['params'], request['headers'])
+
+    def _coalesce_key(self, method, path, request, response_type):
+        if self._request_coalescer is None or method != 'get' or response_type != 'json':
+            return None
+
+        return self._request_coalescer.key(method, path, request['params'], request['headers'])
+
+    def _store_cached(self, cache_key, path, response):
+        if cache_key is not None:
+            self._response_cache.set(cache_key, path, response.headers.get('Content-Type', ''), response.content)
+
+    def _invalidate_cached(self, method, path):
+        if self._response_cache is not None and method != 'get':
+            # Creating a resource does not change the resources below the
+            # collection it is posted to, every other write may.
+            self._response_cache.invalidate(path, descendants=(method != 'post'))
+
+    def _decode_cached(self, content_type, body):
+        if content_type.startswith('application/json'):
+            return self._json_codec.decode(body)
+
+        return body
+
+    def _raise_for_response(self, response, error=None):
+        if response is None:
+            raise AppwriteException(error) from error
+
+        content_type = response.headers.get('Content-Type', '')
+        if content_type.startswith('application/json'):
+            body = self._json_codec.decode(response.content)
+            raise AppwriteException(body['message'], response.status_code, body.get('type'), response.text)
+        else:
+            raise AppwriteException(response.text, response.status_code, None, response.text)
 
     def chunked_upload(
         self,
@@ -203,46 +824,260 @@ class Client:
         params = None,
         param_name = '',
         on_progress = None,
-        upload_id = ''
+        upload_id = '',
+        chunk_size = None,
+        max_workers = None,
+        max_bytes_per_second = None,
+        adaptive = None,
+        endpoint = None
     ):
-        input_file = params[param_name]
+        args = (path, headers, params, param_name, on_progress, upload_id, chunk_size, max_workers, max_bytes_per_second, adaptive, endpoint)
+        if not self._hooks:
+            with self._upload_deadline():
+                return self._upload(*args)
 
-        if input_file.source_type == 'path':
-            size = os.stat(input_file.path).st_size
-            input = None
-        elif input_file.source_type == 'bytes':
-            size = len(input_file.data)
-            input = input_file.data
+        event = self._before_upload(path, params[param_name], chunk_size, endpoint)
+        try:
+            with self._upload_deadline():
+                result = self._upload(*args)
+        except AppwriteException as error:
+            self._on_error(event, error)
+            raise
+
+        self._after_response(event, result)
+        return result
+
+    @contextmanager
+    def _upload_deadline(self):
+        # The client's deadline covers the whole upload, every chunk runs in
+        # a copy of this context and sees it.
+        if self._deadline is None or current_deadline.get() is not None:
+            yield
+            return
+
+        token = current_deadline.set(time.monotonic() + self._deadline)
+        try:
+            yield
+        finally:
+            current_deadline.reset(token)
+
+    def _before_upload(self, path, input_file, chunk_size, endpoint=None):
+        event = RequestEvent('post', path, endpoint, kind='upload', hooks=self._hooks)
+        event.request_bytes = self._upload_size(input_file)
+        event.chunks = max(1, -(-event.request_bytes // (chunk_size or self._chunk_size)))
+        for hook in event.hooks:
+            hook.before_request(event)
+        return event
+
+    def _upload(self, path, headers, params, param_name, on_progress, upload_id, chunk_size, max_workers, max_bytes_per_second, adaptive, endpoint):
+        input_file = params[param_name]
+        size = self._upload_size(input_file)
+        chunk_size, concurrency, limiter = self._upload_options(chunk_size, max_workers, max_bytes_per_second, adaptive)
 
-        if size < self._chunk_size:
+        if size < chunk_size:
             if input_file.source_type == 'path':
                 with open(input_file.path, 'rb') as input:
                     input_file.data = input.read()
 
             params[param_name] = input_file
-            return self.call(
+            return self._call(
                 'post',
                 path,
                 headers,
-                params
+                params,
+                endpoint=endpoint
             )
 
-        offset = 0
+        manifest = self._upload_manifest(path, upload_id, input_file, size, chunk_size)
         counter = 0
+        result = None
 
-        try:
-            result = self.call('get', path + '/' + upload_id, headers)
-            counter = result['chunksUploaded']
-        except:
-            pass
+        if manifest is None:
+            try:
+                result = self._call('get', path + '/' + upload_id, headers, endpoint=self._probe_endpoint(endpoint), kind='probe')
+                counter = result['chunksUploaded']
+            except:
+                pass
+
+        total_chunks = (size + chunk_size - 1) // chunk_size
+        chunks = self._plan_chunks(size, counter, chunk_size)
+
+        if manifest is not None:
+            upload_id = manifest.upload_id or upload_id
+            chunks = [chunk for chunk in chunks if chunk['index'] not in manifest.completed]
+            if not chunks:
+                result = self._call('get', path + '/' + upload_id, headers, endpoint=self._probe_endpoint(endpoint))
+
+        if not chunks:
+            with self._upload_buffer(input_file) as buffer:
+                return self._finish_upload(manifest, buffer, size, result, total_chunks)
+
+        with self._upload_buffer(input_file) as buffer:
+            upload_id_header = upload_id
+            progress_lock = Lock()
+            last_result = None
+            final_result = None
+
+            def upload_chunk(chunk, current_upload_id):
+                chunk_headers, chunk_params = self._chunk_request(
+                    headers, params, param_name, input_file, buffer, chunk, size, current_upload_id
+                )
+                if limiter is not None:
+                    time.sleep(limiter.reserve(chunk['end'] - chunk['start']))
+                return self._call(
+                    'post',
+                    path,
+                    chunk_headers,
+                    chunk_params,
+                    endpoint=endpoint
+                )
+
+            result = upload_chunk(chunks[0], upload_id_header)
+            last_result = result
+            if "$id" in result:
+                upload_id_header = result["$id"]
+            if manifest is not None:
+                manifest.complete(chunks[0]['index'], upload_id_header)
+
+            completed_count = total_chunks - len(chunks) + 1
+            uploaded_size = size - sum(chunk['end'] - chunk['start'] for chunk in chunks[1:])
+
+            if on_progress is not None:
+                on_progress(self._upload_progress(result.get("$id"), uploaded_size, size, total_chunks, completed_count))
+
+            def upload_remaining_chunk(chunk):
+                nonlocal completed_count, uploaded_size, last_result, final_result
+                chunk_result = upload_chunk(chunk, upload_id_header)
+                concurrency.record(chunk['end'] - chunk['start'])
+                if manifest is not None:
+                    manifest.complete(chunk['index'])
+                with progress_lock:
+                    completed_count = completed_count + 1
+                    uploaded_size = uploaded_size + (chunk['end'] - chunk['start'])
+                    last_result = chunk_result
+                    if self._is_upload_complete(chunk_result, total_chunks):
+                        final_result = chunk_result
+                    if on_progress is not None:
+                        on_progress(self._upload_progress(upload_id_header, uploaded_size, size, total_chunks, completed_count))
+
+            remaining = iter(chunks[1:])
+            in_flight = set()
+            with ThreadPoolExecutor(max_workers=concurrency.maximum) as executor:
+                while True:
+                    while len(in_flight) < concurrency.limit:
+                        chunk = next(remaining, None)
+                        if chunk is None:
+                            break
+                        # Each chunk runs in a copy of the caller's context so
+                        # that context variables such as the active trace span
+                        # carry over into the worker threads.
+                        in_flight.add(executor.submit(copy_context().run, upload_remaining_chunk, chunk))
+
+                    if not in_flight:
+                        break
+
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+
+            return self._finish_upload(manifest, buffer, size, final_result or last_result, total_chunks)
+
+    def _upload_options(self, chunk_size, max_workers, max_bytes_per_second, adaptive):
+        chunk_size = chunk_size or self._chunk_size
+        max_workers = max_workers or self._upload_workers
+        max_bytes_per_second = max_bytes_per_second or self._upload_bytes_per_second
+        adaptive = self._upload_adaptive if adaptive is None else adaptive
+
+        if chunk_size < 1 or max_workers < 1:
+            raise AppwriteException('Upload chunk size and workers must be at least 1')
+
+        concurrency = UploadConcurrency(max_workers, adaptive)
+        limiter = RateLimiter(max_bytes_per_second) if max_bytes_per_second else None
+        return chunk_size, concurrency, limiter
+
+    def _probe_endpoint(self, endpoint):
+        """Endpoint of the request asking how far an upload to endpoint got, None for uploads to a plain path"""
+
+        if endpoint is None:
+            return None
+
+        return Endpoint('get', endpoint.path + '/{fileId}', project=endpoint.project)
+
+    def _upload_manifest(self, path, upload_id, input_file, size, chunk_size):
+        if self._upload_manifest_dir is None:
+            return None
+
+        if input_file.source_type == 'path':
+            source = [os.path.abspath(input_file.path), os.stat(input_file.path).st_mtime_ns]
+        else:
+            source = [input_file.filename, hashlib.md5(input_file.data, usedforsecurity=False).hexdigest()]
+
+        fingerprint = hashlib.sha256(
+            json.dumps([self._endpoint, path, upload_id, size, chunk_size, source]).encode()
+        ).hexdigest()
+        os.makedirs(self._upload_manifest_dir, exist_ok=True)
+        return UploadManifest.load(os.path.join(self._upload_manifest_dir, fingerprint + '.json'), fingerprint)
+
+    def _finish_upload(self, manifest, buffer, size, result, total_chunks):
+        if manifest is None:
+            return result
+
+        manifest.delete()
+        if not isinstance(result, dict):
+            return result
+
+        if 'chunksUploaded' in result and not self._is_upload_complete(result, total_chunks):
+            return result
 
-        if counter > 0:
-            offset = counter * self._chunk_size
+        if 'sizeOriginal' in result and int(result['sizeOriginal']) != size:
+            raise AppwriteException('Uploaded file size does not match the local file', 0, 'upload_checksum_mismatch')
 
-        total_chunks = (size + self._chunk_size - 1) // self._chunk_size
+        # Appwrite reports the MD5 of the assembled file as its signature.
+        signature = result.get('signature')
+        if signature and signature != hashlib.md5(buffer, usedforsecurity=False).hexdigest():
+            raise AppwriteException('Uploaded file checksum does not match the local file', 0, 'upload_checksum_mismatch')
+
+        return result
+
+    def _upload_size(self, input_file):
+        if input_file.source_type == 'path':
+            return os.stat(input_file.path).st_size
+
+        return len(input_file.data)
+
+    @contextmanager
+    def _upload_buffer(self, input_file):
+        # Chunks are sliced out of a memoryview over the input bytes or a
+        # read-only memory map of the file, so no chunk is ever copied before
+        # being written to the socket.
+        if input_file.source_type != 'path':
+            view = memoryview(input_file.data).cast('B')
+            try:
+                yield view
+            finally:
+                view.release()
+            return
+
+        with open(input_file.path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # A chunk view is still referenced by a request object, the
+                # map is closed once that is garbage collected.
+                pass
+
+    def _plan_chunks(self, size, counter=0, chunk_size=None):
+        chunk_size = chunk_size or self._chunk_size
+        offset = counter * chunk_size
         chunks = []
         while offset < size:
-            end = min(offset + self._chunk_size, size)
+            end = min(offset + chunk_size, size)
             chunks.append({
                 'index': counter,
                 'start': offset,
@@ -251,109 +1086,37 @@ class Client:
             offset = end
             counter = counter + 1
 
-        if not chunks:
-            return result
-
-        def read_chunk(start, end):
-            if input_file.source_type == 'path':
-                with open(input_file.path, 'rb') as chunk_file:
-                    chunk_file.seek(start)
-                    return chunk_file.read(end - start)
-            return input[start:end]
-
-        upload_id_header = upload_id
-        completed_count = chunks[0]['index']
-        uploaded_size = chunks[0]['start']
-        progress_lock = Lock()
-        last_result = None
-        final_result = None
-
-        def is_upload_complete(chunk_result):
-            chunks_uploaded = chunk_result.get('chunksUploaded')
-            if chunks_uploaded is None:
-                return False
-            chunks_total = chunk_result.get('chunksTotal', total_chunks)
-            return int(chunks_uploaded) >= int(chunks_total)
-
-        def upload_chunk(chunk, current_upload_id):
-            chunk_input = InputFile.from_bytes(
-                read_chunk(chunk['start'], chunk['end']),
-                input_file.filename,
-                getattr(input_file, 'mime_type', None)
-            )
-            chunk_params = {**params, param_name: chunk_input}
-            chunk_headers = {**headers}
-            chunk_headers["content-range"] = f"bytes {chunk['start']}-{chunk['end'] - 1}/{size}"
-            if current_upload_id:
-                chunk_headers["x-appwrite-id"] = current_upload_id
-
-            return self.call(
-                'post',
-                path,
-                chunk_headers,
-                chunk_params,
-            )
-
-        result = upload_chunk(chunks[0], upload_id_header)
-        last_result = result
-        if "$id" in result:
-            upload_id_header = result["$id"]
-
-        completed_count = chunks[0]['index'] + 1
-        uploaded_size = chunks[0]['end']
-
-        if on_progress is not None:
-            on_progress({
-                "$id": result.get("$id"),
-                "progress": uploaded_size / size * 100,
-                "sizeUploaded": uploaded_size,
-                "chunksTotal": total_chunks,
-                "chunksUploaded": completed_count,
-            })
+        return chunks
+
+    def _chunk_request(self, headers, params, param_name, input_file, buffer, chunk, size, upload_id):
+        chunk_input = InputFile.from_bytes(
+            buffer[chunk['start']:chunk['end']],
+            input_file.filename,
+            getattr(input_file, 'mime_type', None)
+        )
+        chunk_params = {**params, param_name: chunk_input}
+        chunk_headers = {**headers}
+        chunk_headers["content-range"] = f"bytes {chunk['start']}-{chunk['end'] - 1}/{size}"
+        if upload_id:
+            chunk_headers["x-appwrite-id"] = upload_id
+
+        return chunk_headers, chunk_params
+
+    def _upload_progress(self, upload_id, uploaded_size, size, total_chunks, completed_count):
+        return {
+            "$id": upload_id,
+            "progress": uploaded_size / size * 100,
+            "sizeUploaded": uploaded_size,
+            "chunksTotal": total_chunks,
+            "chunksUploaded": completed_count,
+        }
 
-        def upload_remaining_chunk(chunk):
-            nonlocal completed_count, uploaded_size, last_result, final_result
-            chunk_result = upload_chunk(chunk, upload_id_header)
-            with progress_lock:
-                completed_count = completed_count + 1
-                uploaded_size = uploaded_size + (chunk['end'] - chunk['start'])
-                last_result = chunk_result
-                if is_upload_complete(chunk_result):
-                    final_result = chunk_result
-                if on_progress is not None:
-                    on_progress({
-                        "$id": upload_id_header,
-                        "progress": uploaded_size / size * 100,
-                        "sizeUploaded": uploaded_size,
-                        "chunksTotal": total_chunks,
-                        "chunksUploaded": completed_count,
-                    })
-
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            futures = [executor.submit(upload_remaining_chunk, chunk) for chunk in chunks[1:]]
-            for future in as_completed(futures):
-                future.result()
-
-        return final_result or last_result
+    def _is_upload_complete(self, chunk_result, total_chunks):
+        chunks_uploaded = chunk_result.get('chunksUploaded')
+        if chunks_uploaded is None:
+            return False
+        chunks_total = chunk_result.get('chunksTotal', total_chunks)
+        return int(chunks_uploaded) >= int(chunks_total)
 
     def flatten(self, data, prefix='', stringify=False):
-        output = {}
-        i = 0
-
-        for key in data:
-            value = data[key] if isinstance(data, dict) else key
-            finalKey = prefix + '[' + key +']' if prefix else key
-            finalKey = prefix + '[' + str(i) +']' if isinstance(data, list) else finalKey
-            i += 1
-
-            if isinstance(value, list) or isinstance(value, dict):
-                output = {**output, **self.flatten(value, finalKey, stringify)}
-            elif isinstance(value, bool):
-                output[finalKey] = 'true' if value else 'false'
-            else:
-                if stringify:
-                    output[finalKey] = str(value)
-                else:
-                    output[finalKey] = value
-
-        return output
+        return flatten(data, prefix, stringify)
@@ -0,0 +1,108 @@
+import asyncio
+from threading import Event, Lock
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error', 'abandoned')
+
+    def __init__(self, done):
+        self.done = done
+        self.result = None
+        self.error = None
+        self.abandoned = False
+
+class RequestCoalescer:
+    """Shares one round trip between identical GET calls that are in flight at the same time
+
+    The first call for a key sends the request; calls for the same key that
+    arrive before it finishes wait for it and receive the same response,
+    or the same error. When the sending call is cancelled or interrupted
+    instead, a waiting call sends the request again. Keys cover the path, query parameters and every
+    request header, so callers authenticating differently never share a
+    response. Each caller decodes the shared body into its own result, so a
+    caller changing its result does not affect the others. Nothing is kept
+    once the request finishes, see ResponseCache for that.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._async_flights = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._flights) + len(self._async_flights)
+
+    def key(self, method, path, params, headers):
+        return (
+            method.lower(),
+            path,
+            tuple(sorted((str(name), str(value)) for name, value in params.items())),
+            tuple(sorted((name.lower(), str(value)) for name, value in headers.items())),
+        )
+
+    def do(self, key, send):
+        """Return (result of send(), shared), where shared tells whether the result came from another caller"""
+
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = _Flight(Event())
+
+            if not leader:
+                flight.done.wait()
+                if flight.abandoned:
+                    continue
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result, True
+
+            try:
+                flight.result = send()
+            except Exception as error:
+                flight.error = error
+                raise
+            except BaseException:
+                # Cancellation and interrupts concern the sending call alone.
+                flight.abandoned = True
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+            return flight.result, False
+
+    async def do_async(self, key, send):
+        """Like do() for calls made on an event loop, send returns an awaitable"""
+
+        while True:
+            with self._lock:
+                flight = self._async_flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._async_flights[key] = _Flight(asyncio.Event())
+
+            if not leader:
+                await flight.done.wait()
+                if flight.abandoned:
+                    continue
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result, True
+
+            try:
+                flight.result = await send()
+            except Exception as error:
+                flight.error = error
+                raise
+            except BaseException:
+                # Cancellation and interrupts concern the sending call alone.
+                flight.abandoned = True
+                raise
+            finally:
+                with self._lock:
+                    del self._async_flights[key]
+                flight.done.set()
+
+            return flight.result, False
@@ -0,0 +1,73 @@
+import json
+from ..exception import AppwriteException
+from ..models.base_model import AppwriteModel
+from .value_class_encoder import ValueClassEncoder
+
+def _encode_model(value):
+    # orjson and msgspec encode enums themselves, models are the only values
+    # they hand back.
+    if isinstance(value, AppwriteModel):
+        return value.to_dict()
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+class JsonCodec:
+    """Encodes request bodies and decodes responses with the standard library json module"""
+
+    name = 'json'
+
+    def encode(self, value):
+        return json.dumps(value, cls=ValueClassEncoder)
+
+    def decode(self, data):
+        return json.loads(data)
+
+class OrjsonCodec:
+    """Encodes request bodies and decodes responses with orjson"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as error:
+            raise AppwriteException('OrjsonCodec requires orjson, install it with: pip install orjson') from error
+
+        self._orjson = orjson
+
+    def encode(self, value):
+        return self._orjson.dumps(value, default=_encode_model, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, data):
+        return self._orjson.loads(data)
+
+class MsgspecCodec:
+    """Encodes request bodies and decodes responses with msgspec"""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        try:
+            import msgspec.json
+        except ImportError as error:
+            raise AppwriteException('MsgspecCodec requires msgspec, install it with: pip install msgspec') from error
+
+        self._encode = msgspec.json.encode
+        self._decode = msgspec.json.decode
+
+    def encode(self, value):
+        return self._encode(value, enc_hook=_encode_model)
+
+    def decode(self, data):
+        return self._decode(data)
+
+def default_json_codec():
+    """The fastest codec available: orjson, then msgspec, then the standard library"""
+
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except AppwriteException:
+            pass
+
+    return JsonCodec()
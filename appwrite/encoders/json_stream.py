@@ -0,0 +1,123 @@
+import codecs
+import json
+import re
+from ..exception import AppwriteException
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+class JsonItemStream:
+    """Yields the items of one array member of a JSON object while the object is still arriving
+
+    chunks is an iterable of bytes, such as the body chunks of a streamed
+    response. Only the item being decoded is buffered. The other members of
+    the object are decoded into fields as they go by, so members placed
+    before the array, like the total of a list response, are known once the
+    first item is yielded.
+    """
+
+    def __init__(self, chunks, key):
+        self.fields = {}
+        self._chunks = iter(chunks)
+        self._key = key
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        self._expect('{')
+        if self._peek() == '}':
+            return
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise self._error('Expecting a member name')
+
+            self._expect(':')
+            if key == self._key and self._peek() == '[':
+                self._pos += 1
+                yield from self._items()
+            else:
+                self.fields[key] = self._value()
+
+            separator = self._peek()
+            self._pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise self._error("Expecting ',' or '}'")
+
+    def _items(self):
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+
+            separator = self._peek()
+            self._pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise self._error("Expecting ',' or ']'")
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as error:
+                if not self._read():
+                    raise AppwriteException(f'Invalid JSON response: {error}') from error
+                continue
+
+            # A number running to the end of the buffer may go on in the
+            # next chunk.
+            if end == len(self._buffer) and self._read():
+                continue
+
+            self._pos = end
+            return value
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                raise self._error('Unexpected end of response')
+
+    def _read(self):
+        """Append at least as much text as is pending to the buffer, False at the end of the response"""
+
+        if self._eof:
+            return False
+
+        pending = self._buffer[self._pos:]
+        parts = [pending]
+        read = 0
+        while read < max(len(pending), 1):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                parts.append(self._text.decode(b'', final=True))
+                break
+
+            text = self._text.decode(chunk)
+            parts.append(text)
+            read += len(text)
+
+        self._buffer = ''.join(parts)
+        self._pos = 0
+        return True
+
+    def _error(self, message):
+        return AppwriteException(f'Invalid JSON response: {message} at {self._buffer[self._pos:self._pos + 20]!r}')
@@ -0,0 +1,48 @@
+import binascii
+import os
+
+def _quote(value):
+    return str(value).translate({10: '%0A', 13: '%0D', 34: '%22'})
+
+class MultipartEncoder:
+    """Streams a multipart/form-data body without copying file contents
+
+    File data may be any buffer (bytes, memoryview, mmap slice) and is yielded
+    as a memoryview between the small encoded part headers, so the body is
+    never assembled in memory. The encoder has a length, so it is sent with a
+    Content-Length header, and can be iterated more than once.
+    """
+
+    def __init__(self, fields, files):
+        self.boundary = binascii.hexlify(os.urandom(16)).decode()
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self._parts = []
+
+        for name, value in fields.items():
+            self._parts.append(
+                self._header(name) + str(value).encode() + b'\r\n'
+            )
+
+        for name, filename, data in files:
+            self._parts.append(self._header(name, filename))
+            self._parts.append(memoryview(data).cast('B'))
+            self._parts.append(b'\r\n')
+
+        self._parts.append(f'--{self.boundary}--\r\n'.encode())
+        self._length = sum(len(part) for part in self._parts)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(self._parts)
+
+    async def __aiter__(self):
+        for part in self._parts:
+            yield part
+
+    def _header(self, name, filename=None):
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        return f'--{self.boundary}\r\nContent-Disposition: {disposition}\r\n\r\n'.encode()
@@ -0,0 +1,36 @@
+from enum import Enum
+from ..models.base_model import AppwriteModel
+
+def flatten(data, prefix='', stringify=False):
+    """Flattens nested params into `key[child][0]` form in a single pass
+
+    Enums are encoded by value and models by their dict, so params do not
+    need to be normalized beforehand.
+    """
+
+    output = {}
+    _flatten_into(output, data, prefix, stringify)
+    return output
+
+def _flatten_into(output, data, prefix, stringify):
+    if isinstance(data, dict):
+        keys = [f'{prefix}[{key}]' for key in data] if prefix else list(data)
+        values = data.values()
+    else:
+        keys = [f'{prefix}[{index}]' for index in range(len(data))]
+        values = data
+
+    for key, value in zip(keys, values):
+        if type(value) is str:
+            output[key] = value
+        elif isinstance(value, (dict, list)):
+            _flatten_into(output, value, key, stringify)
+        elif isinstance(value, bool):
+            output[key] = 'true' if value else 'false'
+        elif isinstance(value, AppwriteModel):
+            _flatten_into(output, value.to_dict(), key, stringify)
+        else:
+            if isinstance(value, Enum):
+                value = value.value
+
+            output[key] = str(value) if stringify else value
@@ -0,0 +1,57 @@
+import re
+from enum import Enum
+
+_PATH_PARAM = re.compile(r'\{(\w+)\}')
+
+def body_kind(content_type):
+    if content_type.startswith('multipart/form-data'):
+        return 'multipart'
+
+    if content_type.startswith('application/json'):
+        return 'json'
+
+    return None
+
+class Endpoint:
+    """An API endpoint compiled once when its service is defined
+
+    Holds everything about a request that does not change between calls: the
+    method, a path formatter, the static headers, whether the project header
+    is sent and how the body and response are encoded.
+    """
+
+    __slots__ = ('method', 'path', 'headers', 'response_type', 'project', 'params', 'body', 'service', 'operation', '_template')
+
+    def __init__(self, method, path, headers=None, response_type='json', project=True):
+        self.method = method
+        self.path = path
+        self.headers = dict(headers or {})
+        self.response_type = response_type
+        self.project = project
+        self.params = tuple(_PATH_PARAM.findall(path))
+        self._template = _PATH_PARAM.sub('{}', path)
+
+        self.body = body_kind(self.headers.get('content-type', ''))
+        self.service = None
+        self.operation = None
+
+    def __set_name__(self, owner, name):
+        # Generated services name the attribute after the method, e.g.
+        # TablesDB._get_row_endpoint belongs to TablesDB.get_row.
+        self.service = owner.__name__
+        self.operation = name.strip('_').removesuffix('_endpoint')
+
+    def __repr__(self):
+        return f'Endpoint({self.method!r}, {self.path!r})'
+
+    def format_path(self, values=()):
+        if not self.params:
+            return self.path
+
+        return self._template.format(*[value.value if isinstance(value, Enum) else value for value in values])
+
+    def request_headers(self, project):
+        if not self.project:
+            return self.headers
+
+        return {'X-Appwrite-Project': project, **self.headers}
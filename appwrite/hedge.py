@@ -0,0 +1,79 @@
+from collections import deque
+from fnmatch import fnmatchcase
+from threading import Lock
+from .exception import AppwriteException
+
+class HedgePolicy:
+    """Sends a second copy of slow GET calls and uses whichever response arrives first
+
+    The copy is sent once a call has been waiting longer than the given
+    percentile of the latencies recently seen on its route, clamped between
+    min_delay and max_delay seconds. Until a route has min_samples
+    latencies, calls on it are not hedged. routes limits hedging to route
+    templates matching one of the fnmatch patterns, such as
+    '/tablesdb/*/tables/*/rows/*'; by default every GET call is hedged.
+    """
+
+    def __init__(self, percentile=0.95, min_delay=0.005, max_delay=2.0, min_samples=20, window=256, routes=None):
+        if not 0 < percentile < 1:
+            raise AppwriteException('Hedge percentile must be between 0 and 1')
+
+        if min_delay < 0 or max_delay < min_delay:
+            raise AppwriteException('Hedge delays must satisfy 0 <= min_delay <= max_delay')
+
+        if min_samples < 1 or window < min_samples:
+            raise AppwriteException('Hedge window must hold at least min_samples latencies, and min_samples must be at least 1')
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.routes = tuple(routes) if routes is not None else None
+        self._latencies = {}
+        self._hedges = {}
+        self._wins = {}
+        self._lock = Lock()
+
+    def applies(self, method, route):
+        if method != 'get':
+            return False
+
+        return self.routes is None or any(fnmatchcase(route, pattern) for pattern in self.routes)
+
+    def delay(self, route):
+        """Seconds to wait for a response before sending the copy, or None while the route has too few latencies"""
+
+        with self._lock:
+            latencies = self._latencies.get(route)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+
+            ordered = sorted(latencies)
+
+        delay = ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def record(self, route, latency):
+        with self._lock:
+            latencies = self._latencies.get(route)
+            if latencies is None:
+                latencies = self._latencies[route] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def record_hedge(self, route, won):
+        with self._lock:
+            self._hedges[route] = self._hedges.get(route, 0) + 1
+            self._wins[route] = self._wins.get(route, 0) + won
+
+    def stats(self):
+        """Hedges sent, hedges that answered first and the current delay of every route"""
+
+        return {
+            route: {
+                'hedges': self._hedges.get(route, 0),
+                'wins': self._wins.get(route, 0),
+                'delay': self.delay(route),
+            }
+            for route in list(self._latencies)
+        }
@@ -0,0 +1,136 @@
+import bisect
+import time
+from contextvars import ContextVar
+from threading import Lock
+
+# The event of the call whose response is being handled in this context, so
+# that Service._parse_response can add its validation time to it.
+current_event = ContextVar('appwrite_current_event', default=None)
+
+class RequestEvent:
+    """One API call or upload as seen by hooks
+
+    timings maps each phase that ran to its duration in seconds: serialize,
+    ttfb (sending the request until the response headers arrive, including
+    waiting for a connection and for retries), download, decode and validate.
+    Hooks may add headers to `headers` in before_request. coalesced is set
+    when the call received the response of an identical call in flight.
+    kind is 'upload' for a whole chunked upload, 'probe' for the call asking
+    how far an earlier upload got, which fails with 404 when there was none,
+    and 'call' otherwise.
+    """
+
+    def __init__(self, method, path, endpoint=None, kind='call', hooks=()):
+        self.method = method
+        self.path = path
+        self.endpoint = endpoint
+        self.kind = kind
+        self.hooks = tuple(hooks)
+        self.headers = None
+        self.status = None
+        self.attempts = 0
+        self.chunks = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.cached = False
+        self.coalesced = False
+        self.error = None
+        self.result = None
+        self.timings = {}
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    @property
+    def route(self):
+        """The path template when the call went through an Endpoint, otherwise the path"""
+
+        return self.endpoint.path if self.endpoint is not None else self.path
+
+    @property
+    def duration(self):
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+class Hook:
+    """Base class for client hooks, override the callbacks you need"""
+
+    def before_request(self, event):
+        pass
+
+    def after_response(self, event):
+        pass
+
+    def on_error(self, event):
+        pass
+
+    def after_parse(self, event):
+        pass
+
+class LatencyHistogram(Hook):
+    """Aggregates call latencies into a histogram per method and route
+
+    Buckets are upper bounds in seconds. Failed calls are counted under their
+    route as well, cached responses are skipped. Whole chunked uploads are
+    keyed 'UPLOAD /route', apart from the calls sending their chunks, and a
+    resume probe finding no earlier upload is not counted as an error.
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._routes = {}
+        self._lock = Lock()
+
+    def after_response(self, event):
+        self._record(event)
+
+    def on_error(self, event):
+        self._record(event)
+
+    def _record(self, event):
+        if event.cached:
+            return
+
+        duration = event.duration
+        key = ('UPLOAD' if event.kind == 'upload' else event.method.upper()) + ' ' + event.route
+        failed = event.error is not None and not (event.kind == 'probe' and event.status == 404)
+        with self._lock:
+            route = self._routes.get(key)
+            if route is None:
+                route = self._routes[key] = {'count': 0, 'errors': 0, 'sum': 0.0, 'max': 0.0, 'buckets': [0] * (len(self.buckets) + 1)}
+
+            route['count'] += 1
+            route['errors'] += failed
+            route['sum'] += duration
+            route['max'] = max(route['max'], duration)
+            route['buckets'][bisect.bisect_left(self.buckets, duration)] += 1
+
+    def percentile(self, route, quantile):
+        """Upper bound of the bucket holding the given quantile (0-1) of a route's calls"""
+
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                return None
+
+            rank = quantile * stats['count']
+            seen = 0
+            for index, count in enumerate(stats['buckets']):
+                seen += count
+                if seen >= rank and count:
+                    return self.buckets[index] if index < len(self.buckets) else stats['max']
+
+            return stats['max']
+
+    def snapshot(self):
+        """Copy of the statistics per route, keyed by 'METHOD /route/{param}' or 'UPLOAD /route/{param}'"""
+
+        with self._lock:
+            return {
+                route: {**stats, 'buckets': dict(zip(self.buckets + (float('inf'),), stats['buckets']))}
+                for route, stats in self._routes.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Type, TypeVar
+from inspect import isclass
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 ModelType = TypeVar('ModelType', bound='AppwriteModel')
 
+# Annotations whose values are used as they are by from_trusted.
+_PLAIN_TYPES = (Any, str, float, int, bool, type(None))
+
+# Per model class: the field names keyed by alias; how to build the fields
+# that are not used as they are; the optional fields, to fill in their
+# defaults; and the defaults of private attributes.
+_TRUSTED_PLANS = {}
+
 class AppwriteModel(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -20,8 +29,122 @@ class AppwriteModel(BaseModel):
 
         return cls.model_validate(data)
 
+    @classmethod
+    def from_trusted(cls: Type[ModelType], data: Dict[str, Any]) -> ModelType:
+        """Create an instance from data known to match the model, such as an Appwrite response, without validating it.
+
+        Nested models are built the same way. Only fields holding enums or a
+        choice between several models are validated, to pick their type.
+        """
+        plan = _TRUSTED_PLANS.get(cls)
+        if plan is None:
+            plan = _TRUSTED_PLANS[cls] = _trusted_plan(cls)
+        names, builders, defaults, private = plan
+
+        values = {}
+        extra = {}
+        for key, value in data.items():
+            name = names.get(key)
+            if name is None:
+                extra[key] = value
+            else:
+                values[name] = value
+
+        for name, kind, build in builders:
+            value = values.get(name)
+            if value is None:
+                continue
+            if kind == 'model':
+                values[name] = build(value) if isinstance(value, dict) else value
+            elif kind == 'list':
+                values[name] = [build(item) if isinstance(item, dict) else item for item in value]
+            elif kind == 'dict':
+                values[name] = {k: build(item) if isinstance(item, dict) else item for k, item in value.items()}
+            else:
+                values[name] = build(value)
+
+        fields_set = set(values)
+        if defaults and len(fields_set) < len(names):
+            for name, field in defaults:
+                if name not in values:
+                    values[name] = field.get_default(call_default_factory=True)
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, '__dict__', values)
+        object.__setattr__(instance, '__pydantic_fields_set__', fields_set)
+        object.__setattr__(instance, '__pydantic_extra__', extra)
+        object.__setattr__(instance, '__pydantic_private__', {name: default() for name, default in private} if private else None)
+        return instance
+
+    @classmethod
+    def _parse(cls: Type[ModelType], data: Dict[str, Any], trusted: bool = False) -> ModelType:
+        return cls.from_trusted(data) if trusted else cls.model_validate(data)
+
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(by_alias=True, mode='json', exclude_unset=True)
 
+    def to_record(self) -> Any:
+        """Compact, immutable copy of this model, see appwrite.records.Record"""
+        from ..records import record_type
+        return record_type(type(self)).from_model(self)
+
     def to_json(self) -> str:
         return self.model_dump_json(by_alias=True)
+
+def _trusted_plan(cls):
+    names = {}
+    builders = []
+    defaults = []
+    for name, field in cls.model_fields.items():
+        names[field.alias or name] = name
+        kind, build = _trusted_builder(field.annotation)
+        if kind is not None:
+            builders.append((name, kind, build))
+        if not field.is_required():
+            defaults.append((name, field))
+
+    private = [
+        (name, attr.default_factory or (lambda attr=attr: attr.get_default()))
+        for name, attr in cls.__private_attributes__.items()
+    ]
+    return names, builders, defaults, private
+
+def _trusted_builder(annotation):
+    """How from_trusted builds a value of annotation: (None, None) keeps it, otherwise (kind, callable)"""
+
+    if _is_plain(annotation):
+        return None, None
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1:
+            return _trusted_builder(options[0])
+    elif origin in (list, List) and args:
+        if _is_plain(args[0]):
+            return None, None
+        if _is_model(args[0]):
+            return 'list', args[0].from_trusted
+    elif origin in (dict, Dict) and len(args) == 2:
+        if _is_plain(args[1]):
+            return None, None
+        if _is_model(args[1]):
+            return 'dict', args[1].from_trusted
+    elif _is_model(annotation):
+        return 'model', annotation.from_trusted
+
+    return 'validate', TypeAdapter(annotation).validate_python
+
+def _is_plain(annotation):
+    if annotation in _PLAIN_TYPES or annotation in (list, dict, List, Dict):
+        return True
+
+    origin = get_origin(annotation)
+    if origin in (list, List, dict, Dict, Union):
+        return all(_is_plain(arg) for arg in get_args(annotation))
+
+    return False
+
+def _is_model(annotation):
+    return isclass(annotation) and issubclass(annotation, AppwriteModel)
@@ -35,15 +35,20 @@ class Document(AppwriteModel, Generic[T]):
     permissions: List[Any] = Field(..., alias='$permissions')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'Document[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'Document[T]':
         """Create Document instance with typed data."""
         internal_aliases = {'$id', '$sequence', '$collectionId', '$databaseId', '$createdAt', '$updatedAt', '$permissions'}
-        internal_fields = {k: v for k, v in data.items() if k in internal_aliases}
-        user_data = {k: v for k, v in data.items() if k not in internal_aliases and k != 'data'}
+        internal_fields = {}
+        user_data = {}
+        for k, v in data.items():
+            if k in internal_aliases:
+                internal_fields[k] = v
+            elif k != 'data':
+                user_data[k] = v
         nested = data.get('data')
         if isinstance(nested, dict):
             user_data = {**nested, **user_data}
-        instance = cls.model_validate(internal_fields)
+        instance = cls._parse(internal_fields, trusted)
         instance._data = model_type(**user_data) if model_type is not dict else user_data
         return instance
 
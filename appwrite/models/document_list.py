@@ -1,7 +1,9 @@
+from functools import partial
 from typing import Any, Dict, List, Optional, Union, cast, Generic, TypeVar, Type
 from pydantic import Field, PrivateAttr
 
 from .base_model import AppwriteModel
+from .lazy_list import LazyList
 from .document import Document
 
 T = TypeVar('T')
@@ -21,12 +23,29 @@ class DocumentList(AppwriteModel, Generic[T]):
     documents: List[Document[T]] = Field(..., alias='documents')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'DocumentList[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'DocumentList[T]':
         """Create DocumentList instance with typed data."""
-        instance = cls.model_validate(data)
-        if 'documents' in data and data['documents'] is not None:
+        items = data.get('documents')
+        instance = cls._parse({**data, 'documents': []} if items is not None else data, trusted)
+        if items is None:
+            return instance
+        if trusted:
+            # Trusted responses need no validation up front, so each document is
+            # only built when it is read.
+            instance.documents = LazyList(items, partial(Document.with_data, model_type=model_type, trusted=True))
+        else:
             instance.documents = [
-                Document.with_data(row, model_type) 
-                for row in data['documents']
+                Document.with_data(row, model_type)
+                for row in items
             ]
         return instance
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        if isinstance(self.documents, LazyList):
+            self.documents = list(self.documents)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        if isinstance(self.documents, LazyList):
+            self.documents = list(self.documents)
+        return super().model_dump_json(**kwargs)
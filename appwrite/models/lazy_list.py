@@ -0,0 +1,76 @@
+from collections.abc import MutableSequence
+from typing import Any, Callable, Dict, List, TypeVar
+
+T = TypeVar('T')
+
+class LazyList(MutableSequence):
+    """List of models built from their decoded items the first time each one is read
+
+    Items are built at most once and the decoded item is dropped as soon as
+    its model exists, so a page that is only partly read holds little more
+    than the decoded response.
+    """
+
+    __slots__ = ('_items', '_models', '_build')
+
+    def __init__(self, items: List[Dict[str, Any]], build: Callable[[Dict[str, Any]], T]):
+        self._items = list(items)
+        self._models = [None] * len(self._items)
+        self._build = build
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        model = self._models[index]
+        if model is not None:
+            return model
+
+        item = self._items[index]
+        if item is None:
+            # Built by another thread since the check above.
+            return self._models[index]
+
+        model = self._models[index] = self._build(item)
+        self._items[index] = None
+        return model
+
+    def __iter__(self):
+        for index in range(len(self._models)):
+            yield self[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            values = list(value)
+            self._models[index] = values
+            self._items[index] = [None] * len(values)
+            return
+
+        self._models[index] = value
+        self._items[index] = None
+
+    def __delitem__(self, index):
+        del self._models[index]
+        del self._items[index]
+
+    def insert(self, index, value):
+        self._models.insert(index, value)
+        self._items.insert(index, None)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    @property
+    def built(self) -> int:
+        """Number of items whose model has been built"""
+        return len(self._models) - self._models.count(None)
@@ -122,11 +122,11 @@ class Organization(AppwriteModel, Generic[T]):
     projects: List[Any] = Field(..., alias='projects')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'Organization[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'Organization[T]':
         """Create Organization instance with typed data."""
-        instance = cls.model_validate(data)
+        instance = cls._parse(data, trusted)
         if 'prefs' in data and data['prefs'] is not None:
             instance.prefs = Preferences.with_data(
-                data['prefs'], model_type
+                data['prefs'], model_type, trusted
             )
         return instance
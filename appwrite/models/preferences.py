@@ -12,10 +12,10 @@ class Preferences(AppwriteModel, Generic[T]):
     pass
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'Preferences[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'Preferences[T]':
         """Create Preferences instance with typed data."""
         user_data = dict(data)
-        instance = cls.model_validate({})
+        instance = cls._parse({}, trusted)
         instance._data = model_type(**user_data) if model_type is not dict else user_data
         return instance
 
@@ -1,7 +1,9 @@
+from functools import partial
 from typing import Any, Dict, List, Optional, Union, cast, Generic, TypeVar, Type
 from pydantic import Field, PrivateAttr
 
 from .base_model import AppwriteModel
+from .lazy_list import LazyList
 from .row import Row
 
 T = TypeVar('T')
@@ -21,12 +23,29 @@ class RowList(AppwriteModel, Generic[T]):
     rows: List[Row[T]] = Field(..., alias='rows')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'RowList[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'RowList[T]':
         """Create RowList instance with typed data."""
-        instance = cls.model_validate(data)
-        if 'rows' in data and data['rows'] is not None:
+        items = data.get('rows')
+        instance = cls._parse({**data, 'rows': []} if items is not None else data, trusted)
+        if items is None:
+            return instance
+        if trusted:
+            # Trusted responses need no validation up front, so each row is
+            # only built when it is read.
+            instance.rows = LazyList(items, partial(Row.with_data, model_type=model_type, trusted=True))
+        else:
             instance.rows = [
-                Row.with_data(row, model_type) 
-                for row in data['rows']
+                Row.with_data(row, model_type)
+                for row in items
             ]
         return instance
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        if isinstance(self.rows, LazyList):
+            self.rows = list(self.rows)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        if isinstance(self.rows, LazyList):
+            self.rows = list(self.rows)
+        return super().model_dump_json(**kwargs)
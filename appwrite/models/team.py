@@ -33,11 +33,11 @@ class Team(AppwriteModel, Generic[T]):
     prefs: Preferences[T] = Field(..., alias='prefs')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'Team[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'Team[T]':
         """Create Team instance with typed data."""
-        instance = cls.model_validate(data)
+        instance = cls._parse(data, trusted)
         if 'prefs' in data and data['prefs'] is not None:
             instance.prefs = Preferences.with_data(
-                data['prefs'], model_type
+                data['prefs'], model_type, trusted
             )
         return instance
@@ -21,12 +21,13 @@ class TeamList(AppwriteModel, Generic[T]):
     teams: List[Team[T]] = Field(..., alias='teams')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'TeamList[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'TeamList[T]':
         """Create TeamList instance with typed data."""
-        instance = cls.model_validate(data)
-        if 'teams' in data and data['teams'] is not None:
+        items = data.get('teams')
+        instance = cls._parse({**data, 'teams': []} if items is not None else data, trusted)
+        if items is not None:
             instance.teams = [
-                Team.with_data(row, model_type) 
-                for row in data['teams']
+                Team.with_data(row, model_type, trusted)
+                for row in items
             ]
         return instance
@@ -101,11 +101,11 @@ class User(AppwriteModel, Generic[T]):
     impersonatoruserid: Optional[str] = Field(default=None, alias='impersonatorUserId')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'User[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'User[T]':
         """Create User instance with typed data."""
-        instance = cls.model_validate(data)
+        instance = cls._parse(data, trusted)
         if 'prefs' in data and data['prefs'] is not None:
             instance.prefs = Preferences.with_data(
-                data['prefs'], model_type
+                data['prefs'], model_type, trusted
             )
         return instance
@@ -21,12 +21,13 @@ class UserList(AppwriteModel, Generic[T]):
     users: List[User[T]] = Field(..., alias='users')
 
     @classmethod
-    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict) -> 'UserList[T]':
+    def with_data(cls, data: Dict[str, Any], model_type: Type[T] = dict, trusted: bool = False) -> 'UserList[T]':
         """Create UserList instance with typed data."""
-        instance = cls.model_validate(data)
-        if 'users' in data and data['users'] is not None:
+        items = data.get('users')
+        instance = cls._parse({**data, 'users': []} if items is not None else data, trusted)
+        if items is not None:
             instance.users = [
-                User.with_data(row, model_type) 
-                for row in data['users']
+                User.with_data(row, model_type, trusted)
+                for row in items
             ]
         return instance
@@ -0,0 +1,13 @@
+from contextvars import ContextVar
+from .exception import AppwriteException
+
+# 'strict' validates responses into their models, 'trusted' builds the models
+# without validating and 'raw' returns the decoded JSON as it is.
+PARSE_MODES = ('strict', 'trusted', 'raw')
+
+# Parse mode of the calls made in this context, set by Client.parse_mode.
+current_parse_mode = ContextVar('appwrite_parse_mode', default=None)
+
+def check_parse_mode(mode):
+    if mode not in PARSE_MODES:
+        raise AppwriteException('Parse mode must be one of: ' + ', '.join(PARSE_MODES))
@@ -0,0 +1,204 @@
+from enum import Enum
+from operator import itemgetter
+from typing import List, Union, get_args, get_origin
+from .models.base_model import AppwriteModel
+from .models.document import Document
+from .models.execution import Execution
+from .models.file import File
+from .models.membership import Membership
+from .models.row import Row
+
+_SCALARS = (str, int, float, bool)
+
+_RECORD_TYPES = {}
+
+class Record(tuple):
+    """Compact, immutable copy of a model, for keeping many of them in memory
+
+    A record is a tuple of the model's field values, readable by the same
+    attribute names, plus the custom data of rows and documents and any
+    fields the model does not declare. Lists become tuples and nested
+    models become records, the custom data itself is shared with the model
+    it came from. Records compare equal when their type and values are, and
+    hash their ID, or their scalar fields when the model has no ID, so
+    records holding custom data can still be set members and dict keys.
+
+    Create one with model.to_record(), or with from_dict() straight from a
+    decoded response without building the model first. to_model() builds
+    the full model again.
+    """
+
+    __slots__ = ()
+
+    _model = AppwriteModel
+    _fields = ()
+    _aliases = ()
+    _data = False
+    _key = staticmethod(lambda record: ())
+    _nested = {}
+    _enums = {}
+
+    @classmethod
+    def from_model(cls, model):
+        values = [_freeze(getattr(model, name, None)) for name in cls._fields]
+        if cls._data:
+            values.append(model.data)
+        values.append(dict(model.__pydantic_extra__) if model.__pydantic_extra__ else None)
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a decoded response without validating it, values are kept as they are"""
+
+        fields = dict.fromkeys(cls._aliases)
+        rest = {}
+        for key, value in data.items():
+            if key not in fields:
+                rest[key] = value
+            elif key in cls._nested and value is not None:
+                fields[key] = _freeze_dicts(value, cls._nested[key])
+            elif key in cls._enums and value is not None:
+                fields[key] = cls._enums[key](value)
+            else:
+                fields[key] = _freeze(value)
+
+        values = list(fields.values())
+        if cls._data:
+            nested = rest.pop('data', None)
+            values.append({**nested, **rest} if isinstance(nested, dict) else rest)
+            rest = None
+        values.append(rest or None)
+        return tuple.__new__(cls, values)
+
+    def to_model(self):
+        values = {alias: _thaw(value) for alias, value in zip(self._aliases, self)}
+        extra = self[-1]
+        if extra:
+            values.update(extra)
+
+        model = self._model.model_validate(values)
+        if self._data:
+            model._data = self[-2]
+        return model
+
+    def to_dict(self):
+        return self.to_model().to_dict()
+
+    @property
+    def extra(self):
+        """Values of fields the model does not declare, None when there are none"""
+        return self[-1]
+
+    def __eq__(self, other):
+        # Plain tuples would otherwise compare equal to records.
+        return type(other) is type(self) and tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._key(self))
+
+    def __reduce__(self):
+        return _rebuild, (self._model, tuple(self))
+
+    def __repr__(self):
+        names = self._fields + (('data',) if self._data else ())
+        values = ', '.join(f'{name}={value!r}' for name, value in zip(names, self))
+        return f'{type(self).__name__}({values})'
+
+def record_type(model):
+    """The Record subclass holding instances of model"""
+
+    model = model.__pydantic_generic_metadata__.get('origin') or model
+    record = _RECORD_TYPES.get(model)
+    if record is not None:
+        return record
+
+    fields = tuple(model.model_fields)
+    data = '_data' in model.__private_attributes__
+    namespace = {
+        '__slots__': (),
+        '__module__': __name__,
+        '_model': model,
+        '_fields': fields,
+        '_aliases': tuple(field.alias or name for name, field in model.model_fields.items()),
+        '_data': data,
+        '_key': staticmethod(_hash_key(model)),
+        '_nested': {
+            field.alias or name: nested
+            for name, field in model.model_fields.items()
+            for nested in [_nested_model(field.annotation)] if nested is not None
+        },
+        '_enums': {
+            field.alias or name: enum
+            for name, field in model.model_fields.items()
+            for enum in [_enum(field.annotation)] if enum is not None
+        },
+    }
+    for index, name in enumerate(fields + (('data',) if data else ())):
+        namespace[name] = property(itemgetter(index))
+
+    record = _RECORD_TYPES[model] = type(model.__name__ + 'Record', (Record,), namespace)
+    return record
+
+def _hash_key(model):
+    names = list(model.model_fields)
+    if 'id' in names:
+        return itemgetter(names.index('id'))
+
+    indexes = [index for index, field in enumerate(model.model_fields.values()) if _is_scalar(field.annotation)]
+    return itemgetter(*indexes) if indexes else Record._key
+
+def _rebuild(model, values):
+    return tuple.__new__(record_type(model), values)
+
+def _freeze(value):
+    if isinstance(value, AppwriteModel):
+        return record_type(type(value)).from_model(value)
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _freeze_dicts(value, model):
+    if isinstance(value, dict):
+        return record_type(model).from_dict(value)
+    if isinstance(value, list):
+        return tuple(_freeze_dicts(item, model) for item in value)
+    return value
+
+def _thaw(value):
+    if isinstance(value, Record):
+        return value.to_model()
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+def _nested_model(annotation):
+    """The model held by fields annotated with a model, or an optional or list of one"""
+
+    if get_origin(annotation) in (Union, list, List):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _nested_model(args[0]) if len(args) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, AppwriteModel):
+        return annotation
+    return None
+
+def _enum(annotation):
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _enum(args[0]) if len(args) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    return None
+
+def _is_scalar(annotation):
+    if get_origin(annotation) is Union:
+        return all(arg is type(None) or _is_scalar(arg) for arg in get_args(annotation))
+    return annotation in _SCALARS or (isinstance(annotation, type) and issubclass(annotation, Enum))
+
+RowRecord = record_type(Row)
+DocumentRecord = record_type(Document)
+FileRecord = record_type(File)
+ExecutionRecord = record_type(Execution)
+MembershipRecord = record_type(Membership)
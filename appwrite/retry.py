@@ -0,0 +1,104 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from .exception import AppwriteException
+
+DEFAULT_METHODS = ('get', 'head', 'options', 'put', 'delete')
+
+def is_idempotent(method, headers, methods=DEFAULT_METHODS, idempotency_header='idempotency-key'):
+    """Whether a request can be sent again without repeating its effect"""
+
+    if method.lower() in methods:
+        return True
+
+    names = {name.lower() for name in headers}
+    if idempotency_header is not None and idempotency_header in names:
+        return True
+
+    # Re-sending a chunk of an upload the server already knows by ID
+    # overwrites the same byte range.
+    return 'content-range' in names and 'x-appwrite-id' in names
+
+class RetryPolicy:
+    """Retries transient failures of Client.call with exponential backoff and jitter
+
+    A request is retried when it failed to connect or was answered with one
+    of the retry statuses, but only when it is safe to send it again: its
+    method is one of `methods`, it carries the `idempotency_header`, or it is
+    a chunk of an upload that already has an ID. The delay before retry n is
+    backoff * backoff_factor ** (n - 1), capped at max_backoff and randomised
+    with full jitter, unless the server sent a Retry-After header.
+
+    on_retry, when given, is called before every retry with a dict holding the
+    method, path, attempt number, delay, status code, error and the time
+    spent on the call so far.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff=0.5,
+        backoff_factor=2.0,
+        max_backoff=30.0,
+        jitter=True,
+        retry_statuses=(408, 429, 500, 502, 503, 504),
+        respect_retry_after=True,
+        methods=DEFAULT_METHODS,
+        idempotency_header='idempotency-key',
+        on_retry=None
+    ):
+        if max_attempts < 1:
+            raise AppwriteException('Retry attempts must be at least 1')
+
+        if backoff < 0 or max_backoff < 0:
+            raise AppwriteException('Retry backoff must not be negative')
+
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.methods = frozenset(method.lower() for method in methods)
+        self.idempotency_header = idempotency_header.lower() if idempotency_header else None
+        self.on_retry = on_retry
+
+    def is_idempotent(self, method, headers):
+        return is_idempotent(method, headers, self.methods, self.idempotency_header)
+
+    def delay(self, attempt, retry_after=None):
+        if self.respect_retry_after and retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_backoff)
+
+        delay = min(self.backoff * self.backoff_factor ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retry_delay(self, method, headers, attempt, status=None, retry_after=None, connection_error=False):
+        """Seconds to wait before retrying a failed attempt, or None when it must not be retried"""
+
+        if attempt >= self.max_attempts:
+            return None
+
+        if not connection_error and status not in self.retry_statuses:
+            return None
+
+        if not self.is_idempotent(method, headers):
+            return None
+
+        return self.delay(attempt, retry_after)
+
+    @staticmethod
+    def parse_retry_after(value):
+        if not value:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
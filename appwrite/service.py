@@ -1,50 +1,584 @@
+import inspect
+import os
+import time
+from collections.abc import MutableSequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
 from enum import Enum
-from typing import Any, Optional, Type, TypeVar
+from itertools import islice
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Type, TypeVar, Union, get_args, get_origin
 
 from pydantic import ValidationError
 
 from .client import Client
+from .encoders.json_stream import JsonItemStream
 from .exception import AppwriteException
+from .hooks import current_event
 from .models.base_model import AppwriteModel
+from .query import Query
+from .retry import is_idempotent
 
 ModelType = TypeVar('ModelType', bound=AppwriteModel)
 
+class _RequestCaptured(BaseException):
+    pass
+
+class _RequestRecorder:
+    """Stands in for the client while a sync service method builds its request"""
+
+    _pending = object()
+
+    def __init__(self, client, response=_pending):
+        self._client = client
+        self._response = response
+        self.request = None
+
+    def get_config(self, key):
+        return self._client.get_config(key)
+
+    def get_parse_mode(self):
+        return self._client.get_parse_mode()
+
+    def call(self, *args, **kwargs):
+        return self._record('call', args, kwargs)
+
+    def call_endpoint(self, endpoint, params=None, path_values=()):
+        return self._record('call_endpoint', (endpoint, params, path_values), {})
+
+    def chunked_upload(self, *args, **kwargs):
+        return self._record('chunked_upload', args, kwargs)
+
+    def call_args(self):
+        """Keyword arguments of client.stream for the recorded request, None unless it is a single call"""
+
+        if self.request is None:
+            return None
+
+        name, args, _ = self.request
+        if name == 'call_endpoint':
+            endpoint, params, path_values = args
+            return {
+                'method': endpoint.method,
+                'path': endpoint.format_path(path_values),
+                'headers': endpoint.request_headers(self.get_config('project')),
+                'params': params,
+                'endpoint': endpoint,
+            }
+        if name == 'call':
+            return dict(zip(('method', 'path', 'headers', 'params'), args))
+        return None
+
+    def _record(self, name, args, kwargs):
+        self.request = (name, args, kwargs)
+        if self._response is self._pending:
+            raise _RequestCaptured()
+
+        return self._response
+
+class BulkWriteResult:
+    """Outcome of writing a single row or document with Service.bulk_write
+
+    ambiguous is set when the write failed in a way that does not tell
+    whether the server applied it, a lost connection or a 5xx response.
+    """
+
+    def __init__(self, item: Dict[str, Any], error: Optional[AppwriteException] = None, ambiguous: bool = False):
+        self.item = item
+        self.error = error
+        self.ambiguous = ambiguous
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
 class Service:
     def __init__(self, client: Client):
         self.client = client
 
     def _normalize_value(self, value: Any) -> Any:
+        # Lists and dicts are passed through untouched: the client encodes the
+        # enums and models nested in them while serializing the request, so
+        # large payloads are walked once instead of being copied here first.
         if isinstance(value, AppwriteModel):
             return value.to_dict()
 
         if isinstance(value, Enum):
             return value.value
 
-        if isinstance(value, list):
-            return [self._normalize_value(item) for item in value]
-
-        if isinstance(value, dict):
-            return {
-                key: self._normalize_value(item)
-                for key, item in value.items()
-            }
-
         return value
 
     def _parse_response(
         self,
         response: Any,
-        model: Optional[Type[ModelType]] = None
+        model: Optional[Type[ModelType]] = None,
+        model_type: Optional[Type[Any]] = None
     ) -> Any:
+        """Build model from a decoded response according to the parse mode of the client
+
+        model_type is the type of the custom data of models built with
+        with_data, such as rows and documents.
+        """
         if model is None:
             return response
 
         if not isinstance(response, dict):
             return response
 
+        mode = self.client.get_parse_mode()
+        event = current_event.get()
+        if event is None or event.result is not response:
+            return self._validate(response, model, model_type, mode)
+
+        started_at = time.perf_counter()
+        try:
+            return self._validate(response, model, model_type, mode)
+        finally:
+            current_event.set(None)
+            event.timings['validate'] = time.perf_counter() - started_at
+            for hook in event.hooks:
+                hook.after_parse(event)
+
+    def _validate(
+        self,
+        response: Dict[str, Any],
+        model: Type[ModelType],
+        model_type: Optional[Type[Any]] = None,
+        mode: str = 'strict'
+    ) -> Any:
+        if mode == 'raw':
+            return response
+
+        trusted = mode == 'trusted'
         try:
-            return model.model_validate(response)
+            if model_type is not None:
+                return model.with_data(response, model_type, trusted)
+            return model._parse(response, trusted)
         except ValidationError as error:
             raise AppwriteException(
                 f'Unable to parse response into {model.__name__}: {error}'
             ) from error
+
+    def paginate(
+        self,
+        method: Callable[..., Any],
+        *args: Any,
+        queries: Optional[List[str]] = None,
+        page_size: int = 100,
+        prefetch: bool = False,
+        **kwargs: Any
+    ) -> Iterator[Any]:
+        """
+        Iterate over every item returned by a list endpoint, one page at a time.
+
+        Pages are requested with `Query.limit` and `Query.cursor_after` on the
+        last item's `$id`, so each request costs the same however deep the
+        iteration goes, and `total=False` is sent to skip counting. Only the
+        current page (plus the prefetched one) is held in memory.
+
+        Parameters
+        ----------
+        method : Callable
+            Bound list method of a service, e.g. `tables_db.list_rows`.
+        *args : Any
+            Positional arguments for `method`.
+        queries : Optional[List[str]]
+            Extra queries to filter or order by. Must not contain limit, offset or cursor queries.
+        page_size : int
+            Number of items requested per page.
+        prefetch : bool
+            Request the next page on a background thread while the current one is consumed.
+        **kwargs : Any
+            Keyword arguments for `method`.
+
+        Returns
+        -------
+        Iterator[Any]
+            Items of every page, in order
+
+        Raises
+        ------
+        AppwriteException
+            If API request fails
+        """
+
+        if page_size < 1:
+            raise AppwriteException('page_size must be at least 1')
+
+        if 'total' in inspect.signature(method).parameters:
+            kwargs.setdefault('total', False)
+
+        base_queries = list(queries or [])
+
+        def fetch(cursor: Optional[str]) -> List[Any]:
+            page_queries = base_queries + [Query.limit(page_size)]
+            if cursor is not None:
+                page_queries.append(Query.cursor_after(cursor))
+            return self._page_items(method(*args, queries=page_queries, **kwargs))
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            items = fetch(None)
+            while True:
+                next_items = None
+                if len(items) >= page_size:
+                    cursor = self._item_id(items[-1])
+                    if executor is not None:
+                        # The page is parsed in the parse mode of the caller's context.
+                        next_items = executor.submit(copy_context().run, fetch, cursor)
+                    else:
+                        next_items = cursor
+
+                yield from items
+
+                if next_items is None:
+                    return
+
+                items = next_items.result() if executor is not None else fetch(next_items)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _page_items(self, page: Any) -> List[Any]:
+        # Pages are models, or decoded responses in the raw parse mode.
+        if isinstance(page, AppwriteModel):
+            for name in type(page).model_fields:
+                value = getattr(page, name)
+                if name != 'total' and isinstance(value, (list, MutableSequence)):
+                    return value
+        elif isinstance(page, dict):
+            for name, value in page.items():
+                if name != 'total' and isinstance(value, list):
+                    return value
+
+        raise AppwriteException(f'{type(page).__name__} is not a paginated list response')
+
+    def _item_id(self, item: Any) -> str:
+        item_id = item.get('$id') if isinstance(item, dict) else getattr(item, 'id', None)
+        if item_id is None:
+            raise AppwriteException(f'Unable to paginate {type(item).__name__} items without an $id')
+
+        return item_id
+
+    def bulk_write(
+        self,
+        method: Callable[..., Any],
+        *args: Any,
+        items: Iterable[Dict[str, Any]],
+        batch_size: int = 100,
+        workers: int = 4,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        **kwargs: Any
+    ) -> Iterator[BulkWriteResult]:
+        """
+        Write rows or documents from any iterable in concurrent batches.
+
+        Items are consumed lazily in batches of `batch_size` and sent with up
+        to `workers` requests in flight, so only a bounded number of batches
+        is held in memory. Batches answered with 408 or 429 are retried with
+        exponential backoff, and so are batches failing with a network error
+        or 5xx when the method can be repeated without writing twice, such as
+        upserts or requests carrying an idempotency key; the failed items of
+        other batches are reported as ambiguous. Retries are left to the
+        client's RetryPolicy when it covers the method. Batches rejected with
+        400, 409 or 413 are split in halves until the offending items are
+        isolated.
+
+        Parameters
+        ----------
+        method : Callable
+            Bound bulk method of a service, e.g. `tables_db.create_rows` or `databases.upsert_documents`.
+        *args : Any
+            Positional arguments for `method`, e.g. the database and table IDs.
+        items : Iterable[Dict[str, Any]]
+            Rows or documents to write. Generators are consumed lazily.
+        batch_size : int
+            Maximum number of items sent per request.
+        workers : int
+            Number of batches written concurrently.
+        max_retries : int
+            Number of times a batch is retried after a transient error.
+        backoff : float
+            Delay in seconds before the first retry, doubled on every further retry.
+        **kwargs : Any
+            Keyword arguments for `method`.
+
+        Returns
+        -------
+        Iterator[BulkWriteResult]
+            One result per item, in the order batches complete
+        """
+
+        parameters = inspect.signature(method).parameters
+        param_name = next((name for name in ('rows', 'documents') if name in parameters), None)
+        if param_name is None:
+            raise AppwriteException(f'{method.__name__} does not accept rows or documents')
+
+        if batch_size < 1 or workers < 1:
+            raise AppwriteException('batch_size and workers must be at least 1')
+
+        request = self._capture_request(method, args, {**kwargs, param_name: []})
+        policy = self.client._retry_policy
+        check = policy.is_idempotent if policy is not None else is_idempotent
+        idempotent = check(request['method'], request.get('headers') or {})
+        # The client's policy has already retried what it could when it
+        # covers the method, retrying again would multiply the attempts.
+        retry = policy is None or not idempotent
+
+        def write(batch: List[Dict[str, Any]]) -> List[BulkWriteResult]:
+            results = []
+            pending = [batch]
+            while pending:
+                chunk = pending.pop()
+                error = self._write_batch(method, args, kwargs, param_name, chunk, max_retries if retry else 0, backoff, idempotent)
+                if error is None:
+                    results.extend(BulkWriteResult(item) for item in chunk)
+                elif len(chunk) > 1 and error.code in (400, 409, 413):
+                    middle = len(chunk) // 2
+                    pending.extend([chunk[middle:], chunk[:middle]])
+                else:
+                    ambiguous = self._is_ambiguous(error)
+                    results.extend(BulkWriteResult(item, error, ambiguous) for item in chunk)
+            return results
+
+        iterator = iter(items)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = set()
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if batch:
+                    in_flight.add(executor.submit(write, batch))
+
+                if in_flight and (not batch or len(in_flight) >= workers * 2):
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+
+                if not batch and not in_flight:
+                    return
+
+    def _write_batch(
+        self,
+        method: Callable[..., Any],
+        args: Any,
+        kwargs: Dict[str, Any],
+        param_name: str,
+        batch: List[Dict[str, Any]],
+        max_retries: int,
+        backoff: float,
+        idempotent: bool
+    ) -> Optional[AppwriteException]:
+        attempt = 0
+        while True:
+            try:
+                method(*args, **{**kwargs, param_name: batch})
+                return None
+            except AppwriteException as error:
+                # 408 and 429 mean the batch was not processed, after the
+                # other transient errors it may have been.
+                transient = error.code in (408, 429) or (idempotent and self._is_ambiguous(error))
+                if not transient or attempt >= max_retries:
+                    return error
+
+            time.sleep(backoff * 2 ** attempt)
+            attempt += 1
+
+    def stream_list(
+        self,
+        method: Callable[..., Any],
+        *args: Any,
+        chunk_size: int = 64 * 1024,
+        **kwargs: Any
+    ) -> Iterator[Any]:
+        """
+        Iterate over the items of a list endpoint while its response is still arriving.
+
+        The body is parsed incrementally, so the first items can be handled
+        before the last bytes arrive. Only the item being parsed is held in
+        memory, not the whole body and every model. Items are built according
+        to the parse mode of the client.
+
+        Parameters
+        ----------
+        method : Callable
+            Bound list method of a service, e.g. `tables_db.list_rows` or `users.list`.
+        *args : Any
+            Positional arguments for `method`.
+        chunk_size : int
+            Maximum number of bytes read from the connection at once.
+        **kwargs : Any
+            Keyword arguments for `method`.
+
+        Returns
+        -------
+        Iterator[Any]
+            Items of the page, in order
+
+        Raises
+        ------
+        AppwriteException
+            If API request fails
+        """
+
+        call_args, model, model_type = self._capture_list_request(method, args, kwargs)
+        key, item_model = self._list_items_field(method, model)
+        mode = self.client.get_parse_mode()
+
+        def items() -> Iterator[Any]:
+            for item in JsonItemStream(self.client.stream(**call_args, chunk_size=chunk_size), key):
+                yield self._validate(item, item_model, model_type, mode)
+
+        return items()
+
+    def _capture_list_request(self, method: Callable[..., Any], args: Any, kwargs: Dict[str, Any]) -> Any:
+        # The method runs against a recorder answering with an empty body, and
+        # the model it parses that body into is recorded too.
+        recorder = _RequestRecorder(self.client, {})
+        service = type(method.__self__)(recorder)
+        parsed = []
+        service._parse_response = lambda response, model=None, model_type=None: parsed.append((model, model_type))
+        method.__func__(service, *args, **kwargs)
+
+        call_args = recorder.call_args()
+        if call_args is None or not parsed or parsed[0][0] is None:
+            raise AppwriteException(f'{method.__name__} cannot be streamed')
+
+        return (call_args,) + parsed[0]
+
+    def _list_items_field(self, method: Callable[..., Any], model: Type[AppwriteModel]) -> Any:
+        for name, field in model.model_fields.items():
+            if name == 'total' or get_origin(field.annotation) not in (list, List):
+                continue
+
+            item_model = get_args(field.annotation)[0]
+            # Generic models such as Row[T] are built through their origin.
+            item_model = getattr(item_model, '__pydantic_generic_metadata__', {}).get('origin') or item_model
+            if inspect.isclass(item_model) and issubclass(item_model, AppwriteModel):
+                return field.alias or name, item_model
+
+        raise AppwriteException(f'{method.__name__} cannot be streamed')
+
+    def stream(
+        self,
+        method: Callable[..., Any],
+        *args: Any,
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        **kwargs: Any
+    ) -> Iterator[bytes]:
+        """
+        Stream the body of a download endpoint in fixed-size chunks.
+
+        Parameters
+        ----------
+        method : Callable
+            Bound download method of a service, e.g. `storage.get_file_download`.
+        *args : Any
+            Positional arguments for `method`.
+        chunk_size : int
+            Maximum number of bytes per yielded chunk.
+        offset : int
+            Byte offset to start from, requested with an HTTP Range header.
+        **kwargs : Any
+            Keyword arguments for `method`.
+
+        Returns
+        -------
+        Iterator[bytes]
+            Chunks of the response body
+
+        Raises
+        ------
+        AppwriteException
+            If API request fails
+        """
+
+        call_args = self._capture_request(method, args, kwargs)
+        return self.client.stream(**call_args, chunk_size=chunk_size, offset=offset)
+
+    def download(
+        self,
+        method: Callable[..., Any],
+        *args: Any,
+        destination: Union[str, os.PathLike, IO[bytes]],
+        chunk_size: int = 1024 * 1024,
+        resume: bool = False,
+        max_resumes: int = 3,
+        **kwargs: Any
+    ) -> int:
+        """
+        Write the body of a download endpoint to a path or binary file object.
+
+        Only one chunk is held in memory at a time. When the connection drops
+        mid-transfer the download continues from the last written byte with
+        an HTTP Range request, up to `max_resumes` times.
+
+        Parameters
+        ----------
+        method : Callable
+            Bound download method of a service, e.g. `storage.get_file_download`.
+        *args : Any
+            Positional arguments for `method`.
+        destination : Union[str, os.PathLike, IO[bytes]]
+            Path or writable binary file object to write to.
+        chunk_size : int
+            Maximum number of bytes read and written at once.
+        resume : bool
+            When `destination` is a path to a partially downloaded file, append the missing bytes instead of starting over.
+        max_resumes : int
+            Number of times an interrupted transfer is resumed.
+        **kwargs : Any
+            Keyword arguments for `method`.
+
+        Returns
+        -------
+        int
+            Size of the downloaded file in bytes
+
+        Raises
+        ------
+        AppwriteException
+            If API request fails
+        """
+
+        call_args = self._capture_request(method, args, kwargs)
+
+        if not isinstance(destination, (str, os.PathLike)):
+            return self._download_into(destination, call_args, 0, chunk_size, max_resumes)
+
+        offset = os.path.getsize(destination) if resume and os.path.exists(destination) else 0
+        with open(destination, 'ab' if offset else 'wb') as file:
+            return self._download_into(file, call_args, offset, chunk_size, max_resumes)
+
+    def _download_into(self, file: IO[bytes], call_args: Any, offset: int, chunk_size: int, max_resumes: int) -> int:
+        resumes = 0
+        while True:
+            try:
+                for chunk in self.client.stream(**call_args, chunk_size=chunk_size, offset=offset):
+                    file.write(chunk)
+                    offset += len(chunk)
+                return offset
+            except AppwriteException as error:
+                if not self._is_connection_error(error) or resumes >= max_resumes:
+                    raise
+                resumes += 1
+
+    def _capture_request(self, method: Callable[..., Any], args: Any, kwargs: Dict[str, Any]) -> Any:
+        recorder = _RequestRecorder(self.client)
+        try:
+            method.__func__(type(method.__self__)(recorder), *args, **kwargs)
+        except _RequestCaptured:
+            pass
+
+        call_args = recorder.call_args()
+        if call_args is None:
+            raise AppwriteException(f'{method.__name__} cannot be streamed')
+
+        return call_args
+
+    def _is_ambiguous(self, error: AppwriteException) -> bool:
+        return self._is_connection_error(error) or (error.code or 0) >= 500
+
+    def _is_connection_error(self, error: AppwriteException) -> bool:
+        # The client chains the error of the transport when the connection failed.
+        return isinstance(error.__cause__, self.client._get_transport().connection_errors)
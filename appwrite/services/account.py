@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar
 from ..exception import AppwriteException
@@ -30,6 +31,10 @@ class Account(Service):
     def __init__(self, client) -> None:
         super(Account, self).__init__(client)
 
+    _get_endpoint = Endpoint('get', '/account', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         model_type: Type[T] = dict
@@ -54,16 +59,17 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _create_endpoint = Endpoint('post', '/account', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create(
         self,
@@ -101,7 +107,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -119,15 +124,15 @@ class Account(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _list_consents_endpoint = Endpoint('get', '/account/consents', {
+        'accept': 'application/json',
+    })
+
     def list_consents(
         self,
         queries: Optional[List[str]] = None,
@@ -154,7 +159,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/consents'
         api_params = {}
 
         if queries is not None:
@@ -162,14 +166,15 @@ class Account(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_consents_endpoint, api_params)
 
         return self._parse_response(response, model=Oauth2ConsentList)
 
 
+    _get_consent_endpoint = Endpoint('get', '/account/consents/{consentId}', {
+        'accept': 'application/json',
+    })
+
     def get_consent(
         self,
         consent_id: str
@@ -193,22 +198,21 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/consents/{consentId}'
         api_params = {}
         if consent_id is None:
             raise AppwriteException('Missing required parameter: "consent_id"')
 
-        api_path = api_path.replace('{consentId}', str(self._normalize_value(consent_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_consent_endpoint, api_params, [consent_id])
 
         return self._parse_response(response, model=Oauth2Consent)
 
 
+    _delete_consent_endpoint = Endpoint('delete', '/account/consents/{consentId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_consent(
         self,
         consent_id: str
@@ -232,23 +236,20 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/consents/{consentId}'
         api_params = {}
         if consent_id is None:
             raise AppwriteException('Missing required parameter: "consent_id"')
 
-        api_path = api_path.replace('{consentId}', str(self._normalize_value(consent_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_consent_endpoint, api_params, [consent_id])
 
         return response
 
 
+    _list_consent_tokens_endpoint = Endpoint('get', '/account/consents/{consentId}/tokens', {
+        'accept': 'application/json',
+    })
+
     def list_consent_tokens(
         self,
         consent_id: str,
@@ -278,26 +279,24 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/consents/{consentId}/tokens'
         api_params = {}
         if consent_id is None:
             raise AppwriteException('Missing required parameter: "consent_id"')
 
-        api_path = api_path.replace('{consentId}', str(self._normalize_value(consent_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_consent_tokens_endpoint, api_params, [consent_id])
 
         return self._parse_response(response, model=Oauth2ConsentTokenList)
 
 
+    _get_consent_token_endpoint = Endpoint('get', '/account/consents/{consentId}/tokens/{tokenId}', {
+        'accept': 'application/json',
+    })
+
     def get_consent_token(
         self,
         consent_id: str,
@@ -324,7 +323,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/consents/{consentId}/tokens/{tokenId}'
         api_params = {}
         if consent_id is None:
             raise AppwriteException('Missing required parameter: "consent_id"')
@@ -332,18 +330,17 @@ class Account(Service):
         if token_id is None:
             raise AppwriteException('Missing required parameter: "token_id"')
 
-        api_path = api_path.replace('{consentId}', str(self._normalize_value(consent_id)))
-        api_path = api_path.replace('{tokenId}', str(self._normalize_value(token_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_consent_token_endpoint, api_params, [consent_id, token_id])
 
         return self._parse_response(response, model=Oauth2ConsentToken)
 
 
+    _delete_consent_token_endpoint = Endpoint('delete', '/account/consents/{consentId}/tokens/{tokenId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_consent_token(
         self,
         consent_id: str,
@@ -370,7 +367,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/consents/{consentId}/tokens/{tokenId}'
         api_params = {}
         if consent_id is None:
             raise AppwriteException('Missing required parameter: "consent_id"')
@@ -378,19 +374,17 @@ class Account(Service):
         if token_id is None:
             raise AppwriteException('Missing required parameter: "token_id"')
 
-        api_path = api_path.replace('{consentId}', str(self._normalize_value(consent_id)))
-        api_path = api_path.replace('{tokenId}', str(self._normalize_value(token_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_consent_token_endpoint, api_params, [consent_id, token_id])
 
         return response
 
 
+    _update_email_endpoint = Endpoint('patch', '/account/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_email(
         self,
         email: str,
@@ -423,7 +417,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/email'
         api_params = {}
         if email is None:
             raise AppwriteException('Missing required parameter: "email"')
@@ -435,15 +428,15 @@ class Account(Service):
         api_params['email'] = self._normalize_value(email)
         api_params['password'] = self._normalize_value(password)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_endpoint, api_params)
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _list_identities_endpoint = Endpoint('get', '/account/identities', {
+        'accept': 'application/json',
+    })
+
     def list_identities(
         self,
         queries: Optional[List[str]] = None,
@@ -470,7 +463,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/identities'
         api_params = {}
 
         if queries is not None:
@@ -478,14 +470,15 @@ class Account(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_identities_endpoint, api_params)
 
         return self._parse_response(response, model=IdentityList)
 
 
+    _delete_identity_endpoint = Endpoint('delete', '/account/identities/{identityId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_identity(
         self,
         identity_id: str
@@ -509,22 +502,21 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/identities/{identityId}'
         api_params = {}
         if identity_id is None:
             raise AppwriteException('Missing required parameter: "identity_id"')
 
-        api_path = api_path.replace('{identityId}', str(self._normalize_value(identity_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_identity_endpoint, api_params, [identity_id])
 
         return response
 
 
+    _create_jwt_endpoint = Endpoint('post', '/account/jwts', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_jwt(
         self,
         duration: Optional[float] = None
@@ -548,21 +540,20 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/jwts'
         api_params = {}
 
         if duration is not None:
             api_params['duration'] = self._normalize_value(duration)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_jwt_endpoint, api_params)
 
         return self._parse_response(response, model=Jwt)
 
 
+    _list_logs_endpoint = Endpoint('get', '/account/logs', {
+        'accept': 'application/json',
+    })
+
     def list_logs(
         self,
         queries: Optional[List[str]] = None,
@@ -589,7 +580,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/logs'
         api_params = {}
 
         if queries is not None:
@@ -597,14 +587,16 @@ class Account(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_logs_endpoint, api_params)
 
         return self._parse_response(response, model=LogList)
 
 
+    _update_mfa_endpoint = Endpoint('patch', '/account/mfa', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mfa(
         self,
         mfa: bool,
@@ -632,7 +624,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa'
         api_params = {}
         if mfa is None:
             raise AppwriteException('Missing required parameter: "mfa"')
@@ -640,15 +631,16 @@ class Account(Service):
 
         api_params['mfa'] = self._normalize_value(mfa)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mfa_endpoint, api_params)
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _create_mfa_authenticator_endpoint = Endpoint('post', '/account/mfa/authenticators/{type}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_mfa_authenticator(
         self,
         type: AuthenticatorType
@@ -672,23 +664,21 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/authenticators/{type}'
         api_params = {}
         if type is None:
             raise AppwriteException('Missing required parameter: "type"')
 
-        api_path = api_path.replace('{type}', str(self._normalize_value(type)))
-
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mfa_authenticator_endpoint, api_params, [type])
 
         return self._parse_response(response, model=MfaType)
 
 
+    _update_mfa_authenticator_endpoint = Endpoint('put', '/account/mfa/authenticators/{type}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mfa_authenticator(
         self,
         type: AuthenticatorType,
@@ -719,7 +709,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/authenticators/{type}'
         api_params = {}
         if type is None:
             raise AppwriteException('Missing required parameter: "type"')
@@ -727,19 +716,17 @@ class Account(Service):
         if otp is None:
             raise AppwriteException('Missing required parameter: "otp"')
 
-        api_path = api_path.replace('{type}', str(self._normalize_value(type)))
-
         api_params['otp'] = self._normalize_value(otp)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mfa_authenticator_endpoint, api_params, [type])
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _delete_mfa_authenticator_endpoint = Endpoint('delete', '/account/mfa/authenticators/{type}', {
+        'content-type': 'application/json',
+    })
+
     def delete_mfa_authenticator(
         self,
         type: AuthenticatorType
@@ -763,22 +750,21 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/authenticators/{type}'
         api_params = {}
         if type is None:
             raise AppwriteException('Missing required parameter: "type"')
 
-        api_path = api_path.replace('{type}', str(self._normalize_value(type)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_mfa_authenticator_endpoint, api_params, [type])
 
         return response
 
 
+    _create_mfa_challenge_endpoint = Endpoint('post', '/account/mfa/challenges', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_mfa_challenge(
         self,
         factor: AuthenticationFactor
@@ -802,7 +788,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/challenges'
         api_params = {}
         if factor is None:
             raise AppwriteException('Missing required parameter: "factor"')
@@ -810,15 +795,16 @@ class Account(Service):
 
         api_params['factor'] = self._normalize_value(factor)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mfa_challenge_endpoint, api_params)
 
         return self._parse_response(response, model=MfaChallenge)
 
 
+    _update_mfa_challenge_endpoint = Endpoint('put', '/account/mfa/challenges', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mfa_challenge(
         self,
         challenge_id: str,
@@ -845,7 +831,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/challenges'
         api_params = {}
         if challenge_id is None:
             raise AppwriteException('Missing required parameter: "challenge_id"')
@@ -857,15 +842,15 @@ class Account(Service):
         api_params['challengeId'] = self._normalize_value(challenge_id)
         api_params['otp'] = self._normalize_value(otp)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mfa_challenge_endpoint, api_params)
 
         return self._parse_response(response, model=Session)
 
 
+    _list_mfa_factors_endpoint = Endpoint('get', '/account/mfa/factors', {
+        'accept': 'application/json',
+    })
+
     def list_mfa_factors(
         self
     ) -> MfaFactors:
@@ -883,17 +868,17 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/factors'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_mfa_factors_endpoint, api_params)
 
         return self._parse_response(response, model=MfaFactors)
 
 
+    _get_mfa_recovery_codes_endpoint = Endpoint('get', '/account/mfa/recovery-codes', {
+        'accept': 'application/json',
+    })
+
     def get_mfa_recovery_codes(
         self
     ) -> MfaRecoveryCodes:
@@ -911,17 +896,18 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/recovery-codes'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_mfa_recovery_codes_endpoint, api_params)
 
         return self._parse_response(response, model=MfaRecoveryCodes)
 
 
+    _create_mfa_recovery_codes_endpoint = Endpoint('post', '/account/mfa/recovery-codes', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_mfa_recovery_codes(
         self
     ) -> MfaRecoveryCodes:
@@ -939,18 +925,18 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/recovery-codes'
         api_params = {}
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mfa_recovery_codes_endpoint, api_params)
 
         return self._parse_response(response, model=MfaRecoveryCodes)
 
 
+    _update_mfa_recovery_codes_endpoint = Endpoint('patch', '/account/mfa/recovery-codes', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mfa_recovery_codes(
         self
     ) -> MfaRecoveryCodes:
@@ -968,18 +954,18 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/mfa/recovery-codes'
         api_params = {}
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mfa_recovery_codes_endpoint, api_params)
 
         return self._parse_response(response, model=MfaRecoveryCodes)
 
 
+    _update_name_endpoint = Endpoint('patch', '/account/name', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_name(
         self,
         name: str,
@@ -1007,7 +993,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/name'
         api_params = {}
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
@@ -1015,14 +1000,15 @@ class Account(Service):
 
         api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_name_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _update_password_endpoint = Endpoint('patch', '/account/password', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_password(
         self,
@@ -1054,7 +1040,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/password'
         api_params = {}
         if password is None:
             raise AppwriteException('Missing required parameter: "password"')
@@ -1064,15 +1049,16 @@ class Account(Service):
         if old_password is not None:
             api_params['oldPassword'] = self._normalize_value(old_password)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_password_endpoint, api_params)
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _update_phone_endpoint = Endpoint('patch', '/account/phone', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_phone(
         self,
         phone: str,
@@ -1103,7 +1089,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/phone'
         api_params = {}
         if phone is None:
             raise AppwriteException('Missing required parameter: "phone"')
@@ -1115,14 +1100,14 @@ class Account(Service):
         api_params['phone'] = self._normalize_value(phone)
         api_params['password'] = self._normalize_value(password)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_phone_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _get_prefs_endpoint = Endpoint('get', '/account/prefs', {
+        'accept': 'application/json',
+    })
 
     def get_prefs(
         self,
@@ -1148,17 +1133,18 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/prefs'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_prefs_endpoint, api_params)
 
-        return Preferences.with_data(response, model_type)
+        return self._parse_response(response, model=Preferences, model_type=model_type)
 
 
+    _update_prefs_endpoint = Endpoint('patch', '/account/prefs', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_prefs(
         self,
         prefs: Dict[str, Any],
@@ -1186,7 +1172,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/prefs'
         api_params = {}
         if prefs is None:
             raise AppwriteException('Missing required parameter: "prefs"')
@@ -1194,14 +1179,15 @@ class Account(Service):
 
         api_params['prefs'] = self._normalize_value(prefs)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_prefs_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _create_recovery_endpoint = Endpoint('post', '/account/recovery', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create_recovery(
         self,
@@ -1229,7 +1215,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/recovery'
         api_params = {}
         if email is None:
             raise AppwriteException('Missing required parameter: "email"')
@@ -1241,15 +1226,16 @@ class Account(Service):
         api_params['email'] = self._normalize_value(email)
         api_params['url'] = self._normalize_value(url)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_recovery_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _update_recovery_endpoint = Endpoint('put', '/account/recovery', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_recovery(
         self,
         user_id: str,
@@ -1281,7 +1267,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/recovery'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1297,15 +1282,15 @@ class Account(Service):
         api_params['secret'] = self._normalize_value(secret)
         api_params['password'] = self._normalize_value(password)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_recovery_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _list_sessions_endpoint = Endpoint('get', '/account/sessions', {
+        'accept': 'application/json',
+    })
+
     def list_sessions(
         self
     ) -> SessionList:
@@ -1323,17 +1308,17 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_sessions_endpoint, api_params)
 
         return self._parse_response(response, model=SessionList)
 
 
+    _delete_sessions_endpoint = Endpoint('delete', '/account/sessions', {
+        'content-type': 'application/json',
+    })
+
     def delete_sessions(
         self
     ) -> Dict[str, Any]:
@@ -1351,17 +1336,18 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions'
         api_params = {}
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_sessions_endpoint, api_params)
 
         return response
 
 
+    _create_anonymous_session_endpoint = Endpoint('post', '/account/sessions/anonymous', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_anonymous_session(
         self
     ) -> Session:
@@ -1379,18 +1365,18 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/anonymous'
         api_params = {}
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_anonymous_session_endpoint, api_params)
 
         return self._parse_response(response, model=Session)
 
 
+    _create_email_password_session_endpoint = Endpoint('post', '/account/sessions/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_email_password_session(
         self,
         email: str,
@@ -1419,7 +1405,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/email'
         api_params = {}
         if email is None:
             raise AppwriteException('Missing required parameter: "email"')
@@ -1431,15 +1416,16 @@ class Account(Service):
         api_params['email'] = self._normalize_value(email)
         api_params['password'] = self._normalize_value(password)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_email_password_session_endpoint, api_params)
 
         return self._parse_response(response, model=Session)
 
 
+    _update_magic_url_session_endpoint = Endpoint('put', '/account/sessions/magic-url', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.6.0. Please use `account.create_session` instead.")
     def update_magic_url_session(
         self,
@@ -1469,7 +1455,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/magic-url'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1481,15 +1466,16 @@ class Account(Service):
         api_params['userId'] = self._normalize_value(user_id)
         api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_magic_url_session_endpoint, api_params)
 
         return self._parse_response(response, model=Session)
 
 
+    _update_phone_session_endpoint = Endpoint('put', '/account/sessions/phone', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.6.0. Please use `account.create_session` instead.")
     def update_phone_session(
         self,
@@ -1519,7 +1505,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/phone'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1531,15 +1516,16 @@ class Account(Service):
         api_params['userId'] = self._normalize_value(user_id)
         api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_phone_session_endpoint, api_params)
 
         return self._parse_response(response, model=Session)
 
 
+    _create_session_endpoint = Endpoint('post', '/account/sessions/token', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_session(
         self,
         user_id: str,
@@ -1566,7 +1552,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/token'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1578,15 +1563,15 @@ class Account(Service):
         api_params['userId'] = self._normalize_value(user_id)
         api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_session_endpoint, api_params)
 
         return self._parse_response(response, model=Session)
 
 
+    _get_session_endpoint = Endpoint('get', '/account/sessions/{sessionId}', {
+        'accept': 'application/json',
+    })
+
     def get_session(
         self,
         session_id: str
@@ -1610,22 +1595,21 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/{sessionId}'
         api_params = {}
         if session_id is None:
             raise AppwriteException('Missing required parameter: "session_id"')
 
-        api_path = api_path.replace('{sessionId}', str(self._normalize_value(session_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_session_endpoint, api_params, [session_id])
 
         return self._parse_response(response, model=Session)
 
 
+    _update_session_endpoint = Endpoint('patch', '/account/sessions/{sessionId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_session(
         self,
         session_id: str
@@ -1649,23 +1633,20 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/{sessionId}'
         api_params = {}
         if session_id is None:
             raise AppwriteException('Missing required parameter: "session_id"')
 
-        api_path = api_path.replace('{sessionId}', str(self._normalize_value(session_id)))
-
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_session_endpoint, api_params, [session_id])
 
         return self._parse_response(response, model=Session)
 
 
+    _delete_session_endpoint = Endpoint('delete', '/account/sessions/{sessionId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_session(
         self,
         session_id: str
@@ -1689,22 +1670,21 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/sessions/{sessionId}'
         api_params = {}
         if session_id is None:
             raise AppwriteException('Missing required parameter: "session_id"')
 
-        api_path = api_path.replace('{sessionId}', str(self._normalize_value(session_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_session_endpoint, api_params, [session_id])
 
         return response
 
 
+    _update_status_endpoint = Endpoint('patch', '/account/status', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_status(
         self,
         model_type: Type[T] = dict
@@ -1729,17 +1709,17 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/status'
         api_params = {}
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_status_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _create_email_token_endpoint = Endpoint('post', '/account/tokens/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create_email_token(
         self,
@@ -1773,7 +1753,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/tokens/email'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1787,15 +1766,16 @@ class Account(Service):
         if phrase is not None:
             api_params['phrase'] = self._normalize_value(phrase)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_email_token_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _create_magic_url_token_endpoint = Endpoint('post', '/account/tokens/magic-url', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_magic_url_token(
         self,
         user_id: str,
@@ -1831,7 +1811,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/tokens/magic-url'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1847,15 +1826,15 @@ class Account(Service):
         if phrase is not None:
             api_params['phrase'] = self._normalize_value(phrase)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_magic_url_token_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _create_o_auth2_token_endpoint = Endpoint('get', '/account/tokens/oauth2/{provider}', {
+        'accept': 'text/html',
+    }, response_type='location')
+
     def create_o_auth2_token(
         self,
         provider: OAuthProvider,
@@ -1892,13 +1871,10 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/tokens/oauth2/{provider}'
         api_params = {}
         if provider is None:
             raise AppwriteException('Missing required parameter: "provider"')
 
-        api_path = api_path.replace('{provider}', str(self._normalize_value(provider)))
-
         if success is not None:
             api_params['success'] = self._normalize_value(success)
         if failure is not None:
@@ -1906,14 +1882,16 @@ class Account(Service):
         if scopes is not None:
             api_params['scopes'] = self._normalize_value(scopes)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'text/html',
-        }, api_params, response_type='location')
+        response = self.client.call_endpoint(self._create_o_auth2_token_endpoint, api_params, [provider])
 
         return response
 
 
+    _create_phone_token_endpoint = Endpoint('post', '/account/tokens/phone', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_phone_token(
         self,
         user_id: str,
@@ -1942,7 +1920,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/tokens/phone'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1954,15 +1931,16 @@ class Account(Service):
         api_params['userId'] = self._normalize_value(user_id)
         api_params['phone'] = self._normalize_value(phone)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_phone_token_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _create_email_verification_endpoint = Endpoint('post', '/account/verifications/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_email_verification(
         self,
         url: str
@@ -1989,7 +1967,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/verifications/email'
         api_params = {}
         if url is None:
             raise AppwriteException('Missing required parameter: "url"')
@@ -1997,15 +1974,16 @@ class Account(Service):
 
         api_params['url'] = self._normalize_value(url)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_email_verification_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _create_verification_endpoint = Endpoint('post', '/account/verifications/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `account.create_email_verification` instead.")
     def create_verification(
         self,
@@ -2035,7 +2013,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/verifications/email'
         api_params = {}
         if url is None:
             raise AppwriteException('Missing required parameter: "url"')
@@ -2043,15 +2020,16 @@ class Account(Service):
 
         api_params['url'] = self._normalize_value(url)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_verification_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _update_email_verification_endpoint = Endpoint('put', '/account/verifications/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_email_verification(
         self,
         user_id: str,
@@ -2078,7 +2056,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/verifications/email'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2090,15 +2067,16 @@ class Account(Service):
         api_params['userId'] = self._normalize_value(user_id)
         api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_verification_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _update_verification_endpoint = Endpoint('put', '/account/verifications/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `account.update_email_verification` instead.")
     def update_verification(
         self,
@@ -2128,7 +2106,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/verifications/email'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2140,15 +2117,16 @@ class Account(Service):
         api_params['userId'] = self._normalize_value(user_id)
         api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_verification_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _create_phone_verification_endpoint = Endpoint('post', '/account/verifications/phone', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_phone_verification(
         self
     ) -> Token:
@@ -2166,18 +2144,18 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/verifications/phone'
         api_params = {}
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_phone_verification_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
 
+    _update_phone_verification_endpoint = Endpoint('put', '/account/verifications/phone', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_phone_verification(
         self,
         user_id: str,
@@ -2204,7 +2182,6 @@ class Account(Service):
             If API request fails
         """
 
-        api_path = '/account/verifications/phone'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2216,11 +2193,7 @@ class Account(Service):
         api_params['userId'] = self._normalize_value(user_id)
         api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_phone_verification_endpoint, api_params)
 
         return self._parse_response(response, model=Token)
 
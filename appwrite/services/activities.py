@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -11,6 +12,10 @@ class Activities(Service):
     def __init__(self, client) -> None:
         super(Activities, self).__init__(client)
 
+    _list_events_endpoint = Endpoint('get', '/activities/events', {
+        'accept': 'application/json',
+    })
+
     def list_events(
         self,
         queries: Optional[str] = None
@@ -34,20 +39,20 @@ class Activities(Service):
             If API request fails
         """
 
-        api_path = '/activities/events'
         api_params = {}
 
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_events_endpoint, api_params)
 
         return self._parse_response(response, model=ActivityEventList)
 
 
+    _get_event_endpoint = Endpoint('get', '/activities/events/{eventId}', {
+        'accept': 'application/json',
+    })
+
     def get_event(
         self,
         event_id: str
@@ -72,18 +77,12 @@ class Activities(Service):
             If API request fails
         """
 
-        api_path = '/activities/events/{eventId}'
         api_params = {}
         if event_id is None:
             raise AppwriteException('Missing required parameter: "event_id"')
 
-        api_path = api_path.replace('{eventId}', str(self._normalize_value(event_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_event_endpoint, api_params, [event_id])
 
         return self._parse_response(response, model=ActivityEvent)
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -13,6 +14,10 @@ class Advisor(Service):
     def __init__(self, client) -> None:
         super(Advisor, self).__init__(client)
 
+    _list_reports_endpoint = Endpoint('get', '/reports', {
+        'accept': 'application/json',
+    })
+
     def list_reports(
         self,
         queries: Optional[List[str]] = None,
@@ -40,7 +45,6 @@ class Advisor(Service):
             If API request fails
         """
 
-        api_path = '/reports'
         api_params = {}
 
         if queries is not None:
@@ -48,14 +52,15 @@ class Advisor(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_reports_endpoint, api_params)
 
         return self._parse_response(response, model=ReportList)
 
 
+    _get_report_endpoint = Endpoint('get', '/reports/{reportId}', {
+        'accept': 'application/json',
+    })
+
     def get_report(
         self,
         report_id: str
@@ -80,22 +85,20 @@ class Advisor(Service):
             If API request fails
         """
 
-        api_path = '/reports/{reportId}'
         api_params = {}
         if report_id is None:
             raise AppwriteException('Missing required parameter: "report_id"')
 
-        api_path = api_path.replace('{reportId}', str(self._normalize_value(report_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_report_endpoint, api_params, [report_id])
 
         return self._parse_response(response, model=Report)
 
 
+    _delete_report_endpoint = Endpoint('delete', '/reports/{reportId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_report(
         self,
         report_id: str
@@ -120,22 +123,20 @@ class Advisor(Service):
             If API request fails
         """
 
-        api_path = '/reports/{reportId}'
         api_params = {}
         if report_id is None:
             raise AppwriteException('Missing required parameter: "report_id"')
 
-        api_path = api_path.replace('{reportId}', str(self._normalize_value(report_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_report_endpoint, api_params, [report_id])
 
         return response
 
 
+    _list_insights_endpoint = Endpoint('get', '/reports/{reportId}/insights', {
+        'accept': 'application/json',
+    })
+
     def list_insights(
         self,
         report_id: str,
@@ -166,26 +167,24 @@ class Advisor(Service):
             If API request fails
         """
 
-        api_path = '/reports/{reportId}/insights'
         api_params = {}
         if report_id is None:
             raise AppwriteException('Missing required parameter: "report_id"')
 
-        api_path = api_path.replace('{reportId}', str(self._normalize_value(report_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_insights_endpoint, api_params, [report_id])
 
         return self._parse_response(response, model=InsightList)
 
 
+    _get_insight_endpoint = Endpoint('get', '/reports/{reportId}/insights/{insightId}', {
+        'accept': 'application/json',
+    })
+
     def get_insight(
         self,
         report_id: str,
@@ -213,7 +212,6 @@ class Advisor(Service):
             If API request fails
         """
 
-        api_path = '/reports/{reportId}/insights/{insightId}'
         api_params = {}
         if report_id is None:
             raise AppwriteException('Missing required parameter: "report_id"')
@@ -221,14 +219,8 @@ class Advisor(Service):
         if insight_id is None:
             raise AppwriteException('Missing required parameter: "insight_id"')
 
-        api_path = api_path.replace('{reportId}', str(self._normalize_value(report_id)))
-        api_path = api_path.replace('{insightId}', str(self._normalize_value(insight_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_insight_endpoint, api_params, [report_id, insight_id])
 
         return self._parse_response(response, model=Insight)
 
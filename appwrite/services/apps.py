@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -20,6 +21,10 @@ class Apps(Service):
     def __init__(self, client) -> None:
         super(Apps, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/apps', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -46,7 +51,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps'
         api_params = {}
 
         if queries is not None:
@@ -54,14 +58,16 @@ class Apps(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
 
         return self._parse_response(response, model=AppsList)
 
 
+    _create_endpoint = Endpoint('post', '/apps', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create(
         self,
         app_id: str,
@@ -139,7 +145,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -187,15 +192,15 @@ class Apps(Service):
         if team_id is not None:
             api_params['teamId'] = self._normalize_value(team_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
         return self._parse_response(response, model=App)
 
 
+    _list_installation_scopes_endpoint = Endpoint('get', '/apps/scopes/installations', {
+        'accept': 'application/json',
+    })
+
     def list_installation_scopes(
         self
     ) -> AppScopeList:
@@ -213,17 +218,17 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/scopes/installations'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_installation_scopes_endpoint, api_params)
 
         return self._parse_response(response, model=AppScopeList)
 
 
+    _list_o_auth2_scopes_endpoint = Endpoint('get', '/apps/scopes/oauth2', {
+        'accept': 'application/json',
+    })
+
     def list_o_auth2_scopes(
         self
     ) -> AppScopeList:
@@ -241,17 +246,17 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/scopes/oauth2'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_o_auth2_scopes_endpoint, api_params)
 
         return self._parse_response(response, model=AppScopeList)
 
 
+    _get_endpoint = Endpoint('get', '/apps/{appId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         app_id: str
@@ -275,22 +280,21 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=App)
 
 
+    _update_endpoint = Endpoint('put', '/apps/{appId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update(
         self,
         app_id: str,
@@ -371,7 +375,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -379,8 +382,6 @@ class Apps(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
         api_params['name'] = self._normalize_value(name)
         if description is not None:
             api_params['description'] = self._normalize_value(description)
@@ -419,15 +420,16 @@ class Apps(Service):
         if installation_redirect_url is not None:
             api_params['installationRedirectUrl'] = self._normalize_value(installation_redirect_url)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=App)
 
 
+    _delete_endpoint = Endpoint('delete', '/apps/{appId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete(
         self,
         app_id: str
@@ -451,23 +453,20 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [app_id])
 
         return response
 
 
+    _list_installations_endpoint = Endpoint('get', '/apps/{appId}/installations', {
+        'accept': 'application/json',
+    })
+
     def list_installations(
         self,
         app_id: str,
@@ -497,26 +496,24 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/installations'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_installations_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=AppInstallationList)
 
 
+    _get_installation_endpoint = Endpoint('get', '/apps/{appId}/installations/{installationId}', {
+        'accept': 'application/json',
+    })
+
     def get_installation(
         self,
         app_id: str,
@@ -543,7 +540,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/installations/{installationId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -551,18 +547,17 @@ class Apps(Service):
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_installation_endpoint, api_params, [app_id, installation_id])
 
         return self._parse_response(response, model=AppInstallation)
 
 
+    _create_installation_token_endpoint = Endpoint('post', '/apps/{appId}/installations/{installationId}/tokens', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_installation_token(
         self,
         app_id: str,
@@ -589,7 +584,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/installations/{installationId}/tokens'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -597,19 +591,16 @@ class Apps(Service):
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
 
-
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_installation_token_endpoint, api_params, [app_id, installation_id])
 
         return self._parse_response(response, model=Oauth2Token)
 
 
+    _list_keys_endpoint = Endpoint('get', '/apps/{appId}/keys', {
+        'accept': 'application/json',
+    })
+
     def list_keys(
         self,
         app_id: str,
@@ -639,26 +630,25 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/keys'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_keys_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=AppKeyList)
 
 
+    _create_key_endpoint = Endpoint('post', '/apps/{appId}/keys', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_key(
         self,
         app_id: str
@@ -682,23 +672,20 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/keys'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
 
-
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_key_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=AppKey)
 
 
+    _get_key_endpoint = Endpoint('get', '/apps/{appId}/keys/{keyId}', {
+        'accept': 'application/json',
+    })
+
     def get_key(
         self,
         app_id: str,
@@ -725,7 +712,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/keys/{keyId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -733,18 +719,17 @@ class Apps(Service):
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_key_endpoint, api_params, [app_id, key_id])
 
         return self._parse_response(response, model=AppKey)
 
 
+    _delete_key_endpoint = Endpoint('delete', '/apps/{appId}/keys/{keyId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_key(
         self,
         app_id: str,
@@ -771,7 +756,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/keys/{keyId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -779,19 +763,17 @@ class Apps(Service):
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_key_endpoint, api_params, [app_id, key_id])
 
         return response
 
 
+    _update_labels_endpoint = Endpoint('put', '/apps/{appId}/labels', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_labels(
         self,
         app_id: str,
@@ -818,7 +800,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/labels'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -826,19 +807,17 @@ class Apps(Service):
         if labels is None:
             raise AppwriteException('Missing required parameter: "labels"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
         api_params['labels'] = self._normalize_value(labels)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_labels_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=App)
 
 
+    _list_secrets_endpoint = Endpoint('get', '/apps/{appId}/secrets', {
+        'accept': 'application/json',
+    })
+
     def list_secrets(
         self,
         app_id: str,
@@ -868,26 +847,25 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/secrets'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_secrets_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=AppSecretList)
 
 
+    _create_secret_endpoint = Endpoint('post', '/apps/{appId}/secrets', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_secret(
         self,
         app_id: str
@@ -911,23 +889,20 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/secrets'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
 
-
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_secret_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=AppSecretPlaintext)
 
 
+    _get_secret_endpoint = Endpoint('get', '/apps/{appId}/secrets/{secretId}', {
+        'accept': 'application/json',
+    })
+
     def get_secret(
         self,
         app_id: str,
@@ -954,7 +929,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/secrets/{secretId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -962,18 +936,17 @@ class Apps(Service):
         if secret_id is None:
             raise AppwriteException('Missing required parameter: "secret_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-        api_path = api_path.replace('{secretId}', str(self._normalize_value(secret_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_secret_endpoint, api_params, [app_id, secret_id])
 
         return self._parse_response(response, model=AppSecret)
 
 
+    _delete_secret_endpoint = Endpoint('delete', '/apps/{appId}/secrets/{secretId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_secret(
         self,
         app_id: str,
@@ -1000,7 +973,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/secrets/{secretId}'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -1008,19 +980,17 @@ class Apps(Service):
         if secret_id is None:
             raise AppwriteException('Missing required parameter: "secret_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-        api_path = api_path.replace('{secretId}', str(self._normalize_value(secret_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_secret_endpoint, api_params, [app_id, secret_id])
 
         return response
 
 
+    _update_team_endpoint = Endpoint('patch', '/apps/{appId}/team', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_team(
         self,
         app_id: str,
@@ -1047,7 +1017,6 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/team'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -1055,19 +1024,18 @@ class Apps(Service):
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
         api_params['teamId'] = self._normalize_value(team_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_team_endpoint, api_params, [app_id])
 
         return self._parse_response(response, model=App)
 
 
+    _delete_tokens_endpoint = Endpoint('delete', '/apps/{appId}/tokens', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_tokens(
         self,
         app_id: str
@@ -1091,19 +1059,12 @@ class Apps(Service):
             If API request fails
         """
 
-        api_path = '/apps/{appId}/tokens'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{appId}', str(self._normalize_value(app_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_tokens_endpoint, api_params, [app_id])
 
         return response
 
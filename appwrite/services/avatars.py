@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -16,6 +17,10 @@ class Avatars(Service):
     def __init__(self, client) -> None:
         super(Avatars, self).__init__(client)
 
+    _get_browser_endpoint = Endpoint('get', '/avatars/browsers/{code}', {
+        'accept': 'image/png',
+    })
+
     def get_browser(
         self,
         code: Browser,
@@ -50,13 +55,10 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/browsers/{code}'
         api_params = {}
         if code is None:
             raise AppwriteException('Missing required parameter: "code"')
 
-        api_path = api_path.replace('{code}', str(self._normalize_value(code)))
-
         if width is not None:
             api_params['width'] = self._normalize_value(width)
         if height is not None:
@@ -64,14 +66,15 @@ class Avatars(Service):
         if quality is not None:
             api_params['quality'] = self._normalize_value(quality)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/png',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_browser_endpoint, api_params, [code])
 
         return response
 
 
+    _get_credit_card_endpoint = Endpoint('get', '/avatars/credit-cards/{code}', {
+        'accept': 'image/png',
+    })
+
     def get_credit_card(
         self,
         code: CreditCard,
@@ -107,13 +110,10 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/credit-cards/{code}'
         api_params = {}
         if code is None:
             raise AppwriteException('Missing required parameter: "code"')
 
-        api_path = api_path.replace('{code}', str(self._normalize_value(code)))
-
         if width is not None:
             api_params['width'] = self._normalize_value(width)
         if height is not None:
@@ -121,14 +121,15 @@ class Avatars(Service):
         if quality is not None:
             api_params['quality'] = self._normalize_value(quality)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/png',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_credit_card_endpoint, api_params, [code])
 
         return response
 
 
+    _get_favicon_endpoint = Endpoint('get', '/avatars/favicon', {
+        'accept': 'image/*',
+    })
+
     def get_favicon(
         self,
         url: str
@@ -154,7 +155,6 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/favicon'
         api_params = {}
         if url is None:
             raise AppwriteException('Missing required parameter: "url"')
@@ -162,14 +162,15 @@ class Avatars(Service):
 
         api_params['url'] = self._normalize_value(url)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/*',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_favicon_endpoint, api_params)
 
         return response
 
 
+    _get_flag_endpoint = Endpoint('get', '/avatars/flags/{code}', {
+        'accept': 'image/png',
+    })
+
     def get_flag(
         self,
         code: Flag,
@@ -205,13 +206,10 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/flags/{code}'
         api_params = {}
         if code is None:
             raise AppwriteException('Missing required parameter: "code"')
 
-        api_path = api_path.replace('{code}', str(self._normalize_value(code)))
-
         if width is not None:
             api_params['width'] = self._normalize_value(width)
         if height is not None:
@@ -219,14 +217,15 @@ class Avatars(Service):
         if quality is not None:
             api_params['quality'] = self._normalize_value(quality)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/png',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_flag_endpoint, api_params, [code])
 
         return response
 
 
+    _get_image_endpoint = Endpoint('get', '/avatars/image', {
+        'accept': 'image/*',
+    })
+
     def get_image(
         self,
         url: str,
@@ -260,7 +259,6 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/image'
         api_params = {}
         if url is None:
             raise AppwriteException('Missing required parameter: "url"')
@@ -272,14 +270,15 @@ class Avatars(Service):
         if height is not None:
             api_params['height'] = self._normalize_value(height)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/*',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_image_endpoint, api_params)
 
         return response
 
 
+    _get_initials_endpoint = Endpoint('get', '/avatars/initials', {
+        'accept': 'image/png',
+    })
+
     def get_initials(
         self,
         name: Optional[str] = None,
@@ -317,7 +316,6 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/initials'
         api_params = {}
 
         if name is not None:
@@ -329,14 +327,15 @@ class Avatars(Service):
         if background is not None:
             api_params['background'] = self._normalize_value(background)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/png',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_initials_endpoint, api_params)
 
         return response
 
 
+    _get_qr_endpoint = Endpoint('get', '/avatars/qr', {
+        'accept': 'image/png',
+    })
+
     def get_qr(
         self,
         text: str,
@@ -370,7 +369,6 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/qr'
         api_params = {}
         if text is None:
             raise AppwriteException('Missing required parameter: "text"')
@@ -384,14 +382,15 @@ class Avatars(Service):
         if download is not None:
             api_params['download'] = self._normalize_value(download)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/png',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_qr_endpoint, api_params)
 
         return response
 
 
+    _get_screenshot_endpoint = Endpoint('get', '/avatars/screenshots', {
+        'accept': 'image/png',
+    })
+
     def get_screenshot(
         self,
         url: str,
@@ -476,7 +475,6 @@ class Avatars(Service):
             If API request fails
         """
 
-        api_path = '/avatars/screenshots'
         api_params = {}
         if url is None:
             raise AppwriteException('Missing required parameter: "url"')
@@ -522,10 +520,7 @@ class Avatars(Service):
         if output is not None:
             api_params['output'] = self._normalize_value(output)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/png',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_screenshot_endpoint, api_params)
 
         return response
 
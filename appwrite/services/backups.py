@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -16,6 +17,10 @@ class Backups(Service):
     def __init__(self, client) -> None:
         super(Backups, self).__init__(client)
 
+    _list_archives_endpoint = Endpoint('get', '/backups/archives', {
+        'accept': 'application/json',
+    })
+
     def list_archives(
         self,
         queries: Optional[List[str]] = None
@@ -39,20 +44,21 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/archives'
         api_params = {}
 
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_archives_endpoint, api_params)
 
         return self._parse_response(response, model=BackupArchiveList)
 
 
+    _create_archive_endpoint = Endpoint('post', '/backups/archives', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_archive(
         self,
         services: List[BackupServices],
@@ -79,7 +85,6 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/archives'
         api_params = {}
         if services is None:
             raise AppwriteException('Missing required parameter: "services"')
@@ -89,15 +94,15 @@ class Backups(Service):
         if resource_id is not None:
             api_params['resourceId'] = self._normalize_value(resource_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_archive_endpoint, api_params)
 
         return self._parse_response(response, model=BackupArchive)
 
 
+    _get_archive_endpoint = Endpoint('get', '/backups/archives/{archiveId}', {
+        'accept': 'application/json',
+    })
+
     def get_archive(
         self,
         archive_id: str
@@ -121,22 +126,21 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/archives/{archiveId}'
         api_params = {}
         if archive_id is None:
             raise AppwriteException('Missing required parameter: "archive_id"')
 
-        api_path = api_path.replace('{archiveId}', str(self._normalize_value(archive_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_archive_endpoint, api_params, [archive_id])
 
         return self._parse_response(response, model=BackupArchive)
 
 
+    _delete_archive_endpoint = Endpoint('delete', '/backups/archives/{archiveId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_archive(
         self,
         archive_id: str
@@ -160,23 +164,20 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/archives/{archiveId}'
         api_params = {}
         if archive_id is None:
             raise AppwriteException('Missing required parameter: "archive_id"')
 
-        api_path = api_path.replace('{archiveId}', str(self._normalize_value(archive_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_archive_endpoint, api_params, [archive_id])
 
         return response
 
 
+    _list_policies_endpoint = Endpoint('get', '/backups/policies', {
+        'accept': 'application/json',
+    })
+
     def list_policies(
         self,
         queries: Optional[List[str]] = None
@@ -200,20 +201,21 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/policies'
         api_params = {}
 
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_policies_endpoint, api_params)
 
         return self._parse_response(response, model=BackupPolicyList)
 
 
+    _create_policy_endpoint = Endpoint('post', '/backups/policies', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_policy(
         self,
         policy_id: str,
@@ -255,7 +257,6 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/policies'
         api_params = {}
         if policy_id is None:
             raise AppwriteException('Missing required parameter: "policy_id"')
@@ -281,15 +282,15 @@ class Backups(Service):
         api_params['retention'] = self._normalize_value(retention)
         api_params['schedule'] = self._normalize_value(schedule)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_policy_endpoint, api_params)
 
         return self._parse_response(response, model=BackupPolicy)
 
 
+    _get_policy_endpoint = Endpoint('get', '/backups/policies/{policyId}', {
+        'accept': 'application/json',
+    })
+
     def get_policy(
         self,
         policy_id: str
@@ -313,22 +314,21 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/policies/{policyId}'
         api_params = {}
         if policy_id is None:
             raise AppwriteException('Missing required parameter: "policy_id"')
 
-        api_path = api_path.replace('{policyId}', str(self._normalize_value(policy_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_policy_endpoint, api_params, [policy_id])
 
         return self._parse_response(response, model=BackupPolicy)
 
 
+    _update_policy_endpoint = Endpoint('patch', '/backups/policies/{policyId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_policy(
         self,
         policy_id: str,
@@ -364,13 +364,10 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/policies/{policyId}'
         api_params = {}
         if policy_id is None:
             raise AppwriteException('Missing required parameter: "policy_id"')
 
-        api_path = api_path.replace('{policyId}', str(self._normalize_value(policy_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if retention is not None:
@@ -380,15 +377,16 @@ class Backups(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_policy_endpoint, api_params, [policy_id])
 
         return self._parse_response(response, model=BackupPolicy)
 
 
+    _delete_policy_endpoint = Endpoint('delete', '/backups/policies/{policyId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_policy(
         self,
         policy_id: str
@@ -412,23 +410,21 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/policies/{policyId}'
         api_params = {}
         if policy_id is None:
             raise AppwriteException('Missing required parameter: "policy_id"')
 
-        api_path = api_path.replace('{policyId}', str(self._normalize_value(policy_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_policy_endpoint, api_params, [policy_id])
 
         return response
 
 
+    _create_restoration_endpoint = Endpoint('post', '/backups/restoration', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_restoration(
         self,
         archive_id: str,
@@ -470,7 +466,6 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/restoration'
         api_params = {}
         if archive_id is None:
             raise AppwriteException('Missing required parameter: "archive_id"')
@@ -486,15 +481,15 @@ class Backups(Service):
         if new_resource_name is not None:
             api_params['newResourceName'] = self._normalize_value(new_resource_name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_restoration_endpoint, api_params)
 
         return self._parse_response(response, model=BackupRestoration)
 
 
+    _list_restorations_endpoint = Endpoint('get', '/backups/restorations', {
+        'accept': 'application/json',
+    })
+
     def list_restorations(
         self,
         queries: Optional[List[str]] = None
@@ -518,20 +513,20 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/restorations'
         api_params = {}
 
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_restorations_endpoint, api_params)
 
         return self._parse_response(response, model=BackupRestorationList)
 
 
+    _get_restoration_endpoint = Endpoint('get', '/backups/restorations/{restorationId}', {
+        'accept': 'application/json',
+    })
+
     def get_restoration(
         self,
         restoration_id: str
@@ -555,18 +550,12 @@ class Backups(Service):
             If API request fails
         """
 
-        api_path = '/backups/restorations/{restorationId}'
         api_params = {}
         if restoration_id is None:
             raise AppwriteException('Missing required parameter: "restoration_id"')
 
-        api_path = api_path.replace('{restorationId}', str(self._normalize_value(restoration_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_restoration_endpoint, api_params, [restoration_id])
 
         return self._parse_response(response, model=BackupRestoration)
 
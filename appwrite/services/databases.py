@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar
 from ..exception import AppwriteException
@@ -44,6 +45,10 @@ class Databases(Service):
     def __init__(self, client) -> None:
         super(Databases, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/databases', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.list` instead.")
     def list(
         self,
@@ -76,7 +81,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases'
         api_params = {}
 
         if queries is not None:
@@ -86,14 +90,16 @@ class Databases(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
 
         return self._parse_response(response, model=DatabaseList)
 
 
+    _create_endpoint = Endpoint('post', '/databases', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create` instead.")
     def create(
         self,
@@ -127,7 +133,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -141,15 +146,15 @@ class Databases(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
         return self._parse_response(response, model=Database)
 
 
+    _list_transactions_endpoint = Endpoint('get', '/databases/transactions', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.list_transactions` instead.")
     def list_transactions(
         self,
@@ -176,20 +181,21 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/transactions'
         api_params = {}
 
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_transactions_endpoint, api_params)
 
         return self._parse_response(response, model=TransactionList)
 
 
+    _create_transaction_endpoint = Endpoint('post', '/databases/transactions', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_transaction` instead.")
     def create_transaction(
         self,
@@ -216,21 +222,20 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/transactions'
         api_params = {}
 
         if ttl is not None:
             api_params['ttl'] = self._normalize_value(ttl)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_transaction_endpoint, api_params)
 
         return self._parse_response(response, model=Transaction)
 
 
+    _get_transaction_endpoint = Endpoint('get', '/databases/transactions/{transactionId}', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.get_transaction` instead.")
     def get_transaction(
         self,
@@ -257,22 +262,21 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/transactions/{transactionId}'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_transaction_endpoint, api_params, [transaction_id])
 
         return self._parse_response(response, model=Transaction)
 
 
+    _update_transaction_endpoint = Endpoint('patch', '/databases/transactions/{transactionId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_transaction` instead.")
     def update_transaction(
         self,
@@ -305,27 +309,24 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/transactions/{transactionId}'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
-
         if commit is not None:
             api_params['commit'] = self._normalize_value(commit)
         if rollback is not None:
             api_params['rollback'] = self._normalize_value(rollback)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_transaction_endpoint, api_params, [transaction_id])
 
         return self._parse_response(response, model=Transaction)
 
 
+    _delete_transaction_endpoint = Endpoint('delete', '/databases/transactions/{transactionId}', {
+        'content-type': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.delete_transaction` instead.")
     def delete_transaction(
         self,
@@ -352,22 +353,21 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/transactions/{transactionId}'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_transaction_endpoint, api_params, [transaction_id])
 
         return response
 
 
+    _create_operations_endpoint = Endpoint('post', '/databases/transactions/{transactionId}/operations', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_operations` instead.")
     def create_operations(
         self,
@@ -397,25 +397,22 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/transactions/{transactionId}/operations'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
-
         if operations is not None:
             api_params['operations'] = self._normalize_value(operations)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_operations_endpoint, api_params, [transaction_id])
 
         return self._parse_response(response, model=Transaction)
 
 
+    _get_endpoint = Endpoint('get', '/databases/{databaseId}', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.get` instead.")
     def get(
         self,
@@ -442,22 +439,21 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=Database)
 
 
+    _update_endpoint = Endpoint('put', '/databases/{databaseId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update` instead.")
     def update(
         self,
@@ -490,27 +486,24 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=Database)
 
 
+    _delete_endpoint = Endpoint('delete', '/databases/{databaseId}', {
+        'content-type': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.delete` instead.")
     def delete(
         self,
@@ -537,22 +530,20 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [database_id])
 
         return response
 
 
+    _list_collections_endpoint = Endpoint('get', '/databases/{databaseId}/collections', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.list_tables` instead.")
     def list_collections(
         self,
@@ -588,13 +579,10 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -602,14 +590,16 @@ class Databases(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_collections_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=CollectionList)
 
 
+    _create_collection_endpoint = Endpoint('post', '/databases/{databaseId}/collections', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_table` instead.")
     def create_collection(
         self,
@@ -657,7 +647,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -668,8 +657,6 @@ class Databases(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
         api_params['collectionId'] = self._normalize_value(collection_id)
         api_params['name'] = self._normalize_value(name)
         if permissions is not None:
@@ -683,15 +670,15 @@ class Databases(Service):
         if indexes is not None:
             api_params['indexes'] = self._normalize_value(indexes)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_collection_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=Collection)
 
 
+    _get_collection_endpoint = Endpoint('get', '/databases/{databaseId}/collections/{collectionId}', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.get_table` instead.")
     def get_collection(
         self,
@@ -721,7 +708,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -729,18 +715,17 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_collection_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=Collection)
 
 
+    _update_collection_endpoint = Endpoint('put', '/databases/{databaseId}/collections/{collectionId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_table` instead.")
     def update_collection(
         self,
@@ -785,7 +770,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -793,9 +777,6 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if permissions is not None:
@@ -807,15 +788,15 @@ class Databases(Service):
         if purge is not None:
             api_params['purge'] = self._normalize_value(purge)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_collection_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=Collection)
 
 
+    _delete_collection_endpoint = Endpoint('delete', '/databases/{databaseId}/collections/{collectionId}', {
+        'content-type': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.delete_table` instead.")
     def delete_collection(
         self,
@@ -845,7 +826,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -853,18 +833,16 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_collection_endpoint, api_params, [database_id, collection_id])
 
         return response
 
 
+    _list_attributes_endpoint = Endpoint('get', '/databases/{databaseId}/collections/{collectionId}/attributes', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.list_columns` instead.")
     def list_attributes(
         self,
@@ -900,7 +878,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -908,22 +885,21 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_attributes_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeList)
 
 
+    _create_big_int_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/bigint', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_big_int_column` instead.")
     def create_big_int_attribute(
         self,
@@ -972,7 +948,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/bigint'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -986,9 +961,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if min is not None:
@@ -1000,15 +972,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_big_int_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeBigint)
 
 
+    _update_big_int_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/bigint/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_big_int_column` instead.")
     def update_big_int_attribute(
         self,
@@ -1057,7 +1030,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/bigint/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1071,10 +1043,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if min is not None:
             api_params['min'] = self._normalize_value(min)
@@ -1084,15 +1052,16 @@ class Databases(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_big_int_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeBigint)
 
 
+    _create_boolean_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/boolean', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_boolean_column` instead.")
     def create_boolean_attribute(
         self,
@@ -1135,7 +1104,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/boolean'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1149,9 +1117,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -1159,15 +1124,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_boolean_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeBoolean)
 
 
+    _update_boolean_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/boolean/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_boolean_column` instead.")
     def update_boolean_attribute(
         self,
@@ -1209,7 +1175,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/boolean/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1223,24 +1188,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_boolean_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeBoolean)
 
 
+    _create_datetime_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/datetime', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_datetime_column` instead.")
     def create_datetime_attribute(
         self,
@@ -1282,7 +1244,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/datetime'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1296,9 +1257,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -1306,15 +1264,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_datetime_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeDatetime)
 
 
+    _update_datetime_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/datetime/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_datetime_column` instead.")
     def update_datetime_attribute(
         self,
@@ -1356,7 +1315,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/datetime/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1370,24 +1328,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_datetime_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeDatetime)
 
 
+    _create_email_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_email_column` instead.")
     def create_email_attribute(
         self,
@@ -1430,7 +1385,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/email'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1444,9 +1398,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -1454,15 +1405,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_email_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeEmail)
 
 
+    _update_email_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/email/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_email_column` instead.")
     def update_email_attribute(
         self,
@@ -1505,7 +1457,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/email/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1519,24 +1470,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeEmail)
 
 
+    _create_enum_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/enum', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_enum_column` instead.")
     def create_enum_attribute(
         self,
@@ -1582,7 +1530,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/enum'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1599,9 +1546,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['elements'] = self._normalize_value(elements)
         api_params['required'] = self._normalize_value(required)
@@ -1610,15 +1554,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_enum_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeEnum)
 
 
+    _update_enum_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/enum/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_enum_column` instead.")
     def update_enum_attribute(
         self,
@@ -1664,7 +1609,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/enum/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1681,25 +1625,22 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['elements'] = self._normalize_value(elements)
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_enum_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeEnum)
 
 
+    _create_float_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/float', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_float_column` instead.")
     def create_float_attribute(
         self,
@@ -1748,7 +1689,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/float'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1762,9 +1702,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if min is not None:
@@ -1776,15 +1713,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_float_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeFloat)
 
 
+    _update_float_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/float/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_float_column` instead.")
     def update_float_attribute(
         self,
@@ -1833,7 +1771,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/float/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1847,10 +1784,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if min is not None:
             api_params['min'] = self._normalize_value(min)
@@ -1860,15 +1793,16 @@ class Databases(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_float_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeFloat)
 
 
+    _create_integer_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/integer', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_integer_column` instead.")
     def create_integer_attribute(
         self,
@@ -1917,7 +1851,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/integer'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1931,9 +1864,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if min is not None:
@@ -1945,15 +1875,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_integer_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeInteger)
 
 
+    _update_integer_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/integer/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_integer_column` instead.")
     def update_integer_attribute(
         self,
@@ -2002,7 +1933,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/integer/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2016,10 +1946,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if min is not None:
             api_params['min'] = self._normalize_value(min)
@@ -2029,15 +1955,16 @@ class Databases(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_integer_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeInteger)
 
 
+    _create_ip_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/ip', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_ip_column` instead.")
     def create_ip_attribute(
         self,
@@ -2080,7 +2007,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/ip'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2094,9 +2020,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -2104,15 +2027,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_ip_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeIp)
 
 
+    _update_ip_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/ip/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_ip_column` instead.")
     def update_ip_attribute(
         self,
@@ -2155,7 +2079,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/ip/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2169,24 +2092,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_ip_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeIp)
 
 
+    _create_line_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/line', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_line_column` instead.")
     def create_line_attribute(
         self,
@@ -2225,7 +2145,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/line'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2239,23 +2158,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_line_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeLine)
 
 
+    _update_line_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/line/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_line_column` instead.")
     def update_line_attribute(
         self,
@@ -2297,7 +2214,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/line/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2311,25 +2227,22 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_line_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeLine)
 
 
+    _create_longtext_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/longtext', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_longtext_column` instead.")
     def create_longtext_attribute(
         self,
@@ -2375,7 +2288,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/longtext'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2389,9 +2301,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -2401,15 +2310,16 @@ class Databases(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_longtext_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeLongtext)
 
 
+    _update_longtext_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/longtext/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_longtext_column` instead.")
     def update_longtext_attribute(
         self,
@@ -2452,7 +2362,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/longtext/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2466,24 +2375,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_longtext_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeLongtext)
 
 
+    _create_mediumtext_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/mediumtext', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_mediumtext_column` instead.")
     def create_mediumtext_attribute(
         self,
@@ -2529,7 +2435,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/mediumtext'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2543,9 +2448,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -2555,15 +2457,16 @@ class Databases(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mediumtext_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeMediumtext)
 
 
+    _update_mediumtext_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/mediumtext/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_mediumtext_column` instead.")
     def update_mediumtext_attribute(
         self,
@@ -2606,7 +2509,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/mediumtext/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2620,24 +2522,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mediumtext_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeMediumtext)
 
 
+    _create_point_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/point', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_point_column` instead.")
     def create_point_attribute(
         self,
@@ -2676,7 +2575,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/point'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2690,23 +2588,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_point_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributePoint)
 
 
+    _update_point_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/point/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_point_column` instead.")
     def update_point_attribute(
         self,
@@ -2748,7 +2644,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/point/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2762,25 +2657,22 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_point_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributePoint)
 
 
+    _create_polygon_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/polygon', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_polygon_column` instead.")
     def create_polygon_attribute(
         self,
@@ -2819,7 +2711,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/polygon'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2833,23 +2724,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_polygon_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributePolygon)
 
 
+    _update_polygon_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/polygon/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_polygon_column` instead.")
     def update_polygon_attribute(
         self,
@@ -2891,7 +2780,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/polygon/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2905,25 +2793,22 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_polygon_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributePolygon)
 
 
+    _create_relationship_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/relationship', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_relationship_column` instead.")
     def create_relationship_attribute(
         self,
@@ -2972,7 +2857,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/relationship'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2986,9 +2870,6 @@ class Databases(Service):
         if type is None:
             raise AppwriteException('Missing required parameter: "type"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['relatedCollectionId'] = self._normalize_value(related_collection_id)
         api_params['type'] = self._normalize_value(type)
         if two_way is not None:
@@ -3000,15 +2881,16 @@ class Databases(Service):
         if on_delete is not None:
             api_params['onDelete'] = self._normalize_value(on_delete)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_relationship_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeRelationship)
 
 
+    _update_relationship_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/relationship/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_relationship_column` instead.")
     def update_relationship_attribute(
         self,
@@ -3048,7 +2930,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/relationship/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3059,24 +2940,21 @@ class Databases(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         if on_delete is not None:
             api_params['onDelete'] = self._normalize_value(on_delete)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_relationship_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeRelationship)
 
 
+    _create_string_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/string', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_string_column` instead.")
     def create_string_attribute(
         self,
@@ -3125,7 +3003,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/string'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3142,9 +3019,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['size'] = self._normalize_value(size)
         api_params['required'] = self._normalize_value(required)
@@ -3155,15 +3029,16 @@ class Databases(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_string_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeString)
 
 
+    _update_string_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/string/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_string_column` instead.")
     def update_string_attribute(
         self,
@@ -3209,7 +3084,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/string/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3223,10 +3097,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if size is not None:
@@ -3234,15 +3104,16 @@ class Databases(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_string_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeString)
 
 
+    _create_text_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/text', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_text_column` instead.")
     def create_text_attribute(
         self,
@@ -3288,7 +3159,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/text'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3302,9 +3172,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -3314,15 +3181,16 @@ class Databases(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_text_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeText)
 
 
+    _update_text_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/text/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_text_column` instead.")
     def update_text_attribute(
         self,
@@ -3365,7 +3233,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/text/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3379,24 +3246,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_text_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeText)
 
 
+    _create_url_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/url', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_url_column` instead.")
     def create_url_attribute(
         self,
@@ -3439,7 +3303,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/url'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3453,9 +3316,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -3463,15 +3323,16 @@ class Databases(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_url_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeUrl)
 
 
+    _update_url_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/url/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_url_column` instead.")
     def update_url_attribute(
         self,
@@ -3514,7 +3375,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/url/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3528,24 +3388,21 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_url_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeUrl)
 
 
+    _create_varchar_attribute_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/attributes/varchar', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_varchar_column` instead.")
     def create_varchar_attribute(
         self,
@@ -3594,7 +3451,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/varchar'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3611,9 +3467,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['size'] = self._normalize_value(size)
         api_params['required'] = self._normalize_value(required)
@@ -3624,15 +3477,16 @@ class Databases(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_varchar_attribute_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=AttributeVarchar)
 
 
+    _update_varchar_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/attributes/varchar/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_varchar_column` instead.")
     def update_varchar_attribute(
         self,
@@ -3678,7 +3532,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/varchar/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3692,10 +3545,6 @@ class Databases(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if size is not None:
@@ -3703,15 +3552,15 @@ class Databases(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_varchar_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=AttributeVarchar)
 
 
+    _get_attribute_endpoint = Endpoint('get', '/databases/{databaseId}/collections/{collectionId}/attributes/{key}', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.get_column` instead.")
     def get_attribute(
         self,
@@ -3744,7 +3593,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3755,15 +3603,8 @@ class Databases(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_attribute_endpoint, api_params, [database_id, collection_id, key])
         if not isinstance(response, dict):
             raise AppwriteException('Expected object response when hydrating a response model')
 
@@ -3800,6 +3641,10 @@ class Databases(Service):
         raise AppwriteException('Unable to match response to any known model')
 
 
+    _delete_attribute_endpoint = Endpoint('delete', '/databases/{databaseId}/collections/{collectionId}/attributes/{key}', {
+        'content-type': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.delete_column` instead.")
     def delete_attribute(
         self,
@@ -3832,7 +3677,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/attributes/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3843,19 +3687,16 @@ class Databases(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_attribute_endpoint, api_params, [database_id, collection_id, key])
 
         return response
 
 
+    _list_documents_endpoint = Endpoint('get', '/databases/{databaseId}/collections/{collectionId}/documents', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.list_rows` instead.")
     def list_documents(
         self,
@@ -3901,7 +3742,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3909,9 +3749,6 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if transaction_id is not None:
@@ -3921,13 +3758,15 @@ class Databases(Service):
         if ttl is not None:
             api_params['ttl'] = self._normalize_value(ttl)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_documents_endpoint, api_params, [database_id, collection_id])
+
+        return self._parse_response(response, model=DocumentList, model_type=model_type)
 
-        return DocumentList.with_data(response, model_type)
 
+    _create_document_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/documents', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_row` instead.")
     def create_document(
@@ -3974,7 +3813,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3988,9 +3826,6 @@ class Databases(Service):
         if data is None:
             raise AppwriteException('Missing required parameter: "data"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['documentId'] = self._normalize_value(document_id)
         api_params['data'] = self._normalize_value(data)
         if permissions is not None:
@@ -3998,14 +3833,15 @@ class Databases(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_document_endpoint, api_params, [database_id, collection_id])
+
+        return self._parse_response(response, model=Document, model_type=model_type)
 
-        return Document.with_data(response, model_type)
 
+    _create_documents_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/documents', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_rows` instead.")
     def create_documents(
@@ -4046,7 +3882,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4057,21 +3892,19 @@ class Databases(Service):
         if documents is None:
             raise AppwriteException('Missing required parameter: "documents"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['documents'] = self._normalize_value(documents)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_documents_endpoint, api_params, [database_id, collection_id])
+
+        return self._parse_response(response, model=DocumentList, model_type=model_type)
 
-        return DocumentList.with_data(response, model_type)
 
+    _upsert_documents_endpoint = Endpoint('put', '/databases/{databaseId}/collections/{collectionId}/documents', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.upsert_rows` instead.")
     def upsert_documents(
@@ -4113,7 +3946,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4124,21 +3956,19 @@ class Databases(Service):
         if documents is None:
             raise AppwriteException('Missing required parameter: "documents"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['documents'] = self._normalize_value(documents)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._upsert_documents_endpoint, api_params, [database_id, collection_id])
+
+        return self._parse_response(response, model=DocumentList, model_type=model_type)
 
-        return DocumentList.with_data(response, model_type)
 
+    _update_documents_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/documents', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_rows` instead.")
     def update_documents(
@@ -4182,7 +4012,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4190,9 +4019,6 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         if data is not None:
             api_params['data'] = self._normalize_value(data)
         if queries is not None:
@@ -4200,14 +4026,15 @@ class Databases(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_documents_endpoint, api_params, [database_id, collection_id])
+
+        return self._parse_response(response, model=DocumentList, model_type=model_type)
 
-        return DocumentList.with_data(response, model_type)
 
+    _delete_documents_endpoint = Endpoint('delete', '/databases/{databaseId}/collections/{collectionId}/documents', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.delete_rows` instead.")
     def delete_documents(
@@ -4248,7 +4075,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4256,22 +4082,19 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_documents_endpoint, api_params, [database_id, collection_id])
+
+        return self._parse_response(response, model=DocumentList, model_type=model_type)
 
-        return DocumentList.with_data(response, model_type)
 
+    _get_document_endpoint = Endpoint('get', '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}', {
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.get_row` instead.")
     def get_document(
@@ -4315,7 +4138,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4326,22 +4148,20 @@ class Databases(Service):
         if document_id is None:
             raise AppwriteException('Missing required parameter: "document_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{documentId}', str(self._normalize_value(document_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_document_endpoint, api_params, [database_id, collection_id, document_id])
+
+        return self._parse_response(response, model=Document, model_type=model_type)
 
-        return Document.with_data(response, model_type)
 
+    _upsert_document_endpoint = Endpoint('put', '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.upsert_row` instead.")
     def upsert_document(
@@ -4388,7 +4208,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4399,10 +4218,6 @@ class Databases(Service):
         if document_id is None:
             raise AppwriteException('Missing required parameter: "document_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{documentId}', str(self._normalize_value(document_id)))
-
         if data is not None:
             api_params['data'] = self._normalize_value(data)
         if permissions is not None:
@@ -4410,14 +4225,15 @@ class Databases(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._upsert_document_endpoint, api_params, [database_id, collection_id, document_id])
+
+        return self._parse_response(response, model=Document, model_type=model_type)
 
-        return Document.with_data(response, model_type)
 
+    _update_document_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_row` instead.")
     def update_document(
@@ -4464,7 +4280,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4475,10 +4290,6 @@ class Databases(Service):
         if document_id is None:
             raise AppwriteException('Missing required parameter: "document_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{documentId}', str(self._normalize_value(document_id)))
-
         if data is not None:
             api_params['data'] = self._normalize_value(data)
         if permissions is not None:
@@ -4486,15 +4297,15 @@ class Databases(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_document_endpoint, api_params, [database_id, collection_id, document_id])
 
-        return Document.with_data(response, model_type)
+        return self._parse_response(response, model=Document, model_type=model_type)
 
 
+    _delete_document_endpoint = Endpoint('delete', '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}', {
+        'content-type': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.delete_row` instead.")
     def delete_document(
         self,
@@ -4530,7 +4341,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4541,21 +4351,19 @@ class Databases(Service):
         if document_id is None:
             raise AppwriteException('Missing required parameter: "document_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{documentId}', str(self._normalize_value(document_id)))
-
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_document_endpoint, api_params, [database_id, collection_id, document_id])
 
         return response
 
 
+    _decrement_document_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}/{attribute}/decrement', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.decrement_row_column` instead.")
     def decrement_document_attribute(
         self,
@@ -4604,7 +4412,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}/{attribute}/decrement'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4618,11 +4425,6 @@ class Databases(Service):
         if attribute is None:
             raise AppwriteException('Missing required parameter: "attribute"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{documentId}', str(self._normalize_value(document_id)))
-        api_path = api_path.replace('{attribute}', str(self._normalize_value(attribute)))
-
         if value is not None:
             api_params['value'] = self._normalize_value(value)
         if min is not None:
@@ -4630,15 +4432,16 @@ class Databases(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._decrement_document_attribute_endpoint, api_params, [database_id, collection_id, document_id, attribute])
 
-        return Document.with_data(response, model_type)
+        return self._parse_response(response, model=Document, model_type=model_type)
 
 
+    _increment_document_attribute_endpoint = Endpoint('patch', '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}/{attribute}/increment', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.increment_row_column` instead.")
     def increment_document_attribute(
         self,
@@ -4687,7 +4490,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/documents/{documentId}/{attribute}/increment'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4701,11 +4503,6 @@ class Databases(Service):
         if attribute is None:
             raise AppwriteException('Missing required parameter: "attribute"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{documentId}', str(self._normalize_value(document_id)))
-        api_path = api_path.replace('{attribute}', str(self._normalize_value(attribute)))
-
         if value is not None:
             api_params['value'] = self._normalize_value(value)
         if max is not None:
@@ -4713,15 +4510,15 @@ class Databases(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._increment_document_attribute_endpoint, api_params, [database_id, collection_id, document_id, attribute])
 
-        return Document.with_data(response, model_type)
+        return self._parse_response(response, model=Document, model_type=model_type)
 
 
+    _list_indexes_endpoint = Endpoint('get', '/databases/{databaseId}/collections/{collectionId}/indexes', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.list_indexes` instead.")
     def list_indexes(
         self,
@@ -4757,7 +4554,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/indexes'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4765,22 +4561,21 @@ class Databases(Service):
         if collection_id is None:
             raise AppwriteException('Missing required parameter: "collection_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_indexes_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=IndexList)
 
 
+    _create_index_endpoint = Endpoint('post', '/databases/{databaseId}/collections/{collectionId}/indexes', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.create_index` instead.")
     def create_index(
         self,
@@ -4826,7 +4621,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/indexes'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4843,9 +4637,6 @@ class Databases(Service):
         if attributes is None:
             raise AppwriteException('Missing required parameter: "attributes"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['type'] = self._normalize_value(type)
         api_params['attributes'] = self._normalize_value(attributes)
@@ -4854,15 +4645,15 @@ class Databases(Service):
         if lengths is not None:
             api_params['lengths'] = self._normalize_value(lengths)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_index_endpoint, api_params, [database_id, collection_id])
 
         return self._parse_response(response, model=Index)
 
 
+    _get_index_endpoint = Endpoint('get', '/databases/{databaseId}/collections/{collectionId}/indexes/{key}', {
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.get_index` instead.")
     def get_index(
         self,
@@ -4895,7 +4686,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/indexes/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4906,19 +4696,16 @@ class Databases(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_index_endpoint, api_params, [database_id, collection_id, key])
 
         return self._parse_response(response, model=Index)
 
 
+    _delete_index_endpoint = Endpoint('delete', '/databases/{databaseId}/collections/{collectionId}/indexes/{key}', {
+        'content-type': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.delete_index` instead.")
     def delete_index(
         self,
@@ -4951,7 +4738,6 @@ class Databases(Service):
             If API request fails
         """
 
-        api_path = '/databases/{databaseId}/collections/{collectionId}/indexes/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4962,15 +4748,8 @@ class Databases(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{collectionId}', str(self._normalize_value(collection_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_index_endpoint, api_params, [database_id, collection_id, key])
 
         return response
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -26,6 +27,10 @@ class Functions(Service):
     def __init__(self, client) -> None:
         super(Functions, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/functions', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -55,7 +60,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions'
         api_params = {}
 
         if queries is not None:
@@ -65,14 +69,16 @@ class Functions(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
 
         return self._parse_response(response, model=FunctionList)
 
 
+    _create_endpoint = Endpoint('post', '/functions', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create(
         self,
         function_id: str,
@@ -159,7 +165,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -213,15 +218,15 @@ class Functions(Service):
         if deployment_retention is not None:
             api_params['deploymentRetention'] = self._normalize_value(deployment_retention)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
         return self._parse_response(response, model=Function)
 
 
+    _list_runtimes_endpoint = Endpoint('get', '/functions/runtimes', {
+        'accept': 'application/json',
+    })
+
     def list_runtimes(
         self
     ) -> RuntimeList:
@@ -239,17 +244,17 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/runtimes'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_runtimes_endpoint, api_params)
 
         return self._parse_response(response, model=RuntimeList)
 
 
+    _list_specifications_endpoint = Endpoint('get', '/functions/specifications', {
+        'accept': 'application/json',
+    })
+
     def list_specifications(
         self,
         type: Optional[str] = None
@@ -273,20 +278,20 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/specifications'
         api_params = {}
 
         if type is not None:
             api_params['type'] = self._normalize_value(type)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_specifications_endpoint, api_params)
 
         return self._parse_response(response, model=SpecificationList)
 
 
+    _get_endpoint = Endpoint('get', '/functions/{functionId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         function_id: str
@@ -310,22 +315,21 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Function)
 
 
+    _update_endpoint = Endpoint('put', '/functions/{functionId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update(
         self,
         function_id: str,
@@ -412,7 +416,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -420,8 +423,6 @@ class Functions(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         api_params['name'] = self._normalize_value(name)
         if runtime is not None:
             api_params['runtime'] = self._normalize_value(runtime)
@@ -464,15 +465,15 @@ class Functions(Service):
         if deployment_retention is not None:
             api_params['deploymentRetention'] = self._normalize_value(deployment_retention)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Function)
 
 
+    _delete_endpoint = Endpoint('delete', '/functions/{functionId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         function_id: str
@@ -496,22 +497,21 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [function_id])
 
         return response
 
 
+    _update_function_deployment_endpoint = Endpoint('patch', '/functions/{functionId}/deployment', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_function_deployment(
         self,
         function_id: str,
@@ -538,7 +538,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployment'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -546,19 +545,17 @@ class Functions(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         api_params['deploymentId'] = self._normalize_value(deployment_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_function_deployment_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Function)
 
 
+    _list_deployments_endpoint = Endpoint('get', '/functions/{functionId}/deployments', {
+        'accept': 'application/json',
+    })
+
     def list_deployments(
         self,
         function_id: str,
@@ -591,13 +588,10 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -605,14 +599,16 @@ class Functions(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_deployments_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=DeploymentList)
 
 
+    _create_deployment_endpoint = Endpoint('post', '/functions/{functionId}/deployments', {
+        'content-type': 'multipart/form-data',
+        'accept': 'application/json',
+    })
+
     def create_deployment(
         self,
         function_id: str,
@@ -620,7 +616,11 @@ class Functions(Service):
         activate: bool,
         entrypoint: Optional[str] = None,
         commands: Optional[str] = None,
-        on_progress = None
+        on_progress = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_bytes_per_second: Optional[float] = None,
+        adaptive: Optional[bool] = None
     ) -> Deployment:
         """
         Create a new function code deployment. Use this endpoint to upload a new version of your code function. To execute your newly uploaded code, you'll need to update the function's deployment to use your new deployment UID.
@@ -643,6 +643,14 @@ class Functions(Service):
             Build Commands.
                 on_progress : callable, optional
             Optional callback for upload progress
+        chunk_size : Optional[int]
+            Size of each uploaded chunk in bytes. Defaults to the client's upload options.
+        max_workers : Optional[int]
+            Maximum number of chunks uploaded in parallel. Defaults to the client's upload options.
+        max_bytes_per_second : Optional[float]
+            Upload bandwidth limit in bytes per second. Defaults to the client's upload options.
+        adaptive : Optional[bool]
+            Adjust the number of parallel chunks to the measured throughput. Defaults to the client's upload options.
         
         Returns
         -------
@@ -655,7 +663,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -666,7 +673,7 @@ class Functions(Service):
         if activate is None:
             raise AppwriteException('Missing required parameter: "activate"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
+        api_path = self._create_deployment_endpoint.format_path([function_id])
 
         if entrypoint is not None:
             api_params['entrypoint'] = self._normalize_value(entrypoint)
@@ -680,15 +687,28 @@ class Functions(Service):
 
         upload_id = ''
 
-        response = self.client.chunked_upload(api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'multipart/form-data',
-            'accept': 'application/json',
-        }, api_params, param_name, on_progress, upload_id)
+        response = self.client.chunked_upload(
+            api_path,
+            self._create_deployment_endpoint.request_headers(self.client.get_config('project')),
+            api_params,
+            param_name,
+            on_progress,
+            upload_id,
+            chunk_size,
+            max_workers,
+            max_bytes_per_second,
+            adaptive,
+            endpoint=self._create_deployment_endpoint
+        )
 
         return self._parse_response(response, model=Deployment)
 
 
+    _create_duplicate_deployment_endpoint = Endpoint('post', '/functions/{functionId}/deployments/duplicate', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_duplicate_deployment(
         self,
         function_id: str,
@@ -718,7 +738,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments/duplicate'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -726,21 +745,20 @@ class Functions(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         api_params['deploymentId'] = self._normalize_value(deployment_id)
         if build_id is not None:
             api_params['buildId'] = self._normalize_value(build_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_duplicate_deployment_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _create_template_deployment_endpoint = Endpoint('post', '/functions/{functionId}/deployments/template', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_template_deployment(
         self,
         function_id: str,
@@ -784,7 +802,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments/template'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -804,8 +821,6 @@ class Functions(Service):
         if reference is None:
             raise AppwriteException('Missing required parameter: "reference"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         api_params['repository'] = self._normalize_value(repository)
         api_params['owner'] = self._normalize_value(owner)
         api_params['rootDirectory'] = self._normalize_value(root_directory)
@@ -814,15 +829,16 @@ class Functions(Service):
         if activate is not None:
             api_params['activate'] = self._normalize_value(activate)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_template_deployment_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _create_vcs_deployment_endpoint = Endpoint('post', '/functions/{functionId}/deployments/vcs', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_vcs_deployment(
         self,
         function_id: str,
@@ -857,7 +873,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments/vcs'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -868,22 +883,20 @@ class Functions(Service):
         if reference is None:
             raise AppwriteException('Missing required parameter: "reference"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         api_params['type'] = self._normalize_value(type)
         api_params['reference'] = self._normalize_value(reference)
         if activate is not None:
             api_params['activate'] = self._normalize_value(activate)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_vcs_deployment_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _get_deployment_endpoint = Endpoint('get', '/functions/{functionId}/deployments/{deploymentId}', {
+        'accept': 'application/json',
+    })
+
     def get_deployment(
         self,
         function_id: str,
@@ -910,7 +923,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments/{deploymentId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -918,18 +930,16 @@ class Functions(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_deployment_endpoint, api_params, [function_id, deployment_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _delete_deployment_endpoint = Endpoint('delete', '/functions/{functionId}/deployments/{deploymentId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_deployment(
         self,
         function_id: str,
@@ -956,7 +966,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments/{deploymentId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -964,18 +973,16 @@ class Functions(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_deployment_endpoint, api_params, [function_id, deployment_id])
 
         return response
 
 
+    _get_deployment_download_endpoint = Endpoint('get', '/functions/{functionId}/deployments/{deploymentId}/download', {
+        'accept': '*/*',
+    })
+
     def get_deployment_download(
         self,
         function_id: str,
@@ -1008,7 +1015,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments/{deploymentId}/download'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1016,22 +1022,21 @@ class Functions(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
-
         if type is not None:
             api_params['type'] = self._normalize_value(type)
         if token is not None:
             api_params['token'] = self._normalize_value(token)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': '*/*',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_deployment_download_endpoint, api_params, [function_id, deployment_id])
 
         return response
 
 
+    _update_deployment_status_endpoint = Endpoint('patch', '/functions/{functionId}/deployments/{deploymentId}/status', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_deployment_status(
         self,
         function_id: str,
@@ -1058,7 +1063,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/deployments/{deploymentId}/status'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1066,19 +1070,16 @@ class Functions(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
-
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_deployment_status_endpoint, api_params, [function_id, deployment_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _list_executions_endpoint = Endpoint('get', '/functions/{functionId}/executions', {
+        'accept': 'application/json',
+    })
+
     def list_executions(
         self,
         function_id: str,
@@ -1108,26 +1109,25 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/executions'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_executions_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=ExecutionList)
 
 
+    _create_execution_endpoint = Endpoint('post', '/functions/{functionId}/executions', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_execution(
         self,
         function_id: str,
@@ -1169,13 +1169,10 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/executions'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         if body is not None:
             api_params['body'] = self._normalize_value(body)
         if xasync is not None:
@@ -1189,15 +1186,15 @@ class Functions(Service):
         if scheduled_at is not None:
             api_params['scheduledAt'] = self._normalize_value(scheduled_at)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_execution_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Execution)
 
 
+    _get_execution_endpoint = Endpoint('get', '/functions/{functionId}/executions/{executionId}', {
+        'accept': 'application/json',
+    })
+
     def get_execution(
         self,
         function_id: str,
@@ -1224,7 +1221,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/executions/{executionId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1232,18 +1228,16 @@ class Functions(Service):
         if execution_id is None:
             raise AppwriteException('Missing required parameter: "execution_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{executionId}', str(self._normalize_value(execution_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_execution_endpoint, api_params, [function_id, execution_id])
 
         return self._parse_response(response, model=Execution)
 
 
+    _delete_execution_endpoint = Endpoint('delete', '/functions/{functionId}/executions/{executionId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_execution(
         self,
         function_id: str,
@@ -1270,7 +1264,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/executions/{executionId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1278,18 +1271,16 @@ class Functions(Service):
         if execution_id is None:
             raise AppwriteException('Missing required parameter: "execution_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{executionId}', str(self._normalize_value(execution_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_execution_endpoint, api_params, [function_id, execution_id])
 
         return response
 
 
+    _list_variables_endpoint = Endpoint('get', '/functions/{functionId}/variables', {
+        'accept': 'application/json',
+    })
+
     def list_variables(
         self,
         function_id: str,
@@ -1319,26 +1310,25 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/variables'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_variables_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=VariableList)
 
 
+    _create_variable_endpoint = Endpoint('post', '/functions/{functionId}/variables', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_variable(
         self,
         function_id: str,
@@ -1374,7 +1364,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/variables'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1388,23 +1377,21 @@ class Functions(Service):
         if value is None:
             raise AppwriteException('Missing required parameter: "value"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-
         api_params['variableId'] = self._normalize_value(variable_id)
         api_params['key'] = self._normalize_value(key)
         api_params['value'] = self._normalize_value(value)
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_variable_endpoint, api_params, [function_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _get_variable_endpoint = Endpoint('get', '/functions/{functionId}/variables/{variableId}', {
+        'accept': 'application/json',
+    })
+
     def get_variable(
         self,
         function_id: str,
@@ -1431,7 +1418,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/variables/{variableId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1439,18 +1425,17 @@ class Functions(Service):
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_variable_endpoint, api_params, [function_id, variable_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _update_variable_endpoint = Endpoint('put', '/functions/{functionId}/variables/{variableId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_variable(
         self,
         function_id: str,
@@ -1486,7 +1471,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/variables/{variableId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1494,9 +1478,6 @@ class Functions(Service):
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
-
         if key is not None:
             api_params['key'] = self._normalize_value(key)
         if value is not None:
@@ -1504,15 +1485,15 @@ class Functions(Service):
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_variable_endpoint, api_params, [function_id, variable_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _delete_variable_endpoint = Endpoint('delete', '/functions/{functionId}/variables/{variableId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_variable(
         self,
         function_id: str,
@@ -1539,7 +1520,6 @@ class Functions(Service):
             If API request fails
         """
 
-        api_path = '/functions/{functionId}/variables/{variableId}'
         api_params = {}
         if function_id is None:
             raise AppwriteException('Missing required parameter: "function_id"')
@@ -1547,14 +1527,8 @@ class Functions(Service):
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{functionId}', str(self._normalize_value(function_id)))
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_variable_endpoint, api_params, [function_id, variable_id])
 
         return response
 
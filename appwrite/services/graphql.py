@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -9,6 +10,12 @@ class Graphql(Service):
     def __init__(self, client) -> None:
         super(Graphql, self).__init__(client)
 
+    _query_endpoint = Endpoint('post', '/graphql', {
+        'x-sdk-graphql': 'true',
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def query(
         self,
         query: Dict[str, Any]
@@ -32,7 +39,6 @@ class Graphql(Service):
             If API request fails
         """
 
-        api_path = '/graphql'
         api_params = {}
         if query is None:
             raise AppwriteException('Missing required parameter: "query"')
@@ -40,16 +46,17 @@ class Graphql(Service):
 
         api_params['query'] = self._normalize_value(query)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'x-sdk-graphql': 'true',
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._query_endpoint, api_params)
 
         return response
 
 
+    _mutation_endpoint = Endpoint('post', '/graphql/mutation', {
+        'x-sdk-graphql': 'true',
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def mutation(
         self,
         query: Dict[str, Any]
@@ -73,7 +80,6 @@ class Graphql(Service):
             If API request fails
         """
 
-        api_path = '/graphql/mutation'
         api_params = {}
         if query is None:
             raise AppwriteException('Missing required parameter: "query"')
@@ -81,12 +87,7 @@ class Graphql(Service):
 
         api_params['query'] = self._normalize_value(query)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'x-sdk-graphql': 'true',
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._mutation_endpoint, api_params)
 
         return response
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -16,6 +17,10 @@ class Locale(Service):
     def __init__(self, client) -> None:
         super(Locale, self).__init__(client)
 
+    _get_endpoint = Endpoint('get', '/locale', {
+        'accept': 'application/json',
+    })
+
     def get(
         self
     ) -> LocaleModel:
@@ -35,17 +40,17 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params)
 
         return self._parse_response(response, model=LocaleModel)
 
 
+    _list_codes_endpoint = Endpoint('get', '/locale/codes', {
+        'accept': 'application/json',
+    })
+
     def list_codes(
         self
     ) -> LocaleCodeList:
@@ -63,17 +68,17 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale/codes'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_codes_endpoint, api_params)
 
         return self._parse_response(response, model=LocaleCodeList)
 
 
+    _list_continents_endpoint = Endpoint('get', '/locale/continents', {
+        'accept': 'application/json',
+    })
+
     def list_continents(
         self
     ) -> ContinentList:
@@ -91,17 +96,17 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale/continents'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_continents_endpoint, api_params)
 
         return self._parse_response(response, model=ContinentList)
 
 
+    _list_countries_endpoint = Endpoint('get', '/locale/countries', {
+        'accept': 'application/json',
+    })
+
     def list_countries(
         self
     ) -> CountryList:
@@ -119,17 +124,17 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale/countries'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_countries_endpoint, api_params)
 
         return self._parse_response(response, model=CountryList)
 
 
+    _list_countries_eu_endpoint = Endpoint('get', '/locale/countries/eu', {
+        'accept': 'application/json',
+    })
+
     def list_countries_eu(
         self
     ) -> CountryList:
@@ -147,17 +152,17 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale/countries/eu'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_countries_eu_endpoint, api_params)
 
         return self._parse_response(response, model=CountryList)
 
 
+    _list_countries_phones_endpoint = Endpoint('get', '/locale/countries/phones', {
+        'accept': 'application/json',
+    })
+
     def list_countries_phones(
         self
     ) -> PhoneList:
@@ -175,17 +180,17 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale/countries/phones'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_countries_phones_endpoint, api_params)
 
         return self._parse_response(response, model=PhoneList)
 
 
+    _list_currencies_endpoint = Endpoint('get', '/locale/currencies', {
+        'accept': 'application/json',
+    })
+
     def list_currencies(
         self
     ) -> CurrencyList:
@@ -203,17 +208,17 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale/currencies'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_currencies_endpoint, api_params)
 
         return self._parse_response(response, model=CurrencyList)
 
 
+    _list_languages_endpoint = Endpoint('get', '/locale/languages', {
+        'accept': 'application/json',
+    })
+
     def list_languages(
         self
     ) -> LanguageList:
@@ -231,13 +236,9 @@ class Locale(Service):
             If API request fails
         """
 
-        api_path = '/locale/languages'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_languages_endpoint, api_params)
 
         return self._parse_response(response, model=LanguageList)
 
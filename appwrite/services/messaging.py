@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -20,6 +21,10 @@ class Messaging(Service):
     def __init__(self, client) -> None:
         super(Messaging, self).__init__(client)
 
+    _list_messages_endpoint = Endpoint('get', '/messaging/messages', {
+        'accept': 'application/json',
+    })
+
     def list_messages(
         self,
         queries: Optional[List[str]] = None,
@@ -49,7 +54,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages'
         api_params = {}
 
         if queries is not None:
@@ -59,14 +63,16 @@ class Messaging(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_messages_endpoint, api_params)
 
         return self._parse_response(response, model=MessageList)
 
 
+    _create_email_endpoint = Endpoint('post', '/messaging/messages/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_email(
         self,
         message_id: str,
@@ -123,7 +129,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/email'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
@@ -157,15 +162,16 @@ class Messaging(Service):
         if scheduled_at is not None:
             api_params['scheduledAt'] = self._normalize_value(scheduled_at)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_email_endpoint, api_params)
 
         return self._parse_response(response, model=Message)
 
 
+    _update_email_endpoint = Endpoint('patch', '/messaging/messages/email/{messageId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_email(
         self,
         message_id: str,
@@ -223,13 +229,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/email/{messageId}'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
 
-        api_path = api_path.replace('{messageId}', str(self._normalize_value(message_id)))
-
         if topics is not None:
             api_params['topics'] = self._normalize_value(topics)
         if users is not None:
@@ -253,15 +256,16 @@ class Messaging(Service):
         if attachments is not None:
             api_params['attachments'] = self._normalize_value(attachments)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_endpoint, api_params, [message_id])
 
         return self._parse_response(response, model=Message)
 
 
+    _create_push_endpoint = Endpoint('post', '/messaging/messages/push', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_push(
         self,
         message_id: str,
@@ -339,7 +343,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/push'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
@@ -383,15 +386,16 @@ class Messaging(Service):
         if priority is not None:
             api_params['priority'] = self._normalize_value(priority)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_push_endpoint, api_params)
 
         return self._parse_response(response, model=Message)
 
 
+    _update_push_endpoint = Endpoint('patch', '/messaging/messages/push/{messageId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_push(
         self,
         message_id: str,
@@ -470,13 +474,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/push/{messageId}'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
 
-        api_path = api_path.replace('{messageId}', str(self._normalize_value(message_id)))
-
         if topics is not None:
             api_params['topics'] = self._normalize_value(topics)
         if users is not None:
@@ -514,15 +515,16 @@ class Messaging(Service):
         if priority is not None:
             api_params['priority'] = self._normalize_value(priority)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_push_endpoint, api_params, [message_id])
 
         return self._parse_response(response, model=Message)
 
 
+    _create_sms_endpoint = Endpoint('post', '/messaging/messages/sms', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_sms(
         self,
         message_id: str,
@@ -564,7 +566,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/sms'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
@@ -586,15 +587,16 @@ class Messaging(Service):
         if scheduled_at is not None:
             api_params['scheduledAt'] = self._normalize_value(scheduled_at)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_sms_endpoint, api_params)
 
         return self._parse_response(response, model=Message)
 
 
+    _update_sms_endpoint = Endpoint('patch', '/messaging/messages/sms/{messageId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_sms(
         self,
         message_id: str,
@@ -637,13 +639,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/sms/{messageId}'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
 
-        api_path = api_path.replace('{messageId}', str(self._normalize_value(message_id)))
-
         if topics is not None:
             api_params['topics'] = self._normalize_value(topics)
         if users is not None:
@@ -657,15 +656,15 @@ class Messaging(Service):
         if scheduled_at is not None:
             api_params['scheduledAt'] = self._normalize_value(scheduled_at)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_sms_endpoint, api_params, [message_id])
 
         return self._parse_response(response, model=Message)
 
 
+    _get_message_endpoint = Endpoint('get', '/messaging/messages/{messageId}', {
+        'accept': 'application/json',
+    })
+
     def get_message(
         self,
         message_id: str
@@ -690,22 +689,20 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/{messageId}'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
 
-        api_path = api_path.replace('{messageId}', str(self._normalize_value(message_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_message_endpoint, api_params, [message_id])
 
         return self._parse_response(response, model=Message)
 
 
+    _delete_endpoint = Endpoint('delete', '/messaging/messages/{messageId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         message_id: str
@@ -729,22 +726,20 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/{messageId}'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
 
-        api_path = api_path.replace('{messageId}', str(self._normalize_value(message_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [message_id])
 
         return response
 
 
+    _list_targets_endpoint = Endpoint('get', '/messaging/messages/{messageId}/targets', {
+        'accept': 'application/json',
+    })
+
     def list_targets(
         self,
         message_id: str,
@@ -774,26 +769,24 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/messages/{messageId}/targets'
         api_params = {}
         if message_id is None:
             raise AppwriteException('Missing required parameter: "message_id"')
 
-        api_path = api_path.replace('{messageId}', str(self._normalize_value(message_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_targets_endpoint, api_params, [message_id])
 
         return self._parse_response(response, model=TargetList)
 
 
+    _list_providers_endpoint = Endpoint('get', '/messaging/providers', {
+        'accept': 'application/json',
+    })
+
     def list_providers(
         self,
         queries: Optional[List[str]] = None,
@@ -823,7 +816,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers'
         api_params = {}
 
         if queries is not None:
@@ -833,14 +825,16 @@ class Messaging(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_providers_endpoint, api_params)
 
         return self._parse_response(response, model=ProviderList)
 
 
+    _create_apns_provider_endpoint = Endpoint('post', '/messaging/providers/apns', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_apns_provider(
         self,
         provider_id: str,
@@ -885,7 +879,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/apns'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -909,15 +902,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_apns_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_apns_provider_endpoint = Endpoint('patch', '/messaging/providers/apns/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_apns_provider(
         self,
         provider_id: str,
@@ -962,13 +956,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/apns/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -984,15 +975,16 @@ class Messaging(Service):
         if sandbox is not None:
             api_params['sandbox'] = self._normalize_value(sandbox)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_apns_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_fcm_provider_endpoint = Endpoint('post', '/messaging/providers/fcm', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_fcm_provider(
         self,
         provider_id: str,
@@ -1025,7 +1017,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/fcm'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -1041,15 +1032,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_fcm_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_fcm_provider_endpoint = Endpoint('patch', '/messaging/providers/fcm/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_fcm_provider(
         self,
         provider_id: str,
@@ -1082,13 +1074,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/fcm/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -1096,15 +1085,16 @@ class Messaging(Service):
         if service_account_json is not None:
             api_params['serviceAccountJSON'] = self._normalize_value(service_account_json)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_fcm_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_mailgun_provider_endpoint = Endpoint('post', '/messaging/providers/mailgun', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_mailgun_provider(
         self,
         provider_id: str,
@@ -1155,7 +1145,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/mailgun'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -1183,15 +1172,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mailgun_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_mailgun_provider_endpoint = Endpoint('patch', '/messaging/providers/mailgun/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mailgun_provider(
         self,
         provider_id: str,
@@ -1242,13 +1232,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/mailgun/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if api_key is not None:
@@ -1268,15 +1255,16 @@ class Messaging(Service):
         if reply_to_email is not None:
             api_params['replyToEmail'] = self._normalize_value(reply_to_email)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mailgun_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_msg91_provider_endpoint = Endpoint('post', '/messaging/providers/msg91', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_msg91_provider(
         self,
         provider_id: str,
@@ -1315,7 +1303,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/msg91'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -1335,15 +1322,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_msg91_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_msg91_provider_endpoint = Endpoint('patch', '/messaging/providers/msg91/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_msg91_provider(
         self,
         provider_id: str,
@@ -1382,13 +1370,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/msg91/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -1400,15 +1385,16 @@ class Messaging(Service):
         if auth_key is not None:
             api_params['authKey'] = self._normalize_value(auth_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_msg91_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_resend_provider_endpoint = Endpoint('post', '/messaging/providers/resend', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_resend_provider(
         self,
         provider_id: str,
@@ -1453,7 +1439,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/resend'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -1477,15 +1462,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_resend_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_resend_provider_endpoint = Endpoint('patch', '/messaging/providers/resend/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_resend_provider(
         self,
         provider_id: str,
@@ -1530,13 +1516,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/resend/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -1552,15 +1535,16 @@ class Messaging(Service):
         if reply_to_email is not None:
             api_params['replyToEmail'] = self._normalize_value(reply_to_email)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_resend_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_sendgrid_provider_endpoint = Endpoint('post', '/messaging/providers/sendgrid', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_sendgrid_provider(
         self,
         provider_id: str,
@@ -1605,7 +1589,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/sendgrid'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -1629,15 +1612,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_sendgrid_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_sendgrid_provider_endpoint = Endpoint('patch', '/messaging/providers/sendgrid/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_sendgrid_provider(
         self,
         provider_id: str,
@@ -1682,13 +1666,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/sendgrid/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -1704,15 +1685,16 @@ class Messaging(Service):
         if reply_to_email is not None:
             api_params['replyToEmail'] = self._normalize_value(reply_to_email)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_sendgrid_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_ses_provider_endpoint = Endpoint('post', '/messaging/providers/ses', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_ses_provider(
         self,
         provider_id: str,
@@ -1763,7 +1745,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/ses'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -1791,15 +1772,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_ses_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_ses_provider_endpoint = Endpoint('patch', '/messaging/providers/ses/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_ses_provider(
         self,
         provider_id: str,
@@ -1850,13 +1832,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/ses/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -1876,15 +1855,16 @@ class Messaging(Service):
         if reply_to_email is not None:
             api_params['replyToEmail'] = self._normalize_value(reply_to_email)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_ses_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_smtp_provider_endpoint = Endpoint('post', '/messaging/providers/smtp', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_smtp_provider(
         self,
         provider_id: str,
@@ -1947,7 +1927,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/smtp'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -1985,15 +1964,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_smtp_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_smtp_provider_endpoint = Endpoint('patch', '/messaging/providers/smtp/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_smtp_provider(
         self,
         provider_id: str,
@@ -2056,13 +2036,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/smtp/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if host is not None:
@@ -2090,15 +2067,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_smtp_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_telesign_provider_endpoint = Endpoint('post', '/messaging/providers/telesign', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_telesign_provider(
         self,
         provider_id: str,
@@ -2137,7 +2115,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/telesign'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -2157,15 +2134,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_telesign_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_telesign_provider_endpoint = Endpoint('patch', '/messaging/providers/telesign/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_telesign_provider(
         self,
         provider_id: str,
@@ -2204,13 +2182,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/telesign/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -2222,15 +2197,16 @@ class Messaging(Service):
         if xfrom is not None:
             api_params['from'] = self._normalize_value(xfrom)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_telesign_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_textmagic_provider_endpoint = Endpoint('post', '/messaging/providers/textmagic', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_textmagic_provider(
         self,
         provider_id: str,
@@ -2269,7 +2245,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/textmagic'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -2289,15 +2264,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_textmagic_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_textmagic_provider_endpoint = Endpoint('patch', '/messaging/providers/textmagic/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_textmagic_provider(
         self,
         provider_id: str,
@@ -2336,13 +2312,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/textmagic/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -2354,15 +2327,16 @@ class Messaging(Service):
         if xfrom is not None:
             api_params['from'] = self._normalize_value(xfrom)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_textmagic_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_twilio_provider_endpoint = Endpoint('post', '/messaging/providers/twilio', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_twilio_provider(
         self,
         provider_id: str,
@@ -2401,7 +2375,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/twilio'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -2421,15 +2394,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_twilio_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_twilio_provider_endpoint = Endpoint('patch', '/messaging/providers/twilio/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_twilio_provider(
         self,
         provider_id: str,
@@ -2468,13 +2442,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/twilio/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -2486,15 +2457,16 @@ class Messaging(Service):
         if xfrom is not None:
             api_params['from'] = self._normalize_value(xfrom)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_twilio_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _create_vonage_provider_endpoint = Endpoint('post', '/messaging/providers/vonage', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_vonage_provider(
         self,
         provider_id: str,
@@ -2533,7 +2505,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/vonage'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
@@ -2553,15 +2524,16 @@ class Messaging(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_vonage_provider_endpoint, api_params)
 
         return self._parse_response(response, model=Provider)
 
 
+    _update_vonage_provider_endpoint = Endpoint('patch', '/messaging/providers/vonage/{providerId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_vonage_provider(
         self,
         provider_id: str,
@@ -2600,13 +2572,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/vonage/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -2618,15 +2587,15 @@ class Messaging(Service):
         if xfrom is not None:
             api_params['from'] = self._normalize_value(xfrom)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_vonage_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _get_provider_endpoint = Endpoint('get', '/messaging/providers/{providerId}', {
+        'accept': 'application/json',
+    })
+
     def get_provider(
         self,
         provider_id: str
@@ -2651,22 +2620,20 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_provider_endpoint, api_params, [provider_id])
 
         return self._parse_response(response, model=Provider)
 
 
+    _delete_provider_endpoint = Endpoint('delete', '/messaging/providers/{providerId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_provider(
         self,
         provider_id: str
@@ -2690,22 +2657,20 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/providers/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_provider_endpoint, api_params, [provider_id])
 
         return response
 
 
+    _list_topics_endpoint = Endpoint('get', '/messaging/topics', {
+        'accept': 'application/json',
+    })
+
     def list_topics(
         self,
         queries: Optional[List[str]] = None,
@@ -2735,7 +2700,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics'
         api_params = {}
 
         if queries is not None:
@@ -2745,14 +2709,16 @@ class Messaging(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_topics_endpoint, api_params)
 
         return self._parse_response(response, model=TopicList)
 
 
+    _create_topic_endpoint = Endpoint('post', '/messaging/topics', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_topic(
         self,
         topic_id: str,
@@ -2782,7 +2748,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
@@ -2796,15 +2761,15 @@ class Messaging(Service):
         if subscribe is not None:
             api_params['subscribe'] = self._normalize_value(subscribe)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_topic_endpoint, api_params)
 
         return self._parse_response(response, model=Topic)
 
 
+    _get_topic_endpoint = Endpoint('get', '/messaging/topics/{topicId}', {
+        'accept': 'application/json',
+    })
+
     def get_topic(
         self,
         topic_id: str
@@ -2829,22 +2794,21 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics/{topicId}'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
 
-        api_path = api_path.replace('{topicId}', str(self._normalize_value(topic_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_topic_endpoint, api_params, [topic_id])
 
         return self._parse_response(response, model=Topic)
 
 
+    _update_topic_endpoint = Endpoint('patch', '/messaging/topics/{topicId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_topic(
         self,
         topic_id: str,
@@ -2875,27 +2839,24 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics/{topicId}'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
 
-        api_path = api_path.replace('{topicId}', str(self._normalize_value(topic_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if subscribe is not None:
             api_params['subscribe'] = self._normalize_value(subscribe)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_topic_endpoint, api_params, [topic_id])
 
         return self._parse_response(response, model=Topic)
 
 
+    _delete_topic_endpoint = Endpoint('delete', '/messaging/topics/{topicId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_topic(
         self,
         topic_id: str
@@ -2919,22 +2880,20 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics/{topicId}'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
 
-        api_path = api_path.replace('{topicId}', str(self._normalize_value(topic_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_topic_endpoint, api_params, [topic_id])
 
         return response
 
 
+    _list_subscribers_endpoint = Endpoint('get', '/messaging/topics/{topicId}/subscribers', {
+        'accept': 'application/json',
+    })
+
     def list_subscribers(
         self,
         topic_id: str,
@@ -2967,13 +2926,10 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics/{topicId}/subscribers'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
 
-        api_path = api_path.replace('{topicId}', str(self._normalize_value(topic_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -2981,14 +2937,16 @@ class Messaging(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_subscribers_endpoint, api_params, [topic_id])
 
         return self._parse_response(response, model=SubscriberList)
 
 
+    _create_subscriber_endpoint = Endpoint('post', '/messaging/topics/{topicId}/subscribers', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_subscriber(
         self,
         topic_id: str,
@@ -3018,7 +2976,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics/{topicId}/subscribers'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
@@ -3029,20 +2986,18 @@ class Messaging(Service):
         if target_id is None:
             raise AppwriteException('Missing required parameter: "target_id"')
 
-        api_path = api_path.replace('{topicId}', str(self._normalize_value(topic_id)))
-
         api_params['subscriberId'] = self._normalize_value(subscriber_id)
         api_params['targetId'] = self._normalize_value(target_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_subscriber_endpoint, api_params, [topic_id])
 
         return self._parse_response(response, model=Subscriber)
 
 
+    _get_subscriber_endpoint = Endpoint('get', '/messaging/topics/{topicId}/subscribers/{subscriberId}', {
+        'accept': 'application/json',
+    })
+
     def get_subscriber(
         self,
         topic_id: str,
@@ -3070,7 +3025,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics/{topicId}/subscribers/{subscriberId}'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
@@ -3078,18 +3032,16 @@ class Messaging(Service):
         if subscriber_id is None:
             raise AppwriteException('Missing required parameter: "subscriber_id"')
 
-        api_path = api_path.replace('{topicId}', str(self._normalize_value(topic_id)))
-        api_path = api_path.replace('{subscriberId}', str(self._normalize_value(subscriber_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_subscriber_endpoint, api_params, [topic_id, subscriber_id])
 
         return self._parse_response(response, model=Subscriber)
 
 
+    _delete_subscriber_endpoint = Endpoint('delete', '/messaging/topics/{topicId}/subscribers/{subscriberId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_subscriber(
         self,
         topic_id: str,
@@ -3116,7 +3068,6 @@ class Messaging(Service):
             If API request fails
         """
 
-        api_path = '/messaging/topics/{topicId}/subscribers/{subscriberId}'
         api_params = {}
         if topic_id is None:
             raise AppwriteException('Missing required parameter: "topic_id"')
@@ -3124,14 +3075,8 @@ class Messaging(Service):
         if subscriber_id is None:
             raise AppwriteException('Missing required parameter: "subscriber_id"')
 
-        api_path = api_path.replace('{topicId}', str(self._normalize_value(topic_id)))
-        api_path = api_path.replace('{subscriberId}', str(self._normalize_value(subscriber_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_subscriber_endpoint, api_params, [topic_id, subscriber_id])
 
         return response
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -18,6 +19,11 @@ class Oauth2(Service):
     def __init__(self, client) -> None:
         super(Oauth2, self).__init__(client)
 
+    _approve_endpoint = Endpoint('post', '/oauth2/{project_id}/approve', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def approve(
         self,
         grant_id: str,
@@ -47,27 +53,25 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/approve'
         api_params = {}
         if grant_id is None:
             raise AppwriteException('Missing required parameter: "grant_id"')
 
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
-
         api_params['grant_id'] = self._normalize_value(grant_id)
         if authorization_details is not None:
             api_params['authorization_details'] = self._normalize_value(authorization_details)
         if scope is not None:
             api_params['scope'] = self._normalize_value(scope)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._approve_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2Approve)
 
 
+    _authorize_endpoint = Endpoint('get', '/oauth2/{project_id}/authorize', {
+        'accept': 'application/json',
+    }, project=False)
+
     def authorize(
         self,
         client_id: Optional[str] = None,
@@ -130,9 +134,7 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/authorize'
         api_params = {}
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
 
         if client_id is not None:
             api_params['client_id'] = self._normalize_value(client_id)
@@ -163,13 +165,16 @@ class Oauth2(Service):
         if request_uri is not None:
             api_params['request_uri'] = self._normalize_value(request_uri)
 
-        response = self.client.call('get', api_path, {
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._authorize_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2Authorize)
 
 
+    _authorize_post_endpoint = Endpoint('post', '/oauth2/{project_id}/authorize', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def authorize_post(
         self,
         client_id: Optional[str] = None,
@@ -232,9 +237,7 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/authorize'
         api_params = {}
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
 
         if client_id is not None:
             api_params['client_id'] = self._normalize_value(client_id)
@@ -265,14 +268,16 @@ class Oauth2(Service):
         if request_uri is not None:
             api_params['request_uri'] = self._normalize_value(request_uri)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._authorize_post_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2Authorize)
 
 
+    _create_device_authorization_endpoint = Endpoint('post', '/oauth2/{project_id}/device_authorization', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def create_device_authorization(
         self,
         client_id: Optional[str] = None,
@@ -308,9 +313,7 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/device_authorization'
         api_params = {}
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
 
         if client_id is not None:
             api_params['client_id'] = self._normalize_value(client_id)
@@ -323,14 +326,16 @@ class Oauth2(Service):
         if audience is not None:
             api_params['audience'] = self._normalize_value(audience)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_device_authorization_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2DeviceAuthorization)
 
 
+    _create_grant_endpoint = Endpoint('post', '/oauth2/{project_id}/grants', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def create_grant(
         self,
         user_code: str
@@ -354,23 +359,21 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/grants'
         api_params = {}
         if user_code is None:
             raise AppwriteException('Missing required parameter: "user_code"')
 
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
-
         api_params['user_code'] = self._normalize_value(user_code)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_grant_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2Grant)
 
 
+    _get_grant_endpoint = Endpoint('get', '/oauth2/{project_id}/grants/{grant_id}', {
+        'accept': 'application/json',
+    }, project=False)
+
     def get_grant(
         self,
         grant_id: str
@@ -394,22 +397,20 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/grants/{grant_id}'
         api_params = {}
         if grant_id is None:
             raise AppwriteException('Missing required parameter: "grant_id"')
 
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
-        api_path = api_path.replace('{grant_id}', str(self._normalize_value(grant_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_grant_endpoint, api_params, [self.client.get_config('project'), grant_id])
 
         return self._parse_response(response, model=Oauth2Grant)
 
 
+    _list_organizations_endpoint = Endpoint('get', '/oauth2/{project_id}/organizations', {
+        'accept': 'application/json',
+    }, project=False)
+
     def list_organizations(
         self,
         limit: Optional[float] = None,
@@ -439,9 +440,7 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/organizations'
         api_params = {}
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
 
         if limit is not None:
             api_params['limit'] = self._normalize_value(limit)
@@ -450,13 +449,16 @@ class Oauth2(Service):
         if search is not None:
             api_params['search'] = self._normalize_value(search)
 
-        response = self.client.call('get', api_path, {
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_organizations_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2OrganizationList)
 
 
+    _create_par_endpoint = Endpoint('post', '/oauth2/{project_id}/par', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def create_par(
         self,
         client_id: str,
@@ -516,7 +518,6 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/par'
         api_params = {}
         if client_id is None:
             raise AppwriteException('Missing required parameter: "client_id"')
@@ -527,8 +528,6 @@ class Oauth2(Service):
         if response_type is None:
             raise AppwriteException('Missing required parameter: "response_type"')
 
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
-
         api_params['client_id'] = self._normalize_value(client_id)
         api_params['redirect_uri'] = self._normalize_value(redirect_uri)
         api_params['response_type'] = self._normalize_value(response_type)
@@ -553,14 +552,15 @@ class Oauth2(Service):
         if audience is not None:
             api_params['audience'] = self._normalize_value(audience)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_par_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2PAR)
 
 
+    _list_projects_endpoint = Endpoint('get', '/oauth2/{project_id}/projects', {
+        'accept': 'application/json',
+    }, project=False)
+
     def list_projects(
         self,
         limit: Optional[float] = None,
@@ -590,9 +590,7 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/projects'
         api_params = {}
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
 
         if limit is not None:
             api_params['limit'] = self._normalize_value(limit)
@@ -601,13 +599,16 @@ class Oauth2(Service):
         if search is not None:
             api_params['search'] = self._normalize_value(search)
 
-        response = self.client.call('get', api_path, {
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_projects_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2ProjectList)
 
 
+    _reject_endpoint = Endpoint('post', '/oauth2/{project_id}/reject', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def reject(
         self,
         grant_id: str
@@ -631,23 +632,22 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/reject'
         api_params = {}
         if grant_id is None:
             raise AppwriteException('Missing required parameter: "grant_id"')
 
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
-
         api_params['grant_id'] = self._normalize_value(grant_id)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._reject_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2Reject)
 
 
+    _revoke_endpoint = Endpoint('post', '/oauth2/{project_id}/revoke', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def revoke(
         self,
         token: str,
@@ -680,13 +680,10 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/revoke'
         api_params = {}
         if token is None:
             raise AppwriteException('Missing required parameter: "token"')
 
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
-
         api_params['token'] = self._normalize_value(token)
         if token_type_hint is not None:
             api_params['token_type_hint'] = self._normalize_value(token_type_hint)
@@ -695,14 +692,16 @@ class Oauth2(Service):
         if client_secret is not None:
             api_params['client_secret'] = self._normalize_value(client_secret)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._revoke_endpoint, api_params, [self.client.get_config('project')])
 
         return response
 
 
+    _create_token_endpoint = Endpoint('post', '/oauth2/{project_id}/token', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    }, project=False)
+
     def create_token(
         self,
         grant_type: str,
@@ -753,13 +752,10 @@ class Oauth2(Service):
             If API request fails
         """
 
-        api_path = '/oauth2/{project_id}/token'
         api_params = {}
         if grant_type is None:
             raise AppwriteException('Missing required parameter: "grant_type"')
 
-        api_path = api_path.replace('{project_id}', str(self._normalize_value(self.client.get_config('project'))))
-
         api_params['grant_type'] = self._normalize_value(grant_type)
         if code is not None:
             api_params['code'] = self._normalize_value(code)
@@ -780,10 +776,7 @@ class Oauth2(Service):
         if audience is not None:
             api_params['audience'] = self._normalize_value(audience)
 
-        response = self.client.call('post', api_path, {
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_token_endpoint, api_params, [self.client.get_config('project')])
 
         return self._parse_response(response, model=Oauth2Token)
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar
 from ..exception import AppwriteException
@@ -22,6 +23,10 @@ class Organization(Service):
     def __init__(self, client) -> None:
         super(Organization, self).__init__(client)
 
+    _get_endpoint = Endpoint('get', '/organization', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         model_type: Type[T] = dict
@@ -46,16 +51,17 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params)
+
+        return self._parse_response(response, model=OrganizationModel, model_type=model_type)
 
-        return OrganizationModel.with_data(response, model_type)
 
+    _update_endpoint = Endpoint('put', '/organization', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update(
         self,
@@ -84,7 +90,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization'
         api_params = {}
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
@@ -92,14 +97,14 @@ class Organization(Service):
 
         api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params)
+
+        return self._parse_response(response, model=OrganizationModel, model_type=model_type)
 
-        return OrganizationModel.with_data(response, model_type)
 
+    _delete_endpoint = Endpoint('delete', '/organization', {
+        'content-type': 'application/json',
+    })
 
     def delete(
         self
@@ -118,17 +123,17 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization'
         api_params = {}
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params)
 
         return response
 
 
+    _list_installations_endpoint = Endpoint('get', '/organization/installations', {
+        'accept': 'application/json',
+    })
+
     def list_installations(
         self,
         queries: Optional[List[str]] = None,
@@ -155,7 +160,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/installations'
         api_params = {}
 
         if queries is not None:
@@ -163,14 +167,16 @@ class Organization(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_installations_endpoint, api_params)
 
         return self._parse_response(response, model=AppInstallationList)
 
 
+    _create_installation_endpoint = Endpoint('post', '/organization/installations', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_installation(
         self,
         app_id: str,
@@ -197,7 +203,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/installations'
         api_params = {}
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
@@ -207,15 +212,15 @@ class Organization(Service):
         if authorization_details is not None:
             api_params['authorizationDetails'] = self._normalize_value(authorization_details)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_installation_endpoint, api_params)
 
         return self._parse_response(response, model=AppInstallation)
 
 
+    _get_installation_endpoint = Endpoint('get', '/organization/installations/{installationId}', {
+        'accept': 'application/json',
+    })
+
     def get_installation(
         self,
         installation_id: str
@@ -239,22 +244,21 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/installations/{installationId}'
         api_params = {}
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_installation_endpoint, api_params, [installation_id])
 
         return self._parse_response(response, model=AppInstallation)
 
 
+    _update_installation_endpoint = Endpoint('put', '/organization/installations/{installationId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_installation(
         self,
         installation_id: str,
@@ -281,25 +285,23 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/installations/{installationId}'
         api_params = {}
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
-
         if authorization_details is not None:
             api_params['authorizationDetails'] = self._normalize_value(authorization_details)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_installation_endpoint, api_params, [installation_id])
 
         return self._parse_response(response, model=AppInstallation)
 
 
+    _delete_installation_endpoint = Endpoint('delete', '/organization/installations/{installationId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_installation(
         self,
         installation_id: str
@@ -323,23 +325,20 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/installations/{installationId}'
         api_params = {}
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_installation_endpoint, api_params, [installation_id])
 
         return response
 
 
+    _list_keys_endpoint = Endpoint('get', '/organization/keys', {
+        'accept': 'application/json',
+    })
+
     def list_keys(
         self,
         queries: Optional[List[str]] = None,
@@ -366,7 +365,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/keys'
         api_params = {}
 
         if queries is not None:
@@ -374,14 +372,16 @@ class Organization(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_keys_endpoint, api_params)
 
         return self._parse_response(response, model=KeyList)
 
 
+    _create_key_endpoint = Endpoint('post', '/organization/keys', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_key(
         self,
         key_id: str,
@@ -414,7 +414,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/keys'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
@@ -432,15 +431,15 @@ class Organization(Service):
         if expire is not None:
             api_params['expire'] = self._normalize_value(expire)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_key_endpoint, api_params)
 
         return self._parse_response(response, model=Key)
 
 
+    _get_key_endpoint = Endpoint('get', '/organization/keys/{keyId}', {
+        'accept': 'application/json',
+    })
+
     def get_key(
         self,
         key_id: str
@@ -464,22 +463,21 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/keys/{keyId}'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
 
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_key_endpoint, api_params, [key_id])
 
         return self._parse_response(response, model=Key)
 
 
+    _update_key_endpoint = Endpoint('put', '/organization/keys/{keyId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_key(
         self,
         key_id: str,
@@ -512,7 +510,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/keys/{keyId}'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
@@ -523,22 +520,20 @@ class Organization(Service):
         if scopes is None:
             raise AppwriteException('Missing required parameter: "scopes"')
 
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['scopes'] = self._normalize_value(scopes)
         if expire is not None:
             api_params['expire'] = self._normalize_value(expire)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_key_endpoint, api_params, [key_id])
 
         return self._parse_response(response, model=Key)
 
 
+    _delete_key_endpoint = Endpoint('delete', '/organization/keys/{keyId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_key(
         self,
         key_id: str
@@ -562,22 +557,20 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/keys/{keyId}'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
 
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_key_endpoint, api_params, [key_id])
 
         return response
 
 
+    _list_memberships_endpoint = Endpoint('get', '/organization/memberships', {
+        'accept': 'application/json',
+    })
+
     def list_memberships(
         self,
         queries: Optional[List[str]] = None,
@@ -607,7 +600,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/memberships'
         api_params = {}
 
         if queries is not None:
@@ -617,14 +609,16 @@ class Organization(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_memberships_endpoint, api_params)
 
         return self._parse_response(response, model=MembershipList)
 
 
+    _create_membership_endpoint = Endpoint('post', '/organization/memberships', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_membership(
         self,
         roles: List[str],
@@ -663,7 +657,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/memberships'
         api_params = {}
         if roles is None:
             raise AppwriteException('Missing required parameter: "roles"')
@@ -681,15 +674,15 @@ class Organization(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_membership_endpoint, api_params)
 
         return self._parse_response(response, model=Membership)
 
 
+    _get_membership_endpoint = Endpoint('get', '/organization/memberships/{membershipId}', {
+        'accept': 'application/json',
+    })
+
     def get_membership(
         self,
         membership_id: str
@@ -713,22 +706,21 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/memberships/{membershipId}'
         api_params = {}
         if membership_id is None:
             raise AppwriteException('Missing required parameter: "membership_id"')
 
-        api_path = api_path.replace('{membershipId}', str(self._normalize_value(membership_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_membership_endpoint, api_params, [membership_id])
 
         return self._parse_response(response, model=Membership)
 
 
+    _update_membership_endpoint = Endpoint('patch', '/organization/memberships/{membershipId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_membership(
         self,
         membership_id: str,
@@ -755,7 +747,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/memberships/{membershipId}'
         api_params = {}
         if membership_id is None:
             raise AppwriteException('Missing required parameter: "membership_id"')
@@ -763,19 +754,17 @@ class Organization(Service):
         if roles is None:
             raise AppwriteException('Missing required parameter: "roles"')
 
-        api_path = api_path.replace('{membershipId}', str(self._normalize_value(membership_id)))
-
         api_params['roles'] = self._normalize_value(roles)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_membership_endpoint, api_params, [membership_id])
 
         return self._parse_response(response, model=Membership)
 
 
+    _delete_membership_endpoint = Endpoint('delete', '/organization/memberships/{membershipId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_membership(
         self,
         membership_id: str
@@ -799,22 +788,20 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/memberships/{membershipId}'
         api_params = {}
         if membership_id is None:
             raise AppwriteException('Missing required parameter: "membership_id"')
 
-        api_path = api_path.replace('{membershipId}', str(self._normalize_value(membership_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_membership_endpoint, api_params, [membership_id])
 
         return response
 
 
+    _list_projects_endpoint = Endpoint('get', '/organization/projects', {
+        'accept': 'application/json',
+    })
+
     def list_projects(
         self,
         queries: Optional[List[str]] = None,
@@ -844,7 +831,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/projects'
         api_params = {}
 
         if queries is not None:
@@ -854,14 +840,16 @@ class Organization(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_projects_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectList)
 
 
+    _create_project_endpoint = Endpoint('post', '/organization/projects', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_project(
         self,
         project_id: str,
@@ -891,7 +879,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/projects'
         api_params = {}
         if project_id is None:
             raise AppwriteException('Missing required parameter: "project_id"')
@@ -905,15 +892,13 @@ class Organization(Service):
         if region is not None:
             api_params['region'] = self._normalize_value(region)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_project_endpoint, api_params)
 
         return self._parse_response(response, model=Project)
 
 
+    _get_project_endpoint = Endpoint('get', '/organization/projects/{projectId}')
+
     def get_project(
         self,
         project_id: str
@@ -937,21 +922,21 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/projects/{projectId}'
         api_params = {}
         if project_id is None:
             raise AppwriteException('Missing required parameter: "project_id"')
 
-        api_path = api_path.replace('{projectId}', str(self._normalize_value(project_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-        }, api_params)
+        response = self.client.call_endpoint(self._get_project_endpoint, api_params, [project_id])
 
         return self._parse_response(response, model=Project)
 
 
+    _update_project_endpoint = Endpoint('patch', '/organization/projects/{projectId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_project(
         self,
         project_id: str,
@@ -978,7 +963,6 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/projects/{projectId}'
         api_params = {}
         if project_id is None:
             raise AppwriteException('Missing required parameter: "project_id"')
@@ -986,19 +970,17 @@ class Organization(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{projectId}', str(self._normalize_value(project_id)))
-
         api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_project_endpoint, api_params, [project_id])
 
         return self._parse_response(response, model=Project)
 
 
+    _delete_project_endpoint = Endpoint('delete', '/organization/projects/{projectId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_project(
         self,
         project_id: str
@@ -1022,18 +1004,12 @@ class Organization(Service):
             If API request fails
         """
 
-        api_path = '/organization/projects/{projectId}'
         api_params = {}
         if project_id is None:
             raise AppwriteException('Missing required parameter: "project_id"')
 
-        api_path = api_path.replace('{projectId}', str(self._normalize_value(project_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_project_endpoint, api_params, [project_id])
 
         return response
 
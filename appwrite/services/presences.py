@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -11,6 +12,10 @@ class Presences(Service):
     def __init__(self, client) -> None:
         super(Presences, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/presences', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -41,7 +46,6 @@ class Presences(Service):
             If API request fails
         """
 
-        api_path = '/presences'
         api_params = {}
 
         if queries is not None:
@@ -51,14 +55,15 @@ class Presences(Service):
         if ttl is not None:
             api_params['ttl'] = self._normalize_value(ttl)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
 
         return self._parse_response(response, model=PresenceList)
 
 
+    _get_endpoint = Endpoint('get', '/presences/{presenceId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         presence_id: str
@@ -83,22 +88,21 @@ class Presences(Service):
             If API request fails
         """
 
-        api_path = '/presences/{presenceId}'
         api_params = {}
         if presence_id is None:
             raise AppwriteException('Missing required parameter: "presence_id"')
 
-        api_path = api_path.replace('{presenceId}', str(self._normalize_value(presence_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [presence_id])
 
         return self._parse_response(response, model=Presence)
 
 
+    _upsert_endpoint = Endpoint('put', '/presences/{presenceId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def upsert(
         self,
         presence_id: str,
@@ -138,7 +142,6 @@ class Presences(Service):
             If API request fails
         """
 
-        api_path = '/presences/{presenceId}'
         api_params = {}
         if presence_id is None:
             raise AppwriteException('Missing required parameter: "presence_id"')
@@ -149,8 +152,6 @@ class Presences(Service):
         if status is None:
             raise AppwriteException('Missing required parameter: "status"')
 
-        api_path = api_path.replace('{presenceId}', str(self._normalize_value(presence_id)))
-
         api_params['userId'] = self._normalize_value(user_id)
         api_params['status'] = self._normalize_value(status)
         if permissions is not None:
@@ -160,15 +161,16 @@ class Presences(Service):
         if metadata is not None:
             api_params['metadata'] = self._normalize_value(metadata)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._upsert_endpoint, api_params, [presence_id])
 
         return self._parse_response(response, model=Presence)
 
 
+    _update_endpoint = Endpoint('patch', '/presences/{presenceId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update(
         self,
         presence_id: str,
@@ -211,7 +213,6 @@ class Presences(Service):
             If API request fails
         """
 
-        api_path = '/presences/{presenceId}'
         api_params = {}
         if presence_id is None:
             raise AppwriteException('Missing required parameter: "presence_id"')
@@ -219,8 +220,6 @@ class Presences(Service):
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{presenceId}', str(self._normalize_value(presence_id)))
-
         api_params['userId'] = self._normalize_value(user_id)
         if status is not None:
             api_params['status'] = self._normalize_value(status)
@@ -233,15 +232,15 @@ class Presences(Service):
         if purge is not None:
             api_params['purge'] = self._normalize_value(purge)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [presence_id])
 
         return self._parse_response(response, model=Presence)
 
 
+    _delete_endpoint = Endpoint('delete', '/presences/{presenceId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         presence_id: str
@@ -266,18 +265,12 @@ class Presences(Service):
             If API request fails
         """
 
-        api_path = '/presences/{presenceId}'
         api_params = {}
         if presence_id is None:
             raise AppwriteException('Missing required parameter: "presence_id"')
 
-        api_path = api_path.replace('{presenceId}', str(self._normalize_value(presence_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [presence_id])
 
         return response
 
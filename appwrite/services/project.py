@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -93,6 +94,8 @@ class Project(Service):
     def __init__(self, client) -> None:
         super(Project, self).__init__(client)
 
+    _get_endpoint = Endpoint('get', '/project')
+
     def get(
         self
     ) -> ProjectModel:
@@ -110,16 +113,17 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _delete_endpoint = Endpoint('delete', '/project', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self
     ) -> Dict[str, Any]:
@@ -137,17 +141,18 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project'
         api_params = {}
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params)
 
         return response
 
 
+    _update_auth_method_endpoint = Endpoint('patch', '/project/auth-methods/{methodId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_auth_method(
         self,
         method_id: ProjectAuthMethodId,
@@ -174,7 +179,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/auth-methods/{methodId}'
         api_params = {}
         if method_id is None:
             raise AppwriteException('Missing required parameter: "method_id"')
@@ -182,19 +186,17 @@ class Project(Service):
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
 
-        api_path = api_path.replace('{methodId}', str(self._normalize_value(method_id)))
-
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_auth_method_endpoint, api_params, [method_id])
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _list_keys_endpoint = Endpoint('get', '/project/keys', {
+        'accept': 'application/json',
+    })
+
     def list_keys(
         self,
         queries: Optional[List[str]] = None,
@@ -221,7 +223,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/keys'
         api_params = {}
 
         if queries is not None:
@@ -229,14 +230,16 @@ class Project(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_keys_endpoint, api_params)
 
         return self._parse_response(response, model=KeyList)
 
 
+    _create_key_endpoint = Endpoint('post', '/project/keys', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_key(
         self,
         key_id: str,
@@ -271,7 +274,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/keys'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
@@ -289,15 +291,16 @@ class Project(Service):
         if expire is not None:
             api_params['expire'] = self._normalize_value(expire)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_key_endpoint, api_params)
 
         return self._parse_response(response, model=Key)
 
 
+    _create_ephemeral_key_endpoint = Endpoint('post', '/project/keys/ephemeral', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_ephemeral_key(
         self,
         scopes: List[ProjectKeyScopes],
@@ -326,7 +329,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/keys/ephemeral'
         api_params = {}
         if scopes is None:
             raise AppwriteException('Missing required parameter: "scopes"')
@@ -338,15 +340,15 @@ class Project(Service):
         api_params['scopes'] = self._normalize_value(scopes)
         api_params['duration'] = self._normalize_value(duration)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_ephemeral_key_endpoint, api_params)
 
         return self._parse_response(response, model=EphemeralKey)
 
 
+    _get_key_endpoint = Endpoint('get', '/project/keys/{keyId}', {
+        'accept': 'application/json',
+    })
+
     def get_key(
         self,
         key_id: str
@@ -370,22 +372,21 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/keys/{keyId}'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
 
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_key_endpoint, api_params, [key_id])
 
         return self._parse_response(response, model=Key)
 
 
+    _update_key_endpoint = Endpoint('put', '/project/keys/{keyId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_key(
         self,
         key_id: str,
@@ -418,7 +419,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/keys/{keyId}'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
@@ -429,22 +429,20 @@ class Project(Service):
         if scopes is None:
             raise AppwriteException('Missing required parameter: "scopes"')
 
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['scopes'] = self._normalize_value(scopes)
         if expire is not None:
             api_params['expire'] = self._normalize_value(expire)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_key_endpoint, api_params, [key_id])
 
         return self._parse_response(response, model=Key)
 
 
+    _delete_key_endpoint = Endpoint('delete', '/project/keys/{keyId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_key(
         self,
         key_id: str
@@ -468,22 +466,21 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/keys/{keyId}'
         api_params = {}
         if key_id is None:
             raise AppwriteException('Missing required parameter: "key_id"')
 
-        api_path = api_path.replace('{keyId}', str(self._normalize_value(key_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_key_endpoint, api_params, [key_id])
 
         return response
 
 
+    _update_labels_endpoint = Endpoint('put', '/project/labels', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_labels(
         self,
         labels: List[str]
@@ -507,7 +504,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/labels'
         api_params = {}
         if labels is None:
             raise AppwriteException('Missing required parameter: "labels"')
@@ -515,15 +511,15 @@ class Project(Service):
 
         api_params['labels'] = self._normalize_value(labels)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_labels_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _list_mock_phones_endpoint = Endpoint('get', '/project/mock-phones', {
+        'accept': 'application/json',
+    })
+
     def list_mock_phones(
         self,
         queries: Optional[List[str]] = None,
@@ -550,7 +546,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/mock-phones'
         api_params = {}
 
         if queries is not None:
@@ -558,14 +553,16 @@ class Project(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_mock_phones_endpoint, api_params)
 
         return self._parse_response(response, model=MockNumberList)
 
 
+    _create_mock_phone_endpoint = Endpoint('post', '/project/mock-phones', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_mock_phone(
         self,
         number: str,
@@ -592,7 +589,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/mock-phones'
         api_params = {}
         if number is None:
             raise AppwriteException('Missing required parameter: "number"')
@@ -604,15 +600,15 @@ class Project(Service):
         api_params['number'] = self._normalize_value(number)
         api_params['otp'] = self._normalize_value(otp)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mock_phone_endpoint, api_params)
 
         return self._parse_response(response, model=MockNumber)
 
 
+    _get_mock_phone_endpoint = Endpoint('get', '/project/mock-phones/{number}', {
+        'accept': 'application/json',
+    })
+
     def get_mock_phone(
         self,
         number: str
@@ -636,22 +632,21 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/mock-phones/{number}'
         api_params = {}
         if number is None:
             raise AppwriteException('Missing required parameter: "number"')
 
-        api_path = api_path.replace('{number}', str(self._normalize_value(number)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_mock_phone_endpoint, api_params, [number])
 
         return self._parse_response(response, model=MockNumber)
 
 
+    _update_mock_phone_endpoint = Endpoint('put', '/project/mock-phones/{number}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mock_phone(
         self,
         number: str,
@@ -678,7 +673,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/mock-phones/{number}'
         api_params = {}
         if number is None:
             raise AppwriteException('Missing required parameter: "number"')
@@ -686,19 +680,17 @@ class Project(Service):
         if otp is None:
             raise AppwriteException('Missing required parameter: "otp"')
 
-        api_path = api_path.replace('{number}', str(self._normalize_value(number)))
-
         api_params['otp'] = self._normalize_value(otp)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mock_phone_endpoint, api_params, [number])
 
         return self._parse_response(response, model=MockNumber)
 
 
+    _delete_mock_phone_endpoint = Endpoint('delete', '/project/mock-phones/{number}', {
+        'content-type': 'application/json',
+    })
+
     def delete_mock_phone(
         self,
         number: str
@@ -722,22 +714,20 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/mock-phones/{number}'
         api_params = {}
         if number is None:
             raise AppwriteException('Missing required parameter: "number"')
 
-        api_path = api_path.replace('{number}', str(self._normalize_value(number)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_mock_phone_endpoint, api_params, [number])
 
         return response
 
 
+    _list_o_auth2_providers_endpoint = Endpoint('get', '/project/oauth2', {
+        'accept': 'application/json',
+    })
+
     def list_o_auth2_providers(
         self,
         queries: Optional[List[str]] = None,
@@ -764,7 +754,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2'
         api_params = {}
 
         if queries is not None:
@@ -772,14 +761,16 @@ class Project(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_o_auth2_providers_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2ProviderList)
 
 
+    _update_o_auth2_server_endpoint = Endpoint('put', '/project/oauth2-server', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_server(
         self,
         enabled: bool,
@@ -845,7 +836,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2-server'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -883,15 +873,16 @@ class Project(Service):
         if default_scopes is not None:
             api_params['defaultScopes'] = self._normalize_value(default_scopes)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_server_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_o_auth2_amazon_endpoint = Endpoint('patch', '/project/oauth2/amazon', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_amazon(
         self,
         client_id: Optional[str] = None,
@@ -921,7 +912,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/amazon'
         api_params = {}
 
         if client_id is not None:
@@ -931,15 +921,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_amazon_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Amazon)
 
 
+    _update_o_auth2_apple_endpoint = Endpoint('patch', '/project/oauth2/apple', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_apple(
         self,
         service_id: Optional[str] = None,
@@ -975,7 +966,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/apple'
         api_params = {}
 
         if service_id is not None:
@@ -989,15 +979,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_apple_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Apple)
 
 
+    _update_o_auth2_appwrite_endpoint = Endpoint('patch', '/project/oauth2/appwrite', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_appwrite(
         self,
         client_id: Optional[str] = None,
@@ -1027,7 +1018,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/appwrite'
         api_params = {}
 
         if client_id is not None:
@@ -1037,15 +1027,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_appwrite_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Appwrite)
 
 
+    _update_o_auth2_auth0_endpoint = Endpoint('patch', '/project/oauth2/auth0', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_auth0(
         self,
         client_id: Optional[str] = None,
@@ -1078,7 +1069,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/auth0'
         api_params = {}
 
         if client_id is not None:
@@ -1090,15 +1080,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_auth0_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Auth0)
 
 
+    _update_o_auth2_authentik_endpoint = Endpoint('patch', '/project/oauth2/authentik', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_authentik(
         self,
         client_id: Optional[str] = None,
@@ -1131,7 +1122,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/authentik'
         api_params = {}
 
         if client_id is not None:
@@ -1143,15 +1133,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_authentik_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Authentik)
 
 
+    _update_o_auth2_autodesk_endpoint = Endpoint('patch', '/project/oauth2/autodesk', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_autodesk(
         self,
         client_id: Optional[str] = None,
@@ -1181,7 +1172,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/autodesk'
         api_params = {}
 
         if client_id is not None:
@@ -1191,15 +1181,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_autodesk_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Autodesk)
 
 
+    _update_o_auth2_bitbucket_endpoint = Endpoint('patch', '/project/oauth2/bitbucket', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_bitbucket(
         self,
         key: Optional[str] = None,
@@ -1229,7 +1220,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/bitbucket'
         api_params = {}
 
         if key is not None:
@@ -1239,15 +1229,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_bitbucket_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Bitbucket)
 
 
+    _update_o_auth2_bitly_endpoint = Endpoint('patch', '/project/oauth2/bitly', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_bitly(
         self,
         client_id: Optional[str] = None,
@@ -1277,7 +1268,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/bitly'
         api_params = {}
 
         if client_id is not None:
@@ -1287,15 +1277,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_bitly_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Bitly)
 
 
+    _update_o_auth2_box_endpoint = Endpoint('patch', '/project/oauth2/box', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_box(
         self,
         client_id: Optional[str] = None,
@@ -1325,7 +1316,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/box'
         api_params = {}
 
         if client_id is not None:
@@ -1335,15 +1325,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_box_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Box)
 
 
+    _update_o_auth2_dailymotion_endpoint = Endpoint('patch', '/project/oauth2/dailymotion', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_dailymotion(
         self,
         api_key: Optional[str] = None,
@@ -1373,7 +1364,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/dailymotion'
         api_params = {}
 
         if api_key is not None:
@@ -1383,15 +1373,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_dailymotion_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Dailymotion)
 
 
+    _update_o_auth2_discord_endpoint = Endpoint('patch', '/project/oauth2/discord', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_discord(
         self,
         client_id: Optional[str] = None,
@@ -1421,7 +1412,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/discord'
         api_params = {}
 
         if client_id is not None:
@@ -1431,15 +1421,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_discord_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Discord)
 
 
+    _update_o_auth2_disqus_endpoint = Endpoint('patch', '/project/oauth2/disqus', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_disqus(
         self,
         public_key: Optional[str] = None,
@@ -1469,7 +1460,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/disqus'
         api_params = {}
 
         if public_key is not None:
@@ -1479,15 +1469,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_disqus_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Disqus)
 
 
+    _update_o_auth2_dropbox_endpoint = Endpoint('patch', '/project/oauth2/dropbox', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_dropbox(
         self,
         app_key: Optional[str] = None,
@@ -1517,7 +1508,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/dropbox'
         api_params = {}
 
         if app_key is not None:
@@ -1527,15 +1517,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_dropbox_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Dropbox)
 
 
+    _update_o_auth2_etsy_endpoint = Endpoint('patch', '/project/oauth2/etsy', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_etsy(
         self,
         key_string: Optional[str] = None,
@@ -1565,7 +1556,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/etsy'
         api_params = {}
 
         if key_string is not None:
@@ -1575,15 +1565,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_etsy_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Etsy)
 
 
+    _update_o_auth2_facebook_endpoint = Endpoint('patch', '/project/oauth2/facebook', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_facebook(
         self,
         app_id: Optional[str] = None,
@@ -1613,7 +1604,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/facebook'
         api_params = {}
 
         if app_id is not None:
@@ -1623,15 +1613,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_facebook_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Facebook)
 
 
+    _update_o_auth2_figma_endpoint = Endpoint('patch', '/project/oauth2/figma', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_figma(
         self,
         client_id: Optional[str] = None,
@@ -1661,7 +1652,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/figma'
         api_params = {}
 
         if client_id is not None:
@@ -1671,15 +1661,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_figma_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Figma)
 
 
+    _update_o_auth2_fusion_auth_endpoint = Endpoint('patch', '/project/oauth2/fusionauth', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_fusion_auth(
         self,
         client_id: Optional[str] = None,
@@ -1712,7 +1703,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/fusionauth'
         api_params = {}
 
         if client_id is not None:
@@ -1724,15 +1714,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_fusion_auth_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2FusionAuth)
 
 
+    _update_o_auth2_git_hub_endpoint = Endpoint('patch', '/project/oauth2/github', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_git_hub(
         self,
         client_id: Optional[str] = None,
@@ -1762,7 +1753,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/github'
         api_params = {}
 
         if client_id is not None:
@@ -1772,15 +1762,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_git_hub_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Github)
 
 
+    _update_o_auth2_gitlab_endpoint = Endpoint('patch', '/project/oauth2/gitlab', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_gitlab(
         self,
         application_id: Optional[str] = None,
@@ -1813,7 +1804,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/gitlab'
         api_params = {}
 
         if application_id is not None:
@@ -1825,15 +1815,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_gitlab_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Gitlab)
 
 
+    _update_o_auth2_google_endpoint = Endpoint('patch', '/project/oauth2/google', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_google(
         self,
         client_id: Optional[str] = None,
@@ -1866,7 +1857,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/google'
         api_params = {}
 
         if client_id is not None:
@@ -1878,15 +1868,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_google_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Google)
 
 
+    _update_o_auth2_keycloak_endpoint = Endpoint('patch', '/project/oauth2/keycloak', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_keycloak(
         self,
         client_id: Optional[str] = None,
@@ -1922,7 +1913,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/keycloak'
         api_params = {}
 
         if client_id is not None:
@@ -1936,15 +1926,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_keycloak_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Keycloak)
 
 
+    _update_o_auth2_kick_endpoint = Endpoint('patch', '/project/oauth2/kick', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_kick(
         self,
         client_id: Optional[str] = None,
@@ -1974,7 +1965,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/kick'
         api_params = {}
 
         if client_id is not None:
@@ -1984,15 +1974,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_kick_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Kick)
 
 
+    _update_o_auth2_linkedin_endpoint = Endpoint('patch', '/project/oauth2/linkedin', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_linkedin(
         self,
         client_id: Optional[str] = None,
@@ -2022,7 +2013,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/linkedin'
         api_params = {}
 
         if client_id is not None:
@@ -2032,15 +2022,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_linkedin_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Linkedin)
 
 
+    _update_o_auth2_microsoft_endpoint = Endpoint('patch', '/project/oauth2/microsoft', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_microsoft(
         self,
         application_id: Optional[str] = None,
@@ -2073,7 +2064,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/microsoft'
         api_params = {}
 
         if application_id is not None:
@@ -2085,15 +2075,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_microsoft_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Microsoft)
 
 
+    _update_o_auth2_notion_endpoint = Endpoint('patch', '/project/oauth2/notion', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_notion(
         self,
         oauth_client_id: Optional[str] = None,
@@ -2123,7 +2114,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/notion'
         api_params = {}
 
         if oauth_client_id is not None:
@@ -2133,15 +2123,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_notion_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Notion)
 
 
+    _update_o_auth2_oidc_endpoint = Endpoint('patch', '/project/oauth2/oidc', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_oidc(
         self,
         client_id: Optional[str] = None,
@@ -2189,7 +2180,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/oidc'
         api_params = {}
 
         if client_id is not None:
@@ -2211,15 +2201,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_oidc_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Oidc)
 
 
+    _update_o_auth2_okta_endpoint = Endpoint('patch', '/project/oauth2/okta', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_okta(
         self,
         client_id: Optional[str] = None,
@@ -2255,7 +2246,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/okta'
         api_params = {}
 
         if client_id is not None:
@@ -2269,15 +2259,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_okta_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Okta)
 
 
+    _update_o_auth2_paypal_endpoint = Endpoint('patch', '/project/oauth2/paypal', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_paypal(
         self,
         client_id: Optional[str] = None,
@@ -2307,7 +2298,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/paypal'
         api_params = {}
 
         if client_id is not None:
@@ -2317,15 +2307,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_paypal_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Paypal)
 
 
+    _update_o_auth2_paypal_sandbox_endpoint = Endpoint('patch', '/project/oauth2/paypalSandbox', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_paypal_sandbox(
         self,
         client_id: Optional[str] = None,
@@ -2355,7 +2346,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/paypalSandbox'
         api_params = {}
 
         if client_id is not None:
@@ -2365,15 +2355,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_paypal_sandbox_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Paypal)
 
 
+    _update_o_auth2_podio_endpoint = Endpoint('patch', '/project/oauth2/podio', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_podio(
         self,
         client_id: Optional[str] = None,
@@ -2403,7 +2394,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/podio'
         api_params = {}
 
         if client_id is not None:
@@ -2413,15 +2403,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_podio_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Podio)
 
 
+    _update_o_auth2_salesforce_endpoint = Endpoint('patch', '/project/oauth2/salesforce', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_salesforce(
         self,
         customer_key: Optional[str] = None,
@@ -2451,7 +2442,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/salesforce'
         api_params = {}
 
         if customer_key is not None:
@@ -2461,15 +2451,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_salesforce_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Salesforce)
 
 
+    _update_o_auth2_slack_endpoint = Endpoint('patch', '/project/oauth2/slack', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_slack(
         self,
         client_id: Optional[str] = None,
@@ -2499,7 +2490,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/slack'
         api_params = {}
 
         if client_id is not None:
@@ -2509,15 +2499,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_slack_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Slack)
 
 
+    _update_o_auth2_spotify_endpoint = Endpoint('patch', '/project/oauth2/spotify', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_spotify(
         self,
         client_id: Optional[str] = None,
@@ -2547,7 +2538,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/spotify'
         api_params = {}
 
         if client_id is not None:
@@ -2557,15 +2547,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_spotify_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Spotify)
 
 
+    _update_o_auth2_stripe_endpoint = Endpoint('patch', '/project/oauth2/stripe', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_stripe(
         self,
         client_id: Optional[str] = None,
@@ -2595,7 +2586,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/stripe'
         api_params = {}
 
         if client_id is not None:
@@ -2605,15 +2595,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_stripe_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Stripe)
 
 
+    _update_o_auth2_tradeshift_endpoint = Endpoint('patch', '/project/oauth2/tradeshift', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_tradeshift(
         self,
         oauth2_client_id: Optional[str] = None,
@@ -2643,7 +2634,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/tradeshift'
         api_params = {}
 
         if oauth2_client_id is not None:
@@ -2653,15 +2643,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_tradeshift_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Tradeshift)
 
 
+    _update_o_auth2_tradeshift_sandbox_endpoint = Endpoint('patch', '/project/oauth2/tradeshiftBox', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_tradeshift_sandbox(
         self,
         oauth2_client_id: Optional[str] = None,
@@ -2691,7 +2682,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/tradeshiftBox'
         api_params = {}
 
         if oauth2_client_id is not None:
@@ -2701,15 +2691,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_tradeshift_sandbox_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Tradeshift)
 
 
+    _update_o_auth2_twitch_endpoint = Endpoint('patch', '/project/oauth2/twitch', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_twitch(
         self,
         client_id: Optional[str] = None,
@@ -2739,7 +2730,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/twitch'
         api_params = {}
 
         if client_id is not None:
@@ -2749,15 +2739,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_twitch_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Twitch)
 
 
+    _update_o_auth2_word_press_endpoint = Endpoint('patch', '/project/oauth2/wordpress', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_word_press(
         self,
         client_id: Optional[str] = None,
@@ -2787,7 +2778,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/wordpress'
         api_params = {}
 
         if client_id is not None:
@@ -2797,15 +2787,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_word_press_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2WordPress)
 
 
+    _update_o_auth2_x_endpoint = Endpoint('patch', '/project/oauth2/x', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_x(
         self,
         customer_key: Optional[str] = None,
@@ -2835,7 +2826,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/x'
         api_params = {}
 
         if customer_key is not None:
@@ -2845,15 +2835,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_x_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2X)
 
 
+    _update_o_auth2_yahoo_endpoint = Endpoint('patch', '/project/oauth2/yahoo', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_yahoo(
         self,
         client_id: Optional[str] = None,
@@ -2883,7 +2874,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/yahoo'
         api_params = {}
 
         if client_id is not None:
@@ -2893,15 +2883,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_yahoo_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Yahoo)
 
 
+    _update_o_auth2_yandex_endpoint = Endpoint('patch', '/project/oauth2/yandex', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_yandex(
         self,
         client_id: Optional[str] = None,
@@ -2931,7 +2922,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/yandex'
         api_params = {}
 
         if client_id is not None:
@@ -2941,15 +2931,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_yandex_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Yandex)
 
 
+    _update_o_auth2_zoho_endpoint = Endpoint('patch', '/project/oauth2/zoho', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_zoho(
         self,
         client_id: Optional[str] = None,
@@ -2979,7 +2970,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/zoho'
         api_params = {}
 
         if client_id is not None:
@@ -2989,15 +2979,16 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_zoho_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Zoho)
 
 
+    _update_o_auth2_zoom_endpoint = Endpoint('patch', '/project/oauth2/zoom', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_o_auth2_zoom(
         self,
         client_id: Optional[str] = None,
@@ -3027,7 +3018,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/zoom'
         api_params = {}
 
         if client_id is not None:
@@ -3037,15 +3027,15 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_o_auth2_zoom_endpoint, api_params)
 
         return self._parse_response(response, model=OAuth2Zoom)
 
 
+    _get_o_auth2_provider_endpoint = Endpoint('get', '/project/oauth2/{providerId}', {
+        'accept': 'application/json',
+    })
+
     def get_o_auth2_provider(
         self,
         provider_id: ProjectOAuthProviderId
@@ -3069,18 +3059,12 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/oauth2/{providerId}'
         api_params = {}
         if provider_id is None:
             raise AppwriteException('Missing required parameter: "provider_id"')
 
-        api_path = api_path.replace('{providerId}', str(self._normalize_value(provider_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_o_auth2_provider_endpoint, api_params, [provider_id])
         if not isinstance(response, dict):
             raise AppwriteException('Expected object response when hydrating a response model')
 
@@ -3207,6 +3191,10 @@ class Project(Service):
         raise AppwriteException('Unable to match response to any known model')
 
 
+    _list_platforms_endpoint = Endpoint('get', '/project/platforms', {
+        'accept': 'application/json',
+    })
+
     def list_platforms(
         self,
         queries: Optional[List[str]] = None,
@@ -3233,7 +3221,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms'
         api_params = {}
 
         if queries is not None:
@@ -3241,14 +3228,16 @@ class Project(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_platforms_endpoint, api_params)
 
         return self._parse_response(response, model=PlatformList)
 
 
+    _create_android_platform_endpoint = Endpoint('post', '/project/platforms/android', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_android_platform(
         self,
         platform_id: str,
@@ -3278,7 +3267,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/android'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3294,15 +3282,16 @@ class Project(Service):
         api_params['name'] = self._normalize_value(name)
         api_params['applicationId'] = self._normalize_value(application_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_android_platform_endpoint, api_params)
 
         return self._parse_response(response, model=PlatformAndroid)
 
 
+    _update_android_platform_endpoint = Endpoint('put', '/project/platforms/android/{platformId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_android_platform(
         self,
         platform_id: str,
@@ -3332,7 +3321,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/android/{platformId}'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3343,20 +3331,19 @@ class Project(Service):
         if application_id is None:
             raise AppwriteException('Missing required parameter: "application_id"')
 
-        api_path = api_path.replace('{platformId}', str(self._normalize_value(platform_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['applicationId'] = self._normalize_value(application_id)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_android_platform_endpoint, api_params, [platform_id])
 
         return self._parse_response(response, model=PlatformAndroid)
 
 
+    _create_apple_platform_endpoint = Endpoint('post', '/project/platforms/apple', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_apple_platform(
         self,
         platform_id: str,
@@ -3386,7 +3373,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/apple'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3402,15 +3388,16 @@ class Project(Service):
         api_params['name'] = self._normalize_value(name)
         api_params['bundleIdentifier'] = self._normalize_value(bundle_identifier)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_apple_platform_endpoint, api_params)
 
         return self._parse_response(response, model=PlatformApple)
 
 
+    _update_apple_platform_endpoint = Endpoint('put', '/project/platforms/apple/{platformId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_apple_platform(
         self,
         platform_id: str,
@@ -3440,7 +3427,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/apple/{platformId}'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3451,20 +3437,19 @@ class Project(Service):
         if bundle_identifier is None:
             raise AppwriteException('Missing required parameter: "bundle_identifier"')
 
-        api_path = api_path.replace('{platformId}', str(self._normalize_value(platform_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['bundleIdentifier'] = self._normalize_value(bundle_identifier)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_apple_platform_endpoint, api_params, [platform_id])
 
         return self._parse_response(response, model=PlatformApple)
 
 
+    _create_linux_platform_endpoint = Endpoint('post', '/project/platforms/linux', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_linux_platform(
         self,
         platform_id: str,
@@ -3494,7 +3479,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/linux'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3510,15 +3494,16 @@ class Project(Service):
         api_params['name'] = self._normalize_value(name)
         api_params['packageName'] = self._normalize_value(package_name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_linux_platform_endpoint, api_params)
 
         return self._parse_response(response, model=PlatformLinux)
 
 
+    _update_linux_platform_endpoint = Endpoint('put', '/project/platforms/linux/{platformId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_linux_platform(
         self,
         platform_id: str,
@@ -3548,7 +3533,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/linux/{platformId}'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3559,20 +3543,19 @@ class Project(Service):
         if package_name is None:
             raise AppwriteException('Missing required parameter: "package_name"')
 
-        api_path = api_path.replace('{platformId}', str(self._normalize_value(platform_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['packageName'] = self._normalize_value(package_name)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_linux_platform_endpoint, api_params, [platform_id])
 
         return self._parse_response(response, model=PlatformLinux)
 
 
+    _create_web_platform_endpoint = Endpoint('post', '/project/platforms/web', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_web_platform(
         self,
         platform_id: str,
@@ -3602,7 +3585,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/web'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3618,15 +3600,16 @@ class Project(Service):
         api_params['name'] = self._normalize_value(name)
         api_params['hostname'] = self._normalize_value(hostname)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_web_platform_endpoint, api_params)
 
         return self._parse_response(response, model=PlatformWeb)
 
 
+    _update_web_platform_endpoint = Endpoint('put', '/project/platforms/web/{platformId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_web_platform(
         self,
         platform_id: str,
@@ -3656,7 +3639,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/web/{platformId}'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3667,20 +3649,19 @@ class Project(Service):
         if hostname is None:
             raise AppwriteException('Missing required parameter: "hostname"')
 
-        api_path = api_path.replace('{platformId}', str(self._normalize_value(platform_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['hostname'] = self._normalize_value(hostname)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_web_platform_endpoint, api_params, [platform_id])
 
         return self._parse_response(response, model=PlatformWeb)
 
 
+    _create_windows_platform_endpoint = Endpoint('post', '/project/platforms/windows', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_windows_platform(
         self,
         platform_id: str,
@@ -3710,7 +3691,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/windows'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3726,15 +3706,16 @@ class Project(Service):
         api_params['name'] = self._normalize_value(name)
         api_params['packageIdentifierName'] = self._normalize_value(package_identifier_name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_windows_platform_endpoint, api_params)
 
         return self._parse_response(response, model=PlatformWindows)
 
 
+    _update_windows_platform_endpoint = Endpoint('put', '/project/platforms/windows/{platformId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_windows_platform(
         self,
         platform_id: str,
@@ -3764,7 +3745,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/windows/{platformId}'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
@@ -3775,20 +3755,18 @@ class Project(Service):
         if package_identifier_name is None:
             raise AppwriteException('Missing required parameter: "package_identifier_name"')
 
-        api_path = api_path.replace('{platformId}', str(self._normalize_value(platform_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['packageIdentifierName'] = self._normalize_value(package_identifier_name)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_windows_platform_endpoint, api_params, [platform_id])
 
         return self._parse_response(response, model=PlatformWindows)
 
 
+    _get_platform_endpoint = Endpoint('get', '/project/platforms/{platformId}', {
+        'accept': 'application/json',
+    })
+
     def get_platform(
         self,
         platform_id: str
@@ -3812,18 +3790,12 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/{platformId}'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
 
-        api_path = api_path.replace('{platformId}', str(self._normalize_value(platform_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_platform_endpoint, api_params, [platform_id])
         if not isinstance(response, dict):
             raise AppwriteException('Expected object response when hydrating a response model')
 
@@ -3845,6 +3817,10 @@ class Project(Service):
         raise AppwriteException('Unable to match response to any known model')
 
 
+    _delete_platform_endpoint = Endpoint('delete', '/project/platforms/{platformId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_platform(
         self,
         platform_id: str
@@ -3868,22 +3844,20 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/platforms/{platformId}'
         api_params = {}
         if platform_id is None:
             raise AppwriteException('Missing required parameter: "platform_id"')
 
-        api_path = api_path.replace('{platformId}', str(self._normalize_value(platform_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_platform_endpoint, api_params, [platform_id])
 
         return response
 
 
+    _list_policies_endpoint = Endpoint('get', '/project/policies', {
+        'accept': 'application/json',
+    })
+
     def list_policies(
         self,
         queries: Optional[List[str]] = None,
@@ -3910,7 +3884,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies'
         api_params = {}
 
         if queries is not None:
@@ -3918,14 +3891,16 @@ class Project(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_policies_endpoint, api_params)
 
         return self._parse_response(response, model=PolicyList)
 
 
+    _update_deny_aliased_email_policy_endpoint = Endpoint('patch', '/project/policies/deny-aliased-email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_deny_aliased_email_policy(
         self,
         enabled: bool
@@ -3949,7 +3924,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/deny-aliased-email'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -3957,15 +3931,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_deny_aliased_email_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_deny_corporate_email_policy_endpoint = Endpoint('patch', '/project/policies/deny-corporate-email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_deny_corporate_email_policy(
         self,
         enabled: bool
@@ -3989,7 +3964,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/deny-corporate-email'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -3997,15 +3971,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_deny_corporate_email_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_deny_disposable_email_policy_endpoint = Endpoint('patch', '/project/policies/deny-disposable-email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_deny_disposable_email_policy(
         self,
         enabled: bool
@@ -4029,7 +4004,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/deny-disposable-email'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -4037,15 +4011,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_deny_disposable_email_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_deny_free_email_policy_endpoint = Endpoint('patch', '/project/policies/deny-free-email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_deny_free_email_policy(
         self,
         enabled: bool
@@ -4069,7 +4044,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/deny-free-email'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -4077,15 +4051,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_deny_free_email_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_membership_privacy_policy_endpoint = Endpoint('patch', '/project/policies/membership-privacy', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_membership_privacy_policy(
         self,
         user_id: Optional[bool] = None,
@@ -4124,7 +4099,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/membership-privacy'
         api_params = {}
 
         if user_id is not None:
@@ -4140,15 +4114,16 @@ class Project(Service):
         if user_accessed_at is not None:
             api_params['userAccessedAt'] = self._normalize_value(user_accessed_at)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_membership_privacy_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_password_dictionary_policy_endpoint = Endpoint('patch', '/project/policies/password-dictionary', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_password_dictionary_policy(
         self,
         enabled: bool
@@ -4172,7 +4147,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/password-dictionary'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -4180,15 +4154,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_password_dictionary_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_password_history_policy_endpoint = Endpoint('patch', '/project/policies/password-history', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_password_history_policy(
         self,
         total: Optional[float]
@@ -4214,20 +4189,20 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/password-history'
         api_params = {}
 
         api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_password_history_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_password_personal_data_policy_endpoint = Endpoint('patch', '/project/policies/password-personal-data', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_password_personal_data_policy(
         self,
         enabled: bool
@@ -4251,7 +4226,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/password-personal-data'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -4259,15 +4233,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_password_personal_data_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_password_strength_policy_endpoint = Endpoint('patch', '/project/policies/password-strength', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_password_strength_policy(
         self,
         min: Optional[float] = None,
@@ -4303,7 +4278,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/password-strength'
         api_params = {}
 
         if min is not None:
@@ -4317,15 +4291,16 @@ class Project(Service):
         if symbols is not None:
             api_params['symbols'] = self._normalize_value(symbols)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_password_strength_policy_endpoint, api_params)
 
         return self._parse_response(response, model=PolicyPasswordStrength)
 
 
+    _update_session_alert_policy_endpoint = Endpoint('patch', '/project/policies/session-alert', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_session_alert_policy(
         self,
         enabled: bool
@@ -4349,7 +4324,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/session-alert'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -4357,15 +4331,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_session_alert_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_session_duration_policy_endpoint = Endpoint('patch', '/project/policies/session-duration', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_session_duration_policy(
         self,
         duration: float
@@ -4389,7 +4364,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/session-duration'
         api_params = {}
         if duration is None:
             raise AppwriteException('Missing required parameter: "duration"')
@@ -4397,15 +4371,16 @@ class Project(Service):
 
         api_params['duration'] = self._normalize_value(duration)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_session_duration_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_session_invalidation_policy_endpoint = Endpoint('patch', '/project/policies/session-invalidation', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_session_invalidation_policy(
         self,
         enabled: bool
@@ -4429,7 +4404,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/session-invalidation'
         api_params = {}
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
@@ -4437,15 +4411,16 @@ class Project(Service):
 
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_session_invalidation_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_session_limit_policy_endpoint = Endpoint('patch', '/project/policies/session-limit', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_session_limit_policy(
         self,
         total: Optional[float]
@@ -4469,20 +4444,20 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/session-limit'
         api_params = {}
 
         api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_session_limit_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_user_limit_policy_endpoint = Endpoint('patch', '/project/policies/user-limit', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_user_limit_policy(
         self,
         total: Optional[float]
@@ -4506,20 +4481,19 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/user-limit'
         api_params = {}
 
         api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_user_limit_policy_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _get_policy_endpoint = Endpoint('get', '/project/policies/{policyId}', {
+        'accept': 'application/json',
+    })
+
     def get_policy(
         self,
         policy_id: ProjectPolicyId
@@ -4543,18 +4517,12 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/policies/{policyId}'
         api_params = {}
         if policy_id is None:
             raise AppwriteException('Missing required parameter: "policy_id"')
 
-        api_path = api_path.replace('{policyId}', str(self._normalize_value(policy_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_policy_endpoint, api_params, [policy_id])
         if not isinstance(response, dict):
             raise AppwriteException('Expected object response when hydrating a response model')
 
@@ -4603,6 +4571,11 @@ class Project(Service):
         raise AppwriteException('Unable to match response to any known model')
 
 
+    _update_protocol_endpoint = Endpoint('patch', '/project/protocols/{protocolId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_protocol(
         self,
         protocol_id: ProjectProtocolId,
@@ -4629,7 +4602,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/protocols/{protocolId}'
         api_params = {}
         if protocol_id is None:
             raise AppwriteException('Missing required parameter: "protocol_id"')
@@ -4637,19 +4609,18 @@ class Project(Service):
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
 
-        api_path = api_path.replace('{protocolId}', str(self._normalize_value(protocol_id)))
-
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_protocol_endpoint, api_params, [protocol_id])
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_service_endpoint = Endpoint('patch', '/project/services/{serviceId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_service(
         self,
         service_id: ProjectServiceId,
@@ -4676,7 +4647,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/services/{serviceId}'
         api_params = {}
         if service_id is None:
             raise AppwriteException('Missing required parameter: "service_id"')
@@ -4684,19 +4654,18 @@ class Project(Service):
         if enabled is None:
             raise AppwriteException('Missing required parameter: "enabled"')
 
-        api_path = api_path.replace('{serviceId}', str(self._normalize_value(service_id)))
-
         api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_service_endpoint, api_params, [service_id])
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _update_smtp_endpoint = Endpoint('patch', '/project/smtp', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_smtp(
         self,
         host: Optional[str] = None,
@@ -4747,7 +4716,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/smtp'
         api_params = {}
 
         if host is not None:
@@ -4771,15 +4739,15 @@ class Project(Service):
         if enabled is not None:
             api_params['enabled'] = self._normalize_value(enabled)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_smtp_endpoint, api_params)
 
         return self._parse_response(response, model=ProjectModel)
 
 
+    _create_smtp_test_endpoint = Endpoint('post', '/project/smtp/tests', {
+        'content-type': 'application/json',
+    })
+
     def create_smtp_test(
         self,
         emails: List[str]
@@ -4803,7 +4771,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/smtp/tests'
         api_params = {}
         if emails is None:
             raise AppwriteException('Missing required parameter: "emails"')
@@ -4811,14 +4778,15 @@ class Project(Service):
 
         api_params['emails'] = self._normalize_value(emails)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_smtp_test_endpoint, api_params)
 
         return response
 
 
+    _list_email_templates_endpoint = Endpoint('get', '/project/templates/email', {
+        'accept': 'application/json',
+    })
+
     def list_email_templates(
         self,
         queries: Optional[List[str]] = None,
@@ -4845,7 +4813,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/templates/email'
         api_params = {}
 
         if queries is not None:
@@ -4853,14 +4820,16 @@ class Project(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_email_templates_endpoint, api_params)
 
         return self._parse_response(response, model=EmailTemplateList)
 
 
+    _update_email_template_endpoint = Endpoint('patch', '/project/templates/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_email_template(
         self,
         template_id: ProjectEmailTemplateId,
@@ -4905,7 +4874,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/templates/email'
         api_params = {}
         if template_id is None:
             raise AppwriteException('Missing required parameter: "template_id"')
@@ -4927,15 +4895,15 @@ class Project(Service):
         if reply_to_name is not None:
             api_params['replyToName'] = self._normalize_value(reply_to_name)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_template_endpoint, api_params)
 
         return self._parse_response(response, model=EmailTemplate)
 
 
+    _get_email_template_endpoint = Endpoint('get', '/project/templates/email/{templateId}', {
+        'accept': 'application/json',
+    })
+
     def get_email_template(
         self,
         template_id: ProjectEmailTemplateId,
@@ -4962,24 +4930,22 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/templates/email/{templateId}'
         api_params = {}
         if template_id is None:
             raise AppwriteException('Missing required parameter: "template_id"')
 
-        api_path = api_path.replace('{templateId}', str(self._normalize_value(template_id)))
-
         if locale is not None:
             api_params['locale'] = self._normalize_value(locale)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_email_template_endpoint, api_params, [template_id])
 
         return self._parse_response(response, model=EmailTemplate)
 
 
+    _list_variables_endpoint = Endpoint('get', '/project/variables', {
+        'accept': 'application/json',
+    })
+
     def list_variables(
         self,
         queries: Optional[List[str]] = None,
@@ -5006,7 +4972,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/variables'
         api_params = {}
 
         if queries is not None:
@@ -5014,14 +4979,16 @@ class Project(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_variables_endpoint, api_params)
 
         return self._parse_response(response, model=VariableList)
 
 
+    _create_variable_endpoint = Endpoint('post', '/project/variables', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_variable(
         self,
         variable_id: str,
@@ -5054,7 +5021,6 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/variables'
         api_params = {}
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
@@ -5072,15 +5038,15 @@ class Project(Service):
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_variable_endpoint, api_params)
 
         return self._parse_response(response, model=Variable)
 
 
+    _get_variable_endpoint = Endpoint('get', '/project/variables/{variableId}', {
+        'accept': 'application/json',
+    })
+
     def get_variable(
         self,
         variable_id: str
@@ -5104,22 +5070,21 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/variables/{variableId}'
         api_params = {}
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_variable_endpoint, api_params, [variable_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _update_variable_endpoint = Endpoint('put', '/project/variables/{variableId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_variable(
         self,
         variable_id: str,
@@ -5152,13 +5117,10 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/variables/{variableId}'
         api_params = {}
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
-
         if key is not None:
             api_params['key'] = self._normalize_value(key)
         if value is not None:
@@ -5166,15 +5128,15 @@ class Project(Service):
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_variable_endpoint, api_params, [variable_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _delete_variable_endpoint = Endpoint('delete', '/project/variables/{variableId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_variable(
         self,
         variable_id: str
@@ -5198,18 +5160,12 @@ class Project(Service):
             If API request fails
         """
 
-        api_path = '/project/variables/{variableId}'
         api_params = {}
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_variable_endpoint, api_params, [variable_id])
 
         return response
 
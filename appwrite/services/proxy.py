@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -13,6 +14,10 @@ class Proxy(Service):
     def __init__(self, client) -> None:
         super(Proxy, self).__init__(client)
 
+    _list_rules_endpoint = Endpoint('get', '/proxy/rules', {
+        'accept': 'application/json',
+    })
+
     def list_rules(
         self,
         queries: Optional[List[str]] = None,
@@ -39,7 +44,6 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules'
         api_params = {}
 
         if queries is not None:
@@ -47,14 +51,16 @@ class Proxy(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_rules_endpoint, api_params)
 
         return self._parse_response(response, model=ProxyRuleList)
 
 
+    _create_api_rule_endpoint = Endpoint('post', '/proxy/rules/api', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_api_rule(
         self,
         domain: str
@@ -80,7 +86,6 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules/api'
         api_params = {}
         if domain is None:
             raise AppwriteException('Missing required parameter: "domain"')
@@ -88,15 +93,16 @@ class Proxy(Service):
 
         api_params['domain'] = self._normalize_value(domain)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_api_rule_endpoint, api_params)
 
         return self._parse_response(response, model=ProxyRule)
 
 
+    _create_function_rule_endpoint = Endpoint('post', '/proxy/rules/function', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_function_rule(
         self,
         domain: str,
@@ -128,7 +134,6 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules/function'
         api_params = {}
         if domain is None:
             raise AppwriteException('Missing required parameter: "domain"')
@@ -142,15 +147,16 @@ class Proxy(Service):
         if branch is not None:
             api_params['branch'] = self._normalize_value(branch)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_function_rule_endpoint, api_params)
 
         return self._parse_response(response, model=ProxyRule)
 
 
+    _create_redirect_rule_endpoint = Endpoint('post', '/proxy/rules/redirect', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_redirect_rule(
         self,
         domain: str,
@@ -188,7 +194,6 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules/redirect'
         api_params = {}
         if domain is None:
             raise AppwriteException('Missing required parameter: "domain"')
@@ -212,15 +217,16 @@ class Proxy(Service):
         api_params['resourceId'] = self._normalize_value(resource_id)
         api_params['resourceType'] = self._normalize_value(resource_type)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_redirect_rule_endpoint, api_params)
 
         return self._parse_response(response, model=ProxyRule)
 
 
+    _create_site_rule_endpoint = Endpoint('post', '/proxy/rules/site', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_site_rule(
         self,
         domain: str,
@@ -252,7 +258,6 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules/site'
         api_params = {}
         if domain is None:
             raise AppwriteException('Missing required parameter: "domain"')
@@ -266,15 +271,15 @@ class Proxy(Service):
         if branch is not None:
             api_params['branch'] = self._normalize_value(branch)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_site_rule_endpoint, api_params)
 
         return self._parse_response(response, model=ProxyRule)
 
 
+    _get_rule_endpoint = Endpoint('get', '/proxy/rules/{ruleId}', {
+        'accept': 'application/json',
+    })
+
     def get_rule(
         self,
         rule_id: str
@@ -298,22 +303,20 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules/{ruleId}'
         api_params = {}
         if rule_id is None:
             raise AppwriteException('Missing required parameter: "rule_id"')
 
-        api_path = api_path.replace('{ruleId}', str(self._normalize_value(rule_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_rule_endpoint, api_params, [rule_id])
 
         return self._parse_response(response, model=ProxyRule)
 
 
+    _delete_rule_endpoint = Endpoint('delete', '/proxy/rules/{ruleId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_rule(
         self,
         rule_id: str
@@ -337,22 +340,21 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules/{ruleId}'
         api_params = {}
         if rule_id is None:
             raise AppwriteException('Missing required parameter: "rule_id"')
 
-        api_path = api_path.replace('{ruleId}', str(self._normalize_value(rule_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_rule_endpoint, api_params, [rule_id])
 
         return response
 
 
+    _update_rule_status_endpoint = Endpoint('patch', '/proxy/rules/{ruleId}/status', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_rule_status(
         self,
         rule_id: str
@@ -376,19 +378,12 @@ class Proxy(Service):
             If API request fails
         """
 
-        api_path = '/proxy/rules/{ruleId}/status'
         api_params = {}
         if rule_id is None:
             raise AppwriteException('Missing required parameter: "rule_id"')
 
-        api_path = api_path.replace('{ruleId}', str(self._normalize_value(rule_id)))
-
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_rule_status_endpoint, api_params, [rule_id])
 
         return self._parse_response(response, model=ProxyRule)
 
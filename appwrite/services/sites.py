@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -26,6 +27,10 @@ class Sites(Service):
     def __init__(self, client) -> None:
         super(Sites, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/sites', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -55,7 +60,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites'
         api_params = {}
 
         if queries is not None:
@@ -65,14 +69,16 @@ class Sites(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
 
         return self._parse_response(response, model=SiteList)
 
 
+    _create_endpoint = Endpoint('post', '/sites', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create(
         self,
         site_id: str,
@@ -162,7 +168,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -220,15 +225,15 @@ class Sites(Service):
         if deployment_retention is not None:
             api_params['deploymentRetention'] = self._normalize_value(deployment_retention)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
         return self._parse_response(response, model=Site)
 
 
+    _list_frameworks_endpoint = Endpoint('get', '/sites/frameworks', {
+        'accept': 'application/json',
+    })
+
     def list_frameworks(
         self
     ) -> FrameworkList:
@@ -246,17 +251,17 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/frameworks'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_frameworks_endpoint, api_params)
 
         return self._parse_response(response, model=FrameworkList)
 
 
+    _list_specifications_endpoint = Endpoint('get', '/sites/specifications', {
+        'accept': 'application/json',
+    })
+
     def list_specifications(
         self,
         type: Optional[str] = None
@@ -280,20 +285,20 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/specifications'
         api_params = {}
 
         if type is not None:
             api_params['type'] = self._normalize_value(type)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_specifications_endpoint, api_params)
 
         return self._parse_response(response, model=SpecificationList)
 
 
+    _get_endpoint = Endpoint('get', '/sites/{siteId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         site_id: str
@@ -317,22 +322,21 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=Site)
 
 
+    _update_endpoint = Endpoint('put', '/sites/{siteId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update(
         self,
         site_id: str,
@@ -422,7 +426,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -433,8 +436,6 @@ class Sites(Service):
         if framework is None:
             raise AppwriteException('Missing required parameter: "framework"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['framework'] = self._normalize_value(framework)
         if enabled is not None:
@@ -478,15 +479,15 @@ class Sites(Service):
         if deployment_retention is not None:
             api_params['deploymentRetention'] = self._normalize_value(deployment_retention)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=Site)
 
 
+    _delete_endpoint = Endpoint('delete', '/sites/{siteId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         site_id: str
@@ -510,22 +511,21 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [site_id])
 
         return response
 
 
+    _update_site_deployment_endpoint = Endpoint('patch', '/sites/{siteId}/deployment', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_site_deployment(
         self,
         site_id: str,
@@ -552,7 +552,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployment'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -560,19 +559,17 @@ class Sites(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         api_params['deploymentId'] = self._normalize_value(deployment_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_site_deployment_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=Site)
 
 
+    _list_deployments_endpoint = Endpoint('get', '/sites/{siteId}/deployments', {
+        'accept': 'application/json',
+    })
+
     def list_deployments(
         self,
         site_id: str,
@@ -605,13 +602,10 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -619,14 +613,16 @@ class Sites(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_deployments_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=DeploymentList)
 
 
+    _create_deployment_endpoint = Endpoint('post', '/sites/{siteId}/deployments', {
+        'content-type': 'multipart/form-data',
+        'accept': 'application/json',
+    })
+
     def create_deployment(
         self,
         site_id: str,
@@ -635,7 +631,11 @@ class Sites(Service):
         build_command: Optional[str] = None,
         output_directory: Optional[str] = None,
         activate: Optional[bool] = None,
-        on_progress = None
+        on_progress = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_bytes_per_second: Optional[float] = None,
+        adaptive: Optional[bool] = None
     ) -> Deployment:
         """
         Create a new site code deployment. Use this endpoint to upload a new version of your site code. To activate your newly uploaded code, you'll need to update the site's deployment to use your new deployment ID.
@@ -656,6 +656,14 @@ class Sites(Service):
             Automatically activate the deployment when it is finished building.
                 on_progress : callable, optional
             Optional callback for upload progress
+        chunk_size : Optional[int]
+            Size of each uploaded chunk in bytes. Defaults to the client's upload options.
+        max_workers : Optional[int]
+            Maximum number of chunks uploaded in parallel. Defaults to the client's upload options.
+        max_bytes_per_second : Optional[float]
+            Upload bandwidth limit in bytes per second. Defaults to the client's upload options.
+        adaptive : Optional[bool]
+            Adjust the number of parallel chunks to the measured throughput. Defaults to the client's upload options.
         
         Returns
         -------
@@ -668,7 +676,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -676,7 +683,7 @@ class Sites(Service):
         if code is None:
             raise AppwriteException('Missing required parameter: "code"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
+        api_path = self._create_deployment_endpoint.format_path([site_id])
 
         if install_command is not None:
             api_params['installCommand'] = self._normalize_value(install_command)
@@ -693,15 +700,28 @@ class Sites(Service):
 
         upload_id = ''
 
-        response = self.client.chunked_upload(api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'multipart/form-data',
-            'accept': 'application/json',
-        }, api_params, param_name, on_progress, upload_id)
+        response = self.client.chunked_upload(
+            api_path,
+            self._create_deployment_endpoint.request_headers(self.client.get_config('project')),
+            api_params,
+            param_name,
+            on_progress,
+            upload_id,
+            chunk_size,
+            max_workers,
+            max_bytes_per_second,
+            adaptive,
+            endpoint=self._create_deployment_endpoint
+        )
 
         return self._parse_response(response, model=Deployment)
 
 
+    _create_duplicate_deployment_endpoint = Endpoint('post', '/sites/{siteId}/deployments/duplicate', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_duplicate_deployment(
         self,
         site_id: str,
@@ -728,7 +748,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments/duplicate'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -736,19 +755,18 @@ class Sites(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         api_params['deploymentId'] = self._normalize_value(deployment_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_duplicate_deployment_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _create_template_deployment_endpoint = Endpoint('post', '/sites/{siteId}/deployments/template', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_template_deployment(
         self,
         site_id: str,
@@ -792,7 +810,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments/template'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -812,8 +829,6 @@ class Sites(Service):
         if reference is None:
             raise AppwriteException('Missing required parameter: "reference"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         api_params['repository'] = self._normalize_value(repository)
         api_params['owner'] = self._normalize_value(owner)
         api_params['rootDirectory'] = self._normalize_value(root_directory)
@@ -822,15 +837,16 @@ class Sites(Service):
         if activate is not None:
             api_params['activate'] = self._normalize_value(activate)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_template_deployment_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _create_vcs_deployment_endpoint = Endpoint('post', '/sites/{siteId}/deployments/vcs', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_vcs_deployment(
         self,
         site_id: str,
@@ -865,7 +881,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments/vcs'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -876,22 +891,20 @@ class Sites(Service):
         if reference is None:
             raise AppwriteException('Missing required parameter: "reference"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         api_params['type'] = self._normalize_value(type)
         api_params['reference'] = self._normalize_value(reference)
         if activate is not None:
             api_params['activate'] = self._normalize_value(activate)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_vcs_deployment_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _get_deployment_endpoint = Endpoint('get', '/sites/{siteId}/deployments/{deploymentId}', {
+        'accept': 'application/json',
+    })
+
     def get_deployment(
         self,
         site_id: str,
@@ -918,7 +931,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments/{deploymentId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -926,18 +938,16 @@ class Sites(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_deployment_endpoint, api_params, [site_id, deployment_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _delete_deployment_endpoint = Endpoint('delete', '/sites/{siteId}/deployments/{deploymentId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_deployment(
         self,
         site_id: str,
@@ -964,7 +974,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments/{deploymentId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -972,18 +981,16 @@ class Sites(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_deployment_endpoint, api_params, [site_id, deployment_id])
 
         return response
 
 
+    _get_deployment_download_endpoint = Endpoint('get', '/sites/{siteId}/deployments/{deploymentId}/download', {
+        'accept': '*/*',
+    })
+
     def get_deployment_download(
         self,
         site_id: str,
@@ -1016,7 +1023,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments/{deploymentId}/download'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1024,22 +1030,21 @@ class Sites(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
-
         if type is not None:
             api_params['type'] = self._normalize_value(type)
         if token is not None:
             api_params['token'] = self._normalize_value(token)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': '*/*',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_deployment_download_endpoint, api_params, [site_id, deployment_id])
 
         return response
 
 
+    _update_deployment_status_endpoint = Endpoint('patch', '/sites/{siteId}/deployments/{deploymentId}/status', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_deployment_status(
         self,
         site_id: str,
@@ -1066,7 +1071,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/deployments/{deploymentId}/status'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1074,19 +1078,16 @@ class Sites(Service):
         if deployment_id is None:
             raise AppwriteException('Missing required parameter: "deployment_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{deploymentId}', str(self._normalize_value(deployment_id)))
-
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_deployment_status_endpoint, api_params, [site_id, deployment_id])
 
         return self._parse_response(response, model=Deployment)
 
 
+    _list_logs_endpoint = Endpoint('get', '/sites/{siteId}/logs', {
+        'accept': 'application/json',
+    })
+
     def list_logs(
         self,
         site_id: str,
@@ -1116,26 +1117,24 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/logs'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_logs_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=ExecutionList)
 
 
+    _get_log_endpoint = Endpoint('get', '/sites/{siteId}/logs/{logId}', {
+        'accept': 'application/json',
+    })
+
     def get_log(
         self,
         site_id: str,
@@ -1162,7 +1161,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/logs/{logId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1170,18 +1168,17 @@ class Sites(Service):
         if log_id is None:
             raise AppwriteException('Missing required parameter: "log_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{logId}', str(self._normalize_value(log_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_log_endpoint, api_params, [site_id, log_id])
 
         return self._parse_response(response, model=Execution)
 
 
+    _delete_log_endpoint = Endpoint('delete', '/sites/{siteId}/logs/{logId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_log(
         self,
         site_id: str,
@@ -1208,7 +1205,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/logs/{logId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1216,19 +1212,16 @@ class Sites(Service):
         if log_id is None:
             raise AppwriteException('Missing required parameter: "log_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{logId}', str(self._normalize_value(log_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_log_endpoint, api_params, [site_id, log_id])
 
         return response
 
 
+    _list_variables_endpoint = Endpoint('get', '/sites/{siteId}/variables', {
+        'accept': 'application/json',
+    })
+
     def list_variables(
         self,
         site_id: str,
@@ -1258,26 +1251,25 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/variables'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_variables_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=VariableList)
 
 
+    _create_variable_endpoint = Endpoint('post', '/sites/{siteId}/variables', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_variable(
         self,
         site_id: str,
@@ -1313,7 +1305,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/variables'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1327,23 +1318,21 @@ class Sites(Service):
         if value is None:
             raise AppwriteException('Missing required parameter: "value"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-
         api_params['variableId'] = self._normalize_value(variable_id)
         api_params['key'] = self._normalize_value(key)
         api_params['value'] = self._normalize_value(value)
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_variable_endpoint, api_params, [site_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _get_variable_endpoint = Endpoint('get', '/sites/{siteId}/variables/{variableId}', {
+        'accept': 'application/json',
+    })
+
     def get_variable(
         self,
         site_id: str,
@@ -1370,7 +1359,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/variables/{variableId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1378,18 +1366,17 @@ class Sites(Service):
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_variable_endpoint, api_params, [site_id, variable_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _update_variable_endpoint = Endpoint('put', '/sites/{siteId}/variables/{variableId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_variable(
         self,
         site_id: str,
@@ -1425,7 +1412,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/variables/{variableId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1433,9 +1419,6 @@ class Sites(Service):
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
-
         if key is not None:
             api_params['key'] = self._normalize_value(key)
         if value is not None:
@@ -1443,15 +1426,15 @@ class Sites(Service):
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_variable_endpoint, api_params, [site_id, variable_id])
 
         return self._parse_response(response, model=Variable)
 
 
+    _delete_variable_endpoint = Endpoint('delete', '/sites/{siteId}/variables/{variableId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_variable(
         self,
         site_id: str,
@@ -1478,7 +1461,6 @@ class Sites(Service):
             If API request fails
         """
 
-        api_path = '/sites/{siteId}/variables/{variableId}'
         api_params = {}
         if site_id is None:
             raise AppwriteException('Missing required parameter: "site_id"')
@@ -1486,14 +1468,8 @@ class Sites(Service):
         if variable_id is None:
             raise AppwriteException('Missing required parameter: "variable_id"')
 
-        api_path = api_path.replace('{siteId}', str(self._normalize_value(site_id)))
-        api_path = api_path.replace('{variableId}', str(self._normalize_value(variable_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_variable_endpoint, api_params, [site_id, variable_id])
 
         return response
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -17,6 +18,10 @@ class Storage(Service):
     def __init__(self, client) -> None:
         super(Storage, self).__init__(client)
 
+    _list_buckets_endpoint = Endpoint('get', '/storage/buckets', {
+        'accept': 'application/json',
+    })
+
     def list_buckets(
         self,
         queries: Optional[List[str]] = None,
@@ -46,7 +51,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets'
         api_params = {}
 
         if queries is not None:
@@ -56,14 +60,16 @@ class Storage(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_buckets_endpoint, api_params)
 
         return self._parse_response(response, model=BucketList)
 
 
+    _create_bucket_endpoint = Endpoint('post', '/storage/buckets', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_bucket(
         self,
         bucket_id: str,
@@ -117,7 +123,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -147,15 +152,15 @@ class Storage(Service):
         if transformations is not None:
             api_params['transformations'] = self._normalize_value(transformations)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_bucket_endpoint, api_params)
 
         return self._parse_response(response, model=Bucket)
 
 
+    _get_bucket_endpoint = Endpoint('get', '/storage/buckets/{bucketId}', {
+        'accept': 'application/json',
+    })
+
     def get_bucket(
         self,
         bucket_id: str
@@ -179,22 +184,21 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_bucket_endpoint, api_params, [bucket_id])
 
         return self._parse_response(response, model=Bucket)
 
 
+    _update_bucket_endpoint = Endpoint('put', '/storage/buckets/{bucketId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_bucket(
         self,
         bucket_id: str,
@@ -248,7 +252,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -256,8 +259,6 @@ class Storage(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-
         api_params['name'] = self._normalize_value(name)
         if permissions is not None:
             api_params['permissions'] = self._normalize_value(permissions)
@@ -278,15 +279,15 @@ class Storage(Service):
         if transformations is not None:
             api_params['transformations'] = self._normalize_value(transformations)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_bucket_endpoint, api_params, [bucket_id])
 
         return self._parse_response(response, model=Bucket)
 
 
+    _delete_bucket_endpoint = Endpoint('delete', '/storage/buckets/{bucketId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_bucket(
         self,
         bucket_id: str
@@ -310,22 +311,20 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_bucket_endpoint, api_params, [bucket_id])
 
         return response
 
 
+    _list_files_endpoint = Endpoint('get', '/storage/buckets/{bucketId}/files', {
+        'accept': 'application/json',
+    })
+
     def list_files(
         self,
         bucket_id: str,
@@ -358,13 +357,10 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -372,21 +368,27 @@ class Storage(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_files_endpoint, api_params, [bucket_id])
 
         return self._parse_response(response, model=FileList)
 
 
+    _create_file_endpoint = Endpoint('post', '/storage/buckets/{bucketId}/files', {
+        'content-type': 'multipart/form-data',
+        'accept': 'application/json',
+    })
+
     def create_file(
         self,
         bucket_id: str,
         file_id: str,
         file: InputFile,
         permissions: Optional[List[str]] = None,
-        on_progress = None
+        on_progress = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_bytes_per_second: Optional[float] = None,
+        adaptive: Optional[bool] = None
     ) -> File:
         """
         Create a new file. Before using this route, you should create a new bucket resource using either a [server integration](https://appwrite.io/docs/server/storage#storageCreateBucket) API or directly from your Appwrite console.
@@ -410,6 +412,14 @@ class Storage(Service):
             An array of permission strings. By default, only the current user is granted all permissions. [Learn more about permissions](https://appwrite.io/docs/permissions).
                 on_progress : callable, optional
             Optional callback for upload progress
+        chunk_size : Optional[int]
+            Size of each uploaded chunk in bytes. Defaults to the client's upload options.
+        max_workers : Optional[int]
+            Maximum number of chunks uploaded in parallel. Defaults to the client's upload options.
+        max_bytes_per_second : Optional[float]
+            Upload bandwidth limit in bytes per second. Defaults to the client's upload options.
+        adaptive : Optional[bool]
+            Adjust the number of parallel chunks to the measured throughput. Defaults to the client's upload options.
         
         Returns
         -------
@@ -422,7 +432,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -433,7 +442,7 @@ class Storage(Service):
         if file is None:
             raise AppwriteException('Missing required parameter: "file"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
+        api_path = self._create_file_endpoint.format_path([bucket_id])
 
         api_params['fileId'] = self._normalize_value(file_id)
         api_params['file'] = self._normalize_value(file)
@@ -446,15 +455,27 @@ class Storage(Service):
         upload_id = ''
         upload_id = file_id
 
-        response = self.client.chunked_upload(api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'multipart/form-data',
-            'accept': 'application/json',
-        }, api_params, param_name, on_progress, upload_id)
+        response = self.client.chunked_upload(
+            api_path,
+            self._create_file_endpoint.request_headers(self.client.get_config('project')),
+            api_params,
+            param_name,
+            on_progress,
+            upload_id,
+            chunk_size,
+            max_workers,
+            max_bytes_per_second,
+            adaptive,
+            endpoint=self._create_file_endpoint
+        )
 
         return self._parse_response(response, model=File)
 
 
+    _get_file_endpoint = Endpoint('get', '/storage/buckets/{bucketId}/files/{fileId}', {
+        'accept': 'application/json',
+    })
+
     def get_file(
         self,
         bucket_id: str,
@@ -481,7 +502,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files/{fileId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -489,18 +509,17 @@ class Storage(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_file_endpoint, api_params, [bucket_id, file_id])
 
         return self._parse_response(response, model=File)
 
 
+    _update_file_endpoint = Endpoint('put', '/storage/buckets/{bucketId}/files/{fileId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_file(
         self,
         bucket_id: str,
@@ -533,7 +552,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files/{fileId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -541,23 +559,20 @@ class Storage(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if permissions is not None:
             api_params['permissions'] = self._normalize_value(permissions)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_file_endpoint, api_params, [bucket_id, file_id])
 
         return self._parse_response(response, model=File)
 
 
+    _delete_file_endpoint = Endpoint('delete', '/storage/buckets/{bucketId}/files/{fileId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_file(
         self,
         bucket_id: str,
@@ -584,7 +599,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files/{fileId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -592,18 +606,16 @@ class Storage(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_file_endpoint, api_params, [bucket_id, file_id])
 
         return response
 
 
+    _get_file_download_endpoint = Endpoint('get', '/storage/buckets/{bucketId}/files/{fileId}/download', {
+        'accept': '*/*',
+    })
+
     def get_file_download(
         self,
         bucket_id: str,
@@ -633,7 +645,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files/{fileId}/download'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -641,20 +652,18 @@ class Storage(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
-
         if token is not None:
             api_params['token'] = self._normalize_value(token)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': '*/*',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_file_download_endpoint, api_params, [bucket_id, file_id])
 
         return response
 
 
+    _get_file_preview_endpoint = Endpoint('get', '/storage/buckets/{bucketId}/files/{fileId}/preview', {
+        'accept': 'image/*',
+    })
+
     def get_file_preview(
         self,
         bucket_id: str,
@@ -717,7 +726,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files/{fileId}/preview'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -725,9 +733,6 @@ class Storage(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
-
         if width is not None:
             api_params['width'] = self._normalize_value(width)
         if height is not None:
@@ -753,14 +758,15 @@ class Storage(Service):
         if token is not None:
             api_params['token'] = self._normalize_value(token)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'image/*',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_file_preview_endpoint, api_params, [bucket_id, file_id])
 
         return response
 
 
+    _get_file_view_endpoint = Endpoint('get', '/storage/buckets/{bucketId}/files/{fileId}/view', {
+        'accept': '*/*',
+    })
+
     def get_file_view(
         self,
         bucket_id: str,
@@ -790,7 +796,6 @@ class Storage(Service):
             If API request fails
         """
 
-        api_path = '/storage/buckets/{bucketId}/files/{fileId}/view'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -798,16 +803,10 @@ class Storage(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
-
         if token is not None:
             api_params['token'] = self._normalize_value(token)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': '*/*',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_file_view_endpoint, api_params, [bucket_id, file_id])
 
         return response
 
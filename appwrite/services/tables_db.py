@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar
 from ..exception import AppwriteException
@@ -48,6 +49,10 @@ class TablesDB(Service):
     def __init__(self, client) -> None:
         super(TablesDB, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/tablesdb', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -77,7 +82,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb'
         api_params = {}
 
         if queries is not None:
@@ -87,14 +91,16 @@ class TablesDB(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
 
         return self._parse_response(response, model=DatabaseList)
 
 
+    _create_endpoint = Endpoint('post', '/tablesdb', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create(
         self,
         database_id: str,
@@ -131,7 +137,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -149,15 +154,15 @@ class TablesDB(Service):
         if replicas is not None:
             api_params['replicas'] = self._normalize_value(replicas)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
         return self._parse_response(response, model=Database)
 
 
+    _list_specifications_endpoint = Endpoint('get', '/tablesdb/specifications', {
+        'accept': 'application/json',
+    })
+
     def list_specifications(
         self
     ) -> DedicatedDatabaseSpecificationList:
@@ -175,17 +180,17 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/specifications'
         api_params = {}
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_specifications_endpoint, api_params)
 
         return self._parse_response(response, model=DedicatedDatabaseSpecificationList)
 
 
+    _list_transactions_endpoint = Endpoint('get', '/tablesdb/transactions', {
+        'accept': 'application/json',
+    })
+
     def list_transactions(
         self,
         queries: Optional[List[str]] = None
@@ -209,20 +214,21 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/transactions'
         api_params = {}
 
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_transactions_endpoint, api_params)
 
         return self._parse_response(response, model=TransactionList)
 
 
+    _create_transaction_endpoint = Endpoint('post', '/tablesdb/transactions', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_transaction(
         self,
         ttl: Optional[float] = None
@@ -246,21 +252,20 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/transactions'
         api_params = {}
 
         if ttl is not None:
             api_params['ttl'] = self._normalize_value(ttl)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_transaction_endpoint, api_params)
 
         return self._parse_response(response, model=Transaction)
 
 
+    _get_transaction_endpoint = Endpoint('get', '/tablesdb/transactions/{transactionId}', {
+        'accept': 'application/json',
+    })
+
     def get_transaction(
         self,
         transaction_id: str
@@ -284,22 +289,21 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/transactions/{transactionId}'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_transaction_endpoint, api_params, [transaction_id])
 
         return self._parse_response(response, model=Transaction)
 
 
+    _update_transaction_endpoint = Endpoint('patch', '/tablesdb/transactions/{transactionId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_transaction(
         self,
         transaction_id: str,
@@ -329,27 +333,24 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/transactions/{transactionId}'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
-
         if commit is not None:
             api_params['commit'] = self._normalize_value(commit)
         if rollback is not None:
             api_params['rollback'] = self._normalize_value(rollback)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_transaction_endpoint, api_params, [transaction_id])
 
         return self._parse_response(response, model=Transaction)
 
 
+    _delete_transaction_endpoint = Endpoint('delete', '/tablesdb/transactions/{transactionId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_transaction(
         self,
         transaction_id: str
@@ -373,22 +374,21 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/transactions/{transactionId}'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_transaction_endpoint, api_params, [transaction_id])
 
         return response
 
 
+    _create_operations_endpoint = Endpoint('post', '/tablesdb/transactions/{transactionId}/operations', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_operations(
         self,
         transaction_id: str,
@@ -415,25 +415,22 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/transactions/{transactionId}/operations'
         api_params = {}
         if transaction_id is None:
             raise AppwriteException('Missing required parameter: "transaction_id"')
 
-        api_path = api_path.replace('{transactionId}', str(self._normalize_value(transaction_id)))
-
         if operations is not None:
             api_params['operations'] = self._normalize_value(operations)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_operations_endpoint, api_params, [transaction_id])
 
         return self._parse_response(response, model=Transaction)
 
 
+    _get_endpoint = Endpoint('get', '/tablesdb/{databaseId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         database_id: str
@@ -457,22 +454,21 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=Database)
 
 
+    _update_endpoint = Endpoint('put', '/tablesdb/{databaseId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update(
         self,
         database_id: str,
@@ -505,13 +501,10 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if enabled is not None:
@@ -519,15 +512,15 @@ class TablesDB(Service):
         if replicas is not None:
             api_params['replicas'] = self._normalize_value(replicas)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=Database)
 
 
+    _delete_endpoint = Endpoint('delete', '/tablesdb/{databaseId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         database_id: str
@@ -551,22 +544,21 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [database_id])
 
         return response
 
 
+    _create_failover_endpoint = Endpoint('post', '/tablesdb/{databaseId}/failovers', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_failover(
         self,
         database_id: str,
@@ -593,25 +585,22 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/failovers'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
         if target_replica_id is not None:
             api_params['targetReplicaId'] = self._normalize_value(target_replica_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_failover_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=DedicatedDatabase)
 
 
+    _get_replicas_endpoint = Endpoint('get', '/tablesdb/{databaseId}/replicas', {
+        'accept': 'application/json',
+    })
+
     def get_replicas(
         self,
         database_id: str
@@ -635,22 +624,20 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/replicas'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_replicas_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=DedicatedDatabaseReplicas)
 
 
+    _get_status_endpoint = Endpoint('get', '/tablesdb/{databaseId}/status', {
+        'accept': 'application/json',
+    })
+
     def get_status(
         self,
         database_id: str
@@ -674,22 +661,20 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/status'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_status_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=DatabaseStatus)
 
 
+    _list_tables_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables', {
+        'accept': 'application/json',
+    })
+
     def list_tables(
         self,
         database_id: str,
@@ -722,13 +707,10 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -736,14 +718,16 @@ class TablesDB(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_tables_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=TableList)
 
 
+    _create_table_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_table(
         self,
         database_id: str,
@@ -788,7 +772,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -799,8 +782,6 @@ class TablesDB(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-
         api_params['tableId'] = self._normalize_value(table_id)
         api_params['name'] = self._normalize_value(name)
         if permissions is not None:
@@ -814,15 +795,15 @@ class TablesDB(Service):
         if indexes is not None:
             api_params['indexes'] = self._normalize_value(indexes)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_table_endpoint, api_params, [database_id])
 
         return self._parse_response(response, model=Table)
 
 
+    _get_table_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}', {
+        'accept': 'application/json',
+    })
+
     def get_table(
         self,
         database_id: str,
@@ -849,7 +830,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -857,18 +837,17 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_table_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=Table)
 
 
+    _update_table_endpoint = Endpoint('put', '/tablesdb/{databaseId}/tables/{tableId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_table(
         self,
         database_id: str,
@@ -910,7 +889,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -918,9 +896,6 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         if name is not None:
             api_params['name'] = self._normalize_value(name)
         if permissions is not None:
@@ -932,15 +907,15 @@ class TablesDB(Service):
         if purge is not None:
             api_params['purge'] = self._normalize_value(purge)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_table_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=Table)
 
 
+    _delete_table_endpoint = Endpoint('delete', '/tablesdb/{databaseId}/tables/{tableId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_table(
         self,
         database_id: str,
@@ -967,7 +942,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -975,18 +949,16 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_table_endpoint, api_params, [database_id, table_id])
 
         return response
 
 
+    _list_columns_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/columns', {
+        'accept': 'application/json',
+    })
+
     def list_columns(
         self,
         database_id: str,
@@ -1019,7 +991,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1027,22 +998,21 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_columns_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnList)
 
 
+    _create_big_int_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/bigint', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_big_int_column(
         self,
         database_id: str,
@@ -1088,7 +1058,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/bigint'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1102,9 +1071,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if min is not None:
@@ -1116,15 +1082,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_big_int_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnBigint)
 
 
+    _update_big_int_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/bigint/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_big_int_column(
         self,
         database_id: str,
@@ -1170,7 +1137,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/bigint/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1184,10 +1150,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if min is not None:
             api_params['min'] = self._normalize_value(min)
@@ -1197,15 +1159,16 @@ class TablesDB(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_big_int_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnBigint)
 
 
+    _create_boolean_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/boolean', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_boolean_column(
         self,
         database_id: str,
@@ -1245,7 +1208,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/boolean'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1259,9 +1221,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -1269,15 +1228,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_boolean_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnBoolean)
 
 
+    _update_boolean_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/boolean/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_boolean_column(
         self,
         database_id: str,
@@ -1316,7 +1276,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/boolean/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1330,24 +1289,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_boolean_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnBoolean)
 
 
+    _create_datetime_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/datetime', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_datetime_column(
         self,
         database_id: str,
@@ -1386,7 +1342,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/datetime'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1400,9 +1355,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -1410,15 +1362,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_datetime_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnDatetime)
 
 
+    _update_datetime_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/datetime/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_datetime_column(
         self,
         database_id: str,
@@ -1457,7 +1410,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/datetime/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1471,24 +1423,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_datetime_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnDatetime)
 
 
+    _create_email_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_email_column(
         self,
         database_id: str,
@@ -1528,7 +1477,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/email'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1542,9 +1490,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -1552,15 +1497,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_email_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnEmail)
 
 
+    _update_email_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/email/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_email_column(
         self,
         database_id: str,
@@ -1600,7 +1546,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/email/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1614,24 +1559,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnEmail)
 
 
+    _create_enum_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/enum', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_enum_column(
         self,
         database_id: str,
@@ -1673,7 +1615,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/enum'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1690,9 +1631,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['elements'] = self._normalize_value(elements)
         api_params['required'] = self._normalize_value(required)
@@ -1701,15 +1639,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_enum_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnEnum)
 
 
+    _update_enum_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/enum/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_enum_column(
         self,
         database_id: str,
@@ -1752,7 +1691,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/enum/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1769,25 +1707,22 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['elements'] = self._normalize_value(elements)
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_enum_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnEnum)
 
 
+    _create_float_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/float', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_float_column(
         self,
         database_id: str,
@@ -1833,7 +1768,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/float'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1847,9 +1781,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if min is not None:
@@ -1861,15 +1792,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_float_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnFloat)
 
 
+    _update_float_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/float/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_float_column(
         self,
         database_id: str,
@@ -1915,7 +1847,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/float/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -1929,10 +1860,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if min is not None:
             api_params['min'] = self._normalize_value(min)
@@ -1942,15 +1869,16 @@ class TablesDB(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_float_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnFloat)
 
 
+    _create_integer_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/integer', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_integer_column(
         self,
         database_id: str,
@@ -1996,7 +1924,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/integer'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2010,9 +1937,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if min is not None:
@@ -2024,15 +1948,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_integer_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnInteger)
 
 
+    _update_integer_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/integer/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_integer_column(
         self,
         database_id: str,
@@ -2078,7 +2003,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/integer/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2092,10 +2016,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if min is not None:
             api_params['min'] = self._normalize_value(min)
@@ -2105,15 +2025,16 @@ class TablesDB(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_integer_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnInteger)
 
 
+    _create_ip_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/ip', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_ip_column(
         self,
         database_id: str,
@@ -2153,7 +2074,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/ip'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2167,9 +2087,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -2177,15 +2094,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_ip_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnIp)
 
 
+    _update_ip_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/ip/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_ip_column(
         self,
         database_id: str,
@@ -2225,7 +2143,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/ip/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2239,24 +2156,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_ip_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnIp)
 
 
+    _create_line_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/line', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_line_column(
         self,
         database_id: str,
@@ -2292,7 +2206,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/line'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2306,23 +2219,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_line_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnLine)
 
 
+    _update_line_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/line/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_line_column(
         self,
         database_id: str,
@@ -2361,7 +2272,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/line/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2375,25 +2285,22 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_line_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnLine)
 
 
+    _create_longtext_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/longtext', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_longtext_column(
         self,
         database_id: str,
@@ -2436,7 +2343,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/longtext'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2450,9 +2356,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -2462,15 +2365,16 @@ class TablesDB(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_longtext_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnLongtext)
 
 
+    _update_longtext_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/longtext/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_longtext_column(
         self,
         database_id: str,
@@ -2510,7 +2414,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/longtext/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2524,24 +2427,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_longtext_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnLongtext)
 
 
+    _create_mediumtext_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/mediumtext', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_mediumtext_column(
         self,
         database_id: str,
@@ -2584,7 +2484,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/mediumtext'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2598,9 +2497,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -2610,15 +2506,16 @@ class TablesDB(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mediumtext_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnMediumtext)
 
 
+    _update_mediumtext_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/mediumtext/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mediumtext_column(
         self,
         database_id: str,
@@ -2658,7 +2555,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/mediumtext/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2672,24 +2568,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mediumtext_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnMediumtext)
 
 
+    _create_point_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/point', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_point_column(
         self,
         database_id: str,
@@ -2725,7 +2618,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/point'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2739,23 +2631,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_point_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnPoint)
 
 
+    _update_point_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/point/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_point_column(
         self,
         database_id: str,
@@ -2794,7 +2684,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/point/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2808,25 +2697,22 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_point_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnPoint)
 
 
+    _create_polygon_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/polygon', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_polygon_column(
         self,
         database_id: str,
@@ -2862,7 +2748,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/polygon'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2876,23 +2761,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_polygon_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnPolygon)
 
 
+    _update_polygon_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/polygon/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_polygon_column(
         self,
         database_id: str,
@@ -2931,7 +2814,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/polygon/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -2945,25 +2827,22 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         if default is not None:
             api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_polygon_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnPolygon)
 
 
+    _create_relationship_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/relationship', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_relationship_column(
         self,
         database_id: str,
@@ -3009,7 +2888,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/relationship'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3023,9 +2901,6 @@ class TablesDB(Service):
         if type is None:
             raise AppwriteException('Missing required parameter: "type"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['relatedTableId'] = self._normalize_value(related_table_id)
         api_params['type'] = self._normalize_value(type)
         if two_way is not None:
@@ -3037,15 +2912,16 @@ class TablesDB(Service):
         if on_delete is not None:
             api_params['onDelete'] = self._normalize_value(on_delete)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_relationship_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnRelationship)
 
 
+    _create_string_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/string', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.9.0. Please use `tablesDB.create_text_column` instead.")
     def create_string_column(
         self,
@@ -3094,7 +2970,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/string'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3111,9 +2986,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['size'] = self._normalize_value(size)
         api_params['required'] = self._normalize_value(required)
@@ -3124,15 +2996,16 @@ class TablesDB(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_string_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnString)
 
 
+    _update_string_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/string/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     @deprecated("This API has been deprecated since 1.8.0. Please use `tablesDB.update_text_column` instead.")
     def update_string_column(
         self,
@@ -3178,7 +3051,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/string/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3192,10 +3064,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if size is not None:
@@ -3203,15 +3071,16 @@ class TablesDB(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_string_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnString)
 
 
+    _create_text_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/text', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_text_column(
         self,
         database_id: str,
@@ -3254,7 +3123,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/text'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3268,9 +3136,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -3280,15 +3145,16 @@ class TablesDB(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_text_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnText)
 
 
+    _update_text_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/text/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_text_column(
         self,
         database_id: str,
@@ -3328,7 +3194,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/text/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3342,24 +3207,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_text_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnText)
 
 
+    _create_url_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/url', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_url_column(
         self,
         database_id: str,
@@ -3399,7 +3261,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/url'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3413,9 +3274,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['required'] = self._normalize_value(required)
         if default is not None:
@@ -3423,15 +3281,16 @@ class TablesDB(Service):
         if array is not None:
             api_params['array'] = self._normalize_value(array)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_url_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnUrl)
 
 
+    _update_url_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/url/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_url_column(
         self,
         database_id: str,
@@ -3471,7 +3330,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/url/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3485,24 +3343,21 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_url_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnUrl)
 
 
+    _create_varchar_column_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/columns/varchar', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_varchar_column(
         self,
         database_id: str,
@@ -3548,7 +3403,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/varchar'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3565,9 +3419,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['size'] = self._normalize_value(size)
         api_params['required'] = self._normalize_value(required)
@@ -3578,15 +3429,16 @@ class TablesDB(Service):
         if encrypt is not None:
             api_params['encrypt'] = self._normalize_value(encrypt)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_varchar_column_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnVarchar)
 
 
+    _update_varchar_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/varchar/{key}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_varchar_column(
         self,
         database_id: str,
@@ -3629,7 +3481,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/varchar/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3643,10 +3494,6 @@ class TablesDB(Service):
         if required is None:
             raise AppwriteException('Missing required parameter: "required"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         api_params['required'] = self._normalize_value(required)
         api_params['default'] = self._normalize_value(default)
         if size is not None:
@@ -3654,15 +3501,15 @@ class TablesDB(Service):
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_varchar_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnVarchar)
 
 
+    _get_column_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/columns/{key}', {
+        'accept': 'application/json',
+    })
+
     def get_column(
         self,
         database_id: str,
@@ -3692,7 +3539,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3703,15 +3549,8 @@ class TablesDB(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_column_endpoint, api_params, [database_id, table_id, key])
         if not isinstance(response, dict):
             raise AppwriteException('Expected object response when hydrating a response model')
 
@@ -3748,6 +3587,10 @@ class TablesDB(Service):
         raise AppwriteException('Unable to match response to any known model')
 
 
+    _delete_column_endpoint = Endpoint('delete', '/tablesdb/{databaseId}/tables/{tableId}/columns/{key}', {
+        'content-type': 'application/json',
+    })
+
     def delete_column(
         self,
         database_id: str,
@@ -3777,7 +3620,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3788,19 +3630,17 @@ class TablesDB(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_column_endpoint, api_params, [database_id, table_id, key])
 
         return response
 
 
+    _update_relationship_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/columns/{key}/relationship', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_relationship_column(
         self,
         database_id: str,
@@ -3837,7 +3677,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/columns/{key}/relationship'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3848,24 +3687,20 @@ class TablesDB(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
         if on_delete is not None:
             api_params['onDelete'] = self._normalize_value(on_delete)
         if new_key is not None:
             api_params['newKey'] = self._normalize_value(new_key)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_relationship_column_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnRelationship)
 
 
+    _list_indexes_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/indexes', {
+        'accept': 'application/json',
+    })
+
     def list_indexes(
         self,
         database_id: str,
@@ -3898,7 +3733,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/indexes'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3906,22 +3740,21 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_indexes_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnIndexList)
 
 
+    _create_index_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/indexes', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_index(
         self,
         database_id: str,
@@ -3964,7 +3797,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/indexes'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -3981,9 +3813,6 @@ class TablesDB(Service):
         if columns is None:
             raise AppwriteException('Missing required parameter: "columns"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['key'] = self._normalize_value(key)
         api_params['type'] = self._normalize_value(type)
         api_params['columns'] = self._normalize_value(columns)
@@ -3992,15 +3821,15 @@ class TablesDB(Service):
         if lengths is not None:
             api_params['lengths'] = self._normalize_value(lengths)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_index_endpoint, api_params, [database_id, table_id])
 
         return self._parse_response(response, model=ColumnIndex)
 
 
+    _get_index_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/indexes/{key}', {
+        'accept': 'application/json',
+    })
+
     def get_index(
         self,
         database_id: str,
@@ -4030,7 +3859,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/indexes/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4041,19 +3869,16 @@ class TablesDB(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_index_endpoint, api_params, [database_id, table_id, key])
 
         return self._parse_response(response, model=ColumnIndex)
 
 
+    _delete_index_endpoint = Endpoint('delete', '/tablesdb/{databaseId}/tables/{tableId}/indexes/{key}', {
+        'content-type': 'application/json',
+    })
+
     def delete_index(
         self,
         database_id: str,
@@ -4083,7 +3908,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/indexes/{key}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4094,19 +3918,16 @@ class TablesDB(Service):
         if key is None:
             raise AppwriteException('Missing required parameter: "key"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{key}', str(self._normalize_value(key)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_index_endpoint, api_params, [database_id, table_id, key])
 
         return response
 
 
+    _list_rows_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/rows', {
+        'accept': 'application/json',
+    })
+
     def list_rows(
         self,
         database_id: str,
@@ -4149,7 +3970,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4157,9 +3977,6 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if transaction_id is not None:
@@ -4169,14 +3986,16 @@ class TablesDB(Service):
         if ttl is not None:
             api_params['ttl'] = self._normalize_value(ttl)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_rows_endpoint, api_params, [database_id, table_id])
 
-        return RowList.with_data(response, model_type)
+        return self._parse_response(response, model=RowList, model_type=model_type)
 
 
+    _create_row_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/rows', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_row(
         self,
         database_id: str,
@@ -4219,7 +4038,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4233,9 +4051,6 @@ class TablesDB(Service):
         if data is None:
             raise AppwriteException('Missing required parameter: "data"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['rowId'] = self._normalize_value(row_id)
         api_params['data'] = self._normalize_value(data)
         if permissions is not None:
@@ -4243,15 +4058,16 @@ class TablesDB(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_row_endpoint, api_params, [database_id, table_id])
 
-        return Row.with_data(response, model_type)
+        return self._parse_response(response, model=Row, model_type=model_type)
 
 
+    _create_rows_endpoint = Endpoint('post', '/tablesdb/{databaseId}/tables/{tableId}/rows', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_rows(
         self,
         database_id: str,
@@ -4288,7 +4104,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4299,22 +4114,20 @@ class TablesDB(Service):
         if rows is None:
             raise AppwriteException('Missing required parameter: "rows"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['rows'] = self._normalize_value(rows)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_rows_endpoint, api_params, [database_id, table_id])
 
-        return RowList.with_data(response, model_type)
+        return self._parse_response(response, model=RowList, model_type=model_type)
 
 
+    _upsert_rows_endpoint = Endpoint('put', '/tablesdb/{databaseId}/tables/{tableId}/rows', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def upsert_rows(
         self,
         database_id: str,
@@ -4352,7 +4165,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4363,21 +4175,19 @@ class TablesDB(Service):
         if rows is None:
             raise AppwriteException('Missing required parameter: "rows"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         api_params['rows'] = self._normalize_value(rows)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._upsert_rows_endpoint, api_params, [database_id, table_id])
+
+        return self._parse_response(response, model=RowList, model_type=model_type)
 
-        return RowList.with_data(response, model_type)
 
+    _update_rows_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/rows', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_rows(
         self,
@@ -4418,7 +4228,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4426,9 +4235,6 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         if data is not None:
             api_params['data'] = self._normalize_value(data)
         if queries is not None:
@@ -4436,14 +4242,15 @@ class TablesDB(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_rows_endpoint, api_params, [database_id, table_id])
+
+        return self._parse_response(response, model=RowList, model_type=model_type)
 
-        return RowList.with_data(response, model_type)
 
+    _delete_rows_endpoint = Endpoint('delete', '/tablesdb/{databaseId}/tables/{tableId}/rows', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def delete_rows(
         self,
@@ -4481,7 +4288,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4489,22 +4295,19 @@ class TablesDB(Service):
         if table_id is None:
             raise AppwriteException('Missing required parameter: "table_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_rows_endpoint, api_params, [database_id, table_id])
+
+        return self._parse_response(response, model=RowList, model_type=model_type)
 
-        return RowList.with_data(response, model_type)
 
+    _get_row_endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}', {
+        'accept': 'application/json',
+    })
 
     def get_row(
         self,
@@ -4545,7 +4348,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4556,22 +4358,20 @@ class TablesDB(Service):
         if row_id is None:
             raise AppwriteException('Missing required parameter: "row_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{rowId}', str(self._normalize_value(row_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_row_endpoint, api_params, [database_id, table_id, row_id])
+
+        return self._parse_response(response, model=Row, model_type=model_type)
 
-        return Row.with_data(response, model_type)
 
+    _upsert_row_endpoint = Endpoint('put', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def upsert_row(
         self,
@@ -4615,7 +4415,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4626,10 +4425,6 @@ class TablesDB(Service):
         if row_id is None:
             raise AppwriteException('Missing required parameter: "row_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{rowId}', str(self._normalize_value(row_id)))
-
         if data is not None:
             api_params['data'] = self._normalize_value(data)
         if permissions is not None:
@@ -4637,14 +4432,15 @@ class TablesDB(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._upsert_row_endpoint, api_params, [database_id, table_id, row_id])
+
+        return self._parse_response(response, model=Row, model_type=model_type)
 
-        return Row.with_data(response, model_type)
 
+    _update_row_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_row(
         self,
@@ -4688,7 +4484,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4699,10 +4494,6 @@ class TablesDB(Service):
         if row_id is None:
             raise AppwriteException('Missing required parameter: "row_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{rowId}', str(self._normalize_value(row_id)))
-
         if data is not None:
             api_params['data'] = self._normalize_value(data)
         if permissions is not None:
@@ -4710,15 +4501,15 @@ class TablesDB(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_row_endpoint, api_params, [database_id, table_id, row_id])
 
-        return Row.with_data(response, model_type)
+        return self._parse_response(response, model=Row, model_type=model_type)
 
 
+    _delete_row_endpoint = Endpoint('delete', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_row(
         self,
         database_id: str,
@@ -4751,7 +4542,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4762,21 +4552,19 @@ class TablesDB(Service):
         if row_id is None:
             raise AppwriteException('Missing required parameter: "row_id"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{rowId}', str(self._normalize_value(row_id)))
-
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_row_endpoint, api_params, [database_id, table_id, row_id])
 
         return response
 
 
+    _decrement_row_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}/{column}/decrement', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def decrement_row_column(
         self,
         database_id: str,
@@ -4822,7 +4610,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}/{column}/decrement'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4836,11 +4623,6 @@ class TablesDB(Service):
         if column is None:
             raise AppwriteException('Missing required parameter: "column"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{rowId}', str(self._normalize_value(row_id)))
-        api_path = api_path.replace('{column}', str(self._normalize_value(column)))
-
         if value is not None:
             api_params['value'] = self._normalize_value(value)
         if min is not None:
@@ -4848,15 +4630,16 @@ class TablesDB(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._decrement_row_column_endpoint, api_params, [database_id, table_id, row_id, column])
 
-        return Row.with_data(response, model_type)
+        return self._parse_response(response, model=Row, model_type=model_type)
 
 
+    _increment_row_column_endpoint = Endpoint('patch', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}/{column}/increment', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def increment_row_column(
         self,
         database_id: str,
@@ -4902,7 +4685,6 @@ class TablesDB(Service):
             If API request fails
         """
 
-        api_path = '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}/{column}/increment'
         api_params = {}
         if database_id is None:
             raise AppwriteException('Missing required parameter: "database_id"')
@@ -4916,11 +4698,6 @@ class TablesDB(Service):
         if column is None:
             raise AppwriteException('Missing required parameter: "column"')
 
-        api_path = api_path.replace('{databaseId}', str(self._normalize_value(database_id)))
-        api_path = api_path.replace('{tableId}', str(self._normalize_value(table_id)))
-        api_path = api_path.replace('{rowId}', str(self._normalize_value(row_id)))
-        api_path = api_path.replace('{column}', str(self._normalize_value(column)))
-
         if value is not None:
             api_params['value'] = self._normalize_value(value)
         if max is not None:
@@ -4928,11 +4705,7 @@ class TablesDB(Service):
         if transaction_id is not None:
             api_params['transactionId'] = self._normalize_value(transaction_id)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._increment_row_column_endpoint, api_params, [database_id, table_id, row_id, column])
 
-        return Row.with_data(response, model_type)
+        return self._parse_response(response, model=Row, model_type=model_type)
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar
 from ..exception import AppwriteException
@@ -18,6 +19,10 @@ class Teams(Service):
     def __init__(self, client) -> None:
         super(Teams, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/teams', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -51,7 +56,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams'
         api_params = {}
 
         if queries is not None:
@@ -61,13 +65,15 @@ class Teams(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
+
+        return self._parse_response(response, model=TeamList, model_type=model_type)
 
-        return TeamList.with_data(response, model_type)
 
+    _create_endpoint = Endpoint('post', '/teams', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create(
         self,
@@ -102,7 +108,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -116,15 +121,15 @@ class Teams(Service):
         if roles is not None:
             api_params['roles'] = self._normalize_value(roles)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
-        return Team.with_data(response, model_type)
+        return self._parse_response(response, model=Team, model_type=model_type)
 
 
+    _get_endpoint = Endpoint('get', '/teams/{teamId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         team_id: str,
@@ -152,21 +157,20 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
 
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [team_id])
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        return self._parse_response(response, model=Team, model_type=model_type)
 
-        return Team.with_data(response, model_type)
 
+    _update_name_endpoint = Endpoint('put', '/teams/{teamId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_name(
         self,
@@ -198,7 +202,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -206,19 +209,17 @@ class Teams(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-
         api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_name_endpoint, api_params, [team_id])
 
-        return Team.with_data(response, model_type)
+        return self._parse_response(response, model=Team, model_type=model_type)
 
 
+    _delete_endpoint = Endpoint('delete', '/teams/{teamId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         team_id: str
@@ -242,22 +243,20 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [team_id])
 
         return response
 
 
+    _list_installations_endpoint = Endpoint('get', '/teams/{teamId}/installations', {
+        'accept': 'application/json',
+    })
+
     def list_installations(
         self,
         team_id: str,
@@ -287,26 +286,25 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/installations'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_installations_endpoint, api_params, [team_id])
 
         return self._parse_response(response, model=AppInstallationList)
 
 
+    _create_installation_endpoint = Endpoint('post', '/teams/{teamId}/installations', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_installation(
         self,
         team_id: str,
@@ -336,7 +334,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/installations'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -344,21 +341,19 @@ class Teams(Service):
         if app_id is None:
             raise AppwriteException('Missing required parameter: "app_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-
         api_params['appId'] = self._normalize_value(app_id)
         if authorization_details is not None:
             api_params['authorizationDetails'] = self._normalize_value(authorization_details)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_installation_endpoint, api_params, [team_id])
 
         return self._parse_response(response, model=AppInstallation)
 
 
+    _get_installation_endpoint = Endpoint('get', '/teams/{teamId}/installations/{installationId}', {
+        'accept': 'application/json',
+    })
+
     def get_installation(
         self,
         team_id: str,
@@ -385,7 +380,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/installations/{installationId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -393,18 +387,17 @@ class Teams(Service):
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_installation_endpoint, api_params, [team_id, installation_id])
 
         return self._parse_response(response, model=AppInstallation)
 
 
+    _update_installation_endpoint = Endpoint('put', '/teams/{teamId}/installations/{installationId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_installation(
         self,
         team_id: str,
@@ -434,7 +427,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/installations/{installationId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -442,21 +434,19 @@ class Teams(Service):
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
-
         if authorization_details is not None:
             api_params['authorizationDetails'] = self._normalize_value(authorization_details)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_installation_endpoint, api_params, [team_id, installation_id])
 
         return self._parse_response(response, model=AppInstallation)
 
 
+    _delete_installation_endpoint = Endpoint('delete', '/teams/{teamId}/installations/{installationId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def delete_installation(
         self,
         team_id: str,
@@ -483,7 +473,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/installations/{installationId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -491,19 +480,16 @@ class Teams(Service):
         if installation_id is None:
             raise AppwriteException('Missing required parameter: "installation_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-        api_path = api_path.replace('{installationId}', str(self._normalize_value(installation_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_installation_endpoint, api_params, [team_id, installation_id])
 
         return response
 
 
+    _list_memberships_endpoint = Endpoint('get', '/teams/{teamId}/memberships', {
+        'accept': 'application/json',
+    })
+
     def list_memberships(
         self,
         team_id: str,
@@ -536,13 +522,10 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/memberships'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -550,14 +533,16 @@ class Teams(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_memberships_endpoint, api_params, [team_id])
 
         return self._parse_response(response, model=MembershipList)
 
 
+    _create_membership_endpoint = Endpoint('post', '/teams/{teamId}/memberships', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_membership(
         self,
         team_id: str,
@@ -606,7 +591,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/memberships'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -614,8 +598,6 @@ class Teams(Service):
         if roles is None:
             raise AppwriteException('Missing required parameter: "roles"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-
         if email is not None:
             api_params['email'] = self._normalize_value(email)
         if user_id is not None:
@@ -628,15 +610,15 @@ class Teams(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_membership_endpoint, api_params, [team_id])
 
         return self._parse_response(response, model=Membership)
 
 
+    _get_membership_endpoint = Endpoint('get', '/teams/{teamId}/memberships/{membershipId}', {
+        'accept': 'application/json',
+    })
+
     def get_membership(
         self,
         team_id: str,
@@ -663,7 +645,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/memberships/{membershipId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -671,18 +652,17 @@ class Teams(Service):
         if membership_id is None:
             raise AppwriteException('Missing required parameter: "membership_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-        api_path = api_path.replace('{membershipId}', str(self._normalize_value(membership_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_membership_endpoint, api_params, [team_id, membership_id])
 
         return self._parse_response(response, model=Membership)
 
 
+    _update_membership_endpoint = Endpoint('patch', '/teams/{teamId}/memberships/{membershipId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_membership(
         self,
         team_id: str,
@@ -713,7 +693,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/memberships/{membershipId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -724,20 +703,17 @@ class Teams(Service):
         if roles is None:
             raise AppwriteException('Missing required parameter: "roles"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-        api_path = api_path.replace('{membershipId}', str(self._normalize_value(membership_id)))
-
         api_params['roles'] = self._normalize_value(roles)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_membership_endpoint, api_params, [team_id, membership_id])
 
         return self._parse_response(response, model=Membership)
 
 
+    _delete_membership_endpoint = Endpoint('delete', '/teams/{teamId}/memberships/{membershipId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_membership(
         self,
         team_id: str,
@@ -764,7 +740,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/memberships/{membershipId}'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -772,18 +747,17 @@ class Teams(Service):
         if membership_id is None:
             raise AppwriteException('Missing required parameter: "membership_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-        api_path = api_path.replace('{membershipId}', str(self._normalize_value(membership_id)))
 
-
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_membership_endpoint, api_params, [team_id, membership_id])
 
         return response
 
 
+    _update_membership_status_endpoint = Endpoint('patch', '/teams/{teamId}/memberships/{membershipId}/status', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_membership_status(
         self,
         team_id: str,
@@ -819,7 +793,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/memberships/{membershipId}/status'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -833,21 +806,18 @@ class Teams(Service):
         if secret is None:
             raise AppwriteException('Missing required parameter: "secret"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-        api_path = api_path.replace('{membershipId}', str(self._normalize_value(membership_id)))
-
         api_params['userId'] = self._normalize_value(user_id)
         api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_membership_status_endpoint, api_params, [team_id, membership_id])
 
         return self._parse_response(response, model=Membership)
 
 
+    _get_prefs_endpoint = Endpoint('get', '/teams/{teamId}/prefs', {
+        'accept': 'application/json',
+    })
+
     def get_prefs(
         self,
         team_id: str,
@@ -875,21 +845,20 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/prefs'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
 
+        response = self.client.call_endpoint(self._get_prefs_endpoint, api_params, [team_id])
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        return self._parse_response(response, model=Preferences, model_type=model_type)
 
-        return Preferences.with_data(response, model_type)
 
+    _update_prefs_endpoint = Endpoint('put', '/teams/{teamId}/prefs', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_prefs(
         self,
@@ -921,7 +890,6 @@ class Teams(Service):
             If API request fails
         """
 
-        api_path = '/teams/{teamId}/prefs'
         api_params = {}
         if team_id is None:
             raise AppwriteException('Missing required parameter: "team_id"')
@@ -929,15 +897,9 @@ class Teams(Service):
         if prefs is None:
             raise AppwriteException('Missing required parameter: "prefs"')
 
-        api_path = api_path.replace('{teamId}', str(self._normalize_value(team_id)))
-
         api_params['prefs'] = self._normalize_value(prefs)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_prefs_endpoint, api_params, [team_id])
 
-        return Preferences.with_data(response, model_type)
+        return self._parse_response(response, model=Preferences, model_type=model_type)
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -11,6 +12,10 @@ class Tokens(Service):
     def __init__(self, client) -> None:
         super(Tokens, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/tokens/buckets/{bucketId}/files/{fileId}', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         bucket_id: str,
@@ -43,7 +48,6 @@ class Tokens(Service):
             If API request fails
         """
 
-        api_path = '/tokens/buckets/{bucketId}/files/{fileId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -51,22 +55,21 @@ class Tokens(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params, [bucket_id, file_id])
 
         return self._parse_response(response, model=ResourceTokenList)
 
 
+    _create_file_token_endpoint = Endpoint('post', '/tokens/buckets/{bucketId}/files/{fileId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_file_token(
         self,
         bucket_id: str,
@@ -96,7 +99,6 @@ class Tokens(Service):
             If API request fails
         """
 
-        api_path = '/tokens/buckets/{bucketId}/files/{fileId}'
         api_params = {}
         if bucket_id is None:
             raise AppwriteException('Missing required parameter: "bucket_id"')
@@ -104,21 +106,18 @@ class Tokens(Service):
         if file_id is None:
             raise AppwriteException('Missing required parameter: "file_id"')
 
-        api_path = api_path.replace('{bucketId}', str(self._normalize_value(bucket_id)))
-        api_path = api_path.replace('{fileId}', str(self._normalize_value(file_id)))
-
         if expire is not None:
             api_params['expire'] = self._normalize_value(expire)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_file_token_endpoint, api_params, [bucket_id, file_id])
 
         return self._parse_response(response, model=ResourceToken)
 
 
+    _get_endpoint = Endpoint('get', '/tokens/{tokenId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         token_id: str
@@ -142,22 +141,21 @@ class Tokens(Service):
             If API request fails
         """
 
-        api_path = '/tokens/{tokenId}'
         api_params = {}
         if token_id is None:
             raise AppwriteException('Missing required parameter: "token_id"')
 
-        api_path = api_path.replace('{tokenId}', str(self._normalize_value(token_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [token_id])
 
         return self._parse_response(response, model=ResourceToken)
 
 
+    _update_endpoint = Endpoint('patch', '/tokens/{tokenId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update(
         self,
         token_id: str,
@@ -184,25 +182,22 @@ class Tokens(Service):
             If API request fails
         """
 
-        api_path = '/tokens/{tokenId}'
         api_params = {}
         if token_id is None:
             raise AppwriteException('Missing required parameter: "token_id"')
 
-        api_path = api_path.replace('{tokenId}', str(self._normalize_value(token_id)))
-
         if expire is not None:
             api_params['expire'] = self._normalize_value(expire)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [token_id])
 
         return self._parse_response(response, model=ResourceToken)
 
 
+    _delete_endpoint = Endpoint('delete', '/tokens/{tokenId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         token_id: str
@@ -226,18 +221,12 @@ class Tokens(Service):
             If API request fails
         """
 
-        api_path = '/tokens/{tokenId}'
         api_params = {}
         if token_id is None:
             raise AppwriteException('Missing required parameter: "token_id"')
 
-        api_path = api_path.replace('{tokenId}', str(self._normalize_value(token_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [token_id])
 
         return response
 
@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar
 from ..exception import AppwriteException
@@ -28,6 +29,10 @@ class Users(Service):
     def __init__(self, client) -> None:
         super(Users, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/users', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -61,7 +66,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users'
         api_params = {}
 
         if queries is not None:
@@ -71,13 +75,15 @@ class Users(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
+
+        return self._parse_response(response, model=UserList, model_type=model_type)
 
-        return UserList.with_data(response, model_type)
 
+    _create_endpoint = Endpoint('post', '/users', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create(
         self,
@@ -118,7 +124,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -134,14 +139,15 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _create_argon2_user_endpoint = Endpoint('post', '/users/argon2', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create_argon2_user(
         self,
@@ -179,7 +185,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/argon2'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -197,15 +202,16 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_argon2_user_endpoint, api_params)
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _create_bcrypt_user_endpoint = Endpoint('post', '/users/bcrypt', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_bcrypt_user(
         self,
         user_id: str,
@@ -242,7 +248,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/bcrypt'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -260,14 +265,14 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_bcrypt_user_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _list_identities_endpoint = Endpoint('get', '/users/identities', {
+        'accept': 'application/json',
+    })
 
     def list_identities(
         self,
@@ -298,7 +303,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/identities'
         api_params = {}
 
         if queries is not None:
@@ -308,14 +312,15 @@ class Users(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_identities_endpoint, api_params)
 
         return self._parse_response(response, model=IdentityList)
 
 
+    _delete_identity_endpoint = Endpoint('delete', '/users/identities/{identityId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_identity(
         self,
         identity_id: str
@@ -339,22 +344,21 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/identities/{identityId}'
         api_params = {}
         if identity_id is None:
             raise AppwriteException('Missing required parameter: "identity_id"')
 
-        api_path = api_path.replace('{identityId}', str(self._normalize_value(identity_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_identity_endpoint, api_params, [identity_id])
 
         return response
 
 
+    _create_md5_user_endpoint = Endpoint('post', '/users/md5', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_md5_user(
         self,
         user_id: str,
@@ -391,7 +395,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/md5'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -409,14 +412,15 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_md5_user_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _create_ph_pass_user_endpoint = Endpoint('post', '/users/phpass', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create_ph_pass_user(
         self,
@@ -454,7 +458,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/phpass'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -472,15 +475,16 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_ph_pass_user_endpoint, api_params)
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _create_scrypt_user_endpoint = Endpoint('post', '/users/scrypt', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_scrypt_user(
         self,
         user_id: str,
@@ -532,7 +536,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/scrypt'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -570,14 +573,15 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_scrypt_user_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _create_scrypt_modified_user_endpoint = Endpoint('post', '/users/scrypt-modified', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create_scrypt_modified_user(
         self,
@@ -624,7 +628,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/scrypt-modified'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -654,14 +657,15 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_scrypt_modified_user_endpoint, api_params)
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _create_sha_user_endpoint = Endpoint('post', '/users/sha', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def create_sha_user(
         self,
@@ -702,7 +706,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/sha'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -722,15 +725,15 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_sha_user_endpoint, api_params)
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _get_endpoint = Endpoint('get', '/users/{userId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         user_id: str,
@@ -758,21 +761,19 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
 
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [user_id])
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _delete_endpoint = Endpoint('delete', '/users/{userId}', {
+        'content-type': 'application/json',
+    })
 
     def delete(
         self,
@@ -797,22 +798,21 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [user_id])
 
         return response
 
 
+    _update_email_endpoint = Endpoint('patch', '/users/{userId}/email', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_email(
         self,
         user_id: str,
@@ -843,7 +843,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/email'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -851,19 +850,18 @@ class Users(Service):
         if email is None:
             raise AppwriteException('Missing required parameter: "email"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['email'] = self._normalize_value(email)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_endpoint, api_params, [user_id])
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _update_impersonator_endpoint = Endpoint('patch', '/users/{userId}/impersonator', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_impersonator(
         self,
         user_id: str,
@@ -895,7 +893,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/impersonator'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -903,19 +900,18 @@ class Users(Service):
         if impersonator is None:
             raise AppwriteException('Missing required parameter: "impersonator"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['impersonator'] = self._normalize_value(impersonator)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_impersonator_endpoint, api_params, [user_id])
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _create_jwt_endpoint = Endpoint('post', '/users/{userId}/jwts', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_jwt(
         self,
         user_id: str,
@@ -945,27 +941,25 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/jwts'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         if session_id is not None:
             api_params['sessionId'] = self._normalize_value(session_id)
         if duration is not None:
             api_params['duration'] = self._normalize_value(duration)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_jwt_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=Jwt)
 
 
+    _update_labels_endpoint = Endpoint('put', '/users/{userId}/labels', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_labels(
         self,
         user_id: str,
@@ -998,7 +992,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/labels'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1006,18 +999,16 @@ class Users(Service):
         if labels is None:
             raise AppwriteException('Missing required parameter: "labels"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['labels'] = self._normalize_value(labels)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_labels_endpoint, api_params, [user_id])
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _list_logs_endpoint = Endpoint('get', '/users/{userId}/logs', {
+        'accept': 'application/json',
+    })
 
     def list_logs(
         self,
@@ -1048,26 +1039,24 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/logs'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_logs_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=LogList)
 
 
+    _list_memberships_endpoint = Endpoint('get', '/users/{userId}/memberships', {
+        'accept': 'application/json',
+    })
+
     def list_memberships(
         self,
         user_id: str,
@@ -1100,13 +1089,10 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/memberships'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if search is not None:
@@ -1114,14 +1100,16 @@ class Users(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_memberships_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=MembershipList)
 
 
+    _update_mfa_endpoint = Endpoint('patch', '/users/{userId}/mfa', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mfa(
         self,
         user_id: str,
@@ -1152,7 +1140,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/mfa'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1160,18 +1147,16 @@ class Users(Service):
         if mfa is None:
             raise AppwriteException('Missing required parameter: "mfa"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['mfa'] = self._normalize_value(mfa)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mfa_endpoint, api_params, [user_id])
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _delete_mfa_authenticator_endpoint = Endpoint('delete', '/users/{userId}/mfa/authenticators/{type}', {
+        'content-type': 'application/json',
+    })
 
     def delete_mfa_authenticator(
         self,
@@ -1199,7 +1184,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/mfa/authenticators/{type}'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1207,18 +1191,16 @@ class Users(Service):
         if type is None:
             raise AppwriteException('Missing required parameter: "type"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-        api_path = api_path.replace('{type}', str(self._normalize_value(type)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_mfa_authenticator_endpoint, api_params, [user_id, type])
 
         return response
 
 
+    _list_mfa_factors_endpoint = Endpoint('get', '/users/{userId}/mfa/factors', {
+        'accept': 'application/json',
+    })
+
     def list_mfa_factors(
         self,
         user_id: str
@@ -1242,22 +1224,20 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/mfa/factors'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_mfa_factors_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=MfaFactors)
 
 
+    _get_mfa_recovery_codes_endpoint = Endpoint('get', '/users/{userId}/mfa/recovery-codes', {
+        'accept': 'application/json',
+    })
+
     def get_mfa_recovery_codes(
         self,
         user_id: str
@@ -1281,22 +1261,21 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/mfa/recovery-codes'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_mfa_recovery_codes_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=MfaRecoveryCodes)
 
 
+    _update_mfa_recovery_codes_endpoint = Endpoint('put', '/users/{userId}/mfa/recovery-codes', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_mfa_recovery_codes(
         self,
         user_id: str
@@ -1320,23 +1299,21 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/mfa/recovery-codes'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_mfa_recovery_codes_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=MfaRecoveryCodes)
 
 
+    _create_mfa_recovery_codes_endpoint = Endpoint('patch', '/users/{userId}/mfa/recovery-codes', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_mfa_recovery_codes(
         self,
         user_id: str
@@ -1360,23 +1337,21 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/mfa/recovery-codes'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_mfa_recovery_codes_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=MfaRecoveryCodes)
 
 
+    _update_name_endpoint = Endpoint('patch', '/users/{userId}/name', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_name(
         self,
         user_id: str,
@@ -1407,7 +1382,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/name'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1415,18 +1389,17 @@ class Users(Service):
         if name is None:
             raise AppwriteException('Missing required parameter: "name"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_name_endpoint, api_params, [user_id])
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _update_password_endpoint = Endpoint('patch', '/users/{userId}/password', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_password(
         self,
@@ -1458,7 +1431,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/password'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1466,18 +1438,17 @@ class Users(Service):
         if password is None:
             raise AppwriteException('Missing required parameter: "password"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['password'] = self._normalize_value(password)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_password_endpoint, api_params, [user_id])
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _update_phone_endpoint = Endpoint('patch', '/users/{userId}/phone', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_phone(
         self,
@@ -1509,7 +1480,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/phone'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1517,18 +1487,16 @@ class Users(Service):
         if number is None:
             raise AppwriteException('Missing required parameter: "number"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['number'] = self._normalize_value(number)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_phone_endpoint, api_params, [user_id])
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _get_prefs_endpoint = Endpoint('get', '/users/{userId}/prefs', {
+        'accept': 'application/json',
+    })
 
     def get_prefs(
         self,
@@ -1557,21 +1525,20 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/prefs'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
 
+        response = self.client.call_endpoint(self._get_prefs_endpoint, api_params, [user_id])
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        return self._parse_response(response, model=Preferences, model_type=model_type)
 
-        return Preferences.with_data(response, model_type)
 
+    _update_prefs_endpoint = Endpoint('patch', '/users/{userId}/prefs', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
 
     def update_prefs(
         self,
@@ -1603,7 +1570,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/prefs'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1611,18 +1577,16 @@ class Users(Service):
         if prefs is None:
             raise AppwriteException('Missing required parameter: "prefs"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['prefs'] = self._normalize_value(prefs)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_prefs_endpoint, api_params, [user_id])
+
+        return self._parse_response(response, model=Preferences, model_type=model_type)
 
-        return Preferences.with_data(response, model_type)
 
+    _list_sessions_endpoint = Endpoint('get', '/users/{userId}/sessions', {
+        'accept': 'application/json',
+    })
 
     def list_sessions(
         self,
@@ -1650,24 +1614,23 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/sessions'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_sessions_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=SessionList)
 
 
+    _create_session_endpoint = Endpoint('post', '/users/{userId}/sessions', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_session(
         self,
         user_id: str
@@ -1693,23 +1656,20 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/sessions'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_session_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=Session)
 
 
+    _delete_sessions_endpoint = Endpoint('delete', '/users/{userId}/sessions', {
+        'content-type': 'application/json',
+    })
+
     def delete_sessions(
         self,
         user_id: str
@@ -1733,22 +1693,20 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/sessions'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_sessions_endpoint, api_params, [user_id])
 
         return response
 
 
+    _delete_session_endpoint = Endpoint('delete', '/users/{userId}/sessions/{sessionId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_session(
         self,
         user_id: str,
@@ -1775,7 +1733,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/sessions/{sessionId}'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1783,18 +1740,17 @@ class Users(Service):
         if session_id is None:
             raise AppwriteException('Missing required parameter: "session_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-        api_path = api_path.replace('{sessionId}', str(self._normalize_value(session_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_session_endpoint, api_params, [user_id, session_id])
 
         return response
 
 
+    _update_status_endpoint = Endpoint('patch', '/users/{userId}/status', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_status(
         self,
         user_id: str,
@@ -1825,7 +1781,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/status'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1833,18 +1788,16 @@ class Users(Service):
         if status is None:
             raise AppwriteException('Missing required parameter: "status"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['status'] = self._normalize_value(status)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_status_endpoint, api_params, [user_id])
+
+        return self._parse_response(response, model=User, model_type=model_type)
 
-        return User.with_data(response, model_type)
 
+    _list_targets_endpoint = Endpoint('get', '/users/{userId}/targets', {
+        'accept': 'application/json',
+    })
 
     def list_targets(
         self,
@@ -1875,26 +1828,25 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/targets'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         if queries is not None:
             api_params['queries'] = self._normalize_value(queries)
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_targets_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=TargetList)
 
 
+    _create_target_endpoint = Endpoint('post', '/users/{userId}/targets', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_target(
         self,
         user_id: str,
@@ -1933,7 +1885,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/targets'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -1947,8 +1898,6 @@ class Users(Service):
         if identifier is None:
             raise AppwriteException('Missing required parameter: "identifier"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['targetId'] = self._normalize_value(target_id)
         api_params['providerType'] = self._normalize_value(provider_type)
         api_params['identifier'] = self._normalize_value(identifier)
@@ -1957,15 +1906,15 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_target_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=Target)
 
 
+    _get_target_endpoint = Endpoint('get', '/users/{userId}/targets/{targetId}', {
+        'accept': 'application/json',
+    })
+
     def get_target(
         self,
         user_id: str,
@@ -1992,7 +1941,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/targets/{targetId}'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2000,18 +1948,17 @@ class Users(Service):
         if target_id is None:
             raise AppwriteException('Missing required parameter: "target_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-        api_path = api_path.replace('{targetId}', str(self._normalize_value(target_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_target_endpoint, api_params, [user_id, target_id])
 
         return self._parse_response(response, model=Target)
 
 
+    _update_target_endpoint = Endpoint('patch', '/users/{userId}/targets/{targetId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_target(
         self,
         user_id: str,
@@ -2047,7 +1994,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/targets/{targetId}'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2055,9 +2001,6 @@ class Users(Service):
         if target_id is None:
             raise AppwriteException('Missing required parameter: "target_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-        api_path = api_path.replace('{targetId}', str(self._normalize_value(target_id)))
-
         if identifier is not None:
             api_params['identifier'] = self._normalize_value(identifier)
         if provider_id is not None:
@@ -2065,15 +2008,15 @@ class Users(Service):
         if name is not None:
             api_params['name'] = self._normalize_value(name)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_target_endpoint, api_params, [user_id, target_id])
 
         return self._parse_response(response, model=Target)
 
 
+    _delete_target_endpoint = Endpoint('delete', '/users/{userId}/targets/{targetId}', {
+        'content-type': 'application/json',
+    })
+
     def delete_target(
         self,
         user_id: str,
@@ -2100,7 +2043,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/targets/{targetId}'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2108,18 +2050,17 @@ class Users(Service):
         if target_id is None:
             raise AppwriteException('Missing required parameter: "target_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-        api_path = api_path.replace('{targetId}', str(self._normalize_value(target_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_target_endpoint, api_params, [user_id, target_id])
 
         return response
 
 
+    _create_token_endpoint = Endpoint('post', '/users/{userId}/tokens', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create_token(
         self,
         user_id: str,
@@ -2150,27 +2091,25 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/tokens'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         if length is not None:
             api_params['length'] = self._normalize_value(length)
         if expire is not None:
             api_params['expire'] = self._normalize_value(expire)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_token_endpoint, api_params, [user_id])
 
         return self._parse_response(response, model=Token)
 
 
+    _update_email_verification_endpoint = Endpoint('patch', '/users/{userId}/verification', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_email_verification(
         self,
         user_id: str,
@@ -2201,7 +2140,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/verification'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2209,19 +2147,18 @@ class Users(Service):
         if email_verification is None:
             raise AppwriteException('Missing required parameter: "email_verification"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['emailVerification'] = self._normalize_value(email_verification)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_email_verification_endpoint, api_params, [user_id])
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
 
+    _update_phone_verification_endpoint = Endpoint('patch', '/users/{userId}/verification/phone', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_phone_verification(
         self,
         user_id: str,
@@ -2252,7 +2189,6 @@ class Users(Service):
             If API request fails
         """
 
-        api_path = '/users/{userId}/verification/phone'
         api_params = {}
         if user_id is None:
             raise AppwriteException('Missing required parameter: "user_id"')
@@ -2260,15 +2196,9 @@ class Users(Service):
         if phone_verification is None:
             raise AppwriteException('Missing required parameter: "phone_verification"')
 
-        api_path = api_path.replace('{userId}', str(self._normalize_value(user_id)))
-
         api_params['phoneVerification'] = self._normalize_value(phone_verification)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_phone_verification_endpoint, api_params, [user_id])
 
-        return User.with_data(response, model_type)
+        return self._parse_response(response, model=User, model_type=model_type)
 
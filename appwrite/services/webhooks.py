@@ -1,4 +1,5 @@
 from ..service import Service
+from ..endpoint import Endpoint
 from urllib.parse import quote
 from typing import Any, Dict, List, Optional, Union
 from ..exception import AppwriteException
@@ -11,6 +12,10 @@ class Webhooks(Service):
     def __init__(self, client) -> None:
         super(Webhooks, self).__init__(client)
 
+    _list_endpoint = Endpoint('get', '/webhooks', {
+        'accept': 'application/json',
+    })
+
     def list(
         self,
         queries: Optional[List[str]] = None,
@@ -37,7 +42,6 @@ class Webhooks(Service):
             If API request fails
         """
 
-        api_path = '/webhooks'
         api_params = {}
 
         if queries is not None:
@@ -45,14 +49,16 @@ class Webhooks(Service):
         if total is not None:
             api_params['total'] = self._normalize_value(total)
 
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._list_endpoint, api_params)
 
         return self._parse_response(response, model=WebhookList)
 
 
+    _create_endpoint = Endpoint('post', '/webhooks', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def create(
         self,
         webhook_id: str,
@@ -100,7 +106,6 @@ class Webhooks(Service):
             If API request fails
         """
 
-        api_path = '/webhooks'
         api_params = {}
         if webhook_id is None:
             raise AppwriteException('Missing required parameter: "webhook_id"')
@@ -130,15 +135,15 @@ class Webhooks(Service):
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('post', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._create_endpoint, api_params)
 
         return self._parse_response(response, model=Webhook)
 
 
+    _get_endpoint = Endpoint('get', '/webhooks/{webhookId}', {
+        'accept': 'application/json',
+    })
+
     def get(
         self,
         webhook_id: str
@@ -162,22 +167,21 @@ class Webhooks(Service):
             If API request fails
         """
 
-        api_path = '/webhooks/{webhookId}'
         api_params = {}
         if webhook_id is None:
             raise AppwriteException('Missing required parameter: "webhook_id"')
 
-        api_path = api_path.replace('{webhookId}', str(self._normalize_value(webhook_id)))
 
-
-        response = self.client.call('get', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._get_endpoint, api_params, [webhook_id])
 
         return self._parse_response(response, model=Webhook)
 
 
+    _update_endpoint = Endpoint('put', '/webhooks/{webhookId}', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update(
         self,
         webhook_id: str,
@@ -222,7 +226,6 @@ class Webhooks(Service):
             If API request fails
         """
 
-        api_path = '/webhooks/{webhookId}'
         api_params = {}
         if webhook_id is None:
             raise AppwriteException('Missing required parameter: "webhook_id"')
@@ -236,8 +239,6 @@ class Webhooks(Service):
         if events is None:
             raise AppwriteException('Missing required parameter: "events"')
 
-        api_path = api_path.replace('{webhookId}', str(self._normalize_value(webhook_id)))
-
         api_params['name'] = self._normalize_value(name)
         api_params['url'] = self._normalize_value(url)
         api_params['events'] = self._normalize_value(events)
@@ -250,15 +251,15 @@ class Webhooks(Service):
         if auth_password is not None:
             api_params['authPassword'] = self._normalize_value(auth_password)
 
-        response = self.client.call('put', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_endpoint, api_params, [webhook_id])
 
         return self._parse_response(response, model=Webhook)
 
 
+    _delete_endpoint = Endpoint('delete', '/webhooks/{webhookId}', {
+        'content-type': 'application/json',
+    })
+
     def delete(
         self,
         webhook_id: str
@@ -282,22 +283,21 @@ class Webhooks(Service):
             If API request fails
         """
 
-        api_path = '/webhooks/{webhookId}'
         api_params = {}
         if webhook_id is None:
             raise AppwriteException('Missing required parameter: "webhook_id"')
 
-        api_path = api_path.replace('{webhookId}', str(self._normalize_value(webhook_id)))
-
 
-        response = self.client.call('delete', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._delete_endpoint, api_params, [webhook_id])
 
         return response
 
 
+    _update_secret_endpoint = Endpoint('patch', '/webhooks/{webhookId}/secret', {
+        'content-type': 'application/json',
+        'accept': 'application/json',
+    })
+
     def update_secret(
         self,
         webhook_id: str,
@@ -324,21 +324,14 @@ class Webhooks(Service):
             If API request fails
         """
 
-        api_path = '/webhooks/{webhookId}/secret'
         api_params = {}
         if webhook_id is None:
             raise AppwriteException('Missing required parameter: "webhook_id"')
 
-        api_path = api_path.replace('{webhookId}', str(self._normalize_value(webhook_id)))
-
         if secret is not None:
             api_params['secret'] = self._normalize_value(secret)
 
-        response = self.client.call('patch', api_path, {
-            'X-Appwrite-Project': self.client.get_config('project'),
-            'content-type': 'application/json',
-            'accept': 'application/json',
-        }, api_params)
+        response = self.client.call_endpoint(self._update_secret_endpoint, api_params, [webhook_id])
 
         return self._parse_response(response, model=Webhook)
 
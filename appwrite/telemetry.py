@@ -0,0 +1,111 @@
+from threading import Lock
+from .hooks import Hook
+
+try:
+    from opentelemetry import context, metrics, propagate, trace
+except ImportError as error:
+    raise ImportError("OpenTelemetryHook requires opentelemetry-api, install it with: pip install 'appwrite[otel]'") from error
+
+class OpenTelemetryHook(Hook):
+    """Traces every call and upload of a client with OpenTelemetry
+
+    Each call becomes a client span named after the service method, e.g.
+    TablesDB.list_rows, carrying the path template rather than the raw IDs.
+    The trace context is propagated with the configured propagator, which
+    injects a traceparent header by default. Request durations and body
+    sizes are recorded as metrics. Nothing is traced unless the hook is added
+    to a client with Client.add_hook.
+    """
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        self._tracer = trace.get_tracer('appwrite', tracer_provider=tracer_provider)
+        meter = metrics.get_meter('appwrite', meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            'http.client.request.duration',
+            unit='s',
+            description='Duration of Appwrite API calls',
+        )
+        self._request_size = meter.create_histogram(
+            'http.client.request.body.size',
+            unit='By',
+            description='Size of Appwrite API request bodies',
+        )
+        self._response_size = meter.create_histogram(
+            'http.client.response.body.size',
+            unit='By',
+            description='Size of Appwrite API response bodies',
+        )
+        self._spans = {}
+        self._lock = Lock()
+
+    def before_request(self, event):
+        span = self._tracer.start_span(self._span_name(event), kind=trace.SpanKind.CLIENT, attributes=self._attributes(event))
+        token = None
+        if event.headers is not None:
+            propagate.inject(event.headers, context=trace.set_span_in_context(span))
+        else:
+            # Uploads have no request of their own, their chunks become
+            # children of the upload span.
+            token = context.attach(trace.set_span_in_context(span))
+
+        with self._lock:
+            self._spans[event] = (span, token)
+
+    def after_response(self, event):
+        self._finish(event)
+
+    def on_error(self, event):
+        self._finish(event)
+
+    def _finish(self, event):
+        with self._lock:
+            span, token = self._spans.pop(event, (None, None))
+
+        if token is not None:
+            context.detach(token)
+
+        attributes = self._attributes(event)
+        if event.status is not None:
+            attributes['http.response.status_code'] = event.status
+        if event.attempts > 1:
+            attributes['http.request.resend_count'] = event.attempts - 1
+        attributes['http.request.body.size'] = event.request_bytes
+        attributes['http.response.body.size'] = event.response_bytes
+        if event.kind == 'upload':
+            attributes['appwrite.upload.chunks'] = event.chunks
+
+        if span is not None:
+            span.set_attributes(attributes)
+            if event.error is not None:
+                span.record_exception(event.error)
+                span.set_status(trace.StatusCode.ERROR, str(event.error))
+            span.end()
+
+        metric_attributes = {
+            key: value for key, value in attributes.items()
+            if key in ('appwrite.service', 'appwrite.operation', 'http.request.method', 'url.template', 'http.response.status_code')
+        }
+        self._duration.record(event.duration, metric_attributes)
+        self._request_size.record(event.request_bytes, metric_attributes)
+        self._response_size.record(event.response_bytes, metric_attributes)
+
+    def _span_name(self, event):
+        endpoint = event.endpoint
+        if endpoint is not None and endpoint.service is not None:
+            return f'{endpoint.service}.{endpoint.operation}'
+
+        if event.kind == 'upload':
+            return f'upload {event.route}'
+
+        return f'{event.method.upper()} {event.route}'
+
+    def _attributes(self, event):
+        attributes = {
+            'http.request.method': event.method.upper(),
+            'url.template': event.route,
+        }
+        endpoint = event.endpoint
+        if endpoint is not None and endpoint.service is not None:
+            attributes['appwrite.service'] = endpoint.service
+            attributes['appwrite.operation'] = endpoint.operation
+        return attributes
@@ -0,0 +1,137 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from threading import Lock
+from .exception import AppwriteException
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover - not available on Windows
+    fcntl = None
+
+class MemoryThrottleStore:
+    """Keeps rate limit budgets in memory, shared by all threads of a process"""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = Lock()
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            yield self._buckets
+
+class FileThrottleStore:
+    """Keeps rate limit budgets in a JSON file so that several processes share them
+
+    Every read-modify-write holds an exclusive lock on the file, which makes it
+    suitable for worker processes on the same host.
+    """
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise AppwriteException('FileThrottleStore requires fcntl, which is not available on this platform')
+
+        self._path = os.fspath(path)
+        self._lock = Lock()
+
+    @contextmanager
+    def transaction(self):
+        with self._lock, open(self._path, 'a+') as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                try:
+                    buckets = json.loads(file.read() or '{}')
+                except ValueError:
+                    buckets = {}
+
+                yield buckets
+
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(buckets))
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+class Throttler:
+    """Paces requests to stay under the rate limits the server reports
+
+    Budgets are learned per endpoint from the X-RateLimit-Limit, -Remaining
+    and -Reset headers. Each endpoint gets a token bucket that allows bursts
+    of up to `burst` requests and spreads the rest of the remaining budget,
+    scaled by `utilization`, evenly until the window resets. Endpoints are
+    keyed by method and route, the path with its parameters left as
+    placeholders such as /teams/{teamId}, unless a `key(method, path)`
+    callable is given.
+    """
+
+    def __init__(self, utilization=0.9, burst=10, key=None, store=None):
+        if not 0 < utilization <= 1:
+            raise AppwriteException('Throttle utilization must be greater than 0 and at most 1')
+
+        if burst < 1:
+            raise AppwriteException('Throttle burst must be at least 1')
+
+        self.utilization = utilization
+        self.burst = burst
+        self._key = key or (lambda method, path: method.upper() + ' ' + path)
+        self._store = store or MemoryThrottleStore()
+
+    def reserve(self, method, path):
+        """Takes a token for the endpoint and returns how many seconds to wait before sending"""
+
+        key = self._key(method, path)
+        with self._store.transaction() as buckets:
+            bucket = buckets.get(key)
+            if bucket is None:
+                return 0.0
+
+            now = time.time()
+            if now >= bucket['reset']:
+                del buckets[key]
+                return 0.0
+
+            tokens = min(bucket['capacity'], bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+            bucket['tokens'] = tokens - 1
+            bucket['updated'] = now
+            if tokens >= 1:
+                return 0.0
+
+            if bucket['rate'] <= 0:
+                return bucket['reset'] - now
+
+            return min((1 - tokens) / bucket['rate'], bucket['reset'] - now)
+
+    def update(self, method, path, headers):
+        """Learns the endpoint's budget from the rate limit headers of a response"""
+
+        try:
+            limit = int(headers['x-ratelimit-limit'])
+            remaining = int(headers['x-ratelimit-remaining'])
+            reset = float(headers['x-ratelimit-reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        now = time.time()
+        key = self._key(method, path)
+        with self._store.transaction() as buckets:
+            if reset <= now:
+                buckets.pop(key, None)
+                return
+
+            usable = max(remaining - limit * (1 - self.utilization), 0.0)
+            capacity = max(min(self.burst, usable), 1.0)
+            buckets[key] = {
+                'tokens': min(capacity, usable),
+                'capacity': capacity,
+                'rate': max(usable - capacity, 0.0) / (reset - now),
+                'updated': now,
+                'reset': reset,
+            }
+
+    def clear(self):
+        with self._store.transaction() as buckets:
+            buckets.clear()
@@ -0,0 +1,43 @@
+import time
+from contextvars import ContextVar
+from .exception import AppwriteException
+
+# Timeout overrides and the deadline of the calls made in this context, set
+# by Client.timeout and Client.deadline. Upload chunks run in a copy of the
+# context of the upload, so they share its deadline.
+current_timeout = ContextVar('appwrite_timeout', default=None)
+current_deadline = ContextVar('appwrite_deadline', default=None)
+
+def check_timeout(value, name):
+    if value is not None and value <= 0:
+        raise AppwriteException(f'{name} must be greater than 0')
+
+def deadline_exceeded():
+    return AppwriteException('Deadline exceeded', 0, 'deadline_exceeded')
+
+def check_deadline(deadline):
+    """Raise the deadline error once deadline, a time.monotonic() value or None, has passed"""
+
+    if deadline is not None and time.monotonic() >= deadline:
+        raise deadline_exceeded()
+
+def request_timeout(connect, read, deadline):
+    """The (connect, read) timeout of the next attempt, shortened to the time left before deadline"""
+
+    override = current_timeout.get()
+    if override is not None:
+        connect = override[0] if override[0] is not None else connect
+        read = override[1] if override[1] is not None else read
+
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise deadline_exceeded()
+
+        connect = remaining if connect is None else min(connect, remaining)
+        read = remaining if read is None else min(read, remaining)
+
+    if connect is None and read is None:
+        return None
+
+    return (connect, read)
@@ -0,0 +1,220 @@
+import asyncio
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from threading import Lock, Thread
+import requests
+from requests.adapters import HTTPAdapter
+from .encoders.multipart_encoder import MultipartEncoder
+
+def _no_cookies():
+    """Cookie policy that stores no cookies
+
+    A pooled session would otherwise send a cookie set by one call, such as
+    the session created by a login, along with every later call.
+    """
+    return DefaultCookiePolicy(allowed_domains=[])
+
+class Transport:
+    """Sends the HTTP requests of a Client
+
+    Subclasses implement request() and return a response with status_code,
+    headers, content and text, plus read(), iter_content() and
+    close_response() for responses requested with stream=True. timeout is
+    None or a (connect, read) tuple of seconds, either of which may be None.
+    connection_errors lists the exceptions that mean the connection failed
+    before a complete response was received, which makes them eligible for
+    retries.
+    """
+
+    connection_errors = ()
+
+    def request(self, method, url, headers, params, data, verify=True, allow_redirects=True, stream=False, timeout=None):
+        raise NotImplementedError
+
+    def read(self, response):
+        return response.content
+
+    def iter_content(self, response, chunk_size):
+        return response.iter_content(chunk_size)
+
+    def close_response(self, response):
+        response.close()
+
+    def close(self):
+        pass
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 transport on a pooled requests session
+
+    The session is created on first use. With idle_timeout, a session left
+    unused for longer is replaced so that stale keep-alive connections are
+    not reused.
+    """
+
+    # A connection dropped while the body arrives surfaces as ChunkedEncodingError.
+    connection_errors = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, idle_timeout=None):
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._idle_timeout = idle_timeout
+        self._session = None
+        self._lock = Lock()
+        self._last_request_at = 0.0
+
+    def request(self, method, url, headers, params, data, verify=True, allow_redirects=True, stream=False, timeout=None):
+        return self._get_session().request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+            verify=verify,
+            allow_redirects=allow_redirects,
+            stream=stream,
+            timeout=timeout
+        )
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_session(self):
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._session is not None
+                and self._idle_timeout is not None
+                and now - self._last_request_at > self._idle_timeout
+            ):
+                self._session.close()
+                self._session = None
+
+            if self._session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self._pool_connections,
+                    pool_maxsize=self._pool_maxsize,
+                    pool_block=self._pool_block,
+                )
+                session = requests.Session()
+                session.cookies.set_policy(_no_cookies())
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+
+            self._last_request_at = now
+            return self._session
+
+class HttpxTransport(Transport):
+    """Transport on an httpx client, multiplexing concurrent requests over HTTP/2
+
+    Requests from every thread are handed to an asynchronous httpx client
+    running on a private event loop thread, so they share a single HTTP/2
+    connection per host instead of opening one connection each. HTTP/2 needs
+    the h2 package, install both with: pip install 'appwrite[http2]'.
+    """
+
+    def __init__(self, http2=True, max_connections=None, max_keepalive_connections=10, keepalive_expiry=5.0):
+        try:
+            import httpx
+        except ImportError as error:
+            raise ImportError("HttpxTransport requires httpx, install it with: pip install 'appwrite[http2]'") from error
+
+        self._httpx = httpx
+        self.connection_errors = (httpx.TransportError,)
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client = None
+        self._verify = None
+        self._loop = None
+        self._thread = None
+        self._lock = Lock()
+
+    def request(self, method, url, headers, params, data, verify=True, allow_redirects=True, stream=False, timeout=None):
+        return self._run(self._request(method, url, headers, params, data, verify, allow_redirects, stream, timeout))
+
+    def read(self, response):
+        return self._run(response.aread())
+
+    def iter_content(self, response, chunk_size):
+        chunks = response.aiter_bytes(chunk_size)
+        while True:
+            try:
+                yield self._run(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+
+    def close_response(self, response):
+        self._run(response.aclose())
+
+    def close(self):
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._close_client(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def _request(self, method, url, headers, params, data, verify, allow_redirects, stream, timeout):
+        # Runs on the event loop thread, which owns the httpx client.
+        if self._client is not None and self._verify != verify:
+            await self._close_client()
+
+        if self._client is None:
+            self._client = self._httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                verify=verify,
+                cookies=CookieJar(_no_cookies()),
+                timeout=None,
+            )
+            self._verify = verify
+
+        options = self._body(data)
+        if timeout is not None:
+            options['timeout'] = self._httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+
+        request = self._client.build_request(method, url, headers=headers, params=params, **options)
+        response = await self._client.send(request, stream=stream, follow_redirects=allow_redirects)
+        return response
+
+    async def _close_client(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = Thread(target=self._loop.run_forever, name='appwrite-httpx', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def _body(self, data):
+        if isinstance(data, MultipartEncoder):
+            return {'content': data.__aiter__()}
+
+        if isinstance(data, (str, bytes)):
+            return {'content': data}
+
+        if data:
+            return {'data': data}
+
+        return {}
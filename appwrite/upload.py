@@ -0,0 +1,121 @@
+import json
+import os
+import time
+from threading import Lock
+from .exception import AppwriteException
+
+class RateLimiter:
+    """Paces uploads so that on average at most bytes_per_second are sent
+
+    reserve() books the next slot and returns how long the caller has to wait
+    before sending, so the same limiter works for threads and coroutines.
+    """
+
+    def __init__(self, bytes_per_second):
+        if bytes_per_second <= 0:
+            raise AppwriteException('Upload rate limit must be greater than 0')
+
+        self._bytes_per_second = bytes_per_second
+        self._next_send_at = 0.0
+        self._lock = Lock()
+
+    def reserve(self, size):
+        with self._lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_send_at)
+            self._next_send_at = send_at + size / self._bytes_per_second
+            return send_at - now
+
+class UploadConcurrency:
+    """Number of chunks kept in flight, fixed at maximum unless adaptive
+
+    In adaptive mode the limit starts low and hill-climbs towards the best
+    measured throughput: throughput is measured over rounds of `limit`
+    completed chunks, and the limit keeps moving in the same direction while
+    throughput improves and turns around as soon as it does not, staying
+    between 1 and maximum.
+    """
+
+    def __init__(self, maximum, adaptive=False):
+        self.maximum = max(1, maximum)
+        self.adaptive = adaptive
+        self.limit = min(2, self.maximum) if adaptive else self.maximum
+        self._direction = 1
+        self._previous = None
+        self._round_bytes = 0
+        self._round_chunks = 0
+        self._round_started_at = time.monotonic()
+        self._lock = Lock()
+
+    def record(self, size):
+        if not self.adaptive:
+            return
+
+        with self._lock:
+            self._round_bytes += size
+            self._round_chunks += 1
+            if self._round_chunks < self.limit:
+                return
+
+            now = time.monotonic()
+            throughput = self._round_bytes / max(now - self._round_started_at, 1e-9)
+            if self._previous is not None and throughput < self._previous * 1.05:
+                self._direction = -self._direction
+
+            self._previous = throughput
+            self.limit = min(self.maximum, max(1, self.limit + self._direction))
+            self._round_bytes = 0
+            self._round_chunks = 0
+            self._round_started_at = now
+
+class UploadManifest:
+    """Persists which chunks of a chunked upload finished in a small JSON file
+
+    The fingerprint identifies the upload (endpoint, file ID, source file and
+    chunk size), so a manifest written for another upload or an older version
+    of the file is ignored. Writes go through a temporary file and an atomic
+    rename, so a crash never leaves a half written manifest behind.
+    """
+
+    def __init__(self, path, fingerprint):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.upload_id = ''
+        self.completed = set()
+        self._lock = Lock()
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        manifest = cls(path, fingerprint)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return manifest
+
+        if data.get('fingerprint') == fingerprint:
+            manifest.upload_id = data.get('uploadId', '')
+            manifest.completed = set(data.get('completed', []))
+        return manifest
+
+    def complete(self, index, upload_id=''):
+        with self._lock:
+            self.completed.add(index)
+            if upload_id:
+                self.upload_id = upload_id
+
+            temporary_path = self.path + '.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                json.dump({
+                    'fingerprint': self.fingerprint,
+                    'uploadId': self.upload_id,
+                    'completed': sorted(self.completed),
+                }, file)
+            os.replace(temporary_path, self.path)
+
+    def delete(self):
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
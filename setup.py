@@ -23,6 +23,11 @@ setuptools.setup(
     'requests',
     'pydantic>=2,<3',
   ],
+  extras_require={
+    'async': ['httpx>=0.24,<1'],
+    'http2': ['httpx[http2]>=0.24,<1'],
+    'otel': ['opentelemetry-api>=1.12,<2'],
+  },
   python_requires='>=3.9',
   classifiers=[
     'Development Status :: 5 - Production/Stable',
@@ -0,0 +1,335 @@
+import asyncio
+import json
+import unittest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from appwrite.coalesce import RequestCoalescer
+from appwrite.exception import AppwriteException
+from appwrite.hedge import HedgePolicy
+from appwrite.hooks import Hook
+from appwrite.input_file import InputFile
+from appwrite.models import *
+from appwrite.retry import RetryPolicy
+from appwrite.transport import Transport
+
+if httpx is not None:
+    from appwrite.aio.client import AsyncClient
+    from appwrite.aio.services.storage import Storage
+    from appwrite.aio.services.tables_db import TablesDB
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class AsyncClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.client = AsyncClient().set_project('test')
+
+    def mock(self, handler):
+        def record(request):
+            self.requests.append(request)
+            return handler(request)
+
+        self.client._async_session = httpx.AsyncClient(transport=httpx.MockTransport(record))
+
+    def run_async(self, coroutine):
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.client.aclose()
+
+        return asyncio.run(run())
+
+    def test_set_transport_is_rejected(self):
+        with self.assertRaises(AppwriteException):
+            self.client.set_transport(Transport())
+
+    def test_session_keeps_no_cookies_and_has_no_timeout(self):
+        def respond(request):
+            self.requests.append(request)
+            return httpx.Response(200, json={}, headers={'Set-Cookie': 'a_session_proj=secret; Path=/'})
+
+        self.client._get_async_session()._transport = httpx.MockTransport(respond)
+
+        async def calls():
+            await self.client.call('post', '/account/sessions/email')
+            await self.client.call('get', '/users')
+
+        self.run_async(calls())
+
+        self.assertNotIn('cookie', self.requests[1].headers)
+        self.assertEqual(self.requests[1].extensions['timeout'], {'connect': None, 'read': None, 'write': None, 'pool': None})
+
+    def test_list_rows(self):
+        data = {
+    "total": 1.0,
+    "rows": [{
+        "$id": "5e5ea5c16897e",
+        "$sequence": "1",
+        "$tableId": "5e5ea5c15117e",
+        "$databaseId": "5e5ea5c15117e",
+        "$createdAt": "2020-10-15T06:38:00.000+00:00",
+        "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+        "$permissions": [],
+        "title": "Hello"
+    }]
+}
+        self.mock(lambda request: httpx.Response(200, json=data))
+
+        response = self.run_async(TablesDB(self.client).list_rows(
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            queries=['{"method":"limit","values":[1]}'],
+        ))
+
+        self.assertIsInstance(response, RowList)
+        self.assertEqual(response.rows[0].data, {'title': 'Hello'})
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0].method, 'GET')
+        self.assertEqual(self.requests[0].url.path, '/v1/tablesdb/<DATABASE_ID>/tables/<TABLE_ID>/rows')
+        self.assertEqual(self.requests[0].url.params['queries[0]'], '{"method":"limit","values":[1]}')
+        self.assertEqual(self.requests[0].headers['x-appwrite-project'], 'test')
+
+    def test_json_body(self):
+        data = {
+    "$id": "5e5ea5c16897e",
+    "name": "My Database",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "enabled": True,
+    "type": "legacy"
+}
+        self.mock(lambda request: httpx.Response(201, json=data))
+
+        response = self.run_async(TablesDB(self.client).create('<DATABASE_ID>', '<NAME>'))
+
+        self.assertEqual(response.to_dict(), data)
+        self.assertEqual(json.loads(self.requests[0].content), {'databaseId': '<DATABASE_ID>', 'name': '<NAME>'})
+
+    def test_bytes_response(self):
+        self.mock(lambda request: httpx.Response(200, content=b'file', headers={'Content-Type': 'application/octet-stream'}))
+
+        response = self.run_async(Storage(self.client).get_file_download('<BUCKET_ID>', '<FILE_ID>'))
+
+        self.assertEqual(response, b'file')
+
+    def test_error_response(self):
+        self.mock(lambda request: httpx.Response(404, json={'message': 'Row not found', 'type': 'row_not_found'}))
+
+        with self.assertRaises(AppwriteException) as context:
+            self.run_async(TablesDB(self.client).get_row('<DATABASE_ID>', '<TABLE_ID>', '<ROW_ID>'))
+
+        self.assertEqual(context.exception.code, 404)
+        self.assertEqual(context.exception.type, 'row_not_found')
+
+    def test_missing_parameter_is_raised_before_sending(self):
+        self.mock(lambda request: httpx.Response(200, json={}))
+
+        with self.assertRaises(AppwriteException):
+            self.run_async(TablesDB(self.client).get_row(None, '<TABLE_ID>', '<ROW_ID>'))
+
+        self.assertEqual(self.requests, [])
+
+    def test_chunked_upload(self):
+        self.client._chunk_size = 4
+        file = {
+    "$id": "5e5ea5c16897e",
+    "bucketId": "5e5ea5c16897e",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "$permissions": [],
+    "name": "Pink.png",
+    "signature": "5d529fd02b544198ae075bd57c1762bb",
+    "mimeType": "image/png",
+    "sizeOriginal": 10,
+    "sizeActual": 10,
+    "chunksTotal": 3,
+    "chunksUploaded": 3,
+    "encryption": False,
+    "compression": "none"
+}
+
+        def handler(request):
+            if request.method == 'GET':
+                return httpx.Response(404, json={'message': 'File not found', 'type': 'storage_file_not_found'})
+            return httpx.Response(201, json=file)
+
+        self.mock(handler)
+        progress = []
+
+        response = self.run_async(Storage(self.client).create_file(
+            '<BUCKET_ID>',
+            '<FILE_ID>',
+            InputFile.from_bytes(b'0123456789', 'file.png'),
+            on_progress=progress.append,
+        ))
+
+        uploads = [request for request in self.requests if request.method == 'POST']
+        self.assertEqual(response.id, '5e5ea5c16897e')
+        self.assertEqual(sorted(request.headers['content-range'] for request in uploads), [
+            'bytes 0-3/10',
+            'bytes 4-7/10',
+            'bytes 8-9/10',
+        ])
+        self.assertEqual(progress[-1]['chunksUploaded'], 3)
+
+    def test_retry(self):
+        responses = [
+            httpx.Response(503, headers={'retry-after': '0'}, json={'message': 'Unavailable'}),
+            httpx.Response(200, json={'$id': 'a'}),
+        ]
+        self.mock(lambda request: responses.pop(0))
+        retries = []
+        self.client.set_retry_policy(RetryPolicy(on_retry=retries.append))
+
+        response = self.run_async(self.client.call('post', '/teams', {'content-type': 'application/json', 'idempotency-key': 'k'}, {'name': 'a'}))
+
+        self.assertEqual(response, {'$id': 'a'})
+        self.assertEqual([json.loads(request.content) for request in self.requests], [{'name': 'a'}] * 2)
+        self.assertEqual(retries[0]['status'], 503)
+
+    def test_request_coalescing(self):
+        async def respond(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={'$id': 'a'})
+
+        self.mock(respond)
+        self.client.set_request_coalescer(RequestCoalescer())
+
+        async def calls():
+            return await asyncio.gather(*(self.client.call('get', '/teams/a') for _ in range(5)))
+
+        responses = self.run_async(calls())
+
+        self.assertEqual(responses, [{'$id': 'a'}] * 5)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_timeouts(self):
+        self.mock(lambda request: httpx.Response(200, json={}))
+        self.client.set_timeout(connect=2, read=10)
+
+        async def calls():
+            await self.client.call('get', '/teams')
+            with self.client.deadline(5):
+                await self.client.call('get', '/teams')
+
+        self.run_async(calls())
+
+        self.assertEqual(self.requests[0].extensions['timeout'], {'connect': 2, 'read': 10, 'write': None, 'pool': None})
+        self.assertTrue(4 < self.requests[1].extensions['timeout']['read'] <= 5)
+
+    def test_hedging(self):
+        delays = [1.0, 0]
+
+        async def respond(request):
+            await asyncio.sleep(delays.pop(0))
+            return httpx.Response(200, json={'$id': 'a'})
+
+        self.mock(respond)
+        policy = HedgePolicy(min_samples=1, min_delay=0.05)
+        policy.record('/teams/a', 0.05)
+        self.client.set_hedge_policy(policy)
+
+        response = self.run_async(self.client.call('get', '/teams/a'))
+
+        self.assertEqual(response, {'$id': 'a'})
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(policy.stats()['/teams/a']['wins'], 1)
+
+    def test_hedging_service_calls_by_route(self):
+        delays = [1.0, 0]
+
+        async def respond(request):
+            await asyncio.sleep(delays.pop(0))
+            return httpx.Response(200, json={'$id': 'a'})
+
+        self.mock(respond)
+        route = '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}'
+        policy = HedgePolicy(min_samples=1, min_delay=0.05)
+        policy.record(route, 0.05)
+        self.client.set_hedge_policy(policy).set_parse_mode('raw')
+
+        response = self.run_async(TablesDB(self.client).get_row('<DATABASE_ID>', '<TABLE_ID>', 'a'))
+
+        self.assertEqual(response, {'$id': 'a'})
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(list(policy.stats()), [route])
+        self.assertEqual(policy.stats()[route]['wins'], 1)
+
+    def test_parse_modes(self):
+        data = {'total': 1, 'rows': [{'$id': 'a', 'title': 'Hello'}]}
+        self.mock(lambda request: httpx.Response(200, json=data))
+        tables_db = TablesDB(self.client.set_parse_mode('trusted'))
+
+        async def calls():
+            trusted = await tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>')
+            with self.client.parse_mode('raw'):
+                raw = await tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>')
+            return trusted, raw
+
+        trusted, raw = self.run_async(calls())
+
+        self.assertIsInstance(trusted, RowList)
+        self.assertEqual(trusted.rows[0].data, {'title': 'Hello'})
+        self.assertEqual(raw, data)
+
+    def test_hooks(self):
+        self.mock(lambda request: httpx.Response(200, json={'$id': 'a'}))
+        events = []
+
+        class Recorder(Hook):
+            def after_response(self, event):
+                events.append(event)
+
+        self.client.add_hook(Recorder())
+
+        self.run_async(self.client.call('get', '/teams/a'))
+
+        self.assertEqual(events[0].status, 200)
+        self.assertEqual(events[0].response_bytes, len(b'{"$id":"a"}'))
+        self.assertEqual(set(events[0].timings), {'serialize', 'ttfb', 'download', 'decode'})
+
+    def test_service_calls_keep_their_endpoint(self):
+        self.mock(lambda request: httpx.Response(200, json={'$id': 'a', 'title': 'Hello'}))
+        self.client.set_parse_mode('raw')
+        events = []
+
+        class Recorder(Hook):
+            def after_response(self, event):
+                events.append(event)
+
+        self.client.add_hook(Recorder())
+
+        self.run_async(TablesDB(self.client).get_row('<DATABASE_ID>', '<TABLE_ID>', '<ROW_ID>'))
+
+        self.assertEqual(self.requests[0].url.path, '/v1/tablesdb/<DATABASE_ID>/tables/<TABLE_ID>/rows/<ROW_ID>')
+        self.assertEqual((events[0].endpoint.service, events[0].endpoint.operation), ('TablesDB', 'get_row'))
+        self.assertEqual(events[0].route, '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}')
+
+    def test_resume_probe_is_reported_by_route(self):
+        self.client._chunk_size = 4
+        self.mock(lambda request: httpx.Response(404, json={'message': 'File not found'}) if request.method == 'GET' else httpx.Response(201, json={'$id': 'a'}))
+        errors = []
+
+        class Recorder(Hook):
+            def on_error(self, event):
+                errors.append(event)
+
+        self.client.add_hook(Recorder())
+
+        self.run_async(self.client.chunked_upload(
+            '/storage/buckets/<BUCKET_ID>/files',
+            {'content-type': 'multipart/form-data'},
+            {'fileId': '<FILE_ID>', 'file': InputFile.from_bytes(b'0123456789', 'file.png')},
+            'file',
+            upload_id='<FILE_ID>',
+            endpoint=Storage._service._create_file_endpoint,
+        ))
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].path, '/storage/buckets/<BUCKET_ID>/files/<FILE_ID>')
+        self.assertEqual(errors[0].route, '/storage/buckets/{bucketId}/files/{fileId}')
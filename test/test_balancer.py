@@ -0,0 +1,158 @@
+import unittest
+from unittest import mock
+
+import requests
+import requests_mock
+
+from appwrite.balancer import EndpointPool
+from appwrite.client import Client
+from appwrite.exception import AppwriteException
+from appwrite.transport import Transport
+
+A = 'https://a.example.com/v1'
+B = 'https://b.example.com/v1'
+C = 'https://c.example.com/v1'
+
+class TestEndpointPool(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('appwrite.balancer.time.monotonic', return_value=1000.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rejects_invalid_settings(self):
+        with self.assertRaises(AppwriteException):
+            EndpointPool([])
+
+        with self.assertRaises(AppwriteException):
+            EndpointPool(['a.example.com'])
+
+        with self.assertRaises(AppwriteException):
+            EndpointPool([A], strategy='random')
+
+        with self.assertRaises(AppwriteException):
+            EndpointPool([A], health_check_interval=0)
+
+    def test_round_robin(self):
+        pool = EndpointPool([A, B, C])
+
+        picked = [pool.acquire() for _ in range(6)]
+
+        self.assertEqual(sorted(picked), sorted([A, B, C] * 2))
+        self.assertEqual(picked[:3], picked[3:])
+
+    def test_least_outstanding(self):
+        pool = EndpointPool([A, B], strategy='least_outstanding')
+
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first, 0.01)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(pool.acquire(), first)
+
+    def test_latency_weighted(self):
+        pool = EndpointPool([A, B], strategy='latency')
+        pool.release(pool.acquire(exclude=[B]), 0.01)
+        pool.release(pool.acquire(exclude=[A]), 1.0)
+
+        picked = [pool.acquire() for _ in range(200)]
+
+        self.assertGreater(picked.count(A), picked.count(B) * 5)
+
+    def test_ejects_after_consecutive_failures(self):
+        pool = EndpointPool([A, B], failure_threshold=2, eject_seconds=30)
+
+        for _ in range(2):
+            pool.release(pool.acquire(exclude=[B]), 0.1, failed=True)
+
+        self.assertTrue(pool.stats()[A]['ejected'])
+        self.assertEqual({pool.acquire() for _ in range(4)}, {B})
+
+        self.clock.return_value += 31
+        self.assertEqual({pool.acquire() for _ in range(4)}, {A, B})
+
+    def test_success_resets_failures(self):
+        pool = EndpointPool([A], failure_threshold=2)
+
+        pool.release(pool.acquire(), 0.1, failed=True)
+        pool.release(pool.acquire(), 0.1)
+        pool.release(pool.acquire(), 0.1, failed=True)
+
+        self.assertFalse(pool.stats()[A]['ejected'])
+
+    def test_every_endpoint_ejected_uses_all(self):
+        pool = EndpointPool([A, B], failure_threshold=1)
+        pool.release(pool.acquire(exclude=[B]), 0.1, failed=True)
+        pool.release(pool.acquire(exclude=[A]), 0.1, failed=True)
+
+        self.assertEqual({pool.acquire() for _ in range(4)}, {A, B})
+
+    def test_can_fail_over(self):
+        pool = EndpointPool([A, B])
+
+        self.assertTrue(pool.can_fail_over('get', {}, [A]))
+        self.assertFalse(pool.can_fail_over('get', {}, [A, B]))
+        self.assertFalse(pool.can_fail_over('post', {}, [A]))
+        self.assertTrue(pool.can_fail_over('post', {'Idempotency-Key': 'k'}, [A]))
+
+    def test_stats(self):
+        pool = EndpointPool([A])
+        pool.release(pool.acquire(), 0.2)
+        pool.release(pool.acquire(), 0.1, failed=True)
+        pool.release(pool.acquire(), 0.4)
+        pool.acquire()
+
+        self.assertEqual(pool.stats()[A], {
+            'requests': 3,
+            'errors': 1,
+            'error_rate': 1 / 3,
+            'latency': 0.2 + 0.2 * (0.4 - 0.2),
+            'outstanding': 1,
+            'ejected': False,
+        })
+
+    @requests_mock.Mocker()
+    def test_check_health(self, m):
+        m.get(A + '/health/version', json={'version': '1.9.5'})
+        m.get(B + '/health/version', status_code=503)
+        m.get(C + '/health/version', exc=requests.ConnectionError)
+        pool = EndpointPool([A, B, C])
+
+        pool.check_health()
+        stats = pool.stats()
+
+        self.assertFalse(stats[A]['ejected'])
+        self.assertTrue(stats[B]['ejected'])
+        self.assertTrue(stats[C]['ejected'])
+
+        m.get(B + '/health/version', json={'version': '1.9.5'})
+        pool.check_health()
+        self.assertFalse(pool.stats()[B]['ejected'])
+
+class TestEndpointPoolClient(unittest.TestCase):
+
+    def test_health_checks_use_the_client_transport(self):
+        transport = mock.Mock(spec=Transport)
+        transport.request.return_value.status_code = 200
+        pool = EndpointPool([A, B])
+        Client().set_self_signed().set_transport(transport).set_endpoint_pool(pool)
+
+        pool.check_health()
+
+        self.assertEqual([call.args[1] for call in transport.request.call_args_list], [A + '/health/version', B + '/health/version'])
+        self.assertFalse(transport.request.call_args.kwargs['verify'])
+
+    def test_close_stops_health_checks(self):
+        transport = mock.Mock(spec=Transport)
+        transport.request.return_value.status_code = 200
+        pool = EndpointPool([A], health_check_interval=60)
+        client = Client().set_transport(transport).set_endpoint_pool(pool)
+        pool.acquire()
+
+        client.close()
+
+        self.assertFalse(pool._health_thread.is_alive())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest import mock
+
+from appwrite.cache import ResponseCache
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache(max_bytes=10, ttl=60)
+
+    def test_get_and_set(self):
+        self.cache.set('a', '/teams/a', 'application/json', b'{}')
+
+        self.assertEqual(self.cache.get('a'), ('application/json', b'{}'))
+        self.assertIsNone(self.cache.get('b'))
+
+    def test_key_depends_on_params_and_headers(self):
+        key = self.cache.key('get', '/teams', {'search': 'a'}, {'x-appwrite-jwt': 'one'})
+
+        self.assertEqual(key, self.cache.key('GET', '/teams', {'search': 'a'}, {'X-Appwrite-JWT': 'one'}))
+        self.assertNotEqual(key, self.cache.key('get', '/teams', {'search': 'b'}, {'x-appwrite-jwt': 'one'}))
+        self.assertNotEqual(key, self.cache.key('get', '/teams', {'search': 'a'}, {'x-appwrite-jwt': 'two'}))
+        self.assertNotIn('one', key)
+
+    def test_evicts_least_recently_used_by_size(self):
+        self.cache.set('a', '/a', '', b'1234')
+        self.cache.set('b', '/b', '', b'1234')
+        self.cache.get('a')
+        self.cache.set('c', '/c', '', b'1234')
+
+        self.assertIsNotNone(self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.size, 8)
+
+    def test_skips_bodies_larger_than_the_cache(self):
+        self.cache.set('a', '/a', '', b'12345678901')
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_entries_expire(self):
+        with mock.patch('appwrite.cache.time.monotonic', return_value=100):
+            self.cache.set('a', '/a', '', b'1')
+
+        with mock.patch('appwrite.cache.time.monotonic', return_value=161):
+            self.assertIsNone(self.cache.get('a'))
+
+        self.assertEqual(self.cache.size, 0)
+
+    def test_per_path_ttls(self):
+        cache = ResponseCache(ttl=0, ttls={'/locale/*': 3600})
+        cache.set('a', '/locale/countries', '', b'1')
+        cache.set('b', '/teams/a', '', b'1')
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+    def test_invalidate_parents_and_descendants(self):
+        cache = ResponseCache()
+        paths = [
+            '/tablesdb/db/tables',
+            '/tablesdb/db/tables/t',
+            '/tablesdb/db/tables/t/rows',
+            '/tablesdb/db/tables/t/rows/r',
+            '/tablesdb/db/tables/t2',
+        ]
+        for path in paths:
+            cache.set(path, path, '', b'1')
+
+        cache.invalidate('/tablesdb/db/tables/t')
+
+        self.assertEqual([path for path in paths if cache.get(path)], ['/tablesdb/db/tables/t2'])
+
+    def test_invalidate_without_descendants(self):
+        cache = ResponseCache()
+        for path in ['/tablesdb/db/tables/t/rows', '/tablesdb/db/tables/t/rows/r']:
+            cache.set(path, path, '', b'1')
+
+        cache.invalidate('/tablesdb/db/tables/t/rows', descendants=False)
+
+        self.assertIsNone(cache.get('/tablesdb/db/tables/t/rows'))
+        self.assertIsNotNone(cache.get('/tablesdb/db/tables/t/rows/r'))
+
+    def test_clear(self):
+        self.cache.set('a', '/a', '', b'1')
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size, 0)
@@ -0,0 +1,1028 @@
+import hashlib
+import io
+import json
+import os
+import requests
+import requests_mock
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from email.parser import BytesParser
+from unittest import mock
+
+from appwrite.balancer import EndpointPool
+from appwrite.cache import ResponseCache
+from appwrite.client import Client
+from appwrite.coalesce import RequestCoalescer
+from appwrite.endpoint import Endpoint
+from appwrite.exception import AppwriteException
+from appwrite.hedge import HedgePolicy
+from appwrite.hooks import Hook, LatencyHistogram
+from appwrite.input_file import InputFile
+from appwrite.retry import RetryPolicy
+from appwrite.throttle import Throttler
+from appwrite.transport import Transport
+from appwrite.services.locale import Locale
+from appwrite.services.storage import Storage
+
+class TransportError(Exception):
+    pass
+
+class RecordingTransport(Transport):
+
+    connection_errors = (TransportError,)
+
+    def __init__(self, body=b'{}', errors=0):
+        self.body = body
+        self.errors = errors
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, url, headers, params, data, verify=True, allow_redirects=True, stream=False, timeout=None):
+        self.requests.append({'method': method, 'url': url, 'params': params, 'verify': verify, 'stream': stream, 'timeout': timeout})
+        if self.errors:
+            self.errors -= 1
+            raise TransportError('connection reset')
+
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = self.body
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        self.closed = True
+
+class TestClientConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    @requests_mock.Mocker()
+    def test_session_is_reused_across_calls(self, m):
+        m.request(requests_mock.ANY, requests_mock.ANY, text=json.dumps({}), headers={'Content-Type': 'application/json'})
+
+        self.client.call('get', '/locale')
+        session = self.client._get_transport()._session
+        self.client.call('get', '/locale')
+
+        self.assertIsNotNone(session)
+        self.assertIs(self.client._get_transport()._session, session)
+        self.assertEqual(m.call_count, 2)
+
+    def test_set_connection_pool(self):
+        self.client.set_connection_pool(pool_connections=4, pool_maxsize=32, pool_block=True)
+
+        adapter = self.client._get_transport()._get_session().get_adapter('https://cloud.appwrite.io/v1')
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+
+    def test_set_connection_pool_rejects_invalid_sizes(self):
+        with self.assertRaises(AppwriteException):
+            self.client.set_connection_pool(pool_maxsize=0)
+
+        with self.assertRaises(AppwriteException):
+            self.client.set_connection_pool(idle_timeout=0)
+
+    def test_idle_timeout_recycles_session(self):
+        self.client.set_connection_pool(idle_timeout=30)
+        transport = self.client._get_transport()
+        session = transport._get_session()
+
+        self.assertIs(transport._get_session(), session)
+
+        transport._last_request_at -= 31
+        self.assertIsNot(transport._get_session(), session)
+
+    def test_close(self):
+        transport = self.client._get_transport()
+        transport._get_session()
+        self.client.close()
+
+        self.assertIsNone(transport._session)
+
+class TestClientTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def test_set_transport(self):
+        transport = RecordingTransport()
+
+        self.assertIs(self.client.set_transport(transport), self.client)
+        self.client.set_project('p').call('get', '/locale', params={'queries': ['a', 'b']})
+
+        self.assertIs(self.client._get_transport(), transport)
+        self.assertEqual(len(transport.requests), 1)
+        request = transport.requests[0]
+        self.assertEqual(request['method'], 'get')
+        self.assertEqual(request['url'], 'https://cloud.appwrite.io/v1/locale')
+        self.assertEqual(request['params'], {'queries[0]': 'a', 'queries[1]': 'b'})
+        self.assertTrue(request['verify'])
+
+    def test_set_transport_rejects_other_objects(self):
+        with self.assertRaises(AppwriteException):
+            self.client.set_transport(object())
+
+    def test_set_connection_pool_keeps_custom_transport(self):
+        transport = RecordingTransport()
+        self.client.set_transport(transport).set_connection_pool(pool_maxsize=4)
+
+        self.assertIs(self.client._get_transport(), transport)
+        self.assertFalse(transport.closed)
+
+    def test_close_closes_transport(self):
+        transport = RecordingTransport()
+        self.client.set_transport(transport).close()
+
+        self.assertTrue(transport.closed)
+
+    def test_connection_errors_are_retried(self):
+        transport = RecordingTransport(errors=1)
+        self.client.set_transport(transport).set_retry_policy(RetryPolicy(backoff=0, jitter=False))
+
+        with mock.patch('appwrite.client.time.sleep'):
+            self.assertEqual(self.client.call('get', '/locale'), {})
+
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_stream_reads_through_transport(self):
+        transport = RecordingTransport(body=b'abcdef')
+        self.client.set_transport(transport)
+
+        self.assertEqual(b''.join(self.client.stream('get', '/file', chunk_size=4)), b'abcdef')
+        self.assertTrue(transport.requests[0]['stream'])
+
+class TestClientEndpoint(unittest.TestCase):
+
+    @requests_mock.Mocker()
+    def test_call_endpoint(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({'$id': 'r'}), headers={'Content-Type': 'application/json'})
+        endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}', {'accept': 'application/json'})
+        client = Client().set_project('p')
+
+        response = client.call_endpoint(endpoint, {'queries': ['limit(1)']}, ['db', 'tbl', 'row'])
+
+        self.assertEqual(response, {'$id': 'r'})
+        self.assertEqual(m.last_request.path, '/v1/tablesdb/db/tables/tbl/rows/row')
+        self.assertEqual(m.last_request.qs, {'queries[0]': ['limit(1)']})
+        self.assertEqual(m.last_request.headers['X-Appwrite-Project'], 'p')
+        self.assertEqual(m.last_request.headers['accept'], 'application/json')
+
+    @requests_mock.Mocker()
+    def test_configuration_changes_reach_cached_headers(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({}), headers={'Content-Type': 'application/json'})
+        endpoint = Endpoint('get', '/teams', {'accept': 'application/json'})
+        client = Client().set_project('one').set_key('first')
+
+        client.call_endpoint(endpoint)
+        client.set_project('two').set_key('second').add_header('x-custom', 'value')
+        client.call_endpoint(endpoint)
+
+        self.assertEqual(m.last_request.headers['X-Appwrite-Project'], 'two')
+        self.assertEqual(m.last_request.headers['x-appwrite-key'], 'second')
+        self.assertEqual(m.last_request.headers['x-custom'], 'value')
+
+class RecordingHook(Hook):
+
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(('before_request', event))
+        if event.headers is not None:
+            event.headers['x-trace'] = 'trace'
+
+    def after_response(self, event):
+        self.calls.append(('after_response', event))
+
+    def on_error(self, event):
+        self.calls.append(('on_error', event))
+
+    def after_parse(self, event):
+        self.calls.append(('after_parse', event))
+
+class TestClientHooks(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = RecordingHook()
+        self.client = Client().set_project('test').add_hook(self.hook)
+
+    @requests_mock.Mocker()
+    def test_service_call_reports_every_phase(self, m):
+        body = json.dumps({
+            'ip': '127.0.0.1',
+            'countryCode': 'US',
+            'country': 'United States',
+            'continentCode': 'NA',
+            'continent': 'North America',
+            'eu': False,
+            'currency': 'USD',
+        })
+        m.get(requests_mock.ANY, text=body, headers={'Content-Type': 'application/json'})
+
+        Locale(self.client).get()
+
+        self.assertEqual([name for name, _ in self.hook.calls], ['before_request', 'after_response', 'after_parse'])
+        event = self.hook.calls[-1][1]
+        self.assertEqual(event.route, '/locale')
+        self.assertEqual((event.endpoint.service, event.endpoint.operation), ('Locale', 'get'))
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.attempts, 1)
+        self.assertEqual(event.response_bytes, len(body))
+        self.assertEqual(set(event.timings), {'serialize', 'ttfb', 'download', 'decode', 'validate'})
+        self.assertEqual(m.last_request.headers['x-trace'], 'trace')
+
+    @requests_mock.Mocker()
+    def test_errors_are_reported(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Not found'}), headers={'Content-Type': 'application/json'})
+
+        with self.assertRaises(AppwriteException):
+            self.client.call('get', '/teams/a')
+
+        name, event = self.hook.calls[-1]
+        self.assertEqual(name, 'on_error')
+        self.assertEqual(event.status, 404)
+        self.assertIsInstance(event.error, AppwriteException)
+
+    @requests_mock.Mocker()
+    def test_request_and_response_sizes(self, m):
+        m.post(requests_mock.ANY, text='{"$id": "a"}', headers={'Content-Type': 'application/json'})
+
+        self.client.call('post', '/teams', {'content-type': 'application/json'}, {'name': 'ü'})
+
+        event = self.hook.calls[-1][1]
+        self.assertEqual(event.request_bytes, len(m.last_request.body))
+        self.assertEqual(event.response_bytes, 12)
+
+    @requests_mock.Mocker()
+    def test_streamed_downloads_are_reported(self, m):
+        m.get(requests_mock.ANY, content=b'0123456789', headers={'Content-Type': 'application/octet-stream'})
+        storage = Storage(self.client)
+
+        self.assertEqual(b''.join(storage.stream(storage.get_file_download, 'bucket', 'file', chunk_size=4)), b'0123456789')
+
+        self.assertEqual([name for name, _ in self.hook.calls], ['before_request', 'after_response'])
+        event = self.hook.calls[-1][1]
+        self.assertEqual(event.route, '/storage/buckets/{bucketId}/files/{fileId}/download')
+        self.assertEqual((event.endpoint.service, event.endpoint.operation), ('Storage', 'get_file_download'))
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.response_bytes, 10)
+        self.assertEqual(set(event.timings), {'serialize', 'ttfb', 'download'})
+        self.assertEqual(m.last_request.headers['x-trace'], 'trace')
+
+    @requests_mock.Mocker()
+    def test_streamed_download_errors_are_reported(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Not found'}), headers={'Content-Type': 'application/json'})
+        storage = Storage(self.client)
+
+        with self.assertRaises(AppwriteException):
+            storage.download(storage.get_file_download, 'bucket', 'file', destination=io.BytesIO())
+
+        self.assertEqual([name for name, _ in self.hook.calls], ['before_request', 'on_error'])
+        self.assertEqual(self.hook.calls[-1][1].status, 404)
+
+class TestClientResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client().set_project('test').set_response_cache(ResponseCache())
+
+    @requests_mock.Mocker()
+    def test_get_is_served_from_cache(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({'total': 0, 'teams': []}), headers={'Content-Type': 'application/json'})
+
+        first = self.client.call('get', '/teams', params={'search': 'a'})
+        first['total'] = 1
+        second = self.client.call('get', '/teams', params={'search': 'a'})
+
+        self.assertEqual(second, {'total': 0, 'teams': []})
+        self.assertEqual(m.call_count, 1)
+
+        self.client.call('get', '/teams', params={'search': 'b'})
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_auth_headers_are_part_of_the_key(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({}), headers={'Content-Type': 'application/json'})
+
+        self.client.set_jwt('one').call('get', '/teams/a')
+        self.client.set_jwt('two').call('get', '/teams/a')
+
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_writes_invalidate_matching_entries(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({}), headers={'Content-Type': 'application/json'})
+        m.patch(requests_mock.ANY, text=json.dumps({}), headers={'Content-Type': 'application/json'})
+
+        self.client.call('get', '/tablesdb/db/tables/t/rows/r')
+        self.client.call('get', '/tablesdb/db/tables/t/rows')
+        self.client.call('patch', '/tablesdb/db/tables/t/rows/r', {'content-type': 'application/json'}, {'data': {}})
+        self.client.call('get', '/tablesdb/db/tables/t/rows/r')
+        self.client.call('get', '/tablesdb/db/tables/t/rows')
+
+        self.assertEqual(m.call_count, 5)
+
+    @requests_mock.Mocker()
+    def test_errors_are_not_cached(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Not found'}), headers={'Content-Type': 'application/json'})
+
+        for _ in range(2):
+            with self.assertRaises(AppwriteException):
+                self.client.call('get', '/teams/a')
+
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_headers_added_by_hooks_are_not_part_of_the_key(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({'$id': 't'}), headers={'Content-Type': 'application/json'})
+        traces = iter(range(10))
+
+        class TraceHook(Hook):
+            def before_request(self, event):
+                event.headers['traceparent'] = f'00-{next(traces):032x}-0000000000000001-01'
+
+        self.client.add_hook(TraceHook())
+        self.client.call('get', '/teams/t')
+        self.client.call('get', '/teams/t')
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(self.client._response_cache), 1)
+
+class GatedTransport(RecordingTransport):
+
+    def __init__(self, body=b'{"$id": "t"}'):
+        super().__init__(body)
+        self.release = threading.Event()
+
+    def request(self, *args, **kwargs):
+        self.release.wait(5)
+        return super().request(*args, **kwargs)
+
+class TestClientCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = GatedTransport()
+        self.client = Client().set_transport(self.transport).set_request_coalescer(RequestCoalescer())
+
+    def call_concurrently(self, calls):
+        with ThreadPoolExecutor(len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            time.sleep(0.2)
+            self.transport.release.set()
+            return [future.result() for future in futures]
+
+    def test_identical_gets_share_one_request(self):
+        results = self.call_concurrently([lambda: self.client.call('get', '/teams/t')] * 8)
+
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(results, [{'$id': 't'}] * 8)
+
+        results[0]['$id'] = 'changed'
+        self.assertEqual(results[1], {'$id': 't'})
+
+    def test_different_headers_are_not_shared(self):
+        results = self.call_concurrently([
+            lambda: self.client.call('get', '/teams/t', {'x-appwrite-jwt': 'a'}),
+            lambda: self.client.call('get', '/teams/t', {'x-appwrite-jwt': 'b'}),
+        ])
+
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(results, [{'$id': 't'}] * 2)
+
+    def test_writes_are_not_shared(self):
+        self.call_concurrently([lambda: self.client.call('delete', '/teams/t')] * 3)
+
+        self.assertEqual(len(self.transport.requests), 3)
+
+    def test_hooks_see_shared_responses(self):
+        hook = RecordingHook()
+        self.client.add_hook(hook)
+
+        self.call_concurrently([lambda: self.client.call('get', '/teams/t')] * 4)
+
+        events = [event for name, event in hook.calls if name == 'after_response']
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(sorted(event.coalesced for event in events), [False, True, True, True])
+        self.assertTrue(all(event.status == 200 for event in events))
+
+class TestClientEndpointPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = EndpointPool(['https://a.example.com/v1', 'https://b.example.com/v1'])
+        self.client = Client().set_endpoint_pool(self.pool)
+
+    @requests_mock.Mocker()
+    def test_spreads_requests(self, m):
+        m.get(requests_mock.ANY, json={}, headers={'Content-Type': 'application/json'})
+
+        for _ in range(4):
+            self.client.call('get', '/teams')
+
+        hosts = [request.hostname for request in m.request_history]
+        self.assertEqual(sorted(hosts), ['a.example.com'] * 2 + ['b.example.com'] * 2)
+        self.assertTrue(all(request.path == '/v1/teams' for request in m.request_history))
+
+    @requests_mock.Mocker()
+    def test_fails_over_idempotent_calls(self, m):
+        m.get('https://a.example.com/v1/teams', exc=requests.ConnectionError)
+        m.get('https://b.example.com/v1/teams', json={'total': 0}, headers={'Content-Type': 'application/json'})
+
+        for _ in range(2):
+            self.assertEqual(self.client.call('get', '/teams'), {'total': 0})
+
+        stats = self.client.get_endpoint_stats()
+        self.assertEqual(stats['https://a.example.com/v1']['errors'], 1)
+        self.assertEqual(stats['https://b.example.com/v1']['requests'], 2)
+
+    @requests_mock.Mocker()
+    def test_does_not_fail_over_other_calls(self, m):
+        m.post('https://a.example.com/v1/teams', exc=requests.ConnectionError)
+        m.post('https://b.example.com/v1/teams', exc=requests.ConnectionError)
+
+        with self.assertRaises(AppwriteException):
+            self.client.call('post', '/teams', {'content-type': 'application/json'}, {'name': 'a'})
+
+        self.assertEqual(m.call_count, 1)
+
+    @requests_mock.Mocker()
+    def test_server_errors_count_as_failures(self, m):
+        m.get(requests_mock.ANY, status_code=503, json={'message': 'Unavailable'}, headers={'Content-Type': 'application/json'})
+
+        for _ in range(2):
+            with self.assertRaises(AppwriteException):
+                self.client.call('get', '/teams')
+
+        self.assertEqual([stats['error_rate'] for stats in self.client.get_endpoint_stats().values()], [1.0, 1.0])
+
+    def test_without_pool(self):
+        self.assertEqual(Client().get_endpoint_stats(), {})
+
+class SlowTransport(RecordingTransport):
+
+    def __init__(self, delays, body=b'{"$id": "r"}'):
+        super().__init__(body)
+        self.delays = list(delays)
+
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        time.sleep(self.delays.pop(0) if self.delays else 0)
+        return response
+
+class DrippingTransport(RecordingTransport):
+
+    def iter_content(self, response, chunk_size):
+        for index in range(0, len(self.body), chunk_size):
+            time.sleep(0.05)
+            yield self.body[index:index + chunk_size]
+
+class TestClientTimeouts(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = RecordingTransport()
+        self.client = Client().set_transport(self.transport)
+
+    def test_no_timeout_by_default(self):
+        self.client.call('get', '/teams')
+
+        self.assertIsNone(self.transport.requests[0]['timeout'])
+
+    def test_set_timeout(self):
+        self.client.set_timeout(connect=2, read=10).call('get', '/teams')
+
+        self.assertEqual(self.transport.requests[0]['timeout'], (2, 10))
+
+    def test_set_timeout_rejects_invalid_values(self):
+        with self.assertRaises(AppwriteException):
+            self.client.set_timeout(read=0)
+
+        with self.assertRaises(AppwriteException):
+            with self.client.deadline(-1):
+                pass
+
+    def test_timeout_overrides_per_call(self):
+        self.client.set_timeout(connect=2, read=10)
+
+        with self.client.timeout(read=1):
+            self.client.call('get', '/teams')
+        self.client.call('get', '/teams')
+
+        self.assertEqual([request['timeout'] for request in self.transport.requests], [(2, 1), (2, 10)])
+
+    def test_deadline_shortens_timeouts(self):
+        self.client.set_timeout(connect=2, read=10)
+
+        with self.client.deadline(5):
+            self.client.call('get', '/teams')
+
+        connect, read = self.transport.requests[0]['timeout']
+        self.assertEqual(connect, 2)
+        self.assertTrue(4 < read <= 5)
+
+    def test_deadline_exceeded(self):
+        with self.client.deadline(0.05):
+            time.sleep(0.06)
+            with self.assertRaises(AppwriteException) as context:
+                self.client.call('get', '/teams')
+
+        self.assertEqual(context.exception.type, 'deadline_exceeded')
+        self.assertEqual(self.transport.requests, [])
+
+    def test_stream_deadline_exceeded(self):
+        with self.client.deadline(0.05):
+            time.sleep(0.06)
+            with self.assertRaises(AppwriteException) as context:
+                list(self.client.stream('get', '/storage/buckets/b/files/f/download'))
+
+        self.assertEqual(context.exception.type, 'deadline_exceeded')
+        self.assertEqual(self.transport.requests, [])
+
+    def test_deadline_covers_streamed_body(self):
+        transport = DrippingTransport(body=b'0123456789')
+        self.client.set_transport(transport)
+        chunks = []
+
+        with self.client.deadline(0.12):
+            with self.assertRaises(AppwriteException) as context:
+                for chunk in self.client.stream('get', '/storage/buckets/b/files/f/download', chunk_size=1):
+                    chunks.append(chunk)
+
+        self.assertEqual(context.exception.type, 'deadline_exceeded')
+        self.assertLess(len(chunks), 10)
+
+    def test_deadline_stops_retries(self):
+        transport = RecordingTransport(errors=5)
+        self.client.set_transport(transport).set_retry_policy(RetryPolicy(max_attempts=5, backoff=0.1, jitter=False))
+
+        with self.client.deadline(0.25):
+            with self.assertRaises(AppwriteException):
+                self.client.call('get', '/teams')
+
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_client_deadline_covers_upload_chunks(self):
+        transport = SlowTransport([0.1] * 10, body=json.dumps({'$id': 'file', 'chunksTotal': 5, 'chunksUploaded': 1}).encode())
+        self.client.set_transport(transport).set_timeout(deadline=0.25).set_upload_options(chunk_size=2, max_workers=1)
+
+        with self.assertRaises(AppwriteException) as context:
+            self.client.chunked_upload('/storage/buckets/bucket/files', {
+                'content-type': 'multipart/form-data',
+            }, {
+                'fileId': 'file',
+                'file': InputFile.from_bytes(b'0123456789', 'file.txt'),
+            }, 'file', None, 'file')
+
+        self.assertEqual(context.exception.type, 'deadline_exceeded')
+        self.assertLess(len(transport.requests), 5)
+
+class TestClientHedging(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = HedgePolicy(min_samples=1, min_delay=0.05)
+        self.policy.record('/teams/{teamId}', 0.05)
+
+    def call(self, client):
+        return client.call_endpoint(Endpoint('get', '/teams/{teamId}'), None, ['t'])
+
+    def test_slow_call_is_hedged(self):
+        transport = SlowTransport([1.0, 0])
+        client = Client().set_transport(transport).set_hedge_policy(self.policy)
+
+        started_at = time.monotonic()
+        self.assertEqual(self.call(client), {'$id': 'r'})
+
+        self.assertLess(time.monotonic() - started_at, 0.5)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(self.policy.stats()['/teams/{teamId}']['wins'], 1)
+
+    def test_fast_call_is_not_hedged(self):
+        transport = SlowTransport([0, 0])
+        client = Client().set_transport(transport).set_hedge_policy(self.policy)
+
+        self.call(client)
+
+        self.assertEqual(len(transport.requests), 1)
+        self.assertEqual(self.policy.stats()['/teams/{teamId}']['hedges'], 0)
+
+    def test_writes_are_not_hedged(self):
+        transport = SlowTransport([0.2, 0])
+        client = Client().set_transport(transport).set_hedge_policy(HedgePolicy(min_samples=1, min_delay=0))
+        client._hedge_policy.record('/teams/t', 0.01)
+
+        client.call('delete', '/teams/t')
+
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_hedge_goes_to_another_endpoint(self):
+        transport = SlowTransport([1.0, 0])
+        pool = EndpointPool(['https://a.example.com/v1', 'https://b.example.com/v1'])
+        client = Client().set_transport(transport).set_endpoint_pool(pool).set_hedge_policy(self.policy)
+
+        self.call(client)
+
+        hosts = {request['url'].split('/')[2] for request in transport.requests}
+        self.assertEqual(hosts, {'a.example.com', 'b.example.com'})
+
+    def test_rejects_other_objects(self):
+        with self.assertRaises(AppwriteException):
+            Client().set_hedge_policy(RetryPolicy())
+
+class TestClientRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.retries = []
+        self.client = Client().set_project('test').set_retry_policy(
+            RetryPolicy(max_attempts=3, on_retry=self.retries.append)
+        )
+        patcher = mock.patch('appwrite.client.time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @requests_mock.Mocker()
+    def test_transient_status_is_retried(self, m):
+        m.get(requests_mock.ANY, [
+            {'status_code': 503, 'text': json.dumps({'message': 'Unavailable'}), 'headers': {'Content-Type': 'application/json'}},
+            {'status_code': 429, 'text': json.dumps({'message': 'Too many'}), 'headers': {'Content-Type': 'application/json', 'Retry-After': '2'}},
+            {'status_code': 200, 'text': json.dumps({'total': 0}), 'headers': {'Content-Type': 'application/json'}},
+        ])
+
+        self.assertEqual(self.client.call('get', '/teams'), {'total': 0})
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual([retry['status'] for retry in self.retries], [503, 429])
+        self.assertEqual([retry['attempt'] for retry in self.retries], [1, 2])
+        self.assertEqual(self.retries[1]['delay'], 2)
+        self.assertEqual(self.retries[0]['path'], '/teams')
+        self.sleep.assert_called_with(2)
+
+    @requests_mock.Mocker()
+    def test_gives_up_after_max_attempts(self, m):
+        m.get(requests_mock.ANY, status_code=503, text=json.dumps({'message': 'Unavailable'}), headers={'Content-Type': 'application/json'})
+
+        with self.assertRaises(AppwriteException) as context:
+            self.client.call('get', '/teams')
+
+        self.assertEqual(context.exception.code, 503)
+        self.assertEqual(m.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_connection_errors_are_retried(self, m):
+        m.get(requests_mock.ANY, [
+            {'exc': requests.exceptions.ConnectionError},
+            {'text': json.dumps({}), 'headers': {'Content-Type': 'application/json'}},
+        ])
+
+        self.client.call('get', '/teams')
+
+        self.assertEqual(m.call_count, 2)
+        self.assertIsInstance(self.retries[0]['error'], requests.exceptions.ConnectionError)
+
+    @requests_mock.Mocker()
+    def test_post_is_not_retried_without_idempotency_key(self, m):
+        m.post(requests_mock.ANY, status_code=503, text=json.dumps({'message': 'Unavailable'}), headers={'Content-Type': 'application/json'})
+
+        with self.assertRaises(AppwriteException):
+            self.client.call('post', '/teams', {'content-type': 'application/json'}, {'name': 'a'})
+        self.assertEqual(m.call_count, 1)
+
+        with self.assertRaises(AppwriteException):
+            self.client.call('post', '/teams', {'content-type': 'application/json', 'idempotency-key': 'k'}, {'name': 'a'})
+        self.assertEqual(m.call_count, 4)
+
+    @requests_mock.Mocker()
+    def test_client_errors_are_not_retried(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Not found'}), headers={'Content-Type': 'application/json'})
+
+        with self.assertRaises(AppwriteException):
+            self.client.call('get', '/teams/a')
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(self.retries, [])
+
+class TestClientThrottle(unittest.TestCase):
+
+    @requests_mock.Mocker()
+    def test_requests_are_paced_by_rate_limit_headers(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({}), headers={
+            'Content-Type': 'application/json',
+            'X-RateLimit-Limit': '10',
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': '1060',
+        })
+        client = Client().set_throttler(Throttler())
+
+        with mock.patch('appwrite.throttle.time.time', return_value=1000.0), \
+                mock.patch('appwrite.client.time.sleep') as sleep:
+            client.call('get', '/teams')
+            client.call('get', '/teams')
+
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0, 60])
+
+    @requests_mock.Mocker()
+    def test_budgets_are_shared_by_the_ids_of_a_route(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({}), headers={
+            'Content-Type': 'application/json',
+            'X-RateLimit-Limit': '10',
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': '1060',
+        })
+        throttler = Throttler()
+        client = Client().set_throttler(throttler)
+        endpoint = Endpoint('get', '/teams/{teamId}')
+
+        with mock.patch('appwrite.throttle.time.time', return_value=1000.0), \
+                mock.patch('appwrite.client.time.sleep') as sleep:
+            client.call_endpoint(endpoint, None, ['a'])
+            client.call_endpoint(endpoint, None, ['b'])
+
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0, 60])
+        with throttler._store.transaction() as buckets:
+            self.assertEqual(list(buckets), ['GET /teams/{teamId}'])
+
+    @requests_mock.Mocker()
+    def test_streamed_downloads_are_keyed_by_route(self, m):
+        m.get(requests_mock.ANY, content=b'file', headers={'Content-Type': 'application/octet-stream', 'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '9', 'X-RateLimit-Reset': '1060'})
+        throttler = Throttler()
+        storage = Storage(Client().set_throttler(throttler))
+
+        with mock.patch('appwrite.throttle.time.time', return_value=1000.0):
+            for file_id in ('a', 'b'):
+                storage.download(storage.get_file_download, 'bucket', file_id, destination=io.BytesIO())
+
+        with throttler._store.transaction() as buckets:
+            self.assertEqual(list(buckets), ['GET /storage/buckets/{bucketId}/files/{fileId}/download'])
+
+class TestClientChunkedUpload(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.client._chunk_size = 4
+        self.data = b'0123456789'
+
+    def mock_upload(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Not found'}), headers={'Content-Type': 'application/json'})
+        m.post(requests_mock.ANY, text=json.dumps({
+    "$id": "file",
+    "bucketId": "bucket",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "$permissions": [],
+    "name": "file.txt",
+    "signature": "5d529fd02b544198ae075bd57c1762bb",
+    "mimeType": "text/plain",
+    "sizeOriginal": 10,
+    "sizeActual": 10,
+    "chunksTotal": 3,
+    "chunksUploaded": 3,
+    "encryption": False,
+    "compression": "none"
+}), headers={'Content-Type': 'application/json'})
+
+    def uploaded_parts(self, m):
+        parts = {}
+        for request in m.request_history:
+            if request.method != 'POST':
+                continue
+            body = b''.join(bytes(part) for part in request.body)
+            self.assertEqual(request.headers['content-length'], str(len(body)))
+            message = BytesParser().parsebytes(b'Content-Type: ' + request.headers['content-type'].encode() + b'\r\n\r\n' + body)
+            fields = {part.get_param('name', header='content-disposition'): part for part in message.get_payload()}
+            self.assertEqual(fields['fileId'].get_payload(), '<FILE_ID>')
+            self.assertEqual(fields['file'].get_filename(), 'file.txt')
+            parts[request.headers['content-range']] = fields['file'].get_payload(decode=True)
+        return parts
+
+    def upload(self, input_file):
+        return self.client.chunked_upload('/storage/buckets/bucket/files', {
+            'content-type': 'multipart/form-data',
+        }, {
+            'fileId': '<FILE_ID>',
+            'file': input_file,
+        }, 'file', None, '<FILE_ID>')
+
+    @requests_mock.Mocker()
+    def test_upload_is_reported_to_hooks(self, m):
+        self.mock_upload(m)
+        hook = RecordingHook()
+        self.client.add_hook(hook)
+
+        self.upload(InputFile.from_bytes(self.data, 'file.txt'))
+
+        uploads = [event for name, event in hook.calls if name == 'after_response' and event.kind == 'upload']
+        chunks = [event for name, event in hook.calls if name == 'after_response' and event.kind == 'call' and event.method == 'post']
+        self.assertEqual(len(uploads), 1)
+        self.assertEqual((uploads[0].request_bytes, uploads[0].chunks), (10, 3))
+        self.assertEqual(len(chunks), 3)
+
+    @requests_mock.Mocker()
+    def test_resume_probe_is_reported_by_route(self, m):
+        self.mock_upload(m)
+        hook = RecordingHook()
+        self.client.add_hook(hook)
+
+        Storage(self.client).create_file('bucket', '<FILE_ID>', InputFile.from_bytes(self.data, 'file.txt'))
+
+        probes = [event for name, event in hook.calls if name == 'on_error']
+        self.assertEqual(len(probes), 1)
+        self.assertEqual(probes[0].path, '/storage/buckets/bucket/files/<FILE_ID>')
+        self.assertEqual(probes[0].route, '/storage/buckets/{bucketId}/files/{fileId}')
+
+    @requests_mock.Mocker()
+    def test_upload_latencies(self, m):
+        self.mock_upload(m)
+        latency = LatencyHistogram()
+        self.client.add_hook(latency)
+
+        Storage(self.client).create_file('bucket', '<FILE_ID>', InputFile.from_bytes(self.data, 'file.txt'))
+
+        stats = latency.snapshot()
+        self.assertEqual({key: (value['count'], value['errors']) for key, value in stats.items()}, {
+            'GET /storage/buckets/{bucketId}/files/{fileId}': (1, 0),
+            'POST /storage/buckets/{bucketId}/files': (3, 0),
+            'UPLOAD /storage/buckets/{bucketId}/files': (1, 0),
+        })
+
+    @requests_mock.Mocker()
+    def test_upload_bytes(self, m):
+        self.mock_upload(m)
+
+        result = self.upload(InputFile.from_bytes(self.data, 'file.txt'))
+
+        self.assertEqual(result['$id'], 'file')
+        self.assertEqual(self.uploaded_parts(m), {
+            'bytes 0-3/10': b'0123',
+            'bytes 4-7/10': b'4567',
+            'bytes 8-9/10': b'89',
+        })
+
+    @requests_mock.Mocker()
+    def test_upload_path(self, m):
+        self.mock_upload(m)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'file.txt')
+            with open(path, 'wb') as file:
+                file.write(self.data)
+
+            self.upload(InputFile.from_path(path))
+
+        self.assertEqual(self.uploaded_parts(m), {
+            'bytes 0-3/10': b'0123',
+            'bytes 4-7/10': b'4567',
+            'bytes 8-9/10': b'89',
+        })
+
+    @requests_mock.Mocker()
+    def test_chunks_are_not_copied(self, m):
+        self.mock_upload(m)
+
+        self.upload(InputFile.from_bytes(self.data, 'file.txt'))
+
+        for request in m.request_history[1:]:
+            self.assertTrue(any(isinstance(part, memoryview) and part.obj is self.data for part in request.body))
+
+    @requests_mock.Mocker()
+    def test_per_call_upload_options(self, m):
+        self.mock_upload(m)
+        self.client._chunk_size = 5*1024*1024
+        storage = Storage(self.client)
+
+        with mock.patch('appwrite.client.time.sleep') as sleep:
+            storage.create_file(
+                'bucket',
+                '<FILE_ID>',
+                InputFile.from_bytes(self.data, 'file.txt'),
+                chunk_size=3,
+                max_workers=1,
+                max_bytes_per_second=3,
+            )
+
+        self.assertEqual(list(self.uploaded_parts(m)), [
+            'bytes 0-2/10',
+            'bytes 3-5/10',
+            'bytes 6-8/10',
+            'bytes 9-9/10',
+        ])
+        self.assertEqual(sleep.call_count, 4)
+
+    def test_set_upload_options(self):
+        self.client.set_upload_options(chunk_size=1024, max_workers=2, adaptive=True)
+
+        chunk_size, concurrency, limiter = self.client._upload_options(None, None, None, None)
+
+        self.assertEqual(chunk_size, 1024)
+        self.assertEqual(concurrency.maximum, 2)
+        self.assertTrue(concurrency.adaptive)
+        self.assertIsNone(limiter)
+
+        with self.assertRaises(AppwriteException):
+            self.client.set_upload_options(max_workers=0)
+
+class TestClientResumableUpload(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.client = Client().set_upload_options(chunk_size=4, max_workers=1, manifest_dir=self.directory.name)
+        self.data = b'0123456789'
+        self.failing_range = None
+        self.file = {
+    "$id": "file",
+    "bucketId": "bucket",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "$permissions": [],
+    "name": "file.txt",
+    "signature": hashlib.md5(self.data).hexdigest(),
+    "mimeType": "text/plain",
+    "sizeOriginal": 10,
+    "sizeActual": 10,
+    "chunksTotal": 3,
+    "chunksUploaded": 3,
+    "encryption": False,
+    "compression": "none"
+}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def mock_upload(self, m):
+        def callback(request, context):
+            if request.headers.get('content-range') == self.failing_range:
+                context.status_code = 500
+                return json.dumps({'message': 'Server error'})
+            return json.dumps(self.file)
+
+        m.post(requests_mock.ANY, text=callback, headers={'Content-Type': 'application/json'})
+        m.get(requests_mock.ANY, text=json.dumps(self.file), headers={'Content-Type': 'application/json'})
+
+    def upload(self):
+        return Storage(self.client).create_file('bucket', 'file', InputFile.from_bytes(self.data, 'file.txt'))
+
+    def manifests(self):
+        return [name for name in os.listdir(self.directory.name) if name.endswith('.json')]
+
+    @requests_mock.Mocker()
+    def test_resume_sends_only_missing_chunks(self, m):
+        self.mock_upload(m)
+        self.failing_range = 'bytes 8-9/10'
+
+        with self.assertRaises(AppwriteException):
+            self.upload()
+
+        with open(os.path.join(self.directory.name, self.manifests()[0])) as file:
+            manifest = json.load(file)
+        self.assertEqual(manifest['completed'], [0, 1])
+        self.assertEqual(manifest['uploadId'], 'file')
+
+        self.failing_range = None
+        m.reset_mock()
+        response = self.upload()
+
+        self.assertEqual(response.id, 'file')
+        self.assertEqual([request.headers['content-range'] for request in m.request_history], ['bytes 8-9/10'])
+        self.assertEqual(m.last_request.headers['x-appwrite-id'], 'file')
+        self.assertEqual(self.manifests(), [])
+
+    @requests_mock.Mocker()
+    def test_finished_upload_is_fetched_instead_of_resent(self, m):
+        self.mock_upload(m)
+        self.upload()
+        manifest = self.client._upload_manifest('/storage/buckets/bucket/files', 'file', InputFile.from_bytes(self.data, 'file.txt'), 10, 4)
+        for index in range(3):
+            manifest.complete(index, 'file')
+
+        m.reset_mock()
+        self.upload()
+
+        self.assertEqual([request.method for request in m.request_history], ['GET'])
+        self.assertEqual(self.manifests(), [])
+
+    @requests_mock.Mocker()
+    def test_checksum_mismatch(self, m):
+        self.file['signature'] = hashlib.md5(b'something else').hexdigest()
+        self.mock_upload(m)
+
+        with self.assertRaises(AppwriteException) as context:
+            self.upload()
+
+        self.assertEqual(context.exception.type, 'upload_checksum_mismatch')
+
+    @requests_mock.Mocker()
+    def test_changed_source_starts_over(self, m):
+        self.mock_upload(m)
+        self.failing_range = 'bytes 8-9/10'
+
+        with self.assertRaises(AppwriteException):
+            self.upload()
+
+        self.failing_range = None
+        self.data = b'abcdefghij'
+        self.file['signature'] = hashlib.md5(self.data).hexdigest()
+        m.reset_mock()
+        self.upload()
+
+        self.assertEqual(len(m.request_history), 3)
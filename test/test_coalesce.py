@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from appwrite.coalesce import RequestCoalescer
+
+class TestRequestCoalescer(unittest.TestCase):
+
+    def setUp(self):
+        self.coalescer = RequestCoalescer()
+
+    def test_key_covers_params_and_headers(self):
+        key = self.coalescer.key('get', '/teams', {'queries[0]': 'a'}, {'X-Appwrite-Key': 'k'})
+
+        self.assertEqual(key, self.coalescer.key('GET', '/teams', {'queries[0]': 'a'}, {'x-appwrite-key': 'k'}))
+        self.assertNotEqual(key, self.coalescer.key('get', '/teams', {'queries[0]': 'b'}, {'x-appwrite-key': 'k'}))
+        self.assertNotEqual(key, self.coalescer.key('get', '/teams', {'queries[0]': 'a'}, {'x-appwrite-key': 'other'}))
+
+    def test_concurrent_calls_share_one_send(self):
+        sends = []
+        release = threading.Event()
+
+        def send():
+            sends.append(1)
+            release.wait(5)
+            return 'response'
+
+        with ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(self.coalescer.do, 'key', send) for _ in range(8)]
+            time.sleep(0.2)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(sends), 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False] + [True] * 7)
+        self.assertTrue(all(result == 'response' for result, _ in results))
+        self.assertEqual(len(self.coalescer), 0)
+
+    def test_error_is_raised_in_every_caller(self):
+        release = threading.Event()
+
+        def send():
+            release.wait(5)
+            raise ConnectionError('reset')
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(self.coalescer.do, 'key', send) for _ in range(4)]
+            time.sleep(0.2)
+            release.set()
+            for future in futures:
+                with self.assertRaises(ConnectionError):
+                    future.result()
+
+        self.assertEqual(len(self.coalescer), 0)
+
+    def test_sequential_calls_are_not_shared(self):
+        self.assertEqual(self.coalescer.do('key', lambda: 1), (1, False))
+        self.assertEqual(self.coalescer.do('key', lambda: 2), (2, False))
+
+    def test_do_async(self):
+        sends = []
+
+        async def send():
+            sends.append(1)
+            await asyncio.sleep(0.05)
+            return 'response'
+
+        async def run():
+            return await asyncio.gather(*(self.coalescer.do_async('key', send) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(sends), 1)
+        self.assertEqual([shared for _, shared in results], [False, True, True, True, True])
+
+    def test_interrupted_sender_leaves_the_request_to_a_waiting_call(self):
+        release = threading.Event()
+        sends = []
+
+        def send():
+            sends.append(1)
+            if len(sends) == 1:
+                release.wait(5)
+                raise KeyboardInterrupt()
+            return 'response'
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(self.coalescer.do, 'key', send)
+            time.sleep(0.1)
+            follower = executor.submit(self.coalescer.do, 'key', send)
+            time.sleep(0.1)
+            release.set()
+
+            with self.assertRaises(KeyboardInterrupt):
+                leader.result()
+            self.assertEqual(follower.result(), ('response', False))
+
+        self.assertEqual(len(sends), 2)
+
+    def test_cancelled_sender_leaves_the_request_to_a_waiting_call(self):
+        sends = []
+
+        async def send():
+            sends.append(1)
+            await asyncio.sleep(0.1)
+            return 'response'
+
+        async def run():
+            leader = asyncio.ensure_future(self.coalescer.do_async('key', send))
+            await asyncio.sleep(0.01)
+            follower = asyncio.ensure_future(self.coalescer.do_async('key', send))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(leader, 0.01)
+            return await follower
+
+        self.assertEqual(asyncio.run(run()), ('response', False))
+        self.assertEqual(len(sends), 2)
+        self.assertEqual(len(self.coalescer), 0)
+
+if __name__ == '__main__':
+    unittest.main()
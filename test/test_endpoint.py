@@ -0,0 +1,29 @@
+import unittest
+
+from appwrite.endpoint import Endpoint
+from appwrite.enums.adapter import Adapter
+
+class TestEndpoint(unittest.TestCase):
+
+    def test_format_path(self):
+        endpoint = Endpoint('get', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}')
+
+        self.assertEqual(endpoint.params, ('databaseId', 'tableId', 'rowId'))
+        self.assertEqual(endpoint.format_path(['db', 'tbl', 'row']), '/tablesdb/db/tables/tbl/rows/row')
+
+    def test_format_path_without_params(self):
+        self.assertEqual(Endpoint('get', '/locale').format_path(), '/locale')
+
+    def test_enums_are_formatted_by_value(self):
+        self.assertEqual(Endpoint('get', '/adapters/{adapter}').format_path([Adapter.SSR]), '/adapters/ssr')
+
+    def test_body_kind(self):
+        self.assertEqual(Endpoint('post', '/teams', {'content-type': 'application/json'}).body, 'json')
+        self.assertEqual(Endpoint('post', '/files', {'content-type': 'multipart/form-data'}).body, 'multipart')
+        self.assertIsNone(Endpoint('get', '/teams', {'accept': 'application/json'}).body)
+
+    def test_request_headers(self):
+        headers = {'accept': 'application/json'}
+
+        self.assertEqual(Endpoint('get', '/teams', headers).request_headers('p'), {'X-Appwrite-Project': 'p', 'accept': 'application/json'})
+        self.assertEqual(Endpoint('get', '/teams', headers, project=False).request_headers('p'), headers)
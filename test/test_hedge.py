@@ -0,0 +1,58 @@
+import unittest
+
+from appwrite.exception import AppwriteException
+from appwrite.hedge import HedgePolicy
+
+class TestHedgePolicy(unittest.TestCase):
+
+    def test_rejects_invalid_settings(self):
+        with self.assertRaises(AppwriteException):
+            HedgePolicy(percentile=1)
+
+        with self.assertRaises(AppwriteException):
+            HedgePolicy(min_delay=1, max_delay=0.5)
+
+        with self.assertRaises(AppwriteException):
+            HedgePolicy(min_samples=10, window=5)
+
+    def test_applies_to_get_routes(self):
+        policy = HedgePolicy(routes=['/tablesdb/*/tables/*/rows/*'])
+
+        self.assertTrue(policy.applies('get', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}'))
+        self.assertFalse(policy.applies('get', '/teams'))
+        self.assertFalse(policy.applies('patch', '/tablesdb/{databaseId}/tables/{tableId}/rows/{rowId}'))
+        self.assertTrue(HedgePolicy().applies('get', '/teams'))
+
+    def test_delay_is_the_percentile_of_recent_latencies(self):
+        policy = HedgePolicy(percentile=0.9, min_samples=10, window=10, max_delay=10)
+
+        for latency in range(1, 10):
+            policy.record('/teams', latency / 100)
+        self.assertIsNone(policy.delay('/teams'))
+
+        policy.record('/teams', 0.1)
+        self.assertAlmostEqual(policy.delay('/teams'), 0.1)
+
+        for _ in range(10):
+            policy.record('/teams', 0.02)
+        self.assertAlmostEqual(policy.delay('/teams'), 0.02)
+
+    def test_delay_is_clamped(self):
+        policy = HedgePolicy(min_delay=0.05, max_delay=0.5, min_samples=1)
+
+        policy.record('/fast', 0.001)
+        policy.record('/slow', 3.0)
+
+        self.assertEqual(policy.delay('/fast'), 0.05)
+        self.assertEqual(policy.delay('/slow'), 0.5)
+
+    def test_stats(self):
+        policy = HedgePolicy(min_samples=1, min_delay=0)
+        policy.record('/teams', 0.2)
+        policy.record_hedge('/teams', True)
+        policy.record_hedge('/teams', False)
+
+        self.assertEqual(policy.stats(), {'/teams': {'hedges': 2, 'wins': 1, 'delay': 0.2}})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from appwrite.endpoint import Endpoint
+from appwrite.exception import AppwriteException
+from appwrite.hooks import LatencyHistogram, RequestEvent
+
+def finished(method, path, duration, endpoint=None, error=None, kind='call'):
+    event = RequestEvent(method, path, endpoint, kind)
+    event.finished_at = event.started_at + duration
+    event.error = error
+    event.status = error.code if error is not None else 200
+    return event
+
+class TestRequestEvent(unittest.TestCase):
+
+    def test_route_uses_the_path_template(self):
+        endpoint = Endpoint('get', '/teams/{teamId}')
+
+        self.assertEqual(RequestEvent('get', '/teams/a', endpoint).route, '/teams/{teamId}')
+        self.assertEqual(RequestEvent('get', '/teams/a').route, '/teams/a')
+
+    def test_duration(self):
+        self.assertEqual(finished('get', '/teams', 0.5).duration, 0.5)
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_aggregates_per_route(self):
+        endpoint = Endpoint('get', '/teams/{teamId}')
+        histogram = LatencyHistogram(buckets=(0.1, 1))
+
+        histogram.after_response(finished('get', '/teams/a', 0.05, endpoint))
+        histogram.after_response(finished('get', '/teams/b', 0.5, endpoint))
+        histogram.on_error(finished('get', '/teams/c', 2, endpoint, AppwriteException('Timeout')))
+
+        stats = histogram.snapshot()['GET /teams/{teamId}']
+        self.assertEqual(stats['count'], 3)
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['max'], 2)
+        self.assertAlmostEqual(stats['sum'], 2.55)
+        self.assertEqual(stats['buckets'], {0.1: 1, 1: 1, float('inf'): 1})
+
+    def test_uploads_are_kept_apart_from_their_chunks(self):
+        endpoint = Endpoint('post', '/storage/buckets/{bucketId}/files')
+        probe = Endpoint('get', '/storage/buckets/{bucketId}/files/{fileId}')
+        histogram = LatencyHistogram()
+
+        histogram.on_error(finished('get', '/storage/buckets/b/files/f', 0.01, probe, AppwriteException('Not found', 404), 'probe'))
+        histogram.on_error(finished('get', '/storage/buckets/b/files/f', 0.01, probe, AppwriteException('Unavailable', 503), 'probe'))
+        histogram.after_response(finished('post', '/storage/buckets/b/files', 0.1, endpoint))
+        histogram.after_response(finished('post', '/storage/buckets/b/files', 0.1, endpoint))
+        histogram.after_response(finished('post', '/storage/buckets/b/files', 0.3, endpoint, kind='upload'))
+
+        stats = histogram.snapshot()
+        self.assertEqual(stats['GET /storage/buckets/{bucketId}/files/{fileId}']['errors'], 1)
+        self.assertEqual(stats['POST /storage/buckets/{bucketId}/files']['count'], 2)
+        self.assertEqual(stats['UPLOAD /storage/buckets/{bucketId}/files']['count'], 1)
+        self.assertAlmostEqual(stats['UPLOAD /storage/buckets/{bucketId}/files']['sum'], 0.3)
+
+    def test_percentile(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1))
+        for duration in [0.05] * 9 + [3]:
+            histogram.after_response(finished('get', '/teams', duration))
+
+        self.assertEqual(histogram.percentile('GET /teams', 0.5), 0.1)
+        self.assertEqual(histogram.percentile('GET /teams', 0.99), 3)
+        self.assertIsNone(histogram.percentile('GET /users', 0.5))
+
+    def test_cached_responses_are_skipped(self):
+        histogram = LatencyHistogram()
+        event = finished('get', '/teams', 0.01)
+        event.cached = True
+
+        histogram.after_response(event)
+
+        self.assertEqual(histogram.snapshot(), {})
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.after_response(finished('get', '/teams', 0.01))
+        histogram.reset()
+
+        self.assertEqual(histogram.snapshot(), {})
@@ -0,0 +1,57 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+import appwrite
+import appwrite.models
+
+def imported_modules(statement):
+    """Run an import in a fresh interpreter with -X importtime and return the appwrite modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(re.findall(r'\|\s*(appwrite[\w.]*)\s*$', result.stderr, re.M))
+
+def model_modules(modules):
+    return {module for module in modules if module.startswith('appwrite.models.')}
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_client_does_not_import_models_or_enums(self):
+        modules = imported_modules('import appwrite.client')
+
+        self.assertEqual(model_modules(modules), {'appwrite.models.base_model'})
+        self.assertFalse([module for module in modules if module.startswith('appwrite.enums.')])
+
+    def test_service_only_imports_the_models_it_uses(self):
+        with open(os.path.join(os.path.dirname(appwrite.__file__), 'services', 'locale.py')) as service:
+            used = set(re.findall(r'^from \.\.models\.(\w+) import', service.read(), re.M))
+
+        modules = imported_modules('import appwrite.client, appwrite.services.locale')
+        expected = imported_modules('import ' + ', '.join(f'appwrite.models.{module}' for module in used))
+
+        self.assertEqual(model_modules(modules), model_modules(expected))
+        self.assertNotIn('appwrite.models.row', modules)
+
+    def test_models_are_resolved_on_access(self):
+        from appwrite.models import Row
+        from appwrite.models.row import Row as RowClass
+
+        self.assertIs(Row, RowClass)
+        self.assertIn('Row', dir(appwrite.models))
+
+    def test_star_import_exposes_every_model(self):
+        namespace = {}
+        exec('from appwrite.models import *', namespace)
+
+        for name in appwrite.models.__all__:
+            self.assertIn(name, namespace)
+
+    def test_unknown_model(self):
+        with self.assertRaises(AttributeError):
+            appwrite.models.NotAModel
@@ -0,0 +1,63 @@
+import json
+import requests_mock
+import unittest
+
+from appwrite.client import Client
+from appwrite.encoders.json_codec import JsonCodec, MsgspecCodec, OrjsonCodec, default_json_codec
+from appwrite.enums.adapter import Adapter
+from appwrite.exception import AppwriteException
+from appwrite.models.base_model import AppwriteModel
+
+class Point(AppwriteModel):
+    x: int
+    y: int
+
+def available_codecs():
+    codecs = [JsonCodec()]
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec())
+        except AppwriteException:
+            pass
+    return codecs
+
+class TestJsonCodec(unittest.TestCase):
+
+    def test_encodes_enums_and_models(self):
+        value = {'adapter': Adapter.SSR, 'point': Point(x=1, y=2), 'points': [Point(x=3, y=4)], 'name': 'ü'}
+
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(json.loads(codec.encode(value)), {
+                    'adapter': 'ssr',
+                    'point': {'x': 1, 'y': 2},
+                    'points': [{'x': 3, 'y': 4}],
+                    'name': 'ü',
+                })
+
+    def test_decodes_bytes(self):
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.decode('{"total": 1, "rows": [{"$id": "ü"}]}'.encode()), {'total': 1, 'rows': [{'$id': 'ü'}]})
+
+    def test_rejects_unknown_values(self):
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                with self.assertRaises(TypeError):
+                    codec.encode({'value': object()})
+
+    def test_default_prefers_installed_fast_codecs(self):
+        codecs = available_codecs()
+        expected = codecs[1] if len(codecs) > 1 else codecs[0]
+
+        self.assertEqual(default_json_codec().name, expected.name)
+
+    @requests_mock.Mocker()
+    def test_client_uses_configured_codec(self, m):
+        m.post(requests_mock.ANY, text=json.dumps({'$id': 'a'}), headers={'Content-Type': 'application/json'})
+        client = Client().set_json_codec(JsonCodec())
+
+        response = client.call('post', '/teams', {'content-type': 'application/json'}, {'name': 'a', 'adapter': Adapter.STATIC})
+
+        self.assertEqual(response, {'$id': 'a'})
+        self.assertEqual(m.last_request.body, '{"name": "a", "adapter": "static"}')
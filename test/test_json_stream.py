@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from appwrite.encoders.json_stream import JsonItemStream
+from appwrite.exception import AppwriteException
+
+def chunked(data, size):
+    data = data.encode() if isinstance(data, str) else data
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+class TestJsonItemStream(unittest.TestCase):
+
+    def setUp(self):
+        self.page = {
+            'total': 1234567,
+            'rows': [{'$id': f'row{i}', 'title': f'Tïtle {i} ✓', 'score': i * 1.5, 'tags': ['a', None, True]} for i in range(20)],
+            'after': {'nested': [1, 2, {'x': 'y'}]},
+        }
+
+    def test_items_and_fields_for_every_chunk_size(self):
+        body = json.dumps(self.page, ensure_ascii=False, indent=1)
+        for size in (1, 2, 3, 7, 64, len(body) * 4):
+            with self.subTest(size=size):
+                stream = JsonItemStream(chunked(body, size), 'rows')
+
+                self.assertEqual(list(stream), self.page['rows'])
+                self.assertEqual(stream.fields, {'total': 1234567, 'after': {'nested': [1, 2, {'x': 'y'}]}})
+
+    def test_fields_before_the_array_are_known_with_the_first_item(self):
+        stream = JsonItemStream(chunked(json.dumps(self.page), 5), 'rows')
+
+        next(iter(stream))
+
+        self.assertEqual(stream.fields, {'total': 1234567})
+
+    def test_items_are_yielded_before_the_body_ends(self):
+        body = chunked(json.dumps(self.page), 16)
+        consumed = []
+
+        def chunks():
+            for chunk in body:
+                consumed.append(chunk)
+                yield chunk
+
+        next(iter(JsonItemStream(chunks(), 'rows')))
+
+        self.assertLess(len(consumed), len(body) // 2)
+
+    def test_empty_and_missing_arrays(self):
+        self.assertEqual(list(JsonItemStream([b'{"total": 0, "rows": []}'], 'rows')), [])
+        self.assertEqual(list(JsonItemStream([b'{}'], 'rows')), [])
+
+        stream = JsonItemStream([b'{"total": 0, "rows": null}'], 'rows')
+        self.assertEqual(list(stream), [])
+        self.assertEqual(stream.fields, {'total': 0, 'rows': None})
+
+    def test_invalid_json(self):
+        for body in ('{"rows": [{"a": 1}', '{"rows": [{"a": 1} {"b": 2}]}', '{"rows": [{"a": }]}', '[1, 2]', '{"total" 1}', ''):
+            with self.subTest(body=body):
+                with self.assertRaises(AppwriteException):
+                    list(JsonItemStream(chunked(body, 3), 'rows'))
@@ -0,0 +1,121 @@
+import json
+import pickle
+import unittest
+
+import requests_mock
+
+from appwrite.client import Client
+from appwrite.models import DocumentList, Row, RowList
+from appwrite.models.lazy_list import LazyList
+from appwrite.services.tables_db import TablesDB
+
+ROW = {
+    "$id": "a",
+    "$sequence": "1",
+    "$tableId": "<TABLE_ID>",
+    "$databaseId": "<DATABASE_ID>",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "$permissions": [],
+    "title": "A",
+}
+
+ROWS = [ROW, {**ROW, "$id": "b", "title": "B"}, {**ROW, "$id": "c", "title": "C"}]
+
+DOCUMENT = {**{key: value for key, value in ROW.items() if key != "$tableId"}, "$collectionId": "<COLLECTION_ID>"}
+
+class TestLazyList(unittest.TestCase):
+
+    def setUp(self):
+        self.built = []
+        self.items = [{'id': i} for i in range(5)]
+
+        def build(item):
+            self.built.append(item['id'])
+            return ('model', item['id'])
+
+        self.lazy = LazyList(self.items, build)
+
+    def test_items_are_built_once_when_read(self):
+        self.assertEqual(len(self.lazy), 5)
+        self.assertEqual(self.lazy.built, 0)
+
+        self.assertEqual(self.lazy[1], ('model', 1))
+        self.assertIs(self.lazy[1], self.lazy[1])
+        self.assertEqual(self.lazy[-1], ('model', 4))
+        self.assertEqual(self.built, [1, 4])
+        self.assertEqual(self.lazy.built, 2)
+
+        self.assertEqual(self.lazy[:3], [('model', 0), ('model', 1), ('model', 2)])
+        self.assertEqual(list(self.lazy), [('model', i) for i in range(5)])
+        self.assertEqual(self.built, [1, 4, 0, 2, 3])
+
+    def test_decoded_items_are_not_changed(self):
+        list(self.lazy)
+
+        self.assertEqual(self.items, [{'id': i} for i in range(5)])
+
+    def test_mutation(self):
+        self.lazy.append('appended')
+        self.lazy[0] = 'replaced'
+        del self.lazy[1]
+        self.lazy.insert(0, 'inserted')
+
+        self.assertEqual(self.lazy, ['inserted', 'replaced', ('model', 2), ('model', 3), ('model', 4), 'appended'])
+        self.assertEqual(self.built, [2, 3, 4])
+
+    def test_index_error(self):
+        with self.assertRaises(IndexError):
+            self.lazy[5]
+
+class TestLazyRows(unittest.TestCase):
+
+    def test_trusted_rows_are_built_on_access(self):
+        page = RowList.with_data({'total': 3, 'rows': ROWS}, dict, True)
+
+        self.assertIsInstance(page.rows, LazyList)
+        self.assertEqual(page.total, 3)
+        self.assertEqual(page.rows.built, 0)
+
+        first = page.rows[0]
+        self.assertIsInstance(first, Row)
+        self.assertEqual(first.data, {'title': 'A'})
+        self.assertEqual(page.rows.built, 1)
+
+    def test_strict_rows_are_built_up_front(self):
+        page = RowList.with_data({'total': 1, 'rows': [ROW]})
+
+        self.assertIsInstance(page.rows, list)
+
+    def test_dump_builds_every_row(self):
+        data = {'total': 2, 'rows': ROWS[:2]}
+        strict = RowList.with_data(data)
+
+        self.assertEqual(RowList.with_data(data, dict, True).to_dict(), strict.to_dict())
+        self.assertEqual(RowList.with_data(data, dict, True).to_json(), strict.to_json())
+        self.assertEqual(RowList.with_data(data, dict, True), strict)
+
+    def test_pickle(self):
+        data = {'total': 2, 'rows': ROWS[:2]}
+        page = RowList.with_data(data, dict, True)
+        page.rows[0]
+        documents = DocumentList.with_data({'total': 1, 'documents': [DOCUMENT]}, dict, True)
+
+        self.assertEqual(pickle.loads(pickle.dumps(page)), RowList.with_data(data))
+        self.assertEqual(pickle.loads(pickle.dumps(documents)).documents[0].id, 'a')
+
+    def test_documents(self):
+        page = DocumentList.with_data({'total': 1, 'documents': [DOCUMENT]}, dict, True)
+
+        self.assertIsInstance(page.documents, LazyList)
+        self.assertEqual(page.documents[0].id, 'a')
+
+    @requests_mock.Mocker()
+    def test_paginate_trusted_pages(self, m):
+        pages = [ROWS[:2], ROWS[2:]]
+        m.get(requests_mock.ANY, [{'text': json.dumps({'total': 3, 'rows': rows}), 'headers': {'Content-Type': 'application/json'}} for rows in pages])
+        tables_db = TablesDB(Client().set_parse_mode('trusted'))
+
+        ids = [item.id for item in tables_db.paginate(tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', page_size=2)]
+
+        self.assertEqual(ids, ['a', 'b', 'c'])
@@ -0,0 +1,41 @@
+import unittest
+
+from appwrite.encoders.params_encoder import flatten
+from appwrite.enums.adapter import Adapter
+from appwrite.models.base_model import AppwriteModel
+
+class Point(AppwriteModel):
+    x: int
+    y: int
+
+class TestFlatten(unittest.TestCase):
+
+    def test_nested_params(self):
+        self.assertEqual(flatten({
+            'queries': ['a', 'b'],
+            'data': {'title': 'Hello', 'tags': [1, 2], 'rows': [{'$id': 'r'}]},
+        }), {
+            'queries[0]': 'a',
+            'queries[1]': 'b',
+            'data[title]': 'Hello',
+            'data[tags][0]': 1,
+            'data[tags][1]': 2,
+            'data[rows][0][$id]': 'r',
+        })
+
+    def test_stringify(self):
+        self.assertEqual(flatten({'enabled': True, 'limit': 25, 'empty': False}, stringify=True), {
+            'enabled': 'true',
+            'limit': '25',
+            'empty': 'false',
+        })
+
+    def test_enums_and_models_are_encoded(self):
+        self.assertEqual(flatten({'adapters': [Adapter.SSR], 'point': Point(x=1, y=2)}, stringify=True), {
+            'adapters[0]': 'ssr',
+            'point[x]': '1',
+            'point[y]': '2',
+        })
+
+    def test_prefix(self):
+        self.assertEqual(flatten(['a'], 'queries'), {'queries[0]': 'a'})
@@ -0,0 +1,103 @@
+import pickle
+import unittest
+
+from appwrite.enums.execution_status import ExecutionStatus
+from appwrite.models import Document, Execution, File, Row
+from appwrite.records import DocumentRecord, ExecutionRecord, FileRecord, Record, RowRecord, record_type
+
+ROW = {
+    "$id": "5e5ea5c16897e",
+    "$sequence": "1",
+    "$tableId": "<TABLE_ID>",
+    "$databaseId": "<DATABASE_ID>",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "$permissions": ["read(\"any\")"],
+    "title": "Hello",
+    "tags": ["a", "b"],
+}
+
+EXECUTION = {
+    "$id": "5e5ea5c16897e",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "$permissions": ["any"],
+    "functionId": "5e5ea6g16897e",
+    "deploymentId": "5e5ea5c16897e",
+    "trigger": "http",
+    "status": "processing",
+    "requestMethod": "GET",
+    "requestPath": "/articles?id=5",
+    "requestHeaders": [{"name": "Content-Type", "value": "application/json"}],
+    "responseStatusCode": 200.0,
+    "responseBody": "",
+    "responseHeaders": [],
+    "logs": "",
+    "errors": "",
+    "duration": 0.4,
+}
+
+class TestRecords(unittest.TestCase):
+
+    def test_row_round_trip(self):
+        row = Row.with_data(ROW)
+        record = row.to_record()
+
+        self.assertIsInstance(record, RowRecord)
+        self.assertEqual(record.id, '5e5ea5c16897e')
+        self.assertEqual(record.permissions, ('read("any")',))
+        self.assertEqual(record.data, {'title': 'Hello', 'tags': ['a', 'b']})
+        self.assertEqual(record.to_model(), row)
+        self.assertEqual(record.to_dict(), row.to_dict())
+        self.assertEqual(RowRecord.from_dict(ROW), record)
+
+    def test_nested_models_and_enums(self):
+        execution = Execution.model_validate(EXECUTION)
+        record = execution.to_record()
+
+        self.assertIs(record.status, ExecutionStatus.PROCESSING)
+        self.assertIsInstance(record.requestheaders[0], Record)
+        self.assertEqual(record.requestheaders[0].name, 'Content-Type')
+        self.assertEqual(ExecutionRecord.from_dict(EXECUTION), record)
+        self.assertEqual(record.to_model(), execution)
+
+    def test_undeclared_fields_are_kept(self):
+        file = {'$id': 'f', 'bucketId': 'b', 'name': 'a.png', 'colorProfile': 'sRGB'}
+        record = FileRecord.from_dict(file)
+
+        self.assertIsNone(record.signature)
+        self.assertEqual(record.extra, {'colorProfile': 'sRGB'})
+        self.assertEqual(File.from_trusted(file).to_record().extra, {'colorProfile': 'sRGB'})
+
+    def test_records_are_immutable(self):
+        record = RowRecord.from_dict(ROW)
+
+        with self.assertRaises(AttributeError):
+            record.id = 'other'
+        with self.assertRaises(AttributeError):
+            record.title = 'other'
+
+    def test_hash_and_equality(self):
+        record = RowRecord.from_dict(ROW)
+        same = Row.with_data(ROW).to_record()
+        changed = RowRecord.from_dict({**ROW, 'title': 'Changed'})
+
+        self.assertEqual(hash(record), hash(same))
+        self.assertEqual(len({record, same, changed}), 2)
+        self.assertNotEqual(record, changed)
+        self.assertNotEqual(record, tuple(record))
+
+        document = {**ROW, '$collectionId': '<COLLECTION_ID>'}
+        del document['$tableId']
+        self.assertNotEqual(DocumentRecord.from_dict(document), RowRecord.from_dict(ROW))
+        self.assertEqual(Document.with_data(document).to_record(), DocumentRecord.from_dict(document))
+
+    def test_pickle(self):
+        record = Execution.model_validate(EXECUTION).to_record()
+
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+    def test_record_types_are_shared(self):
+        self.assertIs(record_type(Row), RowRecord)
+        self.assertIs(record_type(Row[dict]), RowRecord)
+        self.assertEqual(repr(RowRecord.from_dict({'$id': 'a'}))[:22], "RowRecord(id='a', sequ")
@@ -0,0 +1,61 @@
+import unittest
+from email.utils import formatdate
+from unittest import mock
+
+from appwrite.exception import AppwriteException
+from appwrite.retry import RetryPolicy
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(max_attempts=10, backoff=0.5, max_backoff=3, jitter=False)
+
+        self.assertEqual([policy.delay(attempt) for attempt in range(1, 6)], [0.5, 1, 2, 3, 3])
+
+    def test_full_jitter(self):
+        policy = RetryPolicy(backoff=1)
+
+        with mock.patch('appwrite.retry.random.uniform', return_value=0.25) as uniform:
+            self.assertEqual(policy.delay(2), 0.25)
+
+        uniform.assert_called_once_with(0, 2.0)
+
+    def test_retry_after_takes_precedence(self):
+        policy = RetryPolicy(max_backoff=10)
+
+        self.assertEqual(policy.delay(1, retry_after=4), 4)
+        self.assertEqual(policy.delay(1, retry_after=60), 10)
+        self.assertEqual(RetryPolicy(jitter=False, respect_retry_after=False).delay(1, retry_after=4), 0.5)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(RetryPolicy.parse_retry_after('3'), 3)
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+        self.assertIsNone(RetryPolicy.parse_retry_after('soon'))
+
+        with mock.patch('appwrite.retry.time.time', return_value=1000000000):
+            self.assertEqual(RetryPolicy.parse_retry_after(formatdate(1000000030, usegmt=True)), 30)
+
+    def test_only_transient_failures_are_retried(self):
+        policy = RetryPolicy(jitter=False)
+
+        self.assertEqual(policy.retry_delay('get', {}, 1, status=503), 0.5)
+        self.assertEqual(policy.retry_delay('get', {}, 1, connection_error=True), 0.5)
+        self.assertIsNone(policy.retry_delay('get', {}, 1, status=404))
+        self.assertIsNone(policy.retry_delay('get', {}, 3, status=503))
+
+    def test_writes_need_an_idempotency_key(self):
+        policy = RetryPolicy(jitter=False)
+
+        self.assertIsNone(policy.retry_delay('post', {}, 1, status=503))
+        self.assertIsNone(policy.retry_delay('patch', {}, 1, connection_error=True))
+        self.assertEqual(policy.retry_delay('put', {}, 1, status=503), 0.5)
+        self.assertEqual(policy.retry_delay('post', {'Idempotency-Key': 'abc'}, 1, status=503), 0.5)
+        self.assertEqual(policy.retry_delay('post', {'content-range': 'bytes 0-9/20', 'x-appwrite-id': 'file'}, 1, status=503), 0.5)
+        self.assertIsNone(policy.retry_delay('post', {'content-range': 'bytes 0-9/20'}, 1, status=503))
+
+    def test_rejects_invalid_settings(self):
+        with self.assertRaises(AppwriteException):
+            RetryPolicy(max_attempts=0)
+
+        with self.assertRaises(AppwriteException):
+            RetryPolicy(backoff=-1)
@@ -0,0 +1,585 @@
+import io
+import json
+import os
+import requests
+import requests_mock
+import tempfile
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+from appwrite.client import Client
+from appwrite.enums.adapter import Adapter
+from appwrite.exception import AppwriteException
+from appwrite.input_file import InputFile
+from appwrite.models import ColumnBoolean, RowList, Table
+from appwrite.query import Query
+from appwrite.retry import RetryPolicy
+from appwrite.services.locale import Locale
+from appwrite.services.storage import Storage
+from appwrite.services.tables_db import TablesDB
+
+def row(row_id):
+    return {
+        "$id": row_id,
+        "$sequence": "1",
+        "$tableId": "<TABLE_ID>",
+        "$databaseId": "<DATABASE_ID>",
+        "$createdAt": "2020-10-15T06:38:00.000+00:00",
+        "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+        "$permissions": [],
+    }
+
+class TestServiceSerialization(unittest.TestCase):
+
+    @requests_mock.Mocker()
+    def test_nested_enums_are_encoded_without_copying_params(self, m):
+        m.post(requests_mock.ANY, text=json.dumps(row('r')), headers={'Content-Type': 'application/json'})
+        data = {'adapter': Adapter.SSR, 'history': [{'adapter': Adapter.STATIC}]}
+
+        TablesDB(Client()).create_row('<DATABASE_ID>', '<TABLE_ID>', 'r', data)
+
+        self.assertEqual(json.loads(m.last_request.body)['data'], {'adapter': 'ssr', 'history': [{'adapter': 'static'}]})
+        self.assertIs(data['history'][0]['adapter'], Adapter.STATIC)
+
+    @requests_mock.Mocker()
+    def test_query_params_are_flattened(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({'total': 0, 'rows': []}), headers={'Content-Type': 'application/json'})
+
+        TablesDB(Client()).list_rows('<DATABASE_ID>', '<TABLE_ID>', [Query.limit(1), Query.offset(2)])
+
+        query = parse_qs(urlparse(m.last_request.url).query)
+        self.assertEqual(query['queries[0]'], [Query.limit(1)])
+        self.assertEqual(query['queries[1]'], [Query.offset(2)])
+
+class TestServicePaginate(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.tables_db = TablesDB(self.client)
+        self.ids = [f'row{i}' for i in range(7)]
+        self.requests = []
+
+    def mock_rows(self, m):
+        def callback(request, context):
+            queries = [json.loads(value) for key, values in parse_qs(urlparse(request.url).query).items() if key.startswith('queries') for value in values]
+            self.requests.append((queries, request.qs.get('total')))
+            limit = next(query['values'][0] for query in queries if query['method'] == 'limit')
+            cursors = [query['values'][0] for query in queries if query['method'] == 'cursorAfter']
+            start = self.ids.index(cursors[0]) + 1 if cursors else 0
+            return json.dumps({'total': 0, 'rows': [row(row_id) for row_id in self.ids[start:start + limit]]})
+
+        m.get(requests_mock.ANY, text=callback, headers={'Content-Type': 'application/json'})
+
+    @requests_mock.Mocker()
+    def test_paginate_follows_cursors(self, m):
+        self.mock_rows(m)
+
+        rows = list(self.tables_db.paginate(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', page_size=3))
+
+        self.assertEqual([item.id for item in rows], self.ids)
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(self.requests[0][1], ['false'])
+        self.assertEqual(self.requests[2][0][-1], json.loads(Query.cursor_after('row5')))
+
+    @requests_mock.Mocker()
+    def test_paginate_stops_after_exact_last_page(self, m):
+        self.ids = self.ids[:6]
+        self.mock_rows(m)
+
+        rows = list(self.tables_db.paginate(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', page_size=3))
+
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(len(self.requests), 3)
+
+    @requests_mock.Mocker()
+    def test_paginate_in_every_parse_mode(self, m):
+        self.mock_rows(m)
+
+        for mode in ('strict', 'trusted', 'raw'):
+            with self.subTest(mode=mode), self.client.parse_mode(mode):
+                rows = list(self.tables_db.paginate(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', page_size=3, prefetch=True))
+
+                ids = [item['$id'] for item in rows] if mode == 'raw' else [item.id for item in rows]
+                self.assertEqual(ids, self.ids)
+
+    @requests_mock.Mocker()
+    def test_paginate_keeps_user_queries(self, m):
+        self.mock_rows(m)
+
+        list(self.tables_db.paginate(
+            self.tables_db.list_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            queries=[Query.equal('status', 'active')],
+            page_size=5,
+        ))
+
+        for queries, _ in self.requests:
+            self.assertEqual(queries[0], json.loads(Query.equal('status', 'active')))
+
+    @requests_mock.Mocker()
+    def test_paginate_with_prefetch(self, m):
+        self.mock_rows(m)
+
+        rows = list(self.tables_db.paginate(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', page_size=2, prefetch=True))
+
+        self.assertEqual([item.id for item in rows], self.ids)
+
+    @requests_mock.Mocker()
+    def test_paginate_stops_when_closed(self, m):
+        self.mock_rows(m)
+
+        rows = self.tables_db.paginate(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', page_size=2, prefetch=True)
+        self.assertEqual(next(rows).id, 'row0')
+        rows.close()
+
+        self.assertLessEqual(len(self.requests), 2)
+
+    def test_paginate_rejects_invalid_page_size(self):
+        with self.assertRaises(AppwriteException):
+            next(self.tables_db.paginate(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', page_size=0))
+
+    @requests_mock.Mocker()
+    def test_paginate_rejects_non_list_response(self, m):
+        m.get(requests_mock.ANY, text=json.dumps({'ip': '127.0.0.1', 'countryCode': 'US', 'country': 'United States', 'continentCode': 'NA', 'continent': 'North America', 'eu': False, 'currency': 'USD'}), headers={'Content-Type': 'application/json'})
+        locale = Locale(self.client)
+
+        with self.assertRaises(AppwriteException):
+            next(locale.paginate(lambda queries: locale.get()))
+
+class Article:
+    def __init__(self, title, views=0):
+        self.title = title
+        self.views = views
+
+class TestServiceParseModes(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.tables_db = TablesDB(self.client)
+
+    def mock(self, m, data):
+        m.get(requests_mock.ANY, text=json.dumps(data), headers={'Content-Type': 'application/json'})
+
+    @requests_mock.Mocker()
+    def test_trusted_builds_the_same_models(self, m):
+        rows = {'total': 2, 'rows': [{**row('a'), 'title': 'A', 'views': 3}, {**row('b'), 'data': {'title': 'B'}}]}
+        self.mock(m, rows)
+
+        strict = self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>')
+        self.client.set_parse_mode('trusted')
+        trusted = self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>')
+
+        self.assertIsInstance(trusted, RowList)
+        self.assertEqual(trusted.to_dict(), strict.to_dict())
+        self.assertEqual(trusted.rows[1].id, 'b')
+        self.assertEqual(trusted.rows[1].data, {'title': 'B'})
+
+        typed = self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>', model_type=Article)
+        self.assertIsInstance(typed.rows[0].data, Article)
+        self.assertEqual(typed.rows[0].data.views, 3)
+
+    @requests_mock.Mocker()
+    def test_trusted_validates_enums_and_unions(self, m):
+        column = {'key': 'done', 'type': 'boolean', 'status': 'available', 'error': '', 'required': False, '$createdAt': '', '$updatedAt': ''}
+        self.mock(m, {'$id': 't', '$createdAt': '', '$updatedAt': '', '$permissions': [], 'databaseId': 'd', 'name': 'T', 'enabled': True, 'rowSecurity': False, 'columns': [column], 'indexes': [], 'bytesMax': 1.0, 'bytesUsed': 0.0})
+
+        strict = self.tables_db.get_table('<DATABASE_ID>', '<TABLE_ID>')
+        with self.client.parse_mode('trusted'):
+            trusted = self.tables_db.get_table('<DATABASE_ID>', '<TABLE_ID>')
+
+        self.assertIsInstance(trusted, Table)
+        self.assertIsInstance(trusted.columns[0], ColumnBoolean)
+        self.assertIs(type(trusted.columns[0]), type(strict.columns[0]))
+        self.assertEqual(trusted.columns[0].status, strict.columns[0].status)
+        self.assertEqual(trusted.to_dict(), strict.to_dict())
+
+    @requests_mock.Mocker()
+    def test_only_strict_rejects_invalid_responses(self, m):
+        self.mock(m, {'total': 1, 'rows': [{'$id': 'a'}]})
+
+        with self.assertRaises(AppwriteException):
+            self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>')
+
+        with self.client.parse_mode('trusted'):
+            self.assertEqual(self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>').rows[0].id, 'a')
+
+    @requests_mock.Mocker()
+    def test_raw_returns_decoded_json(self, m):
+        rows = {'total': 1, 'rows': [row('a')]}
+        self.mock(m, rows)
+
+        with self.client.parse_mode('raw'):
+            self.assertEqual(self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>'), rows)
+
+        self.assertIsInstance(self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>'), RowList)
+
+    def test_parse_mode_override_and_validation(self):
+        self.client.set_parse_mode('raw')
+        with self.client.parse_mode('trusted'):
+            self.assertEqual(self.client.get_parse_mode(), 'trusted')
+        self.assertEqual(self.client.get_parse_mode(), 'raw')
+
+        with self.assertRaises(AppwriteException):
+            self.client.set_parse_mode('fast')
+
+        with self.assertRaises(AppwriteException):
+            with self.client.parse_mode('fast'):
+                pass
+
+class TestServiceBulkWrite(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.tables_db = TablesDB(self.client)
+        self.batches = []
+        self.failures = {}
+        self.failure_status = 503
+
+    def mock_create_rows(self, m):
+        def callback(request, context):
+            rows = request.json()['rows']
+            self.batches.append([item['$id'] for item in rows])
+            batch_key = tuple(item['$id'] for item in rows)
+            if self.failures.get(batch_key, 0) > 0:
+                self.failures[batch_key] -= 1
+                context.status_code = self.failure_status
+                return json.dumps({'message': 'Service unavailable', 'type': 'general_unavailable'})
+            if any(item.get('duplicate') for item in rows):
+                context.status_code = 409
+                return json.dumps({'message': 'Row already exists', 'type': 'row_already_exists'})
+            context.status_code = 201
+            return json.dumps({'total': len(rows), 'rows': [row(item['$id']) for item in rows]})
+
+        m.post(requests_mock.ANY, text=callback, headers={'Content-Type': 'application/json'})
+        m.put(requests_mock.ANY, text=callback, headers={'Content-Type': 'application/json'})
+
+    def items(self, count):
+        return ({'$id': f'row{i}', 'title': f'Row {i}'} for i in range(count))
+
+    @requests_mock.Mocker()
+    def test_bulk_write_batches_lazily(self, m):
+        self.mock_create_rows(m)
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.create_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=self.items(25),
+            batch_size=10,
+            workers=2,
+        ))
+
+        self.assertEqual(len(results), 25)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(sorted(len(batch) for batch in self.batches), [5, 10, 10])
+        self.assertEqual(sorted(result.item['$id'] for result in results), sorted(f'row{i}' for i in range(25)))
+
+    @requests_mock.Mocker()
+    def test_bulk_write_retries_transient_errors(self, m):
+        self.mock_create_rows(m)
+        self.failures[tuple(f'row{i}' for i in range(5))] = 2
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.upsert_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=self.items(5),
+            backoff=0,
+        ))
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(len(self.batches), 3)
+
+    @requests_mock.Mocker()
+    def test_bulk_write_gives_up_after_max_retries(self, m):
+        self.mock_create_rows(m)
+        self.failures[tuple(f'row{i}' for i in range(5))] = 5
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.upsert_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=self.items(5),
+            max_retries=1,
+            backoff=0,
+        ))
+
+        self.assertEqual(len(self.batches), 2)
+        self.assertTrue(all(result.error.code == 503 for result in results))
+
+    @requests_mock.Mocker()
+    def test_bulk_write_reports_creates_that_may_have_been_written(self, m):
+        self.mock_create_rows(m)
+        self.failures[tuple(f'row{i}' for i in range(5))] = 1
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.create_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=self.items(5),
+            backoff=0,
+        ))
+
+        self.assertEqual(len(self.batches), 1)
+        self.assertTrue(all(result.error.code == 503 and result.ambiguous for result in results))
+
+    @requests_mock.Mocker()
+    def test_bulk_write_retries_creates_that_were_not_processed(self, m):
+        self.mock_create_rows(m)
+        self.failures[tuple(f'row{i}' for i in range(5))] = 2
+        self.failure_status = 429
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.create_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=self.items(5),
+            backoff=0,
+        ))
+
+        self.assertEqual(len(self.batches), 3)
+        self.assertTrue(all(result.success for result in results))
+
+    @requests_mock.Mocker()
+    def test_bulk_write_leaves_retries_to_the_client_policy(self, m):
+        self.mock_create_rows(m)
+        self.failures[tuple(f'row{i}' for i in range(5))] = 5
+        self.client.set_retry_policy(RetryPolicy(max_attempts=2, backoff=0))
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.upsert_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=self.items(5),
+            backoff=0,
+        ))
+
+        self.assertEqual(len(self.batches), 2)
+        self.assertTrue(all(result.error.code == 503 and result.ambiguous for result in results))
+
+    @requests_mock.Mocker()
+    def test_bulk_write_retries_only_connection_errors(self, m):
+        m.put(requests_mock.ANY, [
+            {'exc': requests.ConnectionError('Connection refused')},
+            {'exc': ValueError('Invalid request')},
+        ])
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.upsert_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=self.items(5),
+            backoff=0,
+        ))
+
+        self.assertEqual(m.call_count, 2)
+        self.assertTrue(all(isinstance(result.error.__cause__, ValueError) for result in results))
+
+    @requests_mock.Mocker()
+    def test_bulk_write_isolates_rejected_items(self, m):
+        self.mock_create_rows(m)
+        items = list(self.items(8))
+        items[5]['duplicate'] = True
+
+        results = list(self.tables_db.bulk_write(
+            self.tables_db.create_rows,
+            '<DATABASE_ID>',
+            '<TABLE_ID>',
+            items=items,
+            batch_size=8,
+        ))
+
+        failed = [result for result in results if not result.success]
+        self.assertEqual(len(results), 8)
+        self.assertEqual([result.item['$id'] for result in failed], ['row5'])
+        self.assertEqual(failed[0].error.code, 409)
+
+    def test_bulk_write_rejects_methods_without_items(self):
+        with self.assertRaises(AppwriteException):
+            next(self.tables_db.bulk_write(self.tables_db.get_row, items=[]))
+
+class FlakyBody(io.RawIOBase):
+    def __init__(self, data, fail_after, error=ConnectionResetError('Connection reset by peer')):
+        self.data = data
+        self.position = 0
+        self.fail_after = fail_after
+        self.error = error
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.fail_after is not None and self.position >= self.fail_after:
+            raise self.error
+        end = len(self.data) if self.fail_after is None else self.fail_after
+        size = min(len(buffer), end - self.position, 4)
+        buffer[:size] = self.data[self.position:self.position + size]
+        self.position += size
+        return size
+
+class TestServiceDownload(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.storage = Storage(self.client)
+        self.data = bytes(range(256)) * 4
+        self.ranges = []
+        self.fail_after = None
+        self.error = ConnectionResetError('Connection reset by peer')
+
+    def mock_download(self, m, honor_range=True):
+        def callback(request, context):
+            header = request.headers.get('range')
+            self.ranges.append(header)
+            start = int(header[len('bytes='):-1]) if header else 0
+            if start >= len(self.data):
+                context.status_code = 416
+                return io.BytesIO(b'')
+            if header and honor_range:
+                context.status_code = 206
+                body = self.data[start:]
+            else:
+                body = self.data
+            fail_after, self.fail_after = self.fail_after, None
+            return FlakyBody(body, fail_after, self.error)
+
+        m.get(requests_mock.ANY, body=callback, headers={'Content-Type': 'application/octet-stream'})
+
+    @requests_mock.Mocker()
+    def test_stream_yields_fixed_size_chunks(self, m):
+        self.mock_download(m)
+
+        chunks = list(self.storage.stream(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>', chunk_size=100))
+
+        self.assertEqual(b''.join(chunks), self.data)
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks))
+        self.assertIn('/storage/buckets/%3CBUCKET_ID%3E/files/%3CFILE_ID%3E/download', m.last_request.url)
+
+    @requests_mock.Mocker()
+    def test_stream_from_offset(self, m):
+        self.mock_download(m)
+
+        data = b''.join(self.storage.stream(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>', offset=1000))
+
+        self.assertEqual(data, self.data[1000:])
+        self.assertEqual(self.ranges, ['bytes=1000-'])
+
+    @requests_mock.Mocker()
+    def test_stream_from_offset_when_range_is_ignored(self, m):
+        self.mock_download(m, honor_range=False)
+
+        data = b''.join(self.storage.stream(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>', offset=1000, chunk_size=64))
+
+        self.assertEqual(data, self.data[1000:])
+
+    @requests_mock.Mocker()
+    def test_stream_error(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'File not found', 'type': 'storage_file_not_found'}), headers={'Content-Type': 'application/json'})
+
+        with self.assertRaises(AppwriteException) as context:
+            list(self.storage.stream(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>'))
+
+        self.assertEqual(context.exception.code, 404)
+
+    @requests_mock.Mocker()
+    def test_download_to_file_object_resumes_after_disconnect(self, m):
+        self.mock_download(m)
+        self.fail_after = 300
+        output = io.BytesIO()
+
+        size = self.storage.download(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>', destination=output, chunk_size=64)
+
+        self.assertEqual(size, len(self.data))
+        self.assertEqual(output.getvalue(), self.data)
+        self.assertEqual(self.ranges[0], None)
+        self.assertTrue(self.ranges[1].startswith('bytes='))
+
+    @requests_mock.Mocker()
+    def test_download_does_not_resume_after_other_errors(self, m):
+        self.mock_download(m)
+        self.fail_after = 300
+        self.error = ValueError('Invalid body')
+
+        with self.assertRaises(AppwriteException):
+            self.storage.download(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>', destination=io.BytesIO(), chunk_size=64)
+
+        self.assertEqual(self.ranges, [None])
+
+    @requests_mock.Mocker()
+    def test_download_to_path_with_resume(self, m):
+        self.mock_download(m)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'file.bin')
+            with open(path, 'wb') as partial:
+                partial.write(self.data[:512])
+
+            size = self.storage.download(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>', destination=path, resume=True)
+
+            with open(path, 'rb') as downloaded:
+                self.assertEqual(downloaded.read(), self.data)
+
+            self.assertEqual(size, len(self.data))
+            self.assertEqual(self.ranges, ['bytes=512-'])
+
+            self.storage.download(self.storage.get_file_download, '<BUCKET_ID>', '<FILE_ID>', destination=path, resume=True)
+            self.assertEqual(os.path.getsize(path), len(self.data))
+
+    def test_stream_rejects_uploads(self):
+        with self.assertRaises(AppwriteException):
+            self.storage.stream(self.storage.create_file, '<BUCKET_ID>', '<FILE_ID>', InputFile.from_bytes(b'', 'file'))
+
+class TestServiceStreamList(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.tables_db = TablesDB(self.client)
+        self.page = {'total': 3, 'rows': [{**row(row_id), 'title': row_id.upper()} for row_id in ('a', 'b', 'c')]}
+
+    def mock(self, m, data):
+        m.get(requests_mock.ANY, body=lambda request, context: FlakyBody(json.dumps(data).encode(), None), headers={'Content-Type': 'application/json'})
+
+    @requests_mock.Mocker()
+    def test_stream_list_yields_the_items_of_list_rows(self, m):
+        self.mock(m, self.page)
+
+        rows = list(self.tables_db.stream_list(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>', queries=[Query.limit(3)], chunk_size=7))
+
+        self.assertEqual([item.to_dict() for item in rows], [item.to_dict() for item in self.tables_db.list_rows('<DATABASE_ID>', '<TABLE_ID>').rows])
+        self.assertEqual(rows[1].data, {'title': 'B'})
+        self.assertEqual(parse_qs(urlparse(m.request_history[0].url).query)['queries[0]'], [Query.limit(3)])
+
+    @requests_mock.Mocker()
+    def test_stream_list_follows_the_parse_mode(self, m):
+        self.mock(m, self.page)
+
+        with self.client.parse_mode('raw'):
+            rows = list(self.tables_db.stream_list(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>'))
+
+        self.assertEqual(rows, self.page['rows'])
+
+    @requests_mock.Mocker()
+    def test_stream_list_of_other_models(self, m):
+        self.mock(m, {'total': 1, 'localeCodes': [{'code': 'en-us', 'name': 'US'}]})
+        locale = Locale(self.client)
+
+        codes = list(locale.stream_list(locale.list_codes))
+
+        self.assertEqual([code.code for code in codes], ['en-us'])
+
+    @requests_mock.Mocker()
+    def test_stream_list_error(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Table not found', 'type': 'table_not_found'}), headers={'Content-Type': 'application/json'})
+
+        with self.assertRaises(AppwriteException) as context:
+            list(self.tables_db.stream_list(self.tables_db.list_rows, '<DATABASE_ID>', '<TABLE_ID>'))
+
+        self.assertEqual(context.exception.code, 404)
+
+    def test_stream_list_rejects_other_methods(self):
+        with self.assertRaises(AppwriteException):
+            self.tables_db.stream_list(self.tables_db.get_row, '<DATABASE_ID>', '<TABLE_ID>', '<ROW_ID>')
+
+        with self.assertRaises(AppwriteException):
+            self.tables_db.stream_list(self.tables_db.create_row, '<DATABASE_ID>', '<TABLE_ID>', '<ROW_ID>', {})
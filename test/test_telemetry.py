@@ -0,0 +1,105 @@
+import json
+import requests_mock
+import unittest
+
+try:
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace import SpanKind, StatusCode
+except ImportError:
+    TracerProvider = None
+
+from appwrite.client import Client
+from appwrite.exception import AppwriteException
+from appwrite.input_file import InputFile
+from appwrite.services.storage import Storage
+from appwrite.services.tables_db import TablesDB
+
+if TracerProvider is not None:
+    from appwrite.telemetry import OpenTelemetryHook
+
+FILE = {
+    "$id": "file",
+    "bucketId": "bucket",
+    "$createdAt": "2020-10-15T06:38:00.000+00:00",
+    "$updatedAt": "2020-10-15T06:38:00.000+00:00",
+    "$permissions": [],
+    "name": "file.txt",
+    "signature": "5d529fd02b544198ae075bd57c1762bb",
+    "mimeType": "text/plain",
+    "sizeOriginal": 10,
+    "sizeActual": 10,
+    "chunksTotal": 3,
+    "chunksUploaded": 3,
+    "encryption": False,
+    "compression": "none"
+}
+
+@unittest.skipIf(TracerProvider is None, 'opentelemetry-sdk is not installed')
+class TestOpenTelemetryHook(unittest.TestCase):
+
+    def setUp(self):
+        self.spans = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(self.spans))
+        self.metrics = InMemoryMetricReader()
+        hook = OpenTelemetryHook(tracer_provider, MeterProvider(metric_readers=[self.metrics]))
+        self.client = Client().set_project('test').add_hook(hook)
+
+    def metric_names(self):
+        data = self.metrics.get_metrics_data()
+        return {metric.name for resource in data.resource_metrics for scope in resource.scope_metrics for metric in scope.metrics}
+
+    @requests_mock.Mocker()
+    def test_service_call_span(self, m):
+        body = json.dumps({'total': 0, 'rows': []})
+        m.get(requests_mock.ANY, text=body, headers={'Content-Type': 'application/json'})
+
+        TablesDB(self.client).list_rows('db', 'tbl')
+
+        span, = self.spans.get_finished_spans()
+        self.assertEqual(span.name, 'TablesDB.list_rows')
+        self.assertEqual(span.kind, SpanKind.CLIENT)
+        self.assertEqual(span.attributes['url.template'], '/tablesdb/{databaseId}/tables/{tableId}/rows')
+        self.assertEqual(span.attributes['appwrite.service'], 'TablesDB')
+        self.assertEqual(span.attributes['http.response.status_code'], 200)
+        self.assertEqual(span.attributes['http.response.body.size'], len(body))
+        self.assertIn(format(span.context.trace_id, '032x'), m.last_request.headers['traceparent'])
+        self.assertEqual(self.metric_names(), {
+            'http.client.request.duration',
+            'http.client.request.body.size',
+            'http.client.response.body.size',
+        })
+
+    @requests_mock.Mocker()
+    def test_error_span(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Row not found'}), headers={'Content-Type': 'application/json'})
+
+        with self.assertRaises(AppwriteException):
+            TablesDB(self.client).get_row('db', 'tbl', 'row')
+
+        span, = self.spans.get_finished_spans()
+        self.assertEqual(span.status.status_code, StatusCode.ERROR)
+        self.assertEqual(span.attributes['http.response.status_code'], 404)
+        self.assertEqual(span.events[0].name, 'exception')
+
+    @requests_mock.Mocker()
+    def test_upload_span_parents_chunk_spans(self, m):
+        m.get(requests_mock.ANY, status_code=404, text=json.dumps({'message': 'Not found'}), headers={'Content-Type': 'application/json'})
+        m.post(requests_mock.ANY, text=json.dumps(FILE), headers={'Content-Type': 'application/json'})
+        self.client._chunk_size = 4
+
+        Storage(self.client).create_file('bucket', 'file', InputFile.from_bytes(b'0123456789', 'file.txt'))
+
+        spans = self.spans.get_finished_spans()
+        upload = [span for span in spans if 'appwrite.upload.chunks' in span.attributes]
+        chunks = [span for span in spans if span.attributes['http.request.method'] == 'POST' and span not in upload]
+        self.assertEqual(len(upload), 1)
+        self.assertEqual(upload[0].name, 'Storage.create_file')
+        self.assertEqual(upload[0].attributes['appwrite.upload.chunks'], 3)
+        self.assertEqual(upload[0].attributes['url.template'], '/storage/buckets/{bucketId}/files')
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(all(span.parent.span_id == upload[0].context.span_id for span in chunks))
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from appwrite.exception import AppwriteException
+from appwrite.throttle import FileThrottleStore, Throttler
+
+def rate_limit(limit, remaining, reset):
+    return {
+        'x-ratelimit-limit': str(limit),
+        'x-ratelimit-remaining': str(remaining),
+        'x-ratelimit-reset': str(reset),
+    }
+
+class TestThrottler(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('appwrite.throttle.time.time', return_value=1000.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unknown_endpoints_are_not_paced(self):
+        throttler = Throttler()
+
+        self.assertEqual(throttler.reserve('get', '/teams'), 0)
+        throttler.update('get', '/teams', {})
+        self.assertEqual(throttler.reserve('get', '/teams'), 0)
+
+    def test_bursts_then_paces_the_remaining_budget(self):
+        throttler = Throttler(utilization=1, burst=2)
+        throttler.update('get', '/teams', rate_limit(12, 12, 1010))
+
+        delays = [throttler.reserve('get', '/teams') for _ in range(4)]
+
+        self.assertEqual(delays, [0, 0, 1, 2])
+        self.assertEqual(throttler.reserve('get', '/users'), 0)
+
+    def test_tokens_refill_over_time(self):
+        throttler = Throttler(utilization=1, burst=1)
+        throttler.update('get', '/teams', rate_limit(11, 11, 1010))
+
+        self.assertEqual(throttler.reserve('get', '/teams'), 0)
+        self.clock.return_value = 1001.0
+        self.assertEqual(throttler.reserve('get', '/teams'), 0)
+
+    def test_exhausted_budget_waits_for_reset(self):
+        throttler = Throttler()
+        throttler.update('post', '/account/sessions/email', rate_limit(10, 0, 1030))
+
+        self.assertEqual(throttler.reserve('post', '/account/sessions/email'), 30)
+        self.clock.return_value = 1030.0
+        self.assertEqual(throttler.reserve('post', '/account/sessions/email'), 0)
+
+    def test_utilization_keeps_headroom(self):
+        throttler = Throttler(utilization=0.5, burst=100)
+        throttler.update('get', '/teams', rate_limit(100, 60, 1060))
+
+        delays = [throttler.reserve('get', '/teams') for _ in range(11)]
+
+        self.assertEqual(delays[:10], [0] * 10)
+        self.assertEqual(delays[10], 60)
+
+    def test_custom_key(self):
+        throttler = Throttler(utilization=1, burst=1, key=lambda method, path: path.rsplit('/', 1)[0])
+        throttler.update('get', '/teams/a', rate_limit(10, 1, 1010))
+
+        self.assertEqual(throttler.reserve('get', '/teams/b'), 0)
+        self.assertEqual(throttler.reserve('get', '/teams/c'), 10)
+
+    def test_rejects_invalid_settings(self):
+        with self.assertRaises(AppwriteException):
+            Throttler(utilization=0)
+
+        with self.assertRaises(AppwriteException):
+            Throttler(burst=0)
+
+class TestFileThrottleStore(unittest.TestCase):
+
+    def test_budgets_are_shared_through_the_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'throttle.json')
+
+        with mock.patch('appwrite.throttle.time.time', return_value=1000.0):
+            Throttler(utilization=1, burst=1, store=FileThrottleStore(path)).update('get', '/teams', rate_limit(10, 1, 1010))
+            other = Throttler(utilization=1, burst=1, store=FileThrottleStore(path))
+
+            self.assertEqual(other.reserve('get', '/teams'), 0)
+            self.assertEqual(other.reserve('get', '/teams'), 10)
+
+    def test_corrupt_file_is_ignored(self):
+        path = os.path.join(tempfile.mkdtemp(), 'throttle.json')
+        with open(path, 'w') as file:
+            file.write('{')
+
+        self.assertEqual(Throttler(store=FileThrottleStore(path)).reserve('get', '/teams'), 0)
@@ -0,0 +1,188 @@
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import httpx
+import requests_mock
+
+from appwrite.client import Client
+from appwrite.encoders.multipart_encoder import MultipartEncoder
+from appwrite.hooks import Hook
+from appwrite.retry import RetryPolicy
+from appwrite.transport import HttpxTransport, RequestsTransport
+
+class LoginServer:
+    """Local HTTP server answering every request with a session cookie, keeping the cookies it was sent"""
+
+    def __init__(self):
+        self.cookies = []
+        cookies = self.cookies
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self.rfile.read(int(self.headers.get('content-length') or 0))
+                cookies.append(self.headers.get('cookie'))
+                self.send_response(200)
+                self.send_header('Set-Cookie', 'a_session_proj=secret; Path=/')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', '2')
+                self.end_headers()
+                self.wfile.write(b'{}')
+
+            do_POST = do_GET
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._server.server_port}'
+
+    def __enter__(self):
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+class TestRequestsTransport(unittest.TestCase):
+
+    @requests_mock.Mocker()
+    def test_request(self, m):
+        m.get('https://example.com/v1/locale', text='{}')
+        transport = RequestsTransport()
+
+        response = transport.request('get', 'https://example.com/v1/locale', {'x-test': '1'}, {'a': 'b'}, None)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(transport.read(response), b'{}')
+        self.assertEqual(m.last_request.headers['x-test'], '1')
+        self.assertEqual(m.last_request.qs, {'a': ['b']})
+
+    def test_cookies_are_not_kept(self):
+        # requests_mock bypasses the cookie jar of the session, so this runs
+        # against a real server.
+        with LoginServer() as server:
+            transport = RequestsTransport()
+            self.addCleanup(transport.close)
+
+            transport.request('post', server.url + '/v1/account/sessions/email', {}, None, None)
+            transport.request('get', server.url + '/v1/users', {}, None, None)
+
+        self.assertEqual(server.cookies, [None, None])
+
+class TestHttpxTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.transport = HttpxTransport()
+        self.transport._client = httpx.AsyncClient(transport=httpx.MockTransport(self.record))
+        self.transport._verify = True
+        self.addCleanup(self.transport.close)
+
+    def record(self, request):
+        self.requests.append(request)
+        return httpx.Response(200, json={'$id': 'r', 'path': request.url.path}, headers={'x-ratelimit-remaining': '9'})
+
+    def test_client_call(self):
+        client = Client().set_transport(self.transport)
+
+        response = client.call('post', '/tablesdb', {'content-type': 'application/json'}, {'name': 'db', 'queries': ['a']})
+
+        self.assertEqual(response['$id'], 'r')
+        request = self.requests[0]
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(str(request.url), 'https://cloud.appwrite.io/v1/tablesdb')
+        self.assertEqual(json.loads(request.content), {'name': 'db', 'queries': ['a']})
+        self.assertEqual(request.headers['content-type'], 'application/json')
+
+    def test_query_params(self):
+        Client().set_transport(self.transport).call('get', '/locale', params={'queries': ['a', 'b']})
+
+        self.assertEqual(self.requests[0].url.params.multi_items(), [('queries[0]', 'a'), ('queries[1]', 'b')])
+
+    def test_timeout(self):
+        self.transport.request('get', 'https://example.com/v1/locale', {}, {}, None, timeout=(2, None))
+
+        self.assertEqual(self.requests[0].extensions['timeout'], {'connect': 2, 'read': None, 'write': None, 'pool': None})
+
+    def test_client_keeps_no_cookies_and_has_no_timeout(self):
+        transport = HttpxTransport()
+        self.addCleanup(transport.close)
+        with LoginServer() as server:
+            client = Client().set_endpoint(server.url + '/v1').set_transport(transport)
+
+            client.call('post', '/account/sessions/email')
+            client.call('get', '/users')
+
+        self.assertEqual(server.cookies, [None, None])
+        self.assertEqual(transport._client.timeout, httpx.Timeout(None))
+
+    def test_multipart_body(self):
+        data = MultipartEncoder({'fileId': 'f'}, [('file', 'a.txt', b'hello')])
+
+        self.transport.request('post', 'https://example.com/v1/files', {'content-type': data.content_type}, {}, data)
+
+        self.assertEqual(self.requests[0].content, b''.join(bytes(part) for part in data))
+
+    def test_stream(self):
+        response = self.transport.request('get', 'https://example.com/v1/file', {}, {}, None, stream=True)
+
+        self.assertEqual(b''.join(self.transport.iter_content(response, 4)), b'{"$id":"r","path":"/v1/file"}')
+        self.transport.close_response(response)
+        self.assertTrue(response.is_closed)
+
+    def test_hooks_read_streamed_response(self):
+        timings = []
+
+        class Timings(Hook):
+            def after_response(self, event):
+                timings.append(event)
+
+        client = Client().set_transport(self.transport).add_hook(Timings())
+        client.call('get', '/locale')
+
+        self.assertEqual(timings[0].status, 200)
+        self.assertGreater(timings[0].response_bytes, 0)
+        self.assertIn('download', timings[0].timings)
+
+    def test_connection_errors_are_retried(self):
+        attempts = []
+
+        def flaky(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError('connection reset', request=request)
+            return httpx.Response(200, json={})
+
+        self.transport._client = httpx.AsyncClient(transport=httpx.MockTransport(flaky))
+        client = Client().set_transport(self.transport).set_retry_policy(RetryPolicy(backoff=0, jitter=False))
+
+        self.assertEqual(client.call('get', '/locale'), {})
+        self.assertEqual(len(attempts), 2)
+
+    def test_requests_from_threads_share_the_client(self):
+        client = self.transport._client
+        with ThreadPoolExecutor(8) as executor:
+            statuses = list(executor.map(lambda i: self.transport.request('get', f'https://example.com/v1/{i}', {}, {}, None).status_code, range(32)))
+
+        self.assertEqual(statuses, [200] * 32)
+        self.assertEqual(len(self.requests), 32)
+        self.assertIs(self.transport._client, client)
+
+    def test_close_stops_the_event_loop(self):
+        self.transport.request('get', 'https://example.com/v1/locale', {}, {}, None)
+        thread = self.transport._thread
+
+        self.transport.close()
+
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.transport._client)
+        self.assertIsNone(self.transport._loop)
+
+if __name__ == '__main__':
+    unittest.main()
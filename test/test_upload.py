@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from appwrite.exception import AppwriteException
+from appwrite.upload import RateLimiter, UploadConcurrency, UploadManifest
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_reserve_paces_sends(self):
+        limiter = RateLimiter(100)
+
+        with mock.patch('appwrite.upload.time.monotonic', return_value=10.0):
+            self.assertEqual(limiter.reserve(50), 0)
+            self.assertEqual(limiter.reserve(100), 0.5)
+            self.assertEqual(limiter.reserve(10), 1.5)
+
+        with mock.patch('appwrite.upload.time.monotonic', return_value=20.0):
+            self.assertEqual(limiter.reserve(10), 0)
+
+    def test_rejects_invalid_rate(self):
+        with self.assertRaises(AppwriteException):
+            RateLimiter(0)
+
+class TestUploadConcurrency(unittest.TestCase):
+
+    def run_round(self, concurrency, clock, seconds, size=100):
+        clock.return_value += seconds
+        for _ in range(concurrency.limit):
+            concurrency.record(size)
+
+    def test_fixed(self):
+        concurrency = UploadConcurrency(8)
+        concurrency.record(100)
+
+        self.assertEqual(concurrency.limit, 8)
+
+    def test_adaptive_grows_while_throughput_improves(self):
+        with mock.patch('appwrite.upload.time.monotonic') as clock:
+            clock.return_value = 0.0
+            concurrency = UploadConcurrency(4, adaptive=True)
+            self.assertEqual(concurrency.limit, 2)
+
+            self.run_round(concurrency, clock, 1.0)
+            self.assertEqual(concurrency.limit, 3)
+
+            self.run_round(concurrency, clock, 1.0)
+            self.assertEqual(concurrency.limit, 4)
+
+            self.run_round(concurrency, clock, 1.0)
+            self.assertEqual(concurrency.limit, 4)
+
+    def test_adaptive_backs_off_when_throughput_drops(self):
+        with mock.patch('appwrite.upload.time.monotonic') as clock:
+            clock.return_value = 0.0
+            concurrency = UploadConcurrency(8, adaptive=True)
+
+            self.run_round(concurrency, clock, 1.0)
+            self.assertEqual(concurrency.limit, 3)
+
+            self.run_round(concurrency, clock, 3.0)
+            self.assertEqual(concurrency.limit, 2)
+
+            self.run_round(concurrency, clock, 4.0)
+            self.assertEqual(concurrency.limit, 3)
+
+class TestUploadManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'upload.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_complete_persists_progress(self):
+        manifest = UploadManifest.load(self.path, 'fingerprint')
+        manifest.complete(0, 'file')
+        manifest.complete(2)
+
+        loaded = UploadManifest.load(self.path, 'fingerprint')
+
+        self.assertEqual(loaded.upload_id, 'file')
+        self.assertEqual(loaded.completed, {0, 2})
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+    def test_other_fingerprint_is_ignored(self):
+        UploadManifest.load(self.path, 'fingerprint').complete(0, 'file')
+
+        loaded = UploadManifest.load(self.path, 'other')
+
+        self.assertEqual(loaded.upload_id, '')
+        self.assertEqual(loaded.completed, set())
+
+    def test_corrupt_manifest_is_ignored(self):
+        with open(self.path, 'w') as file:
+            file.write('{')
+
+        self.assertEqual(UploadManifest.load(self.path, 'fingerprint').completed, set())
+
+    def test_delete(self):
+        manifest = UploadManifest.load(self.path, 'fingerprint')
+        manifest.complete(0, 'file')
+        manifest.delete()
+        manifest.delete()
+
+        self.assertFalse(os.path.exists(self.path))